@@ -5,15 +5,24 @@ from flask import Flask
 from flask_cors import CORS
 
 from dotenv import load_dotenv
-import os, pkgutil, importlib
+from functools import partial
+import os, pkgutil, importlib, threading
 
 from .utils.limiter import limiter
 from .utils.session import flask_session
 from .utils.login_manager import login_manager
 from .utils.mysql import mysql
 from .utils.scheduler import scheduler
-from .utils.socketio import socketio
+from .utils.socketio import socketio, message_queue_options
+from .utils.search_index import search_index
+from .utils.suggest_index import suggest_index
+from .utils.auction_engine import auction_engine
+from .utils.auction_scheduler import auction_scheduler
+from .utils.auction_tasks import settle_auctions, activate_listings
+from .utils.response_cache import response_cache
 from .utils.logger import setup_logger
+from .database import pool as db_pool, checkout, init_unit_of_work
+from .data_mappers import ListingMapper
 from . import routes
 
 logger = setup_logger(name="app_logger", log_file="logs/app.log")
@@ -56,13 +65,53 @@ def create_app():
     except Exception as e:
         logger.critical(msg=f"Failed to initialize MySQL in app: {e}")
 
+    try:
+        db_pool.warm()
+    except Exception as e:
+        logger.warning(msg=f"Failed to warm database connection pool: {e}")
+
+    try:
+        init_unit_of_work(app, connection_factory=checkout)
+    except Exception as e:
+        logger.critical(msg=f"Failed to initialize unit of work in app: {e}")
+
+    try:
+        # Built in the background; searches use SQL until the indexes are ready
+        threading.Thread(target=search_index.load, kwargs={"connection_factory": checkout}, daemon=True).start()
+        threading.Thread(target=suggest_index.load, kwargs={"connection_factory": checkout}, daemon=True).start()
+    except Exception as e:
+        logger.warning(msg=f"Failed to start loading search indexes: {e}")
+
+    try:
+        # Listings changed by other worker processes are re-indexed from their cache invalidations
+        response_cache.on_remote_invalidation(ListingMapper.reindex_remote_changes)
+    except Exception as e:
+        logger.warning(msg=f"Failed to subscribe search indexes to remote invalidations: {e}")
+
+    try:
+        # The engine holds auctions in memory, so only the scheduler's leader runs it (after
+        # recovering the journals); bids reaching other processes are refused
+        if os.getenv("AUCTION_ENGINE", "false").lower() == "true":
+            auction_engine.enabled = True
+            auction_scheduler.on_leadership(elected=partial(auction_engine.start, connection_factory=checkout), stepped_down=auction_engine.stop)
+    except Exception as e:
+        logger.warning(msg=f"Failed to set up auction engine: {e}")
+
+    try:
+        # Every worker competes for leadership; only the leader fires deadlines
+        auction_scheduler.register("end", settle_auctions)
+        auction_scheduler.register("activate", activate_listings)
+        auction_scheduler.start(connection_factory=checkout)
+    except Exception as e:
+        logger.warning(msg=f"Failed to start auction scheduler: {e}")
+
     try:
         flask_session.init_app(app)
     except Exception as e:
         logger.critical(msg=f"Failed to initialize session in app: {e}")
 
     try:
-        socketio.init_app(app, transports=["websocket"])
+        socketio.init_app(app, transports=["websocket"], **message_queue_options())
     except Exception as e:
         logger.critical(msg=f"Failed to initialize SocketIO in app: {e}")
 
@@ -0,0 +1,33 @@
+from pymysql import cursors
+
+from ..database import get_db
+from ..entities import AuctionDeadline
+
+
+class AuctionDeadlineMapper:
+    @staticmethod
+    def schedule_deadline(data: dict, db_session=None):
+        """
+        Schedule a deadline of an auction, replacing any deadline of the same kind.
+
+        The auction scheduler's leader picks it up within `AUCTION_SCHEDULER_SYNC_INTERVAL` seconds,
+        whichever worker scheduled it.
+
+        Args:
+            data (dict): Dictionary containing deadline details (`kind`, `listing_id`, `due_at`).
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            int: Number of rows inserted or updated.
+        """
+        deadline = AuctionDeadline(**data)
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute("""
+            INSERT INTO auction_deadlines
+            (kind, listing_id, due_at, updated_at)
+            VALUES (%s, %s, %s, NOW())
+            ON DUPLICATE KEY UPDATE due_at = VALUES(due_at), updated_at = NOW()
+        """, (deadline.kind, deadline.listing_id, deadline.due_at))
+        db.commit()
+        return cursor.rowcount
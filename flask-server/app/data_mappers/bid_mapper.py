@@ -1,7 +1,12 @@
 from pymysql import cursors
+from functools import partial
 
-from ..database import get_db
-from ..entities import Bid
+from ..database import get_db, on_commit
+from .max_bid_mapper import MaxBidMapper
+from ..entities import Bid, MaxBid
+from ..utils.proxy_bidding import resolve_proxies
+from ..utils.soft_close import soft_close_bounds
+from ..utils.suggest_index import suggest_index
 
 
 class BidMapper:
@@ -20,7 +25,7 @@ class BidMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM bids")
         bids = cursor.fetchall()
-        return [Bid(**bid).to_dict() for bid in bids]
+        return [Bid.from_row(bid).to_dict() for bid in bids]
 
 
     @staticmethod
@@ -39,7 +44,7 @@ class BidMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM bids WHERE bid_id = %s", (bid_id,))
         bid = cursor.fetchone()
-        return Bid(**bid).to_dict() if bid else None
+        return Bid.from_row(bid).to_dict() if bid else None
 
     
     @staticmethod
@@ -64,3 +69,186 @@ class BidMapper:
         cursor.execute(statement, tuple(Bid(**data).to_dict().values())[1:])
         db.commit()
         return cursor.lastrowid
+
+
+    @staticmethod
+    def place_bid(data: dict, db_session=None):
+        """
+        Place a bid on an auction if it beats the current price, then let maximum bids answer it.
+
+        The listing is only updated if the auction is still active and the amount is higher than
+        its current price, in one conditional UPDATE, so concurrent bids are serialized by the row
+        lock and a lower bid can never overwrite a higher one. The same UPDATE extends the auction
+        if the bid lands within its soft-close window (see `extended_end`). Maximum bids that beat the amount
+        are then resolved in the same transaction (see `apply_max_bids`), which is committed once.
+
+        Args:
+            data (dict): Dictionary containing bid details (`listing_id`, `user_id`, `amount`).
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict | None: The new `bid_id` and the auction's resulting state (see `apply_max_bids`), or
+                None if the bid was rejected.
+        """
+        bid = Bid(**data)
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        try:
+            cursor.execute("""
+                UPDATE listings SET current_price = %s, bids = bids + 1, updated_at = %s,
+                auction_end = CASE WHEN auction_end <= %s THEN GREATEST(auction_end, %s) ELSE auction_end END
+                WHERE listing_id = %s AND status = 'active' AND auction_end > %s AND COALESCE(current_price, 0) < %s
+            """, (bid.amount, bid.created_at, *soft_close_bounds(bid.created_at), bid.listing_id, bid.created_at, bid.amount))
+            if not cursor.rowcount:
+                return None
+
+            cursor.execute("""
+                INSERT INTO bids 
+                (listing_id, user_id, amount, created_at) 
+                VALUES (%s, %s, %s, %s)
+            """, tuple(bid.to_dict().values())[1:])
+            bid_id = cursor.lastrowid
+            result = BidMapper.apply_max_bids(cursor, bid.listing_id, current_price=bid.amount, leader=bid.user_id, now=bid.created_at)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        on_commit(partial(suggest_index.add_listing_weight, bid.listing_id, 2 if result.get("proxy_bid_id") else 1))
+        return {"bid_id": bid_id, **result}
+
+
+    @staticmethod
+    def place_max_bid(data: dict, db_session=None):
+        """
+        Register or change a user's maximum bid on an auction and resolve it against the others.
+
+        The listing's row is locked first, so maximum bids and bids on the same auction are
+        resolved one at a time. The maximum must beat the current price of an active auction.
+
+        Args:
+            data (dict): Dictionary containing maximum bid details (`listing_id`, `user_id`, `amount`).
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict | None: The auction's resulting state (see `apply_max_bids`), or None if the maximum
+                bid was rejected.
+        """
+        max_bid = MaxBid(**data)
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        try:
+            cursor.execute(
+                "SELECT status, auction_end, current_price FROM listings WHERE listing_id = %s FOR UPDATE",
+                (max_bid.listing_id,)
+            )
+            listing = cursor.fetchone()
+            if (not listing or listing.get("status") != "active" or not listing.get("auction_end")
+                    or listing.get("auction_end") <= max_bid.created_at
+                    or max_bid.amount <= float(listing.get("current_price") or 0)):
+                db.rollback()
+                return None
+
+            cursor.execute("""
+                INSERT INTO max_bids
+                (listing_id, user_id, amount, created_at, updated_at)
+                VALUES (%s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE amount = VALUES(amount), updated_at = VALUES(updated_at)
+            """, tuple(max_bid.to_dict().values())[1:])
+            cursor.execute(
+                "SELECT user_id FROM bids WHERE listing_id = %s ORDER BY amount DESC, bid_id DESC LIMIT 1",
+                (max_bid.listing_id,)
+            )
+            leader = cursor.fetchone()
+            result = BidMapper.apply_max_bids(
+                cursor, max_bid.listing_id, current_price=float(listing.get("current_price") or 0),
+                leader=leader.get("user_id") if leader else None, now=max_bid.created_at
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        if result.get("proxy_bid_id"):
+            on_commit(partial(suggest_index.add_listing_weight, max_bid.listing_id, 1))
+        return result
+
+
+    @staticmethod
+    def apply_max_bids(cursor, listing_id: int, current_price: float, leader: int | None, now):
+        """
+        Resolve the maximum bids competing on an auction and place the single resulting bid.
+
+        Instead of bidding on each other's behalf one increment at a time, the competing maximums
+        are resolved in one computation (see `resolve_proxies`), so at most one bid is placed and
+        one price change results. That bid extends the auction within its soft-close window, as
+        bids placed by users do.
+
+        Args:
+            cursor: Cursor of the transaction holding the listing's row lock.
+            listing_id (int): The ID of the auctioned listing.
+            current_price (float): The auction's current price.
+            leader (int | None): The ID of the user holding the current price, if any.
+            now (datetime): Timestamp of the resulting bid.
+
+        Returns:
+            dict: The auction's resulting `current_price`, `leader`, `bids` and `auction_end`, and the
+                `proxy_bid_id` of the bid placed on behalf of a maximum bid, or None if none was placed.
+        """
+        proxy_bid_id = None
+        resolved = resolve_proxies(current_price, leader, MaxBidMapper.get_competing_max_bids(cursor, listing_id, current_price))
+        if resolved is not None:
+            leader, current_price = resolved
+            # A late proxy bid extends the auction like any other bid
+            cursor.execute("""
+                UPDATE listings SET current_price = %s, bids = bids + 1, updated_at = %s,
+                auction_end = CASE WHEN auction_end <= %s THEN GREATEST(auction_end, %s) ELSE auction_end END
+                WHERE listing_id = %s
+            """, (current_price, now, *soft_close_bounds(now), listing_id))
+            cursor.execute("""
+                INSERT INTO bids 
+                (listing_id, user_id, amount, created_at) 
+                VALUES (%s, %s, %s, %s)
+            """, (listing_id, leader, current_price, now))
+            proxy_bid_id = cursor.lastrowid
+
+        cursor.execute("SELECT bids, auction_end FROM listings WHERE listing_id = %s", (listing_id,))
+        listing = cursor.fetchone() or {}
+        return {
+            "current_price": current_price, "leader": leader, "bids": listing.get("bids"),
+            "auction_end": listing.get("auction_end"), "proxy_bid_id": proxy_bid_id
+        }
+
+
+    @staticmethod
+    def get_winning_bids(listing_ids: list, db_session=None):
+        """
+        Retrieve the highest bid of several auctions with one set-based query.
+
+        Among bids of the same amount, the earliest wins.
+
+        Args:
+            listing_ids (list[int]): The IDs of the auctioned listings.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict[int, dict]: The winning `bid_id`, `user_id` and `amount`, by listing ID; auctions
+                without bids are left out.
+        """
+        if not listing_ids:
+            return {}
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        placeholders = ", ".join(["%s"] * len(listing_ids))
+        cursor.execute(f"""
+            SELECT b.listing_id, b.bid_id, b.user_id, b.amount FROM bids b
+            JOIN (
+                SELECT listing_id, MAX(amount) AS amount FROM bids
+                WHERE listing_id IN ({placeholders}) GROUP BY listing_id
+            ) top ON top.listing_id = b.listing_id AND top.amount = b.amount
+            ORDER BY b.listing_id, b.bid_id
+        """, list(listing_ids))
+        winners = {}
+        for bid in cursor.fetchall():
+            winners.setdefault(bid.pop("listing_id"), bid)
+        return winners
@@ -1,7 +1,10 @@
 from pymysql import cursors
+from functools import partial
 
-from ..database import get_db
+from ..database import get_db, on_commit
 from ..entities import Category
+from ..utils.suggest_index import suggest_index
+from ..utils.response_cache import response_cache, category_tag
 from datetime import datetime
 
 class CategoryMapper:
@@ -16,11 +19,47 @@ class CategoryMapper:
         Returns:
             list: A list of category dictionaries.
         """
-        db = db_session or get_db()
+        db = db_session or get_db(read_only=True)
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM categories")
         categories = cursor.fetchall()
-        return [Category(**category).to_dict() for category in categories]
+        return [Category.from_row(category).to_dict() for category in categories]
+
+
+    @staticmethod
+    def get_categories_version(db_session=None):
+        """
+        Retrieve the version of the categories, for conditional GETs.
+
+        Args:
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: The latest `updated_at` of the categories and their `count`.
+        """
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute("SELECT MAX(updated_at) AS updated_at, COUNT(*) AS count FROM categories")
+        return cursor.fetchone()
+
+
+    @staticmethod
+    def get_category_version(category_id: int, db_session=None):
+        """
+        Retrieve when a category was last updated, for conditional GETs.
+
+        Args:
+            category_id (int): The ID of the category.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            datetime: The `updated_at` of the category, or None if it does not exist.
+        """
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute("SELECT updated_at FROM categories WHERE category_id = %s", (category_id,))
+        category = cursor.fetchone()
+        return category.get("updated_at") if category else None
 
 
     @staticmethod
@@ -35,11 +74,11 @@ class CategoryMapper:
         Returns:
             dict: Category details if found, otherwise None.
         """
-        db = db_session or get_db()
+        db = db_session or get_db(read_only=True)
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM categories WHERE category_id = %s", (category_id,))
         category = cursor.fetchone()
-        return Category(**category).to_dict() if category else None
+        return Category.from_row(category).to_dict() if category else None
 
 
     @staticmethod
@@ -63,6 +102,9 @@ class CategoryMapper:
         """
         cursor.execute(statement, tuple(Category(**data).to_dict().values())[1:])
         db.commit()
+        if suggest_index.active:
+            on_commit(partial(suggest_index.add_category, {"category_id": cursor.lastrowid, "name": data.get("name")}))
+        on_commit(partial(response_cache.invalidate, "categories"))
         return cursor.lastrowid
 
 
@@ -89,12 +131,17 @@ class CategoryMapper:
                     pass
             if isinstance(value, datetime):
                 data[key] = value.strftime('%Y-%m-%d %H:%M:%S')
-        set_clause = ", ".join([f"{key} = %s" for key in data if key not in ["category_id", "created_at"]])
-        values = [data.get(key) for key in data if key not in ["category_id", "created_at"]]
+        set_clause = ", ".join([f"{key} = %s" for key in data if key not in ["category_id", "created_at", "updated_at"]])
+        values = [data.get(key) for key in data if key not in ["category_id", "created_at", "updated_at"]]
+        values.append(datetime.now())
         values.append(category_id)
-        statement = f"UPDATE categories SET {set_clause} WHERE category_id = %s"
+        statement = f"UPDATE categories SET {set_clause}, updated_at = %s WHERE category_id = %s"
         cursor.execute(statement, values)
         db.commit()
+        if cursor.rowcount and "name" in data and suggest_index.active:
+            on_commit(partial(suggest_index.add_category, {"category_id": category_id, "name": data.get("name")}))
+        if cursor.rowcount:
+            on_commit(partial(response_cache.invalidate, category_tag(category_id)))
         return cursor.rowcount
 
 
@@ -114,4 +161,8 @@ class CategoryMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("DELETE FROM categories WHERE category_id = %s", (category_id,))
         db.commit()
+        if cursor.rowcount and suggest_index.active:
+            on_commit(partial(suggest_index.remove_category, category_id))
+        if cursor.rowcount:
+            on_commit(partial(response_cache.invalidate, category_tag(category_id)))
         return cursor.rowcount
@@ -7,22 +7,28 @@ from ..entities import Chat
 
 class ChatMapper:
     @staticmethod
-    def get_chats_by_user_id(user_id: int, db_session=None):
+    def get_chats_by_user_id(user_id: int, fields: str | None = None, db_session=None):
         """
         Retrieve all chats for a given user.
 
         Args:
             user_id (int): The ID of the user.
+            fields (str | None): Comma-separated fields to select (chat_id is always selected),
+                or None for every field.
             db_session: Optional database session to be used in tests.
 
         Returns:
             list: A list of chat dictionaries.
+
+        Raises:
+            ValueError: If a field is unknown.
         """
-        db = db_session or get_db()
+        fields = Chat.parse_fields(fields=fields, required=("chat_id",))
+        db = db_session or get_db(read_only=True)
         cursor = db.cursor(cursors.DictCursor) # type: ignore
-        cursor.execute("SELECT * FROM chats WHERE user1_id = %s OR user2_id = %s ORDER BY updated_at DESC", (user_id, user_id))
+        cursor.execute(f"SELECT {Chat.select_columns(fields)} FROM chats WHERE user1_id = %s OR user2_id = %s ORDER BY updated_at DESC", (user_id, user_id))
         chats = cursor.fetchall()
-        return [Chat(**chat).to_dict() for chat in chats]
+        return [Chat.from_row(chat).to_partial_dict(fields) for chat in chats]
 
 
     @staticmethod
@@ -36,11 +42,11 @@ class ChatMapper:
         Returns:
             list: A list of chat dictionaries.
         """
-        db = db_session or get_db()
+        db = db_session or get_db(read_only=True)
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM chats")
         chats = cursor.fetchall()
-        return [Chat(**chat).to_dict() for chat in chats]
+        return [Chat.from_row(chat).to_dict() for chat in chats]
 
 
     @staticmethod
@@ -55,11 +61,11 @@ class ChatMapper:
         Returns:
             dict: Chat details if found, otherwise None.
         """
-        db = db_session or get_db()
+        db = db_session or get_db(read_only=True)
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM chats WHERE chat_id = %s", (chat_id,))
         chat = cursor.fetchone()
-        return Chat(**chat).to_dict() if chat else None
+        return Chat.from_row(chat).to_dict() if chat else None
 
 
     @staticmethod
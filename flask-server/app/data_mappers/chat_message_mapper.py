@@ -21,7 +21,7 @@ class ChatMessageMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM chat_messages WHERE chat_id = %s ORDER BY sent_at", (chat_id,))
         messages = cursor.fetchall()
-        return [ChatMessage(**message).to_dict() for message in messages]
+        return [ChatMessage.from_row(message).to_dict() for message in messages]
 
 
     @staticmethod
@@ -40,7 +40,7 @@ class ChatMessageMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM chat_messages WHERE message_id = %s", (message_id,))
         message = cursor.fetchone()
-        return ChatMessage(**message).to_dict() if message else None
+        return ChatMessage.from_row(message).to_dict() if message else None
 
 
     @staticmethod
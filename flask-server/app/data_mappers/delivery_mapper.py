@@ -22,7 +22,7 @@ class DeliveryMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM deliveries WHERE user_id = %s", (user_id,))
         deliveries = cursor.fetchall()
-        return [Delivery(**delivery).to_dict() for delivery in deliveries]
+        return [Delivery.from_row(delivery).to_dict() for delivery in deliveries]
 
 
     @staticmethod
@@ -41,7 +41,7 @@ class DeliveryMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM deliveries WHERE delivery_id = %s", (delivery_id,))
         delivery = cursor.fetchone()
-        return Delivery(**delivery).to_dict() if delivery else None
+        return Delivery.from_row(delivery).to_dict() if delivery else None
 
 
     @staticmethod
@@ -69,6 +69,33 @@ class DeliveryMapper:
         return cursor.lastrowid
 
 
+    @staticmethod
+    def create_deliveries(deliveries: list, db_session=None):
+        """
+        Create several delivery records with a single multi-row INSERT.
+
+        Args:
+            deliveries (list[dict]): Delivery details.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            int: Number of deliveries created.
+        """
+        if not deliveries:
+            return 0
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        statement = """
+            INSERT INTO deliveries 
+            (order_item_id, user_id, address, city, state, country, delivery_status, 
+            tracking_number, courier, estimated_delivery_date, delivered_at, created_at, updated_at) 
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """
+        cursor.executemany(statement, [tuple(Delivery(**delivery).to_dict().values())[1:] for delivery in deliveries])  # Exclude delivery_id (auto-incremented)
+        db.commit()
+        return cursor.rowcount
+
+
     @staticmethod
     def update_delivery(delivery_id: int, data: dict, db_session=None):
         """
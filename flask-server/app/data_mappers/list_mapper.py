@@ -1,7 +1,7 @@
 from pymysql import cursors
 
 from ..database import get_db
-from ..entities import List, ListItem
+from ..entities import List, ListItem, Listing
 
 
 class ListMapper:
@@ -21,7 +21,7 @@ class ListMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM lists WHERE user_id = %s", (user_id,))
         lists = cursor.fetchall()
-        return [List(**list_row).to_dict() for list_row in lists]
+        return [List.from_row(list_row).to_dict() for list_row in lists]
 
 
     @staticmethod
@@ -40,7 +40,34 @@ class ListMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM list_items WHERE list_id = %s", (list_id,))
         list_items = cursor.fetchall()
-        return [ListItem(**list_item).to_dict() for list_item in list_items]
+        return [ListItem.from_row(list_item).to_dict() for list_item in list_items]
+
+
+    @staticmethod
+    def get_list_items_with_listings(list_id: int, db_session=None):
+        """
+        Retrieve the listings of all items in a specific list with a single join.
+
+        Args:
+            list_id (int): The ID of the list whose listings are being retrieved.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            list[dict]: The listings of the list's items, in the order they were added. Items
+                whose listing no longer exists, or is a draft of another user than the list's
+                owner, are skipped.
+        """
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute("""
+            SELECT listings.* FROM list_items
+            JOIN lists ON lists.list_id = list_items.list_id
+            JOIN listings ON listings.listing_id = list_items.listing_id
+            WHERE list_items.list_id = %s AND (listings.status != 'draft' OR listings.user_id = lists.user_id)
+            ORDER BY list_items.list_item_id
+        """, (list_id,))
+        listings = cursor.fetchall()
+        return [Listing.from_row(listing).to_dict() for listing in listings]
 
 
     @staticmethod
@@ -59,7 +86,7 @@ class ListMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM lists WHERE list_id = %s", (list_id,))
         list_row = cursor.fetchone()
-        return List(**list_row).to_dict() if list_row else None
+        return List.from_row(list_row).to_dict() if list_row else None
 
 
     @staticmethod
@@ -1,31 +1,78 @@
 from charset_normalizer.md import is_arabic_isolated_form
 from pymysql import cursors
 from datetime import datetime
+from functools import partial
 
-from ..database import get_db
+from ..database import get_db, on_commit
 from ..entities import Listing
+from ..utils.pagination import decode_cursor, keyset_condition
+from ..utils.blob_store import blob_store
+from ..utils.facets import PRICE_BUCKET_EDGES, combine_facets, price_filter
+from ..utils.search_index import search_index, INDEXED_COLUMNS
+from ..utils.suggest_index import suggest_index, SUGGEST_COLUMNS
+from ..utils.auction_engine import auction_engine, AUCTION_COLUMNS
+from ..utils.response_cache import response_cache, listing_tag, category_tag
+from ..utils.logger import setup_logger
+
+logger = setup_logger(name="listing_logger", log_file="logs/listing.log")
+
+# Columns listings may be sorted (and keyset paginated) by
+SORTABLE_COLUMNS = {
+    "listing_id", "title", "current_price", "buy_now_price", "auction_start", "auction_end", "bids",
+    "purchases", "average_review", "total_reviews", "created_at", "updated_at"
+}
+
+# Most relevant search matches, once filtered, considered when search results are sorted by another column
+MAX_SORTED_MATCHES = 10000
+
+# Maximum number of IDs in one `listing_id IN (...)` lookup
+MAX_IDS_PER_QUERY = 1000
+
+# In-memory indexes kept current by listing writes: (index, add, remove, columns it indexes)
+LISTING_INDEXES = (
+    (search_index, search_index.add, search_index.remove, INDEXED_COLUMNS),
+    (suggest_index, suggest_index.add_listing, suggest_index.remove_listing, SUGGEST_COLUMNS),
+    (auction_engine, auction_engine.sync_listing, auction_engine.forget, AUCTION_COLUMNS)
+)
 
 
 class ListingMapper:
     @staticmethod
-    def get_all_listings(args: dict, db_session=None):
+    def get_sort(args: dict):
         """
-        Retrieve all listings with optional filtering, sorting, and pagination.
+        Resolve the sort column and order requested in the query parameters.
 
         Args:
             args (dict): Dictionary of query parameters.
-            db_session: Optional database session to be used in tests.
+
+        Text searches without an explicit sort are ranked by relevance once the search index is ready.
 
         Returns:
-            list: A list of listing dictionaries matching the query conditions.
+            tuple[str, str]: A whitelisted sort column (defaults to listing_id, or "relevance" for
+                text searches) and "ASC" or "DESC".
         """
-        db = db_session or get_db()
-        cursor = db.cursor(cursors.DictCursor) # type: ignore
-        statement = "SELECT * FROM listings"
-        conditions = []
-        values = []
+        if args.get("sort") not in SORTABLE_COLUMNS and args.get("query") and search_index.ready:
+            return "relevance", "DESC"
+        sort = args.get("sort") if args.get("sort") in SORTABLE_COLUMNS else "listing_id"
+        order = "DESC" if str(args.get("order", "")).lower() == "desc" else "ASC"
+        return sort, order
 
-        # Add conditions
+
+    @staticmethod
+    def get_filters(args: dict, include_drafts: bool = False):
+        """
+        Build the conditions of the column filters requested in the query parameters.
+
+        Args:
+            args (dict): Dictionary of query parameters.
+            include_drafts (bool): Whether draft listings, not live yet, match too; only for their
+                owner or staff.
+
+        Returns:
+            tuple[list[str], list]: The conditions and their values.
+        """
+        conditions = [] if include_drafts else ["status != 'draft'"]
+        values = []
         if "user_id" in args:
             conditions.append("user_id = %s")
             values.append(args.get("user_id"))
@@ -41,45 +88,312 @@ class ListingMapper:
         if "max_price" in args:
             conditions.append("buy_now_price < %s")
             values.append(args.get("max_price"))
-        if "query" in args:
+        return conditions, values
+
+
+    @staticmethod
+    def get_listings_version(args: dict, include_drafts: bool = False, db_session=None):
+        """
+        Retrieve the version of the listings matching the filters of a query, for conditional GETs.
+
+        Text searches and pagination are ignored, so the version covers every listing a page of the
+        query can show: it changes whenever one of them is created, updated or deleted.
+
+        Args:
+            args (dict): Dictionary of query parameters, the same as for `get_all_listings`.
+            include_drafts (bool): Whether draft listings are covered too.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: The latest `updated_at` of the listings and their `count`.
+        """
+        conditions, values = ListingMapper.get_filters(args=args, include_drafts=include_drafts)
+        statement = "SELECT MAX(updated_at) AS updated_at, COUNT(*) AS count FROM listings"
+        if conditions:
+            statement += " WHERE " + " AND ".join(conditions)
+
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute(statement, values)
+        return cursor.fetchone()
+
+
+    @staticmethod
+    def get_all_listings(args: dict, include_drafts: bool = False, db_session=None):
+        """
+        Retrieve all listings with optional filtering, sorting, and pagination.
+
+        Pages are selected either with an opaque `cursor` (keyset pagination on the sort column
+        plus listing_id, which stays fast on deep pages) or, for backward compatibility, with
+        `start` as an OFFSET.
+
+        Text searches (`query`) are answered by the in-memory search index when it is ready, ranked
+        by relevance unless another sort is requested, and fall back to a LIKE scan otherwise.
+
+        With `fields` (e.g. "title_short,current_price,image_id" for the card grids), only those
+        columns are selected, plus listing_id and the sort column the next page's cursor is built from.
+
+        Draft listings are left out unless `include_drafts` is set, for their owner's listings.
+
+        Args:
+            args (dict): Dictionary of query parameters.
+            include_drafts (bool): Whether draft listings are returned too.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            list: A list of listing dictionaries matching the query conditions.
+
+        Raises:
+            ValueError: If the cursor is malformed or was issued for another sort column, or a field
+                is unknown.
+        """
+        sort, order = ListingMapper.get_sort(args=args)
+        fields = Listing.parse_fields(fields=args.get("fields"), required=("listing_id",) if sort == "relevance" else ("listing_id", sort))
+        if sort == "relevance":
+            return ListingMapper.search_listings(args=args, fields=fields, db_session=db_session)
+
+        db = db_session or get_db(read_only=True)
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        statement = f"SELECT {Listing.select_columns(fields)} FROM listings"
+
+        # Add conditions
+        conditions, values = ListingMapper.get_filters(args=args, include_drafts=include_drafts)
+        if "query" in args and search_index.ready:
+            listing_ids = search_index.match(query=args.get("query"), filters=args, limit=MAX_SORTED_MATCHES)
+            if not listing_ids:
+                return []
+            if len(listing_ids) == MAX_SORTED_MATCHES:
+                logger.warning(msg=f"Search: {args.get('query')!r} sorted by {sort} truncated to its {MAX_SORTED_MATCHES} most relevant matches")
+            conditions.append(f"listing_id IN ({', '.join(['%s'] * len(listing_ids))})")
+            values.extend(listing_ids)
+        elif "query" in args:
             query = args.get("query")
             conditions.append("(title LIKE %s OR description LIKE %s)")
             values.extend([f"%{query}%", f"%{query}%"])
 
+        # Add keyset pagination
+        if "cursor" in args:
+            value, last_id = decode_cursor(token=args.get("cursor"), sort=sort)
+            condition, condition_values = keyset_condition(sort=sort, id_column="listing_id", order=order, value=value, row_id=last_id)
+            conditions.append(condition)
+            values.extend(condition_values)
+
         if conditions:
             statement += " WHERE " + " AND ".join(conditions)
 
-        # Add sorting
-        if "sort" in args and "order" in args:
-            statement += f" ORDER BY {args['sort']} {args['order'].upper()}"
+        # Add sorting, with listing_id as a tie-breaker so pages are stable
+        statement += f" ORDER BY {sort} {order}" if sort == "listing_id" else f" ORDER BY {sort} {order}, listing_id {order}"
 
         # Add pagination
-        if "start" in args and "range" in args:
+        if "cursor" in args and "range" in args:
+            statement += " LIMIT %s"
+            values.append(int(args.get("range")))
+        elif "start" in args and "range" in args:
             statement += " LIMIT %s OFFSET %s"
             values.extend([int(args.get("range")), int(args.get("start"))])
 
         cursor.execute(statement, values)
         listings = cursor.fetchall()
-        return [Listing(**listing).to_dict() for listing in listings]
+        return [Listing.from_row(listing).to_partial_dict(fields) for listing in listings]
+
+
+    @staticmethod
+    def search_listings(args: dict, fields=None, db_session=None):
+        """
+        Retrieve the listings matching a text search, most relevant first.
+
+        Matching, filtering and ranking happen in the search index; only the requested page of
+        listings is then read from the database.
+
+        Args:
+            args (dict): Dictionary of query parameters, including `query`.
+            fields (tuple[str] | None): The columns to select, as returned by `Listing.parse_fields`,
+                or None for every column.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            list: A list of listing dictionaries, each with its `relevance` score.
+
+        Raises:
+            ValueError: If the cursor is malformed or a filter value is invalid.
+        """
+        after = decode_cursor(token=args.get("cursor"), sort="relevance") if "cursor" in args else None
+        limit = int(args.get("range")) if "range" in args else None
+        offset = int(args.get("start")) if "start" in args and limit is not None and after is None else 0
+
+        hits = search_index.search(query=args.get("query"), filters=args, limit=limit, offset=offset, after=after)
+        if not hits:
+            return []
+
+        scores = dict(hits)
+        listings = ListingMapper.get_listings_by_ids(listing_ids=list(scores), fields=fields, db_session=db_session)
+        return [{**listing, "relevance": scores[listing.get("listing_id")]} for listing in listings]
+
+
+    @staticmethod
+    def get_facets(args: dict, db_session=None):
+        """
+        Count the listings matching a search per category, listing type and price bucket.
+
+        All counts come from a single aggregated pass: a vectorized pass over the search index
+        columns when it is ready, otherwise one GROUP BY query. Each facet is counted with every
+        filter applied except its own, see `combine_facets`.
+
+        Args:
+            args (dict): Dictionary of query parameters, the same as for `get_all_listings`.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: Counts per `category_id`, per `listing_type` and per `price` bucket.
+
+        Raises:
+            ValueError: If a price filter is not a number.
+        """
+        if search_index.ready:
+            return combine_facets(groups=search_index.facet_groups(query=args.get("query"), filters=args), args=args)
+
+        min_price, max_price = price_filter(args)
+        price_conditions = []
+        values = []
+        if min_price is not None:
+            price_conditions.append("buy_now_price > %s")
+            values.append(min_price)
+        if max_price is not None:
+            price_conditions.append("buy_now_price < %s")
+            values.append(max_price)
+        in_price = f"COALESCE({' AND '.join(price_conditions)}, FALSE)" if price_conditions else "TRUE"
+
+        edges = ", ".join(str(edge) for edge in PRICE_BUCKET_EDGES)
+        statement = f"""
+            SELECT category_id, listing_type, INTERVAL(buy_now_price, {edges}) AS bucket, {in_price} AS in_price, COUNT(*) AS count
+            FROM listings
+        """
+        conditions = ["status != 'draft'"]
+        if "user_id" in args:
+            conditions.append("user_id = %s")
+            values.append(args.get("user_id"))
+        if "query" in args:
+            query = args.get("query")
+            conditions.append("(title LIKE %s OR description LIKE %s)")
+            values.extend([f"%{query}%", f"%{query}%"])
+        if conditions:
+            statement += " WHERE " + " AND ".join(conditions)
+        statement += " GROUP BY category_id, listing_type, bucket, in_price"
+
+        db = db_session or get_db(read_only=True)
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute(statement, values)
+        groups = (
+            (row.get("category_id"), row.get("listing_type"), row.get("bucket"), bool(row.get("in_price")), row.get("count"))
+            for row in cursor.fetchall()
+        )
+        return combine_facets(groups=groups, args=args)
 
 
     @staticmethod
-    def get_listing_by_id(listing_id: int, db_session=None):
+    def get_suggestions(prefix: str, limit: int = 10, db_session=None):
+        """
+        Retrieve typeahead suggestions (categories and active listings) for a prefix.
+
+        Suggestions come from the in-memory suggest index when it is ready, otherwise from a
+        prefix LIKE on category names and listing titles.
+
+        Args:
+            prefix (str): What the user has typed so far.
+            limit (int): Maximum number of suggestions.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            list[dict]: Suggestions with their `type` ("listing" or "category"), `id` and `text`.
+        """
+        if suggest_index.ready:
+            return suggest_index.suggest(prefix=prefix, limit=limit)
+
+        db = db_session or get_db(read_only=True)
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        cursor.execute("SELECT category_id, name FROM categories WHERE name LIKE %s LIMIT %s", (pattern, limit))
+        suggestions = [{"type": "category", "id": row.get("category_id"), "text": row.get("name")} for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT listing_id, title FROM listings WHERE status = 'active' AND title LIKE %s ORDER BY purchases + bids DESC LIMIT %s",
+            (pattern, limit)
+        )
+        suggestions += [{"type": "listing", "id": row.get("listing_id"), "text": row.get("title")} for row in cursor.fetchall()]
+        return suggestions[:limit]
+
+
+    @staticmethod
+    def get_listing_by_id(listing_id: int, include_drafts: bool = False, db_session=None):
         """
         Retrieve a single listing by its ID.
 
         Args:
             listing_id (int): The ID of the listing to retrieve.
+            include_drafts (bool): Whether a draft listing is returned too; only for its owner or staff.
             db_session: Optional database session to be used in tests.
 
         Returns:
             dict: Listing details if found, otherwise None.
         """
+        db = db_session or get_db(read_only=True)
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        statement = "SELECT * FROM listings WHERE listing_id = %s"
+        if not include_drafts:
+            statement += " AND status != 'draft'"
+        cursor.execute(statement, (listing_id,))
+        listing = cursor.fetchone()
+        return Listing.from_row(listing).to_dict() if listing else None
+
+
+    @staticmethod
+    def get_listing_version(listing_id: int, db_session=None):
+        """
+        Retrieve when a listing was last updated, for conditional GETs.
+
+        Args:
+            listing_id (int): The ID of the listing.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            datetime: The `updated_at` of the listing, or None if it does not exist or is a draft.
+        """
         db = db_session or get_db()
         cursor = db.cursor(cursors.DictCursor) # type: ignore
-        cursor.execute("SELECT * FROM listings WHERE listing_id = %s", (listing_id,))
+        cursor.execute("SELECT updated_at FROM listings WHERE listing_id = %s AND status != 'draft'", (listing_id,))
         listing = cursor.fetchone()
-        return Listing(**listing).to_dict() if listing else None
+        return listing.get("updated_at") if listing else None
+
+
+    @staticmethod
+    def get_listings_by_ids(listing_ids: list, fields=None, db_session=None):
+        """
+        Retrieve several listings by their IDs in as few queries as possible.
+
+        IDs are looked up with `listing_id IN (...)` queries of at most `MAX_IDS_PER_QUERY` IDs
+        each, instead of one query per listing.
+
+        Args:
+            listing_ids (list[int]): The IDs of the listings to retrieve.
+            fields (tuple[str] | None): The columns to select, including listing_id, as returned by
+                `Listing.parse_fields`, or None for every column.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            list[dict]: The listings found, in the order of `listing_ids` (repeated IDs are
+                returned once); IDs without a listing are skipped.
+        """
+        listing_ids = list(dict.fromkeys(listing_ids))
+        if not listing_ids:
+            return []
+
+        db = db_session or get_db(read_only=True)
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        listings = {}
+        for start in range(0, len(listing_ids), MAX_IDS_PER_QUERY):
+            chunk = listing_ids[start:start + MAX_IDS_PER_QUERY]
+            cursor.execute(f"SELECT {Listing.select_columns(fields)} FROM listings WHERE listing_id IN ({', '.join(['%s'] * len(chunk))})", chunk)
+            listings.update((listing.get("listing_id"), listing) for listing in cursor.fetchall())
+        return [Listing.from_row(listings[listing_id]).to_partial_dict(fields) for listing_id in listing_ids if listing_id in listings]
 
 
     @staticmethod
@@ -100,12 +414,18 @@ class ListingMapper:
             INSERT INTO listings 
             (user_id, title, title_short, description, item_specifics, category_id, listing_type, starting_price, 
             reserve_price, current_price, buy_now_price, auction_start, auction_end, status, image_encoded, bids, purchases, 
-            average_review, total_reviews, created_at, updated_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            average_review, total_reviews, created_at, updated_at, image_id)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
-        cursor.execute(statement, tuple(Listing(**data).to_dict().values())[1:])
+        listing = Listing(**ListingMapper.store_image(data)).to_dict()
+        cursor.execute(statement, tuple(listing.values())[1:])
         db.commit()
-        return cursor.lastrowid
+        listing_id = cursor.lastrowid
+        for index, add, _, _ in LISTING_INDEXES:
+            if index.active:
+                on_commit(partial(add, {**listing, "listing_id": listing_id}))
+        on_commit(partial(response_cache.invalidate, "listings", category_tag(listing.get("category_id")), listing_tag(listing_id)))
+        return listing_id
 
 
     @staticmethod
@@ -121,6 +441,7 @@ class ListingMapper:
         Returns:
             int: Number of rows updated.
         """
+        data = ListingMapper.store_image(data)
         db = db_session or get_db()
         cursor = db.cursor(cursors.DictCursor)  # type: ignore
         set_clause = []
@@ -135,7 +456,249 @@ class ListingMapper:
         statement = f"UPDATE listings SET {', '.join(set_clause)}, updated_at = %s WHERE listing_id = %s"
         cursor.execute(statement, values)
         db.commit()
-        return cursor.rowcount
+        rowcount = cursor.rowcount
+        if rowcount:
+            ListingMapper.reindex_listings(cursor=cursor, listing_ids=[listing_id], changed=data.keys())
+        return rowcount
+
+
+    @staticmethod
+    def lock_listings(listing_ids: list, db_session=None):
+        """
+        Retrieve listings and lock their rows until the current transaction ends.
+
+        Rows are locked in listing_id order with a single `SELECT ... FOR UPDATE`, so concurrent
+        checkouts of overlapping carts wait for each other instead of deadlocking.
+
+        Args:
+            listing_ids (list[int]): The IDs of the listings to lock.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict[int, dict]: The listings found, by listing ID.
+        """
+        if not listing_ids:
+            return {}
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute(
+            f"SELECT * FROM listings WHERE listing_id IN ({', '.join(['%s'] * len(listing_ids))}) ORDER BY listing_id FOR UPDATE",
+            list(listing_ids)
+        )
+        return {listing.get("listing_id"): Listing.from_row(listing).to_dict() for listing in cursor.fetchall()}
+
+
+    @staticmethod
+    def add_purchases(quantities: dict, db_session=None):
+        """
+        Increase the purchase counters of several listings with a single UPDATE.
+
+        Args:
+            quantities (dict[int, int]): Quantity purchased, by listing ID.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            int: Number of rows updated.
+        """
+        if not quantities:
+            return 0
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cases = " ".join(["WHEN %s THEN %s"] * len(quantities))
+        values = [value for item in quantities.items() for value in item]
+        values.append(datetime.now())
+        values.extend(quantities)
+        cursor.execute(
+            f"UPDATE listings SET purchases = purchases + CASE listing_id {cases} END, updated_at = %s "
+            f"WHERE listing_id IN ({', '.join(['%s'] * len(quantities))})",
+            values
+        )
+        db.commit()
+        rowcount = cursor.rowcount
+        if rowcount:
+            ListingMapper.reindex_listings(cursor=cursor, listing_ids=list(quantities), changed=("purchases",))
+        return rowcount
+
+
+    @staticmethod
+    def lock_ended_auctions(listing_ids: list, db_session=None):
+        """
+        Lock the active auctions, among the given listings, whose end has passed.
+
+        Listings whose auction was extended or already settled are skipped, so settling the same
+        auctions twice is harmless.
+
+        Args:
+            listing_ids (list[int]): The IDs of the auctioned listings.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict[int, dict]: The `user_id` (seller) and `reserve_price` of the auctions, by listing ID.
+        """
+        if not listing_ids:
+            return {}
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        now = datetime.now()
+        auctions = {}
+        for start in range(0, len(listing_ids), MAX_IDS_PER_QUERY):
+            chunk = list(listing_ids[start:start + MAX_IDS_PER_QUERY])
+            cursor.execute(
+                f"SELECT listing_id, user_id, reserve_price FROM listings WHERE listing_id IN ({', '.join(['%s'] * len(chunk))}) "
+                "AND listing_type = 'auction' AND status = 'active' AND auction_end <= %s ORDER BY listing_id FOR UPDATE",
+                [*chunk, now]
+            )
+            auctions.update((listing.pop("listing_id"), listing) for listing in cursor.fetchall())
+        return auctions
+
+
+    @staticmethod
+    def get_extended_auctions(listing_ids: list, db_session=None):
+        """
+        Retrieve the end of the active auctions, among the given listings, that have not ended yet,
+        e.g. because late bids extended them.
+
+        Args:
+            listing_ids (list[int]): The IDs of the auctioned listings.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict[int, datetime]: The auctions' end, by listing ID.
+        """
+        if not listing_ids:
+            return {}
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        now = datetime.now()
+        auctions = {}
+        for start in range(0, len(listing_ids), MAX_IDS_PER_QUERY):
+            chunk = list(listing_ids[start:start + MAX_IDS_PER_QUERY])
+            cursor.execute(
+                f"SELECT listing_id, auction_end FROM listings WHERE listing_id IN ({', '.join(['%s'] * len(chunk))}) "
+                "AND listing_type = 'auction' AND status = 'active' AND auction_end > %s",
+                [*chunk, now]
+            )
+            auctions.update((listing.get("listing_id"), listing.get("auction_end")) for listing in cursor.fetchall())
+        return auctions
+
+
+    @staticmethod
+    def lock_due_drafts(listing_ids: list, db_session=None):
+        """
+        Lock the draft listings, among the given listings, whose auction start has passed.
+
+        Args:
+            listing_ids (list[int]): The IDs of the draft listings.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            list[int]: The IDs of the drafts due to go live.
+        """
+        if not listing_ids:
+            return []
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        now = datetime.now()
+        drafts = []
+        for start in range(0, len(listing_ids), MAX_IDS_PER_QUERY):
+            chunk = list(listing_ids[start:start + MAX_IDS_PER_QUERY])
+            cursor.execute(
+                f"SELECT listing_id FROM listings WHERE listing_id IN ({', '.join(['%s'] * len(chunk))}) "
+                "AND status = 'draft' AND auction_start <= %s ORDER BY listing_id FOR UPDATE",
+                [*chunk, now]
+            )
+            drafts.extend(listing.get("listing_id") for listing in cursor.fetchall())
+        return drafts
+
+
+    @staticmethod
+    def update_statuses(statuses: dict, db_session=None):
+        """
+        Update the status of several listings with a single UPDATE.
+
+        Args:
+            statuses (dict[int, str]): New status, by listing ID.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            int: Number of rows updated.
+        """
+        if not statuses:
+            return 0
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cases = " ".join(["WHEN %s THEN %s"] * len(statuses))
+        values = [value for item in statuses.items() for value in item]
+        values.append(datetime.now())
+        values.extend(statuses)
+        cursor.execute(
+            f"UPDATE listings SET status = CASE listing_id {cases} END, updated_at = %s "
+            f"WHERE listing_id IN ({', '.join(['%s'] * len(statuses))})",
+            values
+        )
+        db.commit()
+        rowcount = cursor.rowcount
+        if rowcount:
+            ListingMapper.reindex_listings(cursor=cursor, listing_ids=list(statuses), changed=("status",))
+        return rowcount
+
+
+    @staticmethod
+    def reindex_listings(cursor, listing_ids: list, changed):
+        """
+        Re-index updated listings, once committed, in the in-memory indexes covering a changed column,
+        and drop the cached responses showing them.
+
+        Args:
+            cursor: Cursor of the connection the listings were updated on.
+            listing_ids (list[int]): The IDs of the updated listings.
+            changed (iterable[str]): The columns that were updated.
+        """
+        on_commit(partial(response_cache.invalidate, *map(listing_tag, listing_ids)))
+        changed = set(changed)
+        indexes = [(add, columns) for index, add, _, columns in LISTING_INDEXES if index.active and not changed.isdisjoint(columns)]
+        if not indexes:
+            return
+        columns = dict.fromkeys(column for _, index_columns in indexes for column in index_columns)
+        cursor.execute(
+            f"SELECT {', '.join(columns)} FROM listings WHERE listing_id IN ({', '.join(['%s'] * len(listing_ids))})",
+            list(listing_ids)
+        )
+        for listing in cursor.fetchall():
+            for add, _ in indexes:
+                on_commit(partial(add, listing))
+
+
+    @staticmethod
+    def reindex_remote_changes(tags: list, db_session=None):
+        """
+        Re-index the listings another worker process changed, named by the cache tags it invalidated
+        once its writes were committed; the listings that no longer exist are removed.
+
+        Args:
+            tags (list[str]): The invalidated tags, as relayed by `response_cache.on_remote_invalidation`.
+            db_session: Optional database session to be used in tests.
+        """
+        prefix = listing_tag("")
+        listing_ids = [int(tag[len(prefix):]) for tag in tags if tag.startswith(prefix)]
+        indexes = [(add, remove, columns) for index, add, remove, columns in LISTING_INDEXES if index.active]
+        if not listing_ids or not indexes:
+            return
+
+        columns = dict.fromkeys(column for _, _, index_columns in indexes for column in index_columns)
+        db = db_session or get_db()  # The primary has the committed rows; a replica may lag behind
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute(
+            f"SELECT {', '.join(columns)} FROM listings WHERE listing_id IN ({', '.join(['%s'] * len(listing_ids))})",
+            listing_ids
+        )
+        listings = {listing.get("listing_id"): listing for listing in cursor.fetchall()}
+        for listing_id in listing_ids:
+            for add, remove, _ in indexes:
+                if listing_id in listings:
+                    add(listings[listing_id])
+                else:
+                    remove(listing_id)
 
 
     @staticmethod
@@ -154,5 +717,31 @@ class ListingMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("DELETE FROM listings WHERE listing_id = %s", (listing_id,))
         db.commit()
+        for index, _, remove, _ in LISTING_INDEXES:
+            if cursor.rowcount and index.active:
+                on_commit(partial(remove, listing_id))
+        if cursor.rowcount:
+            on_commit(partial(response_cache.invalidate, listing_tag(listing_id)))
         return cursor.rowcount
 
+
+    @staticmethod
+    def store_image(data: dict):
+        """
+        Move an uploaded base64 image out of the listing row and into the blob store.
+
+        Args:
+            data (dict): Listing fields, possibly containing a non-empty `image_encoded`.
+
+        Returns:
+            dict: A copy of the fields with `image_id` set and `image_encoded` emptied, or the
+                fields unchanged if there is no image to store or it could not be decoded.
+        """
+        if not data.get("image_encoded"):
+            return data
+        try:
+            image_id = blob_store.put_base64(encoded=data.get("image_encoded"))
+        except ValueError as e:
+            logger.warning(msg=f"Keeping image inline, failed storing it in the blob store: {e}")
+            return data
+        return {**data, "image_id": image_id, "image_encoded": ""}
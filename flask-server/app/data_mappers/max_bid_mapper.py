@@ -0,0 +1,45 @@
+from pymysql import cursors
+
+from ..database import get_db
+from ..entities import MaxBid
+
+
+class MaxBidMapper:
+    @staticmethod
+    def get_max_bid(listing_id: int, user_id: int, db_session=None):
+        """
+        Retrieve a user's maximum bid on an auction.
+
+        Args:
+            listing_id (int): The ID of the auctioned listing.
+            user_id (int): The ID of the user.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: Maximum bid details if found, otherwise None.
+        """
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute("SELECT * FROM max_bids WHERE listing_id = %s AND user_id = %s", (listing_id, user_id))
+        max_bid = cursor.fetchone()
+        return MaxBid.from_row({**max_bid, "amount": float(max_bid.get("amount"))}).to_dict() if max_bid else None
+
+
+    @staticmethod
+    def get_competing_max_bids(cursor, listing_id: int, price: float):
+        """
+        Retrieve the maximum bids on an auction that beat a price, in registration order.
+
+        Args:
+            cursor: Cursor of the transaction holding the listing's row lock.
+            listing_id (int): The ID of the auctioned listing.
+            price (float): The price to beat; lower maximums cannot change the auction.
+
+        Returns:
+            list[tuple]: (user_id, amount) maximum bids.
+        """
+        cursor.execute(
+            "SELECT user_id, amount FROM max_bids WHERE listing_id = %s AND amount > %s ORDER BY created_at, max_bid_id",
+            (listing_id, price)
+        )
+        return [(row.get("user_id"), float(row.get("amount"))) for row in cursor.fetchall()]
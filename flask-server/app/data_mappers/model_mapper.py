@@ -20,7 +20,7 @@ class ModelMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM models")
         models = cursor.fetchall()
-        return [Model(**model).to_dict() for model in models]
+        return [Model.from_row(model).to_dict() for model in models]
 
 
     @staticmethod
@@ -39,7 +39,7 @@ class ModelMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM models WHERE listing_id = %s", (listing_id,))
         model = cursor.fetchone()
-        return Model(**model).to_dict() if model else None
+        return Model.from_row(model).to_dict() if model else None
 
 
     @staticmethod
@@ -58,4 +58,4 @@ class ModelMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM models WHERE model_id = %s", (model_id,))
         model = cursor.fetchone()
-        return Model(**model).to_dict() if model else None
\ No newline at end of file
+        return Model.from_row(model).to_dict() if model else None
\ No newline at end of file
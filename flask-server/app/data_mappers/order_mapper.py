@@ -7,22 +7,28 @@ from ..entities import Order, OrderItem
 
 class OrderMapper:
     @staticmethod
-    def get_all_orders(user_id: int, db_session=None):
+    def get_all_orders(user_id: int, fields: str | None = None, db_session=None):
         """
         Retrieve all orders from the database.
 
         Args:
             user_id (int): The unique identifier of the user.
+            fields (str | None): Comma-separated fields to select (order_id is always selected),
+                or None for every field.
             db_session: Optional database session to be used in tests.
 
         Returns:
             list: A list of order dictionaries.
+
+        Raises:
+            ValueError: If a field is unknown.
         """
+        fields = Order.parse_fields(fields=fields, required=("order_id",))
         db = db_session or get_db()
         cursor = db.cursor(cursors.DictCursor) # type: ignore
-        cursor.execute("SELECT * FROM orders WHERE user_id = %s", (user_id,))
+        cursor.execute(f"SELECT {Order.select_columns(fields)} FROM orders WHERE user_id = %s", (user_id,))
         orders = cursor.fetchall()
-        return [Order(**order).to_dict() for order in orders]
+        return [Order.from_row(order).to_partial_dict(fields) for order in orders]
 
 
     @staticmethod
@@ -41,7 +47,7 @@ class OrderMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM orders WHERE order_id = %s", (order_id,))
         order = cursor.fetchone()
-        return Order(**order).to_dict() if order else None
+        return Order.from_row(order).to_dict() if order else None
 
 
     @staticmethod
@@ -74,6 +80,36 @@ class OrderMapper:
         return cursor.lastrowid
 
 
+    @staticmethod
+    def create_orders(orders: list, db_session=None):
+        """
+        Create orders for several users with a single multi-row INSERT.
+
+        Args:
+            orders (list[dict]): Order details, with distinct `user_id`s; they are all dated now.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict[int, int]: The IDs of the newly created orders, by user ID.
+        """
+        if not orders:
+            return {}
+        now = datetime.now()
+        orders = [Order(**{**order, "order_date": now, "created_at": now, "updated_at": now}).to_dict() for order in orders]
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor)  # type: ignore
+        statement = f"""
+            INSERT INTO orders 
+            (user_id, order_date, status, created_at, updated_at) 
+            VALUES {', '.join(['(%s, %s, %s, %s, %s)'] * len(orders))}
+        """
+        cursor.execute(statement, [value for order in orders for value in tuple(order.values())[1:]])  # Exclude order_id (auto-incremented)
+        db.commit()
+
+        # A single INSERT of a known number of rows gets consecutive IDs from InnoDB, the first one
+        # being the last insert ID
+        return {order.get("user_id"): cursor.lastrowid + i for i, order in enumerate(orders)}
+
 
     @staticmethod
     def create_order_item(data: dict, db_session=None):
@@ -99,6 +135,41 @@ class OrderMapper:
         return cursor.lastrowid
 
 
+    @staticmethod
+    def create_order_items(items: list, db_session=None):
+        """
+        Create the items of an order with a single multi-row INSERT.
+
+        Args:
+            items (list[dict]): Order item details, with distinct `listing_id`s per order.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            list[int]: The IDs of the newly created order items, in the order of `items`.
+        """
+        if not items:
+            return []
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        statement = """
+            INSERT INTO order_items 
+            (order_id, listing_id, quantity, price, total_price, created_at, updated_at) 
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """
+        cursor.executemany(statement, [tuple(OrderItem(**item).to_dict().values())[1:] for item in items]) # Exclude order_item_id (auto-incremented)
+        db.commit()
+
+        # IDs generated by a multi-row insert are not guaranteed to be consecutive, read them back
+        order_ids = list(dict.fromkeys(item.get("order_id") for item in items))
+        cursor.execute(
+            f"SELECT order_item_id, order_id, listing_id FROM order_items WHERE order_id IN ({', '.join(['%s'] * len(order_ids))})",
+            order_ids
+        )
+        order_item_ids = {(row.get("order_id"), row.get("listing_id")): row.get("order_item_id") for row in cursor.fetchall()}
+        keys = [(item.get("order_id"), item.get("listing_id")) for item in items]
+        return [order_item_ids[key] for key in keys if key in order_item_ids]
+
+
     @staticmethod
     def update_order(order_id: int, data: dict, db_session=None):
         """
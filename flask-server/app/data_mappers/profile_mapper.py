@@ -22,7 +22,7 @@ class ProfileMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM profiles WHERE user_id = %s", (user_id,))
         profile = cursor.fetchone()
-        return Profile(**profile).to_dict() if profile else None
+        return Profile.from_row(profile).to_dict() if profile else None
 
 
     @staticmethod
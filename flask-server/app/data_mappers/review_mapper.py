@@ -1,15 +1,111 @@
 from pymysql import cursors
 from datetime import datetime
+from functools import partial
 
-from ..database import get_db
+from ..database import get_db, on_commit
 from ..entities import Review
+from ..utils.pagination import decode_cursor, keyset_condition
+from ..utils.response_cache import response_cache, listing_tag, review_tag
+
+# Columns reviews may be sorted (and keyset paginated) by
+SORTABLE_COLUMNS = {"review_id", "stars", "created_at"}
 
 
 class ReviewMapper:
+    @staticmethod
+    def get_sort(args: dict):
+        """
+        Resolve the sort column and order requested in the query parameters.
+
+        Args:
+            args (dict): Dictionary of query parameters.
+
+        Returns:
+            tuple[str, str]: A whitelisted sort column (defaults to review_id) and "ASC" or "DESC".
+        """
+        sort = args.get("sort") if args.get("sort") in SORTABLE_COLUMNS else "review_id"
+        order = "DESC" if str(args.get("order", "")).lower() == "desc" else "ASC"
+        return sort, order
+
+
+    @staticmethod
+    def get_filters(args: dict):
+        """
+        Build the conditions of the column filters requested in the query parameters.
+
+        Args:
+            args (dict): Dictionary of query parameters.
+
+        Returns:
+            tuple[list[str], list]: The conditions and their values.
+        """
+        conditions = []
+        values = []
+        if "listing_id" in args:
+            conditions.append("listing_id = %s")
+            values.append(args.get("listing_id"))
+        if "user_id" in args:
+            conditions.append("user_id = %s")
+            values.append(args.get("user_id"))
+        return conditions, values
+
+
+    @staticmethod
+    def get_reviews_version(args: dict, db_session=None):
+        """
+        Retrieve the version of the reviews matching the filters of a query, for conditional GETs.
+
+        Pagination is ignored, so the version changes whenever any review a page of the query can
+        show is created, updated or deleted.
+
+        Args:
+            args (dict): Dictionary of query parameters, the same as for `get_all_reviews`.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: The latest `updated_at` (or `created_at`, for reviews never updated) of the
+                reviews and their `count`.
+        """
+        conditions, values = ReviewMapper.get_filters(args=args)
+        statement = "SELECT MAX(COALESCE(updated_at, created_at)) AS updated_at, COUNT(*) AS count FROM reviews"
+        if conditions:
+            statement += " WHERE " + " AND ".join(conditions)
+
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute(statement, values)
+        return cursor.fetchone()
+
+
+    @staticmethod
+    def get_review_version(review_id: int, db_session=None):
+        """
+        Retrieve when a review was last updated (or created), for conditional GETs.
+
+        Args:
+            review_id (int): The ID of the review.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            datetime: The `updated_at` (or `created_at`) of the review, or None if it does not exist.
+        """
+        db = db_session or get_db()
+        cursor = db.cursor(cursors.DictCursor) # type: ignore
+        cursor.execute("SELECT COALESCE(updated_at, created_at) AS updated_at FROM reviews WHERE review_id = %s", (review_id,))
+        review = cursor.fetchone()
+        return review.get("updated_at") if review else None
+
+
     @staticmethod
     def get_all_reviews(args: dict, db_session=None):
         """
-        Retrieve all reviews with optional filtering
+        Retrieve all reviews with optional filtering, sorting, and pagination.
+
+        Pages are selected either with an opaque `cursor` (keyset pagination on the sort column
+        plus review_id) or, for backward compatibility, with `start` as an OFFSET.
+
+        With `fields`, only those columns are selected, plus review_id and the sort column the next
+        page's cursor is built from.
 
         Args:
             args (dict): Dictionary of query parameters.
@@ -17,32 +113,45 @@ class ReviewMapper:
 
         Returns:
             list: A list of review dictionaries matching the query conditions.
+
+        Raises:
+            ValueError: If the cursor is malformed or was issued for another sort column, or a field
+                is unknown.
         """
-        db = db_session or get_db()
+        sort, order = ReviewMapper.get_sort(args=args)
+        fields = Review.parse_fields(fields=args.get("fields"), required=("review_id", sort))
+
+        db = db_session or get_db(read_only=True)
         cursor = db.cursor(cursors.DictCursor) # type: ignore
-        statement = "SELECT * FROM reviews"
-        values = []
+        statement = f"SELECT {Review.select_columns(fields)} FROM reviews"
 
         # Add conditions
-        if "listing_id" in args:
-            statement += " WHERE listing_id = %s"
-            values.append(args.get("listing_id"))
-        if "user_id" in args:
-            statement += " WHERE user_id = %s"
-            values.append(args.get("user_id"))
+        conditions, values = ReviewMapper.get_filters(args=args)
+
+        # Add keyset pagination
+        if "cursor" in args:
+            value, last_id = decode_cursor(token=args.get("cursor"), sort=sort)
+            condition, condition_values = keyset_condition(sort=sort, id_column="review_id", order=order, value=value, row_id=last_id)
+            conditions.append(condition)
+            values.extend(condition_values)
 
-        # Add sorting
-        if "sort" in args and "order" in args:
-            statement += f" ORDER BY {args['sort']} {args['order'].upper()}"
+        if conditions:
+            statement += " WHERE " + " AND ".join(conditions)
+
+        # Add sorting, with review_id as a tie-breaker so pages are stable
+        statement += f" ORDER BY {sort} {order}" if sort == "review_id" else f" ORDER BY {sort} {order}, review_id {order}"
 
         # Add start and range
-        if "start" in args and "range" in args:
+        if "cursor" in args and "range" in args:
+            statement += " LIMIT %s"
+            values.append(int(args.get("range")))
+        elif "start" in args and "range" in args:
             statement += " LIMIT %s OFFSET %s"
             values.extend([int(args.get("range")), int(args.get("start"))])
 
         cursor.execute(statement, values)
         reviews = cursor.fetchall()
-        return [Review(**review).to_dict() for review in reviews]
+        return [Review.from_row(review).to_partial_dict(fields) for review in reviews]
 
 
     @staticmethod
@@ -57,11 +166,11 @@ class ReviewMapper:
         Returns:
             dict: Review details if found, otherwise None.
         """
-        db = db_session or get_db()
+        db = db_session or get_db(read_only=True)
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM reviews WHERE review_id = %s", (review_id,))
         review = cursor.fetchone()
-        return Review(**review).to_dict() if review else None
+        return Review.from_row(review).to_dict() if review else None
 
 
     @staticmethod
@@ -95,6 +204,7 @@ class ReviewMapper:
         ]
         cursor.execute(statement, values)
         db.commit()
+        on_commit(partial(response_cache.invalidate, "reviews", listing_tag(data.get("listing_id"))))
         return cursor.lastrowid
 
 
@@ -128,6 +238,8 @@ class ReviewMapper:
         statement = f"UPDATE reviews SET {set_clause}, updated_at = %s WHERE review_id = %s"
         cursor.execute(statement, values)
         db.commit()
+        if cursor.rowcount:
+            on_commit(partial(response_cache.invalidate, review_tag(review_id)))
         return cursor.rowcount
 
 
@@ -147,4 +259,6 @@ class ReviewMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("DELETE FROM reviews WHERE review_id = %s", (review_id,))
         db.commit()
+        if cursor.rowcount:
+            on_commit(partial(response_cache.invalidate, review_tag(review_id)))
         return cursor.rowcount
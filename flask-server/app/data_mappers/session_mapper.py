@@ -21,7 +21,7 @@ class SessionMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM sessions")
         sessions = cursor.fetchall()
-        return [Session(**session).to_dict() for session in sessions]
+        return [Session.from_row(session).to_dict() for session in sessions]
 
 
     @staticmethod
@@ -40,7 +40,7 @@ class SessionMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM sessions WHERE session_id = %s", (session_id,))
         session = cursor.fetchone()
-        return Session(**session).to_dict() if session else None
+        return Session.from_row(session).to_dict() if session else None
 
 
     @staticmethod
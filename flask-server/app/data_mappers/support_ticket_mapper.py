@@ -22,7 +22,7 @@ class SupportTicketMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM support_tickets WHERE user_id = %s ORDER BY updated_at DESC", (user_id,))
         tickets = cursor.fetchall()
-        return [SupportTicket(**ticket).to_dict() for ticket in tickets]
+        return [SupportTicket.from_row(ticket).to_dict() for ticket in tickets]
 
 
     @staticmethod
@@ -41,7 +41,7 @@ class SupportTicketMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM support_tickets WHERE assigned_to = %s ORDER BY updated_at DESC", (staff_id,))
         tickets = cursor.fetchall()
-        return [SupportTicket(**ticket).to_dict() for ticket in tickets]
+        return [SupportTicket.from_row(ticket).to_dict() for ticket in tickets]
 
 
     @staticmethod
@@ -60,7 +60,7 @@ class SupportTicketMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM support_tickets WHERE ticket_id = %s", (ticket_id,))
         ticket = cursor.fetchone()
-        return SupportTicket(**ticket).to_dict() if ticket else None
+        return SupportTicket.from_row(ticket).to_dict() if ticket else None
 
 
     @staticmethod
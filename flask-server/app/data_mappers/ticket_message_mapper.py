@@ -21,7 +21,7 @@ class TicketMessageMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM ticket_messages WHERE ticket_id = %s ORDER BY sent_at ASC", (ticket_id,))
         messages = cursor.fetchall()
-        return [TicketMessage(**message).to_dict() for message in messages]
+        return [TicketMessage.from_row(message).to_dict() for message in messages]
 
 
     @staticmethod
@@ -22,7 +22,7 @@ class TransactionMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM transactions WHERE user_id = %s ORDER BY created_at DESC", (user_id,))
         transactions = cursor.fetchall()
-        return [Transaction(**transaction).to_dict() for transaction in transactions]
+        return [Transaction.from_row(transaction).to_dict() for transaction in transactions]
 
 
     @staticmethod
@@ -41,7 +41,7 @@ class TransactionMapper:
         cursor = db.cursor(cursors.DictCursor) # type: ignore
         cursor.execute("SELECT * FROM transactions WHERE transaction_id = %s", (transaction_id,))
         transaction = cursor.fetchone()
-        return Transaction(**transaction).to_dict() if transaction else None
+        return Transaction.from_row(transaction).to_dict() if transaction else None
 
     @staticmethod
     def create_transaction(data: dict, db_session=None):
@@ -1,2 +1,5 @@
 from .backup import backup_db, recover_db
-from .connection import get_db
\ No newline at end of file
+from .connection import get_db, checkout, unit_of_work, on_commit, pool, router
+from .pool import ConnectionPool, PooledConnection, PoolTimeoutError
+from .router import ReplicaRouter
+from .unit_of_work import UnitOfWork, current_unit_of_work, init_unit_of_work
@@ -1,50 +1,172 @@
-from mysql.connector import Error
+from pymysql.err import OperationalError
 from dotenv import load_dotenv
 import os, pymysql
 
-from ..utils.mysql import mysql
+from functools import partial
+
 from ..utils.logger import setup_logger
 from .backup import recover_db
+from .pool import ConnectionPool, PoolTimeoutError
+from .router import ReplicaRouter
+from .unit_of_work import UnitOfWork, current_unit_of_work
 
 load_dotenv()
 
 logger = setup_logger(name="database_logger", log_file="logs/database.log")
 
 
-def get_db():
+def connect(host: str | None = None, port: int | None = None):
     """
-    Establishes a connection to the MySQL database. If the database is missing (Error 1049),
-    it attempts to recover it from the latest backup file.
+    Open a new physical connection to the MySQL database using the credentials from environment variables.
 
-    The function first tries to connect to the MySQL database using the credentials and database
-    name from environment variables. If the database is not found (Error 1049: "Unknown database"),
-    it invokes the `recover_db` function to restore the database from the most recent backup. After
-    recovery, it retries the connection and returns the connection object.
+    Args:
+        host (str, optional): Host to connect to instead of `DB_HOST`, e.g. a read replica.
+        port (int, optional): Port to connect to instead of the default MySQL port.
 
     Returns:
-        pymysql.connections.Connection: A connection object to the MySQL database if successful.
-        None: If the connection attempt fails due to an error other than "Unknown database".
+        pymysql.connections.Connection: A new connection object.
+    """
+    conn = pymysql.connect(
+        host=host or os.getenv("DB_HOST"),
+        port=port or 3306,
+        user=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        database=os.getenv("DB")
+    )
+    logger.info(msg=f"Database: {os.getenv('DB')} on {host or os.getenv('DB_HOST')} successfully connected")
+    return conn
+
+
+def create_pool(factory):
+    """
+    Create a connection pool configured from the `DB_POOL_*` environment variables.
+
+    Args:
+        factory (callable): Zero-argument callable returning a new connection.
+
+    Returns:
+        ConnectionPool: The configured pool.
+    """
+    return ConnectionPool(
+        factory=factory,
+        min_size=int(os.getenv("DB_POOL_MIN_SIZE", 2)),
+        max_size=int(os.getenv("DB_POOL_MAX_SIZE", 20)),
+        idle_timeout=float(os.getenv("DB_POOL_IDLE_TIMEOUT", 300)),
+        max_lifetime=float(os.getenv("DB_POOL_MAX_LIFETIME", 3600)),
+        ping_interval=float(os.getenv("DB_POOL_PING_INTERVAL", 5)),
+        timeout=float(os.getenv("DB_POOL_TIMEOUT", 10))
+    )
+
+
+def create_replica_pools():
+    """
+    Create one connection pool per read replica listed in `DB_REPLICA_HOSTS` ("host[:port],...").
 
-    Raises:
-        Error: If there is a MySQL connection error other than "Unknown database".
+    Returns:
+        list[ConnectionPool]: The replica pools, empty if no replicas are configured.
+    """
+    pools = []
+    for address in filter(None, (a.strip() for a in os.getenv("DB_REPLICA_HOSTS", "").split(","))):
+        host, _, port = address.partition(":")
+        pools.append(create_pool(factory=partial(connect, host=host, port=int(port) if port else None)))
+    return pools
+
+
+# Shared pool used by every mapper through `get_db()`
+pool = create_pool(factory=connect)
+
+
+def get_db(read_only: bool = False):
+    """
+    Returns the connection mappers should use for the current context.
+
+    Inside a unit of work (every Flask request, or an explicit `with unit_of_work():` block) all
+    mappers share that unit of work's connection and their commits are deferred until it completes.
+    Otherwise a connection is checked out of the shared pool.
+
+    Read-only callers may be routed to a read replica instead. They stay on the primary once the
+    current unit of work has written something, so a request always reads its own writes.
+
+    Args:
+        read_only (bool): Whether the caller only reads data that may be slightly stale.
+
+    Returns:
+        UnitOfWorkConnection | PooledConnection: A connection to the MySQL database if successful.
+        None: If no connection could be established.
+    """
+    uow = current_unit_of_work()
+    if read_only and router.replicas and (uow is None or not uow.dirty):
+        return router.checkout_read()
+    if uow is not None:
+        return uow.connection
+    return checkout()
+
+
+def unit_of_work():
+    """
+    Return the active unit of work, or a new one if none is active.
+
+    Returns:
+        UnitOfWork: A unit of work to be used as a context manager.
+    """
+    return current_unit_of_work() or UnitOfWork(connection_factory=checkout)
+
+
+def on_commit(callback):
+    """
+    Run a callback once the current writes are committed.
+
+    Inside a unit of work the callback is deferred until its transaction commits and dropped if it
+    rolls back. Outside of one, mappers commit immediately, so the callback runs right away.
+
+    Args:
+        callback (callable): Zero-argument callable.
+    """
+    uow = current_unit_of_work()
+    if uow is not None:
+        uow.on_commit(callback)
+    else:
+        callback()
+
+
+def checkout():
+    """
+    Checks a connection out of the shared connection pool. If the database is missing (Error 1049),
+    it attempts to recover it from the latest backup file.
+
+    Connections are reused across calls instead of paying a TCP and authentication handshake per
+    mapper call. The returned proxy behaves like a pymysql connection and is handed back to the pool
+    when it is closed or goes out of scope, so callers do not need to release it explicitly. If the
+    database is not found (Error 1049: "Unknown database"), it invokes the `recover_db` function to
+    restore the database from the most recent backup and retries the checkout.
+
+    Returns:
+        PooledConnection: A pooled connection to the MySQL database if successful.
+        None: If the connection attempt fails due to an error other than "Unknown database",
+            or if the pool stays exhausted for longer than `DB_POOL_TIMEOUT`.
     """
     try:
-        conn = pymysql.connect(
-            host=os.getenv("DB_HOST"),
-            user=os.getenv("DB_USER"),
-            password=os.getenv("DB_PASSWORD"),
-            database=os.getenv("DB")
-        )
-        logger.info(msg=f"Database: {os.getenv('DB')} successfully connected")
-        return conn
-
-    except Error as e:
-        if e.errno == 1049:  # Error code for "Unknown database"
+        return pool.acquire()
+
+    except OperationalError as e:
+        if e.args and e.args[0] == 1049:  # Error code for "Unknown database"
             recover_db()  # Recover the database from backup
-            conn = mysql.connect()
-            conn.cursor().execute(f"USE {os.getenv('DB')}")  # Retry selecting the database
+            conn = pool.acquire()  # Retry now that the database exists
             logger.info(msg=f"Database: {os.getenv('DB')} successfully connected after backup recovery")
             return conn
         else:
             logger.critical(msg=f"MySQL Connection Error: {e}")
             return None
+
+    except PoolTimeoutError as e:
+        logger.critical(msg=f"MySQL Connection Pool Exhausted: {e}")
+        return None
+
+
+# Routes read-only mapper calls to the replicas in `DB_REPLICA_HOSTS`
+router = ReplicaRouter(
+    primary=checkout,
+    replicas=create_replica_pools(),
+    max_lag=float(os.getenv("DB_REPLICA_MAX_LAG", 5)),
+    lag_check_interval=float(os.getenv("DB_REPLICA_LAG_CHECK_INTERVAL", 5))
+)
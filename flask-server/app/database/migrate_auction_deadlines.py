@@ -0,0 +1,49 @@
+from ..utils.logger import setup_logger
+from .connection import connect
+
+logger = setup_logger(name="database_logger", log_file="logs/database.log")
+
+
+def ensure_auction_deadlines_table(conn):
+    """
+    Create the `auction_deadlines` table read by the auction scheduler, if it does not exist yet,
+    and schedule the end of every active auction and the activation of every draft that has none.
+
+    Args:
+        conn: An open database connection.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS auction_deadlines (
+            kind VARCHAR(16) NOT NULL,
+            listing_id INT NOT NULL,
+            due_at DATETIME NOT NULL,
+            updated_at DATETIME NOT NULL,
+            PRIMARY KEY (kind, listing_id),
+            KEY auction_deadlines_updated_at (updated_at),
+            FOREIGN KEY (listing_id) REFERENCES listings (listing_id) ON DELETE CASCADE
+        )
+    """)
+    cursor.execute("""
+        INSERT IGNORE INTO auction_deadlines (kind, listing_id, due_at, updated_at)
+        SELECT 'end', listing_id, auction_end, NOW() FROM listings
+        WHERE listing_type = 'auction' AND status = 'active' AND auction_end IS NOT NULL
+    """)
+    ends = cursor.rowcount
+    cursor.execute("""
+        INSERT IGNORE INTO auction_deadlines (kind, listing_id, due_at, updated_at)
+        SELECT 'activate', listing_id, auction_start, NOW() FROM listings
+        WHERE status = 'draft' AND auction_start IS NOT NULL
+    """)
+    conn.commit()
+    logger.info(msg=f"Ensured table auction_deadlines, scheduled {ends} auction ends and {cursor.rowcount} activations")
+    cursor.close()
+
+
+if __name__ == "__main__":
+    connection = connect()
+    try:
+        ensure_auction_deadlines_table(connection)
+    finally:
+        connection.close()
+    print("Table auction_deadlines is ready")
@@ -0,0 +1,93 @@
+from pymysql import cursors
+
+from ..utils.blob_store import blob_store
+from ..utils.logger import setup_logger
+from .connection import connect
+
+logger = setup_logger(name="database_logger", log_file="logs/database.log")
+
+
+def ensure_image_id_column(conn):
+    """
+    Add the `listings.image_id` column if it does not exist yet.
+
+    Args:
+        conn: An open database connection.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT COUNT(*) FROM information_schema.columns
+        WHERE table_schema = DATABASE() AND table_name = 'listings' AND column_name = 'image_id'
+    """)
+    if not cursor.fetchone()[0]:
+        cursor.execute("ALTER TABLE listings ADD COLUMN image_id CHAR(64) NULL")
+        conn.commit()
+        logger.info(msg="Added column listings.image_id")
+    cursor.close()
+
+
+def migrate_listing_images(batch_size: int = 100):
+    """
+    Move every inline `listings.image_encoded` image into the blob store.
+
+    This function performs the following tasks:
+    1. Adds the `image_id` column to `listings` if needed.
+    2. Streams listings that still have an inline image with an unbuffered cursor, so rows are
+       never all held in memory at once.
+    3. Stores each image (deduplicated by content hash) with its thumbnails in the blob store.
+    4. Sets `image_id` and empties `image_encoded`, committing every `batch_size` rows so the
+       migration can be interrupted and resumed.
+
+    Rows whose image cannot be decoded are left untouched and logged.
+
+    Args:
+        batch_size (int): Number of listings updated per commit.
+
+    Returns:
+        tuple[int, int]: Number of listings migrated and number of listings skipped.
+    """
+    reader, writer = connect(), connect()
+    migrated, skipped, batch = 0, 0, []
+
+    try:
+        ensure_image_id_column(writer)
+
+        stream = reader.cursor(cursors.SSDictCursor)  # type: ignore
+        stream.execute("""
+            SELECT listing_id, image_encoded FROM listings
+            WHERE image_id IS NULL AND image_encoded IS NOT NULL AND image_encoded <> ''
+        """)
+        update = writer.cursor()
+
+        for row in stream:
+            try:
+                image_id = blob_store.put_base64(encoded=row.get("image_encoded"))
+            except ValueError as e:
+                skipped += 1
+                logger.warning(msg=f"Skipping image of listing: {row.get('listing_id')}: {e}")
+                continue
+
+            batch.append((image_id, row.get("listing_id")))
+            if len(batch) >= batch_size:
+                update.executemany("UPDATE listings SET image_id = %s, image_encoded = '' WHERE listing_id = %s", batch)
+                writer.commit()
+                migrated += len(batch)
+                batch.clear()
+                logger.info(msg=f"Migrated images of {migrated} listings")
+
+        if batch:
+            update.executemany("UPDATE listings SET image_id = %s, image_encoded = '' WHERE listing_id = %s", batch)
+            writer.commit()
+            migrated += len(batch)
+
+        stream.close()
+        logger.info(msg=f"Listing image migration finished: {migrated} migrated, {skipped} skipped")
+        return migrated, skipped
+
+    finally:
+        reader.close()
+        writer.close()
+
+
+if __name__ == "__main__":
+    print("Migrated %d listing images, skipped %d" % migrate_listing_images())
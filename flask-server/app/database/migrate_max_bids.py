@@ -0,0 +1,40 @@
+from ..utils.logger import setup_logger
+from .connection import connect
+
+logger = setup_logger(name="database_logger", log_file="logs/database.log")
+
+
+def ensure_max_bids_table(conn):
+    """
+    Create the `max_bids` table, holding each user's maximum (proxy) bid per auction, if it does not exist yet.
+
+    Args:
+        conn: An open database connection.
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS max_bids (
+            max_bid_id INT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+            listing_id INT NOT NULL,
+            user_id INT NOT NULL,
+            amount DECIMAL(10, 2) NOT NULL,
+            created_at DATETIME NOT NULL,
+            updated_at DATETIME NOT NULL,
+            UNIQUE KEY max_bids_listing_user (listing_id, user_id),
+            KEY max_bids_listing_amount (listing_id, amount),
+            FOREIGN KEY (listing_id) REFERENCES listings (listing_id) ON DELETE CASCADE,
+            FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE
+        )
+    """)
+    conn.commit()
+    cursor.close()
+    logger.info(msg="Ensured table max_bids")
+
+
+if __name__ == "__main__":
+    connection = connect()
+    try:
+        ensure_max_bids_table(connection)
+    finally:
+        connection.close()
+    print("Table max_bids is ready")
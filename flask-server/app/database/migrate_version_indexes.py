@@ -0,0 +1,49 @@
+from ..utils.logger import setup_logger
+from .connection import connect
+
+logger = setup_logger(name="database_logger", log_file="logs/database.log")
+
+# Indexes covering the version queries of conditional GETs, by table: (name, columns)
+VERSION_INDEXES = {
+    "listings": (
+        ("listings_status_updated_at", "status, updated_at"),
+        ("listings_category_status_updated_at", "category_id, status, updated_at"),
+    ),
+    "reviews": (
+        ("reviews_listing_updated_at", "listing_id, updated_at, created_at"),
+    ),
+}
+
+
+def ensure_version_indexes(conn):
+    """
+    Create the indexes the `MAX(updated_at)` and `COUNT(*)` of the listing and review versions are
+    read from, if they do not exist yet, so they are answered from an index instead of a table scan.
+
+    Args:
+        conn: An open database connection.
+    """
+    cursor = conn.cursor()
+    created = []
+    for table, indexes in VERSION_INDEXES.items():
+        for name, columns in indexes:
+            cursor.execute(
+                "SELECT 1 FROM information_schema.statistics WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s LIMIT 1",
+                (table, name)
+            )
+            if cursor.fetchone():
+                continue
+            cursor.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+            created.append(name)
+    conn.commit()
+    cursor.close()
+    logger.info(msg=f"Ensured version indexes, created: {created}")
+
+
+if __name__ == "__main__":
+    connection = connect()
+    try:
+        ensure_version_indexes(connection)
+    finally:
+        connection.close()
+    print("Version indexes are ready")
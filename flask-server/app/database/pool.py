@@ -0,0 +1,280 @@
+from collections import deque
+from pymysql.constants import SERVER_STATUS
+import os, threading, time, weakref
+
+from ..utils.logger import setup_logger
+
+logger = setup_logger(name="database_logger", log_file="logs/database.log")
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection becomes available before the checkout timeout expires."""
+
+
+class _PoolEntry:
+    """
+    Bookkeeping for a single physical connection owned by the pool.
+
+    Attributes:
+        conn: The underlying pymysql connection.
+        created_at (float): Monotonic timestamp of when the connection was opened.
+        last_used (float): Monotonic timestamp of when the connection was last returned to the pool.
+    """
+    __slots__ = ("conn", "created_at", "last_used")
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class PooledConnection:
+    """
+    Proxy around a pooled connection that behaves like a pymysql connection.
+
+    The connection is handed back to the pool when `close()` is called, when used as a context
+    manager, or when the proxy is garbage collected. The latter keeps existing call sites that
+    never close their connection (e.g. `db = db_session or get_db()`) from leaking it.
+    """
+    def __init__(self, pool, entry: _PoolEntry):
+        self._conn = entry.conn
+        self._finalizer = weakref.finalize(self, pool.release_entry, entry)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def raw(self):
+        """The underlying pymysql connection."""
+        return self._conn
+
+    @property
+    def released(self):
+        """Whether the connection has already been returned to the pool."""
+        return not self._finalizer.alive
+
+    def close(self):
+        """Return the connection to the pool instead of closing the socket."""
+        self._finalizer()
+
+
+class ConnectionPool:
+    """
+    Bounded pool of database connections.
+
+    The pool is safe to share between threads and, since `app/__init__.py` runs
+    `gevent.monkey.patch_all()` before anything else is imported, between greenlets as well:
+    the `threading` primitives used here are cooperative once patched, and no lock is held
+    while the pool is doing network I/O (connecting, pinging or closing).
+
+    Args:
+        factory (callable): Zero-argument callable returning a new DB-API connection.
+        min_size (int): Number of idle connections kept open regardless of the idle timeout.
+        max_size (int): Maximum number of open connections (idle and checked out).
+        idle_timeout (float): Seconds after which an idle connection above `min_size` is closed.
+        max_lifetime (float): Seconds after which a connection is recycled, 0 to disable.
+        ping_interval (float): Connections idle for longer than this are pinged on checkout.
+        timeout (float): Seconds to wait for a free connection before raising `PoolTimeoutError`.
+    """
+    def __init__(
+            self,
+            factory,
+            min_size: int = 1,
+            max_size: int = 10,
+            idle_timeout: float = 300,
+            max_lifetime: float = 3600,
+            ping_interval: float = 5,
+            timeout: float = 10
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool bounds: min_size={min_size}, max_size={max_size}")
+
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.ping_interval = ping_interval
+        self.timeout = timeout
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # Most recently used on the right
+        self._size = 0
+        self._pid = os.getpid()
+
+    @property
+    def size(self):
+        """Number of open connections, idle and checked out."""
+        return self._size
+
+    @property
+    def idle(self):
+        """Number of idle connections."""
+        return len(self._idle)
+
+    def acquire(self, timeout: float | None = None):
+        """
+        Check a connection out of the pool, opening a new one if the pool is not full.
+
+        Args:
+            timeout (float, optional): Override of the pool's checkout timeout.
+
+        Returns:
+            PooledConnection: A live connection proxy.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for longer than the timeout.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            self._check_fork()
+            entry, stale = None, []
+            with self._cond:
+                while entry is None:
+                    now = time.monotonic()
+                    while self._idle:
+                        candidate = self._idle.pop()
+                        if self._expired(candidate, now, idle=False):
+                            self._size -= 1
+                            stale.append(candidate)
+                            continue
+                        entry = candidate
+                        break
+                    if entry is not None:
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise PoolTimeoutError(f"No connection available after {timeout}s (max_size={self.max_size})")
+                    self._cond.wait(remaining)
+
+            self._close_entries(stale)
+
+            if entry is None:
+                try:
+                    entry = _PoolEntry(self.factory())
+                except Exception:
+                    self._discard_slot()
+                    raise
+                return PooledConnection(self, entry)
+
+            if time.monotonic() - entry.last_used > self.ping_interval and not self._ping(entry):
+                self._discard_slot()
+                self._close_entries([entry])
+                continue
+            return PooledConnection(self, entry)
+
+    def release_entry(self, entry: _PoolEntry):
+        """
+        Return a physical connection to the pool. Called by `PooledConnection` on close or collection.
+
+        Any transaction left open by the borrower is rolled back so the next borrower starts clean.
+        """
+        if os.getpid() != self._pid:
+            return
+
+        try:
+            if entry.conn.open and entry.conn.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+                entry.conn.rollback()
+            healthy = entry.conn.open
+        except Exception as e:
+            logger.warning(msg=f"Discarding pooled connection after failed reset: {e}")
+            healthy = False
+
+        now = time.monotonic()
+        if not healthy or self._expired(entry, now, idle=False):
+            self._discard_slot()
+            self._close_entries([entry])
+            return
+
+        entry.last_used = now
+        with self._cond:
+            self._idle.append(entry)
+            stale = self._reap_idle(now)
+            self._cond.notify()
+        self._close_entries(stale)
+
+    def warm(self):
+        """Open connections until at least `min_size` are idle."""
+        opened = []
+        try:
+            while True:
+                with self._cond:
+                    if self._size >= self.max_size or len(self._idle) + len(opened) >= self.min_size:
+                        break
+                    self._size += 1
+                try:
+                    opened.append(_PoolEntry(self.factory()))
+                except Exception:
+                    self._discard_slot()
+                    raise
+        finally:
+            with self._cond:
+                self._idle.extendleft(opened)
+                self._cond.notify(len(opened))
+
+    def close_all(self):
+        """Close every idle connection. Checked out connections are closed when released."""
+        with self._cond:
+            stale = list(self._idle)
+            self._idle.clear()
+            self._size -= len(stale)
+            self._cond.notify_all()
+        self._close_entries(stale)
+
+    def _expired(self, entry: _PoolEntry, now: float, idle: bool = True):
+        """Whether a connection is past its max lifetime or, if idle, past the idle timeout."""
+        if self.max_lifetime and now - entry.created_at > self.max_lifetime:
+            return True
+        return idle and self.idle_timeout and now - entry.last_used > self.idle_timeout and self._size > self.min_size
+
+    def _reap_idle(self, now: float):
+        """Pop idle connections above `min_size` that exceeded the idle timeout. Caller holds the lock."""
+        stale = []
+        while self._idle and self._size > self.min_size and self._expired(self._idle[0], now):
+            stale.append(self._idle.popleft())
+            self._size -= 1
+        return stale
+
+    def _discard_slot(self):
+        """Give up a reserved slot and wake one waiter."""
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _check_fork(self):
+        """Forget connections inherited from a parent process; their sockets belong to the parent."""
+        if os.getpid() != self._pid:
+            with self._cond:
+                self._idle.clear()
+                self._size = 0
+                self._pid = os.getpid()
+
+    @staticmethod
+    def _ping(entry: _PoolEntry):
+        """Check that a connection is still alive."""
+        try:
+            entry.conn.ping(reconnect=False)
+            return True
+        except Exception as e:
+            logger.warning(msg=f"Pooled connection failed liveness ping: {e}")
+            return False
+
+    @staticmethod
+    def _close_entries(entries):
+        """Close physical connections, ignoring errors from already broken sockets."""
+        for entry in entries:
+            try:
+                entry.conn.close()
+            except Exception:
+                pass
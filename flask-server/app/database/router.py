@@ -0,0 +1,126 @@
+from pymysql import cursors
+import itertools, threading, time
+
+from ..utils.logger import setup_logger
+from .pool import PoolTimeoutError
+
+logger = setup_logger(name="database_logger", log_file="logs/database.log")
+
+
+class ReplicaRouter:
+    """
+    Routes read-only checkouts to a set of read replicas, falling back to the primary.
+
+    Replicas are picked round-robin. Each replica's replication lag is sampled at most once per
+    `lag_check_interval` seconds on a connection that is being checked out anyway; a replica whose
+    lag exceeds `max_lag`, whose replication is broken, or that cannot be reached is skipped until
+    its next sample, and if no replica qualifies the read goes to the primary.
+
+    Args:
+        primary (callable): Zero-argument callable returning a primary connection.
+        replicas (list[ConnectionPool]): Pools of connections to the read replicas.
+        max_lag (float): Maximum tolerated replication lag in seconds.
+        lag_check_interval (float): Seconds between lag samples of the same replica.
+    """
+    def __init__(self, primary, replicas: list | None = None, max_lag: float = 5, lag_check_interval: float = 5):
+        self.primary = primary
+        self.replicas = list(replicas or [])
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(range(len(self.replicas))) if self.replicas else None
+        self._lag = {}  # replica index -> (sampled_at, lag in seconds or None if unhealthy)
+
+    def checkout_read(self):
+        """
+        Check out a connection suitable for a read that tolerates `max_lag` of staleness.
+
+        Returns:
+            A replica connection if a healthy one is available, otherwise a primary connection.
+        """
+        for index in self._candidates():
+            try:
+                conn = self.replicas[index].acquire(timeout=0)
+            except PoolTimeoutError:
+                continue  # Busy, not unhealthy
+            except Exception as e:
+                logger.warning(msg=f"Replica {index} unavailable, skipping: {e}")
+                self._record_lag(index, None)
+                continue
+
+            if self._lag_ok(index, conn):
+                return conn
+            conn.close()
+
+        return self.primary()
+
+    def replica_lag(self):
+        """
+        Last sampled lag per replica, for monitoring.
+
+        Returns:
+            dict: Replica index mapped to its lag in seconds, or None if it was unhealthy.
+        """
+        with self._lock:
+            return {index: lag for index, (_, lag) in self._lag.items()}
+
+    def _candidates(self):
+        """Replica indices in round-robin order, skipping those known to be lagging."""
+        if not self.replicas:
+            return []
+
+        now = time.monotonic()
+        with self._lock:
+            start = next(self._cycle)
+            order = [(start + offset) % len(self.replicas) for offset in range(len(self.replicas))]
+            return [
+                index for index in order
+                if index not in self._lag
+                or now - self._lag[index][0] > self.lag_check_interval
+                or self._healthy(self._lag[index][1])
+            ]
+
+    def _lag_ok(self, index: int, conn):
+        """Check the replica's lag, re-sampling it on `conn` if the cached sample is stale."""
+        now = time.monotonic()
+        with self._lock:
+            sample = self._lag.get(index)
+        if sample is None or now - sample[0] > self.lag_check_interval:
+            lag = self._measure_lag(index, conn)
+            self._record_lag(index, lag)
+        else:
+            lag = sample[1]
+        return self._healthy(lag)
+
+    def _healthy(self, lag):
+        return lag is not None and lag <= self.max_lag
+
+    def _record_lag(self, index: int, lag):
+        with self._lock:
+            self._lag[index] = (time.monotonic(), lag)
+
+    @staticmethod
+    def _measure_lag(index: int, conn):
+        """
+        Read the replication lag reported by the replica.
+
+        Returns:
+            float | None: Seconds behind the source, 0 for a server that is not replicating
+                (e.g. a stand-in), or None if replication is broken or the query fails.
+        """
+        try:
+            cursor = conn.cursor(cursors.DictCursor)  # type: ignore
+            cursor.execute("SHOW REPLICA STATUS")
+            status = cursor.fetchone()
+            cursor.close()
+        except Exception as e:
+            logger.warning(msg=f"Failed reading replication status of replica {index}: {e}")
+            return None
+
+        if not status:
+            return 0
+        lag = status.get("Seconds_Behind_Source", status.get("Seconds_Behind_Master"))
+        if lag is None:
+            logger.warning(msg=f"Replica {index} is not replicating")
+        return lag
@@ -0,0 +1,209 @@
+from contextvars import ContextVar
+from flask import g, has_app_context
+
+from ..utils.logger import setup_logger
+
+logger = setup_logger(name="database_logger", log_file="logs/database.log")
+
+# Unit of work opened explicitly with a `with` block outside of (or nested in) a request
+_current = ContextVar("unit_of_work", default=None)
+
+
+class UnitOfWorkConnection:
+    """
+    Connection handed to mappers while a unit of work is active.
+
+    It behaves like the underlying pooled connection, except that `commit()` only records that
+    the unit of work has pending writes and `close()` does nothing; the unit of work decides when
+    the transaction is committed or rolled back and when the connection goes back to the pool.
+    """
+    def __init__(self, unit_of_work, conn):
+        self._unit_of_work = unit_of_work
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def commit(self):
+        """Defer the commit to the end of the unit of work."""
+        self._unit_of_work.dirty = True
+
+    def rollback(self):
+        """Roll back immediately and make sure the unit of work does not commit later."""
+        self._unit_of_work.rollback_only = True
+        self._conn.rollback()
+
+    def close(self):
+        """The connection is owned by the unit of work."""
+
+
+class UnitOfWork:
+    """
+    Groups every mapper call made while it is active into a single database transaction.
+
+    All mappers calling `get_db()` receive the same connection, their individual `db.commit()`
+    calls are deferred, and the transaction is committed once when the outermost block exits,
+    or rolled back if it exits with an exception. Nested blocks join the enclosing unit of work.
+
+    Usage:
+        with unit_of_work():
+            order_id = OrderMapper.create_order(data=order_data)
+            OrderMapper.create_order_item(data={"order_id": order_id, ...})
+
+    Args:
+        connection_factory (callable): Zero-argument callable returning a pooled connection.
+
+    Attributes:
+        dirty (bool): Whether a mapper has issued a write that is waiting to be committed.
+        rollback_only (bool): Whether the transaction must be rolled back instead of committed.
+    """
+    def __init__(self, connection_factory):
+        self.connection_factory = connection_factory
+        self.dirty = False
+        self.rollback_only = False
+        self._conn = None
+        self._depth = 0
+        self._token = None
+        self._on_commit = []
+
+    @property
+    def connection(self):
+        """The connection shared by every mapper in this unit of work, checked out on first use."""
+        if self._conn is None:
+            conn = self.connection_factory()
+            if conn is None:
+                return None
+            self._conn = UnitOfWorkConnection(unit_of_work=self, conn=conn)
+        return self._conn
+
+    @property
+    def active(self):
+        """Whether the unit of work still holds (or may still check out) a connection."""
+        return self._depth > 0
+
+    def on_commit(self, callback):
+        """
+        Run a callback once the unit of work's transaction has been committed.
+
+        Callbacks are dropped if the unit of work rolls back, so in-memory state derived from
+        the database (e.g. search indexes) only ever reflects committed writes.
+
+        Args:
+            callback (callable): Zero-argument callable.
+        """
+        self._on_commit.append(callback)
+
+    def __enter__(self):
+        self._depth += 1
+        if self._depth == 1 and _current.get() is not self:
+            self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            self.rollback_only = True
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                self.complete(commit=not self.rollback_only)
+            finally:
+                if self._token is not None:
+                    _current.reset(self._token)
+                    self._token = None
+        return False
+
+    def complete(self, commit: bool = True):
+        """
+        Finish the unit of work and return its connection to the pool.
+
+        Args:
+            commit (bool): Commit pending writes if True, otherwise roll them back.
+
+        Raises:
+            Exception: Any error raised by the database while committing, after rolling back.
+        """
+        conn, self._conn = self._conn, None
+        callbacks, self._on_commit = self._on_commit, []
+        if conn is None:
+            return
+
+        raw = conn._conn
+        committed = False
+        try:
+            if commit and self.dirty and not self.rollback_only:
+                raw.commit()
+                committed = True
+            else:
+                raw.rollback()
+        except Exception as e:
+            logger.critical(msg=f"Failed completing unit of work, rolling back: {e}")
+            try:
+                raw.rollback()
+            except Exception:
+                pass
+            raise
+        finally:
+            self.dirty = False
+            self.rollback_only = False
+            raw.close()  # Return to the pool
+
+        if committed:
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(msg=f"Unit of work commit callback failed: {e}")
+
+
+def current_unit_of_work():
+    """
+    Return the active unit of work, if any.
+
+    An explicitly opened block takes precedence over the one bound to the current Flask request.
+
+    Returns:
+        UnitOfWork | None: The active unit of work.
+    """
+    uow = _current.get()
+    if uow is not None and uow.active:
+        return uow
+    if has_app_context():
+        uow = g.get("unit_of_work")
+        if uow is not None and uow.active:
+            return uow
+    return None
+
+
+def init_unit_of_work(app, connection_factory):
+    """
+    Bind a unit of work to every request handled by the application.
+
+    The transaction is committed once after the view returns a successful (< 400) response and
+    rolled back for error responses or unhandled exceptions, so a request either applies all of
+    its writes or none of them.
+
+    Args:
+        app (Flask): The application to register the request hooks on.
+        connection_factory (callable): Zero-argument callable returning a pooled connection.
+    """
+    @app.before_request
+    def begin_unit_of_work():
+        g.unit_of_work = UnitOfWork(connection_factory=connection_factory)
+        g.unit_of_work.__enter__()
+
+    @app.after_request
+    def commit_unit_of_work(response):
+        uow = g.pop("unit_of_work", None)
+        if uow is not None:
+            uow.rollback_only = uow.rollback_only or response.status_code >= 400
+            uow.__exit__(None, None, None)
+        return response
+
+    @app.teardown_request
+    def rollback_unit_of_work(exc):
+        uow = g.pop("unit_of_work", None)
+        if uow is not None and uow.active:
+            if exc is not None:
+                logger.error(msg=f"Rolling back unit of work after unhandled exception: {exc}")
+            uow.rollback_only = True
+            uow.__exit__(None, None, None)
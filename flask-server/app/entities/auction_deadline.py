@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from .entity import Entity
+
+
+class AuctionDeadline(Entity):
+    """
+    Represents a pending deadline in the lifecycle of an auction (e.g., its end).
+
+    Attributes:
+        kind (str): What happens at the deadline: the auction's "end", or the "activate" of its draft listing.
+        listing_id (int): The ID of the auctioned listing.
+        due_at (datetime): When the deadline is reached.
+        updated_at (datetime, optional): When the deadline was last scheduled.
+    """
+    __slots__ = ("kind", "listing_id", "due_at", "updated_at")
+
+    KINDS = ("end", "activate")
+
+    def __init__(
+            self,
+            kind: str,
+            listing_id: int,
+            due_at: datetime | str,
+            updated_at: datetime | None = None
+    ):
+        # Type checks for required attributes
+        if kind not in self.KINDS:
+            raise ValueError(f"kind must be one of {', '.join(self.KINDS)}, got {kind!r}")
+        if not isinstance(listing_id, int):
+            raise TypeError(f"listing_id must be a int, got {type(listing_id).__name__}")
+        if not isinstance(due_at, (datetime, str)):
+            raise TypeError(f"due_at must be a datetime, got {type(due_at).__name__}")
+
+        # Type checks for optional attributes
+        if updated_at is not None and not isinstance(updated_at, (datetime, str)):
+            raise TypeError(f"updated_at must be a datetime or None, got {type(updated_at).__name__}")
+
+        self.kind = kind
+        self.listing_id = listing_id
+        self.due_at = due_at
+        self.updated_at = updated_at or datetime.now()
+
+    def to_dict(self):
+        """Converts the auction deadline object to a dictionary representation."""
+        return {
+            "kind": self.kind,
+            "listing_id": self.listing_id,
+            "due_at": self.due_at,
+            "updated_at": self.updated_at
+        }
@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class Bid:
+
+class Bid(Entity):
     """
     Represents a bid in the system.
 
@@ -12,6 +14,8 @@ class Bid:
         amount (float): The amount of the bid.
         created_at (datetime, optional): The creation timestamp.
     """
+    __slots__ = ("bid_id", "listing_id", "user_id", "amount", "created_at")
+
     def __init__(
             self,
             listing_id: int,
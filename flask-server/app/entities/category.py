@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class Category:
+
+class Category(Entity):
     """
     Represents a category in the system.
 
@@ -13,6 +15,8 @@ class Category:
         created_at (datetime, optional): The creation timestamp.
         updated_at (datetime, optional): The last updated timestamp.
     """
+    __slots__ = ("category_id", "name", "description", "image_encoded", "created_at", "updated_at")
+
     def __init__(
             self,
             name: str,
@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class Chat:
+
+class Chat(Entity):
     """
     Represents a chat in the system.
 
@@ -12,6 +14,8 @@ class Chat:
         created_at (datetime, optional): The creation timestamp.
         updated_at (datetime, optional): The updated timestamp.
     """
+    __slots__ = ("chat_id", "user1_id", "user2_id", "created_at", "updated_at")
+
     def __init__(
             self,
             user1_id: int,
@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class ChatMessage:
+
+class ChatMessage(Entity):
     """
     Represents a chat message in the system.
 
@@ -12,6 +14,8 @@ class ChatMessage:
         message (str): The content of the message.
         sent_at (datetime, optional): The creation timestamp.
     """
+    __slots__ = ("message_id", "sender_id", "chat_id", "message", "sent_at")
+
     def __init__(
             self,
             sender_id: int,
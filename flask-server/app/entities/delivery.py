@@ -1,7 +1,9 @@
 from datetime import datetime, date
 
+from .entity import Entity
 
-class Delivery:
+
+class Delivery(Entity):
     """
     Represents a delivery record in the system.
 
@@ -21,6 +23,24 @@ class Delivery:
         created_at (datetime, optional): The creation timestamp.
         updated_at (datetime, optional): The last updated timestamp.
     """
+    VALID_DELIVERY_STATUSES = frozenset({"pending", "processing", "shipped", "in_transit", "out_for_delivery", "delivered", "cancelled", "returned", "failed"})
+    __slots__ = (
+        "delivery_id",
+        "order_item_id",
+        "user_id",
+        "address",
+        "city",
+        "state",
+        "country",
+        "delivery_status",
+        "tracking_number",
+        "courier",
+        "estimated_delivery_date",
+        "delivered_at",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
             self,
             order_item_id: int,
@@ -38,8 +58,6 @@ class Delivery:
             updated_at: datetime | None = None,
             delivery_id: int | None = None
     ):
-        self.VALID_DELIVERY_STATUSES = {"pending", "processing", "shipped", "in_transit", "out_for_delivery", "delivered", "cancelled", "returned", "failed"}
-
         # Type checks for required attributes
         if not isinstance(order_item_id, int):
             raise TypeError(f"order_id must be an int, got {type(order_item_id).__name__}")
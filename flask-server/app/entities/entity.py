@@ -0,0 +1,81 @@
+class Entity:
+    """
+    Base of the entities, held in slots instead of a per-instance dict.
+
+    Each entity's `__init__` checks every argument, for data coming from requests. Rows read back
+    from the database were checked when they were written, so mappers build them with `from_row`,
+    which skips the checks and the defaults.
+
+    The slots are also the columns a client may select with a `fields=` query parameter: mappers
+    select only those columns and return them with `to_partial_dict`.
+    """
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = cls.__slots__
+        new = object.__new__
+
+        def from_row(cls, row: dict):
+            """
+            Build an entity from a database row, trusted to be valid: nothing is checked.
+
+            Args:
+                row (dict): The row, as returned by a `DictCursor`; columns the entity does not have
+                    are ignored and those it has that are missing are set to None.
+
+            Returns:
+                The entity.
+            """
+            entity = new(cls)
+            get = row.get
+            for field in fields:
+                setattr(entity, field, get(field))
+            return entity
+
+        cls.from_row = classmethod(from_row)
+
+    @classmethod
+    def parse_fields(cls, fields: str | None, required=()):
+        """
+        Resolve the columns requested with a `fields=` query parameter, e.g. "listing_id,title_short".
+
+        Args:
+            fields (str | None): Comma-separated names of the fields, or None for every field.
+            required (iterable[str]): Fields always selected, e.g. the ID and sort column pages are
+                paginated on.
+
+        Returns:
+            tuple[str] | None: The whitelisted columns, in the order requested after the required
+                ones, or None to select every column.
+
+        Raises:
+            ValueError: If a field is not one of the entity's.
+        """
+        if fields is None:
+            return None
+        requested = [field.strip() for field in str(fields).split(",") if field.strip()]
+        unknown = [field for field in requested if field not in cls.__slots__]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return tuple(dict.fromkeys([*required, *requested]))
+
+    @staticmethod
+    def select_columns(fields):
+        """Column list of a SELECT of the fields returned by `parse_fields`."""
+        return ", ".join(fields) if fields else "*"
+
+    def to_partial_dict(self, fields):
+        """
+        Converts the fields selected of an entity built with `from_row` to a dictionary representation.
+
+        Args:
+            fields (iterable[str] | None): The fields returned by `parse_fields`; None for all of them,
+                as `to_dict`.
+
+        Returns:
+            dict: The fields and their values.
+        """
+        if fields is None:
+            return self.to_dict()
+        return {field: getattr(self, field) for field in fields}
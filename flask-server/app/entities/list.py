@@ -1,10 +1,14 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class List:
+
+class List(Entity):
     """
     Represents a list in the system.
     """
+    __slots__ = ("list_id", "user_id", "title", "created_at")
+
     def __init__(
             self,
             user_id: int,
@@ -1,10 +1,14 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class ListItem:
+
+class ListItem(Entity):
     """
     Represents a list item in the system.
     """
+    __slots__ = ("list_item_id", "list_id", "listing_id", "created_at")
+
     def __init__(
             self,
             list_id: int,
@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class Listing:
+
+class Listing(Entity):
     """
     Represents a listing in the system.
 
@@ -21,7 +23,8 @@ class Listing:
         auction_start (datetime | None): The start date and time of the auction (optional).
         auction_end (datetime | None): The end date and time of the auction (optional).
         status (str): The status of the listing ("active", "sold", "cancelled", "ended", "draft").
-        image_encoded (str): The encoded image of the item for the listing.
+        image_encoded (str): The encoded image of the item for the listing (empty once moved to the blob store).
+        image_id (str | None): The blob store ID of the listing's image (optional).
         bids (int | None): The number of bids received (for auction listings, optional).
         purchases (int | None): The number of purchases made (for "buy_now" listings, optional).
         average_review (float | None): The average review rating of the listing (optional).
@@ -29,6 +32,34 @@ class Listing:
         created_at (datetime | None): The date and time the listing was created.
         updated_at (datetime | None): The date and time the listing was last updated.
     """
+    VALID_LISTING_TYPES = frozenset({"auction", "buy_now"})
+    VALID_STATUSES = frozenset({"active", "sold", "cancelled", "ended", "draft"})
+    __slots__ = (
+        "listing_id",
+        "user_id",
+        "title",
+        "title_short",
+        "description",
+        "item_specifics",
+        "category_id",
+        "listing_type",
+        "starting_price",
+        "reserve_price",
+        "current_price",
+        "buy_now_price",
+        "auction_start",
+        "auction_end",
+        "status",
+        "image_encoded",
+        "bids",
+        "purchases",
+        "average_review",
+        "total_reviews",
+        "created_at",
+        "updated_at",
+        "image_id",
+    )
+
     def __init__(
             self,
             user_id: int,
@@ -52,11 +83,9 @@ class Listing:
             total_reviews: int | None = 0,
             created_at: datetime | None = None,
             updated_at: datetime | None = None,
-            listing_id: int | None = None
+            listing_id: int | None = None,
+            image_id: str | None = None
     ):
-        self.VALID_LISTING_TYPES = {"auction", "buy_now"}
-        self.VALID_STATUSES = {"active", "sold", "cancelled", "ended", "draft"}
-
         # Type checks for required attributes
         if not isinstance(user_id, int):
             raise TypeError(f"user_id must be an int, got {type(user_id).__name__}")
@@ -102,6 +131,8 @@ class Listing:
             raise TypeError(f"created_at must be a datetime, str, or None, got {type(created_at).__name__}")
         if updated_at is not None and not isinstance(updated_at, (datetime, str)):
             raise TypeError(f"updated_at must be a datetime, str, or None, got {type(updated_at).__name__}")
+        if image_id is not None and not isinstance(image_id, str):
+            raise TypeError(f"image_id must be a str or None, got {type(image_id).__name__}")
 
         # Value checks for enumerated attributes
         if listing_type not in self.VALID_LISTING_TYPES:
@@ -125,6 +156,7 @@ class Listing:
         self.auction_end = auction_end
         self.status = status
         self.image_encoded = image_encoded
+        self.image_id = image_id
         self.bids = bids
         self.purchases = purchases
         self.average_review = average_review
@@ -156,5 +188,6 @@ class Listing:
             "average_review": self.average_review,
             "total_reviews": self.total_reviews,
             "created_at": self.created_at,
-            "updated_at": self.updated_at
+            "updated_at": self.updated_at,
+            "image_id": self.image_id
         }
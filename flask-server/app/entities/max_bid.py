@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from .entity import Entity
+
+
+class MaxBid(Entity):
+    """
+    Represents a user's maximum (proxy) bid on an auction.
+
+    Attributes:
+        max_bid_id (int, optional): The unique identifier for the maximum bid.
+        listing_id (int): The ID of the listing that the maximum bid is for.
+        user_id (int): The ID of the user who registered the maximum bid.
+        amount (float): The most the user is willing to bid.
+        created_at (datetime, optional): The creation timestamp, which decides ties between equal maximums.
+        updated_at (datetime, optional): The timestamp of the last change of the amount.
+    """
+    __slots__ = ("max_bid_id", "listing_id", "user_id", "amount", "created_at", "updated_at")
+
+    def __init__(
+            self,
+            listing_id: int,
+            user_id: int,
+            amount: float | int,
+            created_at: datetime | None = None,
+            updated_at: datetime | None = None,
+            max_bid_id: int | None = None,
+    ):
+        # Type checks for required attributes
+        if not isinstance(listing_id, int):
+            raise TypeError(f"listing_id must be a int, got {type(listing_id).__name__}")
+        if not isinstance(user_id, int):
+            raise TypeError(f"user_id must be a int, got {type(user_id).__name__}")
+        if not isinstance(amount, (float, int)):
+            raise TypeError(f"amount must be a number, got {type(amount).__name__}")
+
+        # Type checks for optional attributes
+        if created_at is not None and not isinstance(created_at, (datetime, str)):
+            raise TypeError(f"created_at must be a datetime or None, got {type(created_at).__name__}")
+        if updated_at is not None and not isinstance(updated_at, (datetime, str)):
+            raise TypeError(f"updated_at must be a datetime or None, got {type(updated_at).__name__}")
+        if max_bid_id is not None and not isinstance(max_bid_id, int):
+            raise TypeError(f"max_bid_id must be a int or None, got {type(max_bid_id).__name__}")
+
+        self.max_bid_id = max_bid_id
+        self.listing_id = listing_id
+        self.user_id = user_id
+        self.amount = amount
+        self.created_at = created_at or datetime.now()
+        self.updated_at = updated_at or self.created_at
+
+    def to_dict(self):
+        """Converts the maximum bid object to a dictionary representation."""
+        return {
+            "max_bid_id": self.max_bid_id,
+            "listing_id": self.listing_id,
+            "user_id": self.user_id,
+            "amount": self.amount,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
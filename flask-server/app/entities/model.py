@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class Model:
+
+class Model(Entity):
     """
     Represents a 3D model in the system.
 
@@ -14,6 +16,8 @@ class Model:
         created_at (datetime, optional): The timestamp when the model was created.
         updated_at (datetime, optional): The timestamp when the model was last updated.
     """
+    __slots__ = ("model_id", "listing_id", "file_reference", "created_at", "updated_at")
+
     def __init__(
             self,
             listing_id: int,
@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class Order:
+
+class Order(Entity):
     """
     Represents an order in the system.
 
@@ -13,6 +15,9 @@ class Order:
         created_at (datetime, optional): The timestamp when the order was created. Defaults to the current time if not provided.
         updated_at (datetime, optional): The timestamp of the last update to the order. Defaults to the current time if not provided.
     """
+    VALID_STATUSES = frozenset({"pending", "processing", "shipped", "delivered", "cancelled", "returned"})
+    __slots__ = ("order_id", "user_id", "order_date", "status", "created_at", "updated_at")
+
     def __init__(
             self,
             user_id: int,
@@ -22,8 +27,6 @@ class Order:
             updated_at: datetime | None = None,
             order_id: int | None = None
     ):
-        self.VALID_STATUSES = {"pending", "processing", "shipped", "delivered", "cancelled", "returned"}
-
         # Type checks for required attributes
         if not isinstance(user_id, int):
             raise TypeError(f"user_id must be a int, got {type(user_id).__name__}")
@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class OrderItem:
+
+class OrderItem(Entity):
     """
     Represents an order in the system.
 
@@ -15,6 +17,17 @@ class OrderItem:
         created_at (datetime, optional): The timestamp when the order was created. Defaults to the current time if not provided.
         updated_at (datetime, optional): The timestamp of the last update to the order. Defaults to the current time if not provided.
     """
+    __slots__ = (
+        "order_item_id",
+        "order_id",
+        "listing_id",
+        "quantity",
+        "price",
+        "total_price",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
             self,
             order_id: int,
@@ -1,7 +1,9 @@
 from datetime import datetime, date
 
+from .entity import Entity
 
-class Profile:
+
+class Profile(Entity):
     """
     Represents a profile in the system.
 
@@ -22,6 +24,24 @@ class Profile:
         created_at (datetime, optional): The creation timestamp.
         updated_at (datetime, optional): The last updated timestamp.
     """
+    __slots__ = (
+        "profile_id",
+        "user_id",
+        "first_name",
+        "last_name",
+        "date_of_birth",
+        "phone_number",
+        "address",
+        "city",
+        "state",
+        "country",
+        "profile_picture",
+        "bio",
+        "social_links",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
             self,
             user_id: int,
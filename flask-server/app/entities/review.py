@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class Review:
+
+class Review(Entity):
     """
     Represents a review in the system.
 
@@ -15,6 +17,8 @@ class Review:
         stars (float): The rating given in the review.
         created_at (datetime, optional): The timestamp when the review was created.
     """
+    __slots__ = ("review_id", "listing_id", "user_id", "username", "title", "description", "stars", "created_at")
+
     def __init__(
             self,
             listing_id: int,
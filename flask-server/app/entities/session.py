@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class Session:
+
+class Session(Entity):
     """
     Represents a session in the system.
 
@@ -13,6 +15,8 @@ class Session:
         expires_at (datetime): The timestamp of when the session token expires.
         created_at (datetime): The creation timestamp.
     """
+    __slots__ = ("session_id", "user_id", "role", "token", "created_at", "expires_at")
+
     def __init__(
             self,
             user_id: int,
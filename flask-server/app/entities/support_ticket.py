@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class SupportTicket:
+
+class SupportTicket(Entity):
     """
     Represents a support ticket in the system.
 
@@ -15,6 +17,8 @@ class SupportTicket:
         created_at (datetime, optional): The timestamp when the ticket was created.
         updated_at (datetime, optional): The timestamp when the ticket was last updated.
     """
+    __slots__ = ("ticket_id", "user_id", "subject", "status", "priority", "assigned_to", "created_at", "updated_at")
+
     def __init__(
             self,
             user_id: int,
@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class TicketMessage:
+
+class TicketMessage(Entity):
     """
     Represents a message in a support ticket.
 
@@ -12,6 +14,8 @@ class TicketMessage:
         message (str): The content of the message.
         sent_at (datetime, optional): The timestamp when the message was sent.
     """
+    __slots__ = ("message_id", "ticket_id", "sender_id", "message", "sent_at")
+
     def __init__(
         self,
         ticket_id: int,
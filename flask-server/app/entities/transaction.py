@@ -1,7 +1,9 @@
 from datetime import datetime
 
+from .entity import Entity
 
-class Transaction:
+
+class Transaction(Entity):
     """
     Represents a transaction in the system.
 
@@ -12,6 +14,10 @@ class Transaction:
         created_at (datetime, optional): The timestamp when the transaction was created. Defaults to the current time if not provided.
         updated_at (datetime, optional): The timestamp when the transaction was last updated. Defaults to the current time if not provided.
     """
+    VALID_TRANSACTION_TYPES = frozenset({"auction", "buy_now"})
+    VALID_PAYMENT_STATUSES = frozenset({"pending", "completed", "failed", "refunded"})
+    __slots__ = ("transaction_id", "user_id", "payment_intent_id", "created_at", "updated_at")
+
     def __init__(
             self,
             user_id: int,
@@ -20,9 +26,6 @@ class Transaction:
             updated_at: datetime | None = None,
             transaction_id: int | None = None
     ):
-        self.VALID_TRANSACTION_TYPES = {"auction", "buy_now"}
-        self.VALID_PAYMENT_STATUSES = {"pending", "completed", "failed", "refunded"}
-
         # Type checks for required attributes
         if not isinstance(user_id, int):
             raise TypeError(f"user_id must be a int, got {type(user_id).__name__}")
@@ -1,7 +1,8 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request
 from flask_login import login_required, current_user
 
 from ..services import AuthService
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 # Blueprint for user login-related routes
@@ -45,7 +46,7 @@ def create_user(db_session=None):
     if not data.get("username") or not data.get("password") or not data.get("email"):
         response_data = {"error": "Username, password, and email are required"}
         logger.error(msg=f"Failed creating user with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+        return json_response(response_data, status=400)
 
     return AuthService.create_user(data=data, db_session=db_session)
 
@@ -70,7 +71,7 @@ def login(db_session=None):
     if not data.get("username") or not data.get("password"):
         response_data = {"error": "Username and password are required"}
         logger.error(msg=f"Failed logging in with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+        return json_response(response_data, status=400)
 
     return AuthService.login(data=data, db_session=db_session)
 
@@ -127,6 +128,6 @@ def password_reset(db_session=None):
     if not data.get("token") or not data.get("new_password"):
         response_data = {"error": "Token and new password are required"}
         logger.error(msg=f"Failed resetting password with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+        return json_response(response_data, status=400)
 
     return AuthService.reset_user_password(reset_token=data.get("token"), new_password=data.get("new_password"), db_session=db_session)
@@ -1,7 +1,8 @@
-from flask import Blueprint, request, jsonify, Response
-from flask_login import current_user
+from flask import Blueprint, request
+from flask_login import login_required, current_user
 
 from ..services import BidService
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 # Blueprint for bid-related routes
@@ -58,8 +59,68 @@ def create_bid(db_session=None):
     if not data.get("listing_id") or not data.get("amount"):
         response_data = {"error": "listing_id and amount are required"}
         logger.error(msg=f"Failed creating bid with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+        return json_response(response_data, status=400)
 
     data.update(user_id=current_user.id)
 
-    return BidService.create_bid(data=data, db_session=db_session)
\ No newline at end of file
+    return BidService.create_bid(data=data, db_session=db_session)
+
+@bp.route('/stats/', methods=['GET'])
+@login_required
+def get_realtime_stats():
+    """
+    Get the number of bid updates sent to watchers and suppressed by coalescing.
+
+    Returns:
+        JSON response with the realtime statistics, or an error with HTTP 401 if the user is
+        not an admin.
+    """
+    if current_user.role != "admin":
+        response_data = {"error": "Unauthorized access"}
+        logger.error(msg=f"Unauthorized access attempt to get realtime statistics by user {current_user.id}")
+        return json_response(response_data, status=401)
+
+    return BidService.get_realtime_stats()
+
+
+@bp.route('/max/<int:listing_id>', methods=['GET'])
+@login_required
+def get_max_bid(listing_id: int, db_session=None):
+    """
+    Get the current user's maximum bid on an auction.
+
+    Args:
+        listing_id (int): The ID of the auctioned listing.
+        db_session: Optional database session to be used in tests.
+
+    Returns:
+        JSON response with the maximum bid if found, or a 404 error if not found.
+    """
+    return BidService.get_max_bid(listing_id=listing_id, user_id=current_user.id, db_session=db_session)
+
+
+@bp.route('/max/', methods=['POST'])
+@login_required
+def create_max_bid(db_session=None):
+    """
+    Register or change the current user's maximum bid on an auction.
+
+    Args:
+        db_session: Optional database session to be used in tests.
+
+    Expects:
+        JSON payload containing the listing_id and the maximum amount.
+
+    Returns:
+        JSON response with the auction's resulting price and leader.
+    """
+    data = request.json
+
+    if not data.get("listing_id") or not data.get("amount"):
+        response_data = {"error": "listing_id and amount are required"}
+        logger.error(msg=f"Failed creating maximum bid with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
+        return json_response(response_data, status=400)
+
+    data.update(user_id=current_user.id)
+
+    return BidService.create_max_bid(data=data, db_session=db_session)
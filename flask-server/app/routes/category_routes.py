@@ -1,7 +1,10 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request
 from flask_login import login_required, current_user
 
 from ..services import CategoryService
+from ..utils.responses import json_response
+from ..utils.conditional import conditional
+from ..utils.response_cache import response_cache, category_tag
 from ..utils.logger import setup_logger
 
 # Blueprint for category-related routes
@@ -12,6 +15,8 @@ logger = setup_logger(name="category_logger", log_file="logs/category.log")
 
 # GET /api/categories/
 @bp.route("/", methods=["GET"])
+@conditional(validator=lambda args: CategoryService.get_categories_version())
+@response_cache.cached(tags=lambda data, args, view_args: ["categories", *(category_tag(category.get("category_id")) for category in data.get("categories", []))])
 def get_all_categories(db_session=None):
     """
     Retrieve all categories.
@@ -27,6 +32,8 @@ def get_all_categories(db_session=None):
 
 # GET /api/categories/{id}/
 @bp.route("/<int:category_id>/", methods=["GET"])
+@conditional(validator=lambda args, category_id: CategoryService.get_category_version(category_id=category_id))
+@response_cache.cached(tags=lambda data, args, view_args: [category_tag(view_args.get("category_id"))])
 def get_category(category_id: int, db_session=None):
     """
     Retrieve a single category by its ID.
@@ -60,7 +67,7 @@ def create_category(db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to create category by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     data = request.json
     return CategoryService.create_category(data=data, db_session=db_session)
@@ -86,7 +93,7 @@ def update_category(category_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to update category by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     data = request.json
     return CategoryService.update_category(category_id=category_id, data=data, db_session=db_session)
@@ -109,6 +116,6 @@ def delete_category(category_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to delete category by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
     
     return CategoryService.delete_category(category_id=category_id, db_session=db_session)
@@ -20,7 +20,8 @@ def get_chats(db_session=None):
     Returns:
         JSON response containing a list of chats.
     """
-    return ChatService.get_chats(db_session=db_session)
+    args = request.args
+    return ChatService.get_chats(args=args, db_session=db_session)
 
 
 # GET /api/user/chats/{id}/
@@ -1,7 +1,8 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request
 from flask_login import login_required, current_user
 
 from ..services import HistoryService
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 # Blueprint for history-related routes
@@ -26,6 +27,8 @@ def get_user_orders(db_session=None):
     args = None
     if current_user.role in ["staff", "admin"]:
         args = request.args.to_dict()
+    elif "fields" in request.args:
+        args = {"fields": request.args.get("fields")}
 
     return HistoryService.get_user_orders(args=args, db_session=db_session)
 
@@ -40,7 +43,7 @@ def update_user_order(order_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to update order by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     data = request.json
     return HistoryService.update_user_order(order_id=order_id, data=data, db_session=db_session)
@@ -56,7 +59,7 @@ def delete_user_order(order_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to delete order by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     return HistoryService.delete_user_order(order_id=order_id, db_session=db_session)
 
@@ -79,10 +82,29 @@ def get_user_listings(db_session=None):
         args = request.args.to_dict()
     else:
         args = {"user_id": current_user.id}
+        if "fields" in request.args:
+            args["fields"] = request.args.get("fields")
 
     return HistoryService.get_user_listings(args=args, db_session=db_session)
 
 
+# GET /api/user/listings/<int:listing_id>/
+@bp.route('/listings/<int:listing_id>/', methods=['GET'])
+@login_required
+def get_user_listing(listing_id: int, db_session=None):
+    """
+    Retrieve one of the user's listings, including drafts hidden from the public listing routes.
+
+    Args:
+        listing_id (int): The ID of the listing.
+        db_session: Optional database session to be used in tests.
+
+    Returns:
+        JSON response containing the listing.
+    """
+    return HistoryService.get_user_listing(listing_id=listing_id, db_session=db_session)
+
+
 # PUT /api/user/listings/<int:listing_id>/
 @bp.route('/listings/<int:listing_id>/', methods=['PUT'])
 @login_required
@@ -134,7 +156,7 @@ def update_user_transaction(transaction_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to update transaction by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     data = request.json
     return HistoryService.update_user_transaction(transaction_id=transaction_id, data=data, db_session=db_session)
@@ -150,7 +172,7 @@ def delete_user_transaction(transaction_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to delete transaction by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     return HistoryService.delete_user_transaction(transaction_id=transaction_id, db_session=db_session)
 
@@ -185,7 +207,7 @@ def update_user_delivery(delivery_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to update delivery by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     data = request.json
     return HistoryService.update_user_delivery(delivery_id=delivery_id, data=data, db_session=db_session)
@@ -201,7 +223,7 @@ def delete_user_delivery(delivery_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to delete delivery by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     return HistoryService.delete_user_delivery(delivery_id=delivery_id, db_session=db_session)
 
@@ -236,7 +258,7 @@ def update_user_support_ticket(ticket_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to update support ticket by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     data = request.json
     return HistoryService.update_user_support_ticket(ticket_id=ticket_id, data=data, db_session=db_session)
@@ -252,7 +274,7 @@ def delete_user_support_ticket(ticket_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to delete support ticket by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     return HistoryService.delete_user_support_ticket(ticket_id=ticket_id, db_session=db_session)
 
@@ -0,0 +1,25 @@
+from flask import Blueprint, request
+
+from ..services import ImageService
+
+# Blueprint for image-related routes
+bp = Blueprint("images_bp", __name__, url_prefix="/api/images")
+
+
+# GET /api/images/{id}/
+@bp.route("/<string:image_id>/", methods=["GET"])
+def get_image(image_id: str):
+    """
+    Serve a listing image by its content hash.
+
+    Args:
+        image_id (str): The ID of the image to retrieve.
+
+    Query Parameters:
+        size (int, optional): Serve the WebP thumbnail of at least this size instead of the original.
+
+    Returns:
+        The image file, cacheable indefinitely.
+    """
+    size = request.args.get("size", type=int)
+    return ImageService.get_image(image_id=image_id, size=size)
@@ -1,14 +1,29 @@
 from flask import Blueprint, request
-from flask_login import login_required
+from flask_login import login_required, current_user
 
 from ..services import ListingService
+from ..utils.responses import json_response
+from ..utils.conditional import conditional
+from ..utils.response_cache import response_cache, listing_tag, category_tag
+from ..utils.logger import setup_logger
 
 # Blueprint for listing-related routes
 bp = Blueprint("listings_bp", __name__, url_prefix="/api/listings")
 
+logger = setup_logger(name="listing_logger", log_file="logs/listing.log")
+
+
+def listings_tags(data: dict, args, view_args: dict):
+    """Tags of a page of listings: its listings, and the category filtered by or any new listing."""
+    tags = [listing_tag(listing.get("listing_id")) for listing in data.get("listings", [])]
+    tags.append(category_tag(args.get("category_id")) if "category_id" in args else "listings")
+    return tags
+
 
 # GET /api/listings/
 @bp.route("/", methods=["GET"])
+@conditional(validator=lambda args: ListingService.get_listings_version(args=args))
+@response_cache.cached(tags=listings_tags)
 def get_all_listings(db_session=None):
     """
     Retrieve all listings with optional filters.
@@ -23,8 +38,49 @@ def get_all_listings(db_session=None):
     return ListingService.get_all_listings(args=args, db_session=db_session)
 
 
+# GET /api/listings/suggest/
+@bp.route("/suggest/", methods=["GET"])
+def get_suggestions(db_session=None):
+    """
+    Retrieve typeahead suggestions for a search prefix.
+
+    Args:
+        db_session: Optional database session to be used in tests.
+
+    Query Parameters:
+        prefix (str): What the user has typed so far.
+        limit (int, optional): Maximum number of suggestions (default 10).
+
+    Returns:
+        JSON response containing the matching categories and listings, best first.
+    """
+    args = request.args
+    return ListingService.get_suggestions(args=args, db_session=db_session)
+
+
+# GET /api/listings/suggest/stats/
+@bp.route("/suggest/stats/", methods=["GET"])
+@login_required
+def get_index_stats():
+    """
+    Retrieve the size and memory use of the in-memory search and suggest indexes and the response cache.
+
+    Returns:
+        JSON response containing the statistics of each index, or an error with HTTP 401 if
+        the user is not an admin.
+    """
+    if current_user.role != "admin":
+        response_data = {"error": "Unauthorized access"}
+        logger.error(msg=f"Unauthorized access attempt to get index statistics by user {current_user.id}")
+        return json_response(response_data, status=401)
+
+    return ListingService.get_index_stats()
+
+
 # GET /api/listings/{id}/
 @bp.route("/<int:listing_id>/", methods=["GET"])
+@conditional(validator=lambda args, listing_id: ListingService.get_listing_version(listing_id=listing_id))
+@response_cache.cached(tags=lambda data, args, view_args: [listing_tag(view_args.get("listing_id"))])
 def get_listing(listing_id: int, db_session=None):
     """
     Retrieve a single listing by its ID.
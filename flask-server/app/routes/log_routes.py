@@ -1,7 +1,8 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request
 from flask_login import current_user
 
 from ..services import LogService
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 # Blueprint for log-related routes
@@ -23,7 +24,7 @@ def list_logs():
     if current_user.role != "admin":
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to get logs by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     return LogService.list_logs()
 
@@ -44,7 +45,7 @@ def get_log_file(filename: str):
     if current_user.role != "admin":
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to get log file by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     args = request.args
     return LogService.get_log_file(filename=filename, args=args)
\ No newline at end of file
@@ -1,7 +1,8 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request
 from flask_login import login_required, current_user
 
 from ..services import PurchaseService
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 # Blueprint for purchase-related routes
@@ -33,7 +34,7 @@ def process_purchase(db_session=None):
     if not amount > 0:
         response_data = {"error": "Invalid amount"}
         logger.error(msg=f"Invalid amount: {amount} for user: {current_user.id} payment")
-        return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+        return json_response(response_data, status=400)
 
     return PurchaseService.process_payment(data=data, db_session=db_session)
 
@@ -57,7 +58,7 @@ def get_stripe_session_status(db_session=None):
     if not args.get("session_id"):
         response_data = {"error": "Missing session_id parameter"}
         logger.error(msg=f"Failed retrieving stripe session with args: {', '.join(f'{k}={v!r}' for k, v in args.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+        return json_response(response_data, status=400)
 
     return PurchaseService.get_stripe_session_status(session_id=args.get("session_id"), db_session=db_session)
 
@@ -2,13 +2,24 @@ from flask import Blueprint, request
 from flask_login import login_required
 
 from ..services import ReviewService
+from ..utils.conditional import conditional
+from ..utils.response_cache import response_cache, listing_tag, review_tag
 
 # Blueprint for review-related routes
 bp = Blueprint("review_bp", __name__, url_prefix="/api/reviews")
 
 
+def reviews_tags(data: dict, args, view_args: dict):
+    """Tags of a page of reviews: its reviews, and the listing filtered by or any new review."""
+    tags = [review_tag(review.get("review_id")) for review in data.get("reviews", [])]
+    tags.append(listing_tag(args.get("listing_id")) if "listing_id" in args else "reviews")
+    return tags
+
+
 # GET /api/reviews/
 @bp.route("/", methods=["GET"])
+@conditional(validator=lambda args: ReviewService.get_reviews_version(args=args))
+@response_cache.cached(tags=reviews_tags)
 def get_all_reviews(db_session=None):
     """
     Retrieve all reviews.
@@ -26,6 +37,8 @@ def get_all_reviews(db_session=None):
 
 # GET /api/reviews/{id}/
 @bp.route("/<int:review_id>/", methods=["GET"])
+@conditional(validator=lambda args, review_id: ReviewService.get_review_version(review_id=review_id))
+@response_cache.cached(tags=lambda data, args, view_args: [review_tag(view_args.get("review_id"))])
 def get_review(review_id: int, db_session=None):
     """
     Retrieve a single review by its ID.
@@ -0,0 +1,127 @@
+from flask_login import current_user
+from flask_socketio import join_room, leave_room
+
+from ..data_mappers import ChatMapper, SupportTicketMapper
+from ..utils.socketio import socketio, listing_room, chat_room, ticket_room
+from ..utils.logger import setup_logger
+
+logger = setup_logger(name="socket_logger", log_file="logs/socket.log")
+
+
+def room_id(data, key: str):
+    """
+    Read the ID of the room to join or leave from an event payload.
+
+    Args:
+        data: The event payload, expected to be a dictionary.
+        key (str): Name of the ID in the payload (e.g., listing_id).
+
+    Returns:
+        int | None: The ID, or None if it is missing or not an integer.
+    """
+    value = data.get(key) if isinstance(data, dict) else None
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+@socketio.on("join_listing")
+def join_listing(data):
+    """
+    Join the room of a listing to receive its bid updates.
+
+    Args:
+        data (dict): Payload containing the listing_id.
+
+    Returns:
+        bool: Whether the room was joined.
+    """
+    listing_id = room_id(data, "listing_id")
+    if listing_id is None:
+        return False
+    join_room(listing_room(listing_id))
+    return True
+
+
+@socketio.on("leave_listing")
+def leave_listing(data):
+    """
+    Leave the room of a listing.
+
+    Args:
+        data (dict): Payload containing the listing_id.
+    """
+    listing_id = room_id(data, "listing_id")
+    if listing_id is not None:
+        leave_room(listing_room(listing_id))
+
+
+@socketio.on("join_chat")
+def join_chat(data):
+    """
+    Join the room of a chat to receive its new messages. Only the chat's participants may join.
+
+    Args:
+        data (dict): Payload containing the chat_id.
+
+    Returns:
+        bool: Whether the room was joined.
+    """
+    chat_id = room_id(data, "chat_id")
+    if chat_id is None or not current_user.is_authenticated:
+        return False
+
+    chat = ChatMapper.get_chat_by_id(chat_id=chat_id)
+    if not chat or current_user.id not in (chat.get("user1_id"), chat.get("user2_id")):
+        logger.error(msg=f"Unauthorized attempt to join chat: {chat_id} by user {current_user.id}")
+        return False
+    join_room(chat_room(chat_id))
+    return True
+
+
+@socketio.on("leave_chat")
+def leave_chat(data):
+    """
+    Leave the room of a chat.
+
+    Args:
+        data (dict): Payload containing the chat_id.
+    """
+    chat_id = room_id(data, "chat_id")
+    if chat_id is not None:
+        leave_room(chat_room(chat_id))
+
+
+@socketio.on("join_ticket")
+def join_ticket(data):
+    """
+    Join the room of a support ticket to receive its new messages. Only the ticket's owner and
+    staff may join.
+
+    Args:
+        data (dict): Payload containing the ticket_id.
+
+    Returns:
+        bool: Whether the room was joined.
+    """
+    ticket_id = room_id(data, "ticket_id")
+    if ticket_id is None or not current_user.is_authenticated:
+        return False
+
+    ticket = SupportTicketMapper.get_ticket_by_id(ticket_id=ticket_id)
+    if not ticket or (current_user.id != ticket.get("user_id") and current_user.role not in ["staff", "admin"]):
+        logger.error(msg=f"Unauthorized attempt to join support ticket: {ticket_id} by user {current_user.id}")
+        return False
+    join_room(ticket_room(ticket_id))
+    return True
+
+
+@socketio.on("leave_ticket")
+def leave_ticket(data):
+    """
+    Leave the room of a support ticket.
+
+    Args:
+        data (dict): Payload containing the ticket_id.
+    """
+    ticket_id = room_id(data, "ticket_id")
+    if ticket_id is not None:
+        leave_room(ticket_room(ticket_id))
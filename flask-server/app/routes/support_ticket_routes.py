@@ -1,7 +1,8 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request
 from flask_login import login_required, current_user
 
 from ..services import SupportTicketService
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 # Blueprint for support ticket routes
@@ -78,7 +79,7 @@ def update_ticket(ticket_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to update support ticket by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     data = request.json
     return SupportTicketService.update_ticket(ticket_id=ticket_id, data=data, db_session=db_session)
@@ -101,6 +102,6 @@ def delete_ticket(ticket_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to delete support ticket by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     return SupportTicketService.delete_ticket(ticket_id=ticket_id, db_session=db_session)
\ No newline at end of file
@@ -1,7 +1,8 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request
 from flask_login import login_required, current_user
 
 from ..services import TicketMessageService
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 # Blueprint for ticket message-related routes
@@ -66,6 +67,6 @@ def delete_message(message_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"]:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to delete ticket message by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     return TicketMessageService.delete_message(message_id=message_id, db_session=db_session)
@@ -1,7 +1,8 @@
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request
 from flask_login import login_required, current_user
 
 from ..services import UserService
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 # Blueprint for user login-related routes
@@ -50,7 +51,7 @@ def update_user(user_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"] and user_id != current_user.id:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to update user by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     data = request.json
     return UserService.update_user(user_id=user_id, data=data, db_session=db_session)
@@ -73,6 +74,6 @@ def delete_user(user_id: int, db_session=None):
     if current_user.role not in ["staff", "admin"] and user_id != current_user.id:
         response_data = {"error": "Unauthorized access"}
         logger.error(msg=f"Unauthorized access attempt to delete user by user {current_user.id}")
-        return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+        return json_response(response_data, status=401)
 
     return UserService.delete_user(user_id=user_id, db_session=db_session)
\ No newline at end of file
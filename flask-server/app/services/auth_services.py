@@ -1,4 +1,4 @@
-from flask import jsonify, session, Response, make_response
+from flask import session
 from flask_login import login_user, logout_user, current_user
 
 from datetime import datetime, timedelta, timezone
@@ -8,6 +8,7 @@ from .email_services import EmailService
 from .sms_services import SMSService
 from ..data_mappers import AuthMapper, ProfileMapper, UserMapper
 from ..utils.password import hash_password
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="auth_logger", log_file="logs/auth.log")
@@ -29,11 +30,11 @@ class AuthService:
         if not current_user.is_authenticated:
             response_data = {"error": "Error user is not authenticated", "authenticated": False}
             logger.error(msg=f"User is not authenticated")
-            return Response(response=jsonify(response_data).get_data(), status=401, mimetype="application/json")
+            return json_response(response_data, status=401)
 
         response_data = {"message": "User is authenticated", "authenticated": True, "id": current_user.id, "role": current_user.role}
         logger.info(msg=f"User: {current_user.id} is authenticated as: {current_user.role}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -54,18 +55,18 @@ class AuthService:
         if not user_id:
             response_data = {"error": "Error creating user"}
             logger.error(msg=f"Failed creating user with data: {', '.join(f'{k}={v!r}' for k, v in user_data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         profile_data = {"user_id": user_id, "first_name": data.get("first_name"), "last_name": data.get("last_name")}
         profile_id = ProfileMapper.create_profile(data=profile_data, db_session=db_session).get_json().get("profile_id")
         if not profile_id:
             response_data = {"error": "Error creating profile"}
             logger.error(msg=f"Failed creating profile with data: {', '.join(f'{k}={v!r}' for k, v in profile_data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "User registered successfully", "user_id": user_id, "profile_id": profile_id}
         logger.info(msg=f"User: {user_id} and profile: {profile_id} registered successfully with data: {data}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype="application/json")
+        return json_response(response_data, status=201)
 
 
     @staticmethod
@@ -85,7 +86,7 @@ class AuthService:
         if not user or not user.password_hash == hash_password(data.get("password")):
             response_data = {"error": "Invalid username or password"}
             logger.error(msg=f"Invalid username: {data.get('username')} or password: {data.get('password')}")
-            return Response(response=jsonify(response_data).get_data(), status=422, mimetype="application/json")
+            return json_response(response_data, status=422)
 
         login_user(user=user)
         session.update(user_id=user.id, _user_id=user.id, role=user.role)
@@ -95,8 +96,7 @@ class AuthService:
 
         response_data = {"message": "Login successful", "user": user.to_dict()}
         logger.info(msg=f"Login successful for user: {user.id}")
-        response = make_response(jsonify(response_data), 200)
-        return response
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -119,7 +119,7 @@ class AuthService:
 
         response_data = {"message": "Logout successful"}
         logger.info(msg=f"Logout successful for user: {user_id}")
-        response = Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        response = json_response(response_data, status=200)
         response.set_cookie("session", value="", max_age=0, expires=0, path="/", secure=True, samesite="None")
         return response
 
@@ -140,13 +140,13 @@ class AuthService:
         if not profile:
             response_data = {"error": "Profile not found"}
             logger.error(msg=f"Profile not found for user: {current_user.id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         user = UserMapper.get_user(user_id=current_user.id, db_session=db_session)
         if not user:
             response_data = {"error": "User not found"}
             logger.error(msg=f"User not found with id: {current_user.id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         reset_token = jwt.encode({"user_id": current_user.id, "exp": datetime.now(timezone.utc) + timedelta(hours=1)}, os.getenv("SECRET_KEY"), algorithm="HS256")
         reset_link = f"{os.getenv('FRONTEND_URL')}/reset_password?token={reset_token}"
@@ -158,7 +158,7 @@ class AuthService:
         if not int(mail_response) == 202:
             response_data = {"error": "HTTP error sending email"}
             logger.error(msg=f"HTTP failure sending email to: {user.get('email')} body: {body}")
-            return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+            return json_response(response_data, status=400)
 
         sms_response = SMSService.send_sms(profile.get("phone_number"), body)
         if int(sms_response) != 200:
@@ -166,7 +166,7 @@ class AuthService:
 
         response_data = {"message": "Password reset email sent"}
         logger.info(msg=f"Password reset email sent to: {user.get('email')}")
-        return Response(response=jsonify(response_data).get_data(), status=202, mimetype="application/json")
+        return json_response(response_data, status=202)
 
 
     @staticmethod
@@ -189,18 +189,18 @@ class AuthService:
         except jwt.ExpiredSignatureError:
             response_data = {"error": "Reset token has expired"}
             logger.error(msg=f"Reset token: {reset_token} expired")
-            return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+            return json_response(response_data, status=400)
         except jwt.InvalidTokenError:
             response_data = {"error": "Invalid reset token"}
             logger.error(msg=f"Invalid reset token: {reset_token}")
-            return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+            return json_response(response_data, status=400)
 
         # Get the current user
         user = UserMapper.get_user(user_id=user_id, db_session=db_session)
         if not user:
             response_data = {"error": "User not found"}
             logger.error(msg=f"User not found with id: {user_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         # Update the user's password
         updated_user_data = {"password_hash": hash_password(new_password)}
@@ -208,8 +208,8 @@ class AuthService:
         if not updated_rows:
             response_data = {"error": "Error updating user"}
             logger.error(msg=f"Failed updating user: {user_id} with new password: {new_password}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Password has been reset"}
         logger.info(msg=f"User: {user_id} successfully reset password to: {new_password}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
@@ -1,7 +1,13 @@
-from flask import jsonify, Response
-
-from ..data_mappers import BidMapper, ListingMapper
-from ..utils.socketio import socketio
+from datetime import datetime, timedelta
+from functools import partial
+
+from ..data_mappers import BidMapper, MaxBidMapper
+from ..database import on_commit
+from ..utils.auction_engine import auction_engine
+from ..utils.coalescer import bid_updates, BID_CLOSING_WINDOW
+from ..utils.socketio import listing_room
+from ..utils.response_cache import response_cache, listing_tag
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="bid_logger", log_file="logs/bid.log")
@@ -23,11 +29,11 @@ class BidService:
         if not bids:
             response_data = {"error": "No bids found"}
             logger.error(msg=f"No bids found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Bids found", "bids": bids}
         logger.info(msg=f"Bids found: {[bid.get('bid_id') for bid in bids]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -47,48 +53,195 @@ class BidService:
         if not bid:
             response_data = {"error": "Bid not found"}
             logger.error(msg=f"Bid: {bid_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Bid found", "bid": bid}
         logger.info(msg=f"Bid: {bid_id} found")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
 
     @staticmethod
     def create_bid(data: dict, db_session=None):
         """
-        Creates a new bid and emits an event through a socket.
+        Places a new bid, answered by the maximum bids competing with it, and emits the resulting
+        price change through a socket.
 
         Args:
             data (dict): A dictionary containing the bid details (e.g., user, amount).
             db_session: Optional database session to be used in tests.
 
+        Bids are placed through the auction engine when it is enabled, otherwise in the database.
+
         Returns:
-            Response: A JSON response containing the success message, bid ID, and bid data if successful.
-                Returns status code 400 if required fields are missing.
-        """
-        bid_id = BidMapper.create_bid(data=data, db_session=db_session)
-        if not bid_id:
-            response_data = {"error": "Error creating bid"}
-            logger.error(msg=f"Failed creating bid with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
-
-        listing_args = {"bids": 1, "current_price": data.get("amount")}
-        updated_rows = ListingMapper.update_listing(listing_id=data.get("listing_id"), data=listing_args, db_session=db_session)
-        if not updated_rows:
-            response_data = {"error": "Error updating listing"}
-            logger.error(msg=f"Failed updating listing with data: {', '.join(f'{k}={v!r}' for k, v in listing_args.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            Response: A JSON response containing the success message, bid ID, and the auction's
+                resulting price and leader if successful.
+                Returns status code 400 if the bid data is invalid, 409 if the bid was rejected
+                because the auction has ended or the amount does not beat the current price, or 503
+                if the auction engine is enabled but not running in this process or did not answer.
+        """
+        try:
+            if auction_engine.enabled:
+                return BidService.place_live_bid(data=data)
+            result = BidMapper.place_bid(data=data, db_session=db_session)
+        except TypeError as e:
+            response_data = {"error": str(e)}
+            logger.error(msg=f"Invalid bid data: {', '.join(f'{k}={v!r}' for k, v in data.items())}: {e}")
+            return json_response(response_data, status=400)
+        except (RuntimeError, TimeoutError) as e:
+            response_data = {"error": "Bids cannot be placed right now, please try again"}
+            logger.error(msg=f"Auction engine unavailable for bid with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}: {e}")
+            return json_response(response_data, status=503)
+
+        if not result:
+            response_data = {"error": "Bid must be higher than the current price of an active auction"}
+            logger.error(msg=f"Bid rejected with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
+            return json_response(response_data, status=409)
+
+        on_commit(partial(BidService.emit_bid_update, data.get("listing_id"), result))
+
+        bid_id = result.get("bid_id")
+        response_data = {"message": "Bid created", "bid_id": bid_id, "current_price": result.get("current_price"), "leader": result.get("leader")}
+        logger.info(msg=f"Bid: {bid_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
+        return json_response(response_data, status=201)
 
-        bid = BidMapper.get_bid_by_id(bid_id=bid_id, db_session=db_session)
-        if not bid:
-            response_data = {"error": "Bid not found"}
-            logger.error(msg=f"Bid: {bid_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
 
-        socketio.emit("new_bid")
+    @staticmethod
+    def place_live_bid(data: dict):
+        """
+        Places a bid through the in-memory auction engine, which persists it shortly after.
 
-        response_data = {"message": "Bid created", "bid_id": bid_id}
-        logger.info(msg=f"Bid: {bid_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype="application/json")
\ No newline at end of file
+        Args:
+            data (dict): A dictionary containing the bid details (e.g., user, amount).
+
+        Returns:
+            Response: A JSON response containing the accepted bid and the auction's resulting price
+                and leader with status code 202, or an error with status code 409 if the bid was rejected.
+
+        Raises:
+            TypeError: If the bid data is invalid.
+            RuntimeError: If the auction engine is not running in this process.
+            TimeoutError: If the auction engine did not answer in time.
+        """
+        result = auction_engine.place_bid(data=data)
+        if not result.get("accepted"):
+            response_data = {"error": result.get("error")}
+            logger.error(msg=f"Bid rejected with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}: {result.get('error')}")
+            return json_response(response_data, status=409)
+
+        BidService.emit_bid_update(listing_id=data.get("listing_id"), result=result)
+
+        response_data = {"message": "Bid accepted", "bid": result.get("bid"), "current_price": result.get("current_price"), "leader": result.get("leader"), "bids": result.get("bids")}
+        logger.info(msg=f"Bid: {result.get('bid').get('sequence')} accepted with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
+        return json_response(response_data, status=202)
+
+
+    @staticmethod
+    def get_max_bid(listing_id: int, user_id: int, db_session=None):
+        """
+        Retrieves a user's maximum bid on an auction.
+
+        Args:
+            listing_id (int): The ID of the auctioned listing.
+            user_id (int): The ID of the user.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            Response: A JSON response containing the maximum bid if found.
+                Returns status code 404 if the user has no maximum bid on the auction.
+        """
+        max_bid = MaxBidMapper.get_max_bid(listing_id=listing_id, user_id=user_id, db_session=db_session)
+        if not max_bid:
+            response_data = {"error": "Maximum bid not found"}
+            logger.error(msg=f"Maximum bid of user: {user_id} on listing: {listing_id} not found")
+            return json_response(response_data, status=404)
+
+        response_data = {"message": "Maximum bid found", "max_bid": max_bid}
+        logger.info(msg=f"Maximum bid of user: {user_id} on listing: {listing_id} found")
+        return json_response(response_data, status=200)
+
+
+    @staticmethod
+    def create_max_bid(data: dict, db_session=None):
+        """
+        Registers or changes a user's maximum bid on an auction, bids on their behalf as far as
+        needed against the other maximum bids, and emits the resulting price change through a socket.
+
+        Args:
+            data (dict): A dictionary containing the maximum bid details (e.g., user, amount).
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            Response: A JSON response containing the auction's resulting price and leader with status
+                code 201 (202 through the auction engine). Returns status code 400 if the data is
+                invalid, 409 if the auction is not active or the amount does not beat its current price,
+                or 503 if the auction engine is enabled but not running in this process or did not answer.
+        """
+        try:
+            if auction_engine.enabled:
+                result = auction_engine.place_max_bid(data=data)
+                status = 202
+            else:
+                result = BidMapper.place_max_bid(data=data, db_session=db_session)
+                status = 201
+        except TypeError as e:
+            response_data = {"error": str(e)}
+            logger.error(msg=f"Invalid maximum bid data: {', '.join(f'{k}={v!r}' for k, v in data.items())}: {e}")
+            return json_response(response_data, status=400)
+        except (RuntimeError, TimeoutError) as e:
+            response_data = {"error": "Maximum bids cannot be placed right now, please try again"}
+            logger.error(msg=f"Auction engine unavailable for maximum bid with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}: {e}")
+            return json_response(response_data, status=503)
+
+        if not result or result.get("accepted") is False:
+            response_data = {"error": (result or {}).get("error", "Maximum bid must be higher than the current price of an active auction")}
+            logger.error(msg=f"Maximum bid rejected with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
+            return json_response(response_data, status=409)
+
+        if result.get("proxy_bid"):
+            BidService.emit_bid_update(listing_id=data.get("listing_id"), result=result)
+        elif result.get("proxy_bid_id"):
+            on_commit(partial(BidService.emit_bid_update, data.get("listing_id"), result))
+
+        response_data = {"message": "Maximum bid placed", "current_price": result.get("current_price"), "leader": result.get("leader")}
+        logger.info(msg=f"Maximum bid placed with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}, leader: {result.get('leader')}")
+        return json_response(response_data, status=status)
+
+
+    @staticmethod
+    def emit_bid_update(listing_id: int, result: dict):
+        """
+        Emits an auction's new state to the clients watching its listing, so they do not have to
+        fetch the listing again.
+
+        Updates are coalesced to at most `BID_UPDATE_RATE` per second per listing, only the latest
+        state being sent, except within `BID_CLOSING_WINDOW` seconds of the auction's end. The
+        cached responses showing the listing are dropped.
+
+        Args:
+            listing_id (int): The ID of the auctioned listing.
+            result (dict): The auction's resulting `current_price`, `bids`, `leader` and `auction_end`.
+        """
+        response_cache.invalidate(listing_tag(listing_id))
+        auction_end = result.get("auction_end")
+        closing = isinstance(auction_end, datetime) and auction_end - datetime.now() <= timedelta(seconds=BID_CLOSING_WINDOW)
+        bid_updates.publish("new_bid", {
+            "listing_id": listing_id,
+            "current_price": result.get("current_price"),
+            "bids": result.get("bids"),
+            "leader": result.get("leader"),
+            "auction_end": auction_end.isoformat() if hasattr(auction_end, "isoformat") else auction_end
+        }, room=listing_room(listing_id), immediate=closing)
+
+
+    @staticmethod
+    def get_realtime_stats():
+        """
+        Retrieves the number of bid updates emitted and suppressed by coalescing.
+
+        Returns:
+            Response: A JSON response containing the realtime statistics.
+        """
+        response_data = {"message": "Realtime statistics found", "bid_updates": bid_updates.stats()}
+        logger.info(msg="Realtime statistics found")
+        return json_response(response_data, status=200)
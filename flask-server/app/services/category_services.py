@@ -1,6 +1,5 @@
-from flask import jsonify, Response
-
 from ..data_mappers import CategoryMapper
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="category_logger", log_file="logs/category.log")
@@ -23,11 +22,39 @@ class CategoryService:
         if not categories:
             response_data = {"error": "No categories found"}
             logger.error(msg=f"No categories found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Categories found", "categories": categories}
         logger.info(msg=f"Categories found: {[category.get('name') for category in categories]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
+
+    @staticmethod
+    def get_categories_version(db_session=None):
+        """
+        Retrieves the version of the categories, for conditional GETs.
+
+        Args:
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: The latest `updated_at` of the categories and their `count`.
+        """
+        return CategoryMapper.get_categories_version(db_session=db_session)
+
+    @staticmethod
+    def get_category_version(category_id: int, db_session=None):
+        """
+        Retrieves the version of a category, for conditional GETs.
+
+        Args:
+            category_id (int): The ID of the category.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: The `updated_at` and `last_modified` of the category, or None if it does not exist.
+        """
+        updated_at = CategoryMapper.get_category_version(category_id=category_id, db_session=db_session)
+        return {"updated_at": updated_at, "last_modified": updated_at} if updated_at else None
 
     @staticmethod
     def get_category_by_id(category_id: int, db_session=None):
@@ -46,11 +73,11 @@ class CategoryService:
         if not category:
             response_data = {"error": "Category not found"}
             logger.error(msg=f"Category: {category_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Category found", "category": category}
         logger.info(msg=f"Category: {category_id} found")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
     @staticmethod
     def create_category(data: dict, db_session=None):
@@ -69,11 +96,11 @@ class CategoryService:
         if not category_id:
             response_data = {"error": "Error creating category"}
             logger.error(msg=f"Failed creating category with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Category created", "category_id": category_id}
         logger.info(msg=f"Category: {category_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype="application/json")
+        return json_response(response_data, status=201)
 
     @staticmethod
     def update_category(category_id: int, data: dict, db_session=None):
@@ -93,11 +120,11 @@ class CategoryService:
         if not updated_rows:
             response_data = {"error": "Error updating category"}
             logger.error(msg=f"Failed updating category: {category_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Category updated", "updated_rows": updated_rows}
         logger.info(msg=f"Category: {category_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
     @staticmethod
     def delete_category(category_id: int, db_session=None):
@@ -116,8 +143,8 @@ class CategoryService:
         if not deleted_rows:
             response_data = {"error": "Category not found"}
             logger.error(msg=f"Category: {category_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Category deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Category: {category_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
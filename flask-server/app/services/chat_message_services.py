@@ -1,7 +1,9 @@
-from flask import jsonify, Response
+from functools import partial
 
 from ..data_mappers import ChatMessageMapper, ChatMapper
-from ..utils.socketio import socketio
+from ..database import on_commit
+from ..utils.socketio import socketio, chat_room
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="chat_message_logger", log_file="logs/chat_message.log")
@@ -24,11 +26,11 @@ class ChatMessageService:
         if not messages:
             response_data = {"error": "No messages found"}
             logger.error(msg=f"No messages found for chat: {chat_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Messages found", "messages": messages}
         logger.info(msg=f"Messages found: {[message.get('message') for message in messages]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -47,19 +49,20 @@ class ChatMessageService:
         if not message_id:
             response_data = {"error": "Error creating message"}
             logger.error(msg=f"Failed creating message with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+            return json_response(response_data, status=409)
 
         updated_rows = ChatMapper.update_chat_timestamp(chat_id=data.get("chat_id"), db_session=db_session)
         if not updated_rows:
             response_data = {"error": "Error updating chat timestamp"}
             logger.error(msg=f"Failed updating timestamp of chat: {data.get('chat_id')}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+            return json_response(response_data, status=409)
 
-        socketio.emit("new_message")
+        # Participants refetch the messages when notified, so only once the message is committed
+        on_commit(partial(socketio.emit, "new_message", {"chat_id": data.get("chat_id"), "message_id": message_id, "sender_id": data.get("sender_id")}, to=chat_room(data.get("chat_id"))))
 
         response_data = {"message": "Message created", "message_id": message_id}
         logger.info(msg=f"Message: {message_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype='application/json')
+        return json_response(response_data, status=201)
 
 
     @staticmethod
@@ -79,11 +82,11 @@ class ChatMessageService:
         if not updated_rows:
             response_data = {"error": "Error updating chat message"}
             logger.error(msg=f"Failed updating message: {message_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Message updated", "updated_rows": updated_rows}
         logger.info(msg=f"Message: {message_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -102,8 +105,8 @@ class ChatMessageService:
         if not deleted_rows:
             response_data = {"error": "Message not found"}
             logger.error(msg=f"Message: {message_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Message deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Message: {message_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
\ No newline at end of file
+        return json_response(response_data, status=200)
\ No newline at end of file
@@ -1,7 +1,7 @@
-from flask import jsonify, Response
 from flask_login import current_user
 
 from ..data_mappers import ChatMapper
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="chat_logger", log_file="logs/chat.log")
@@ -9,25 +9,32 @@ logger = setup_logger(name="chat_logger", log_file="logs/chat.log")
 
 class ChatService:
     @staticmethod
-    def get_chats(db_session=None):
+    def get_chats(args=None, db_session=None):
         """
         Fetch all support chats for the authenticated user.
 
         Args:
+            args (dict, optional): Dictionary of query parameters, optionally the `fields` to return.
             db_session: Database session for executing queries.
 
         Returns:
-            Response: JSON response containing the user's chats if available, otherwise a 404 error.
+            Response: JSON response containing the user's chats if available, otherwise a 404 error,
+                or a 400 error if a field is unknown.
         """
-        chats = ChatMapper.get_chats_by_user_id(user_id=current_user.id, db_session=db_session)
+        try:
+            chats = ChatMapper.get_chats_by_user_id(user_id=current_user.id, fields=(args or {}).get("fields"), db_session=db_session)
+        except ValueError as e:
+            response_data = {"error": str(e)}
+            logger.error(msg=f"Invalid chats query: {e}")
+            return json_response(response_data, status=400)
         if not chats:
             response_data = {"error": "No chats found"}
             logger.error(msg=f"No chats found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Chats retrieved", "chats": chats}
         logger.info(msg=f"Chats found: {[chat.get('chat_id') for chat in chats]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -46,11 +53,11 @@ class ChatService:
         if not chat:
             response_data = {"error": "Chat not found"}
             logger.error(msg=f"Chat: {chat_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Chat retrieved", "chat": chat}
         logger.info(msg=f"Chat: {chat_id} found")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -69,11 +76,11 @@ class ChatService:
         if not chat_id:
             response_data = {"error": "Error creating chat"}
             logger.error(msg=f"Failed creating chat with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Chat and message created", "chat_id": chat_id}
         logger.info(msg=f"Chat: {chat_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype='application/json')
+        return json_response(response_data, status=201)
 
 
     @staticmethod
@@ -93,11 +100,11 @@ class ChatService:
         if not updated_rows:
             response_data = {"error": "Error updating chat"}
             logger.error(msg=f"Failed updating chat: {chat_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Chat updated", "updated_rows": updated_rows}
         logger.info(msg=f"Chat: {chat_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -116,8 +123,8 @@ class ChatService:
         if not deleted_rows:
             response_data = {"error": "Chat not found"}
             logger.error(msg=f"Chat: {chat_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Chat deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Chat: {chat_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
\ No newline at end of file
+        return json_response(response_data, status=200)
\ No newline at end of file
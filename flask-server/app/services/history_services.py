@@ -1,9 +1,9 @@
-from flask import jsonify, Response
 from flask_login import current_user
 
 import stripe
 
 from ..data_mappers import OrderMapper, ListingMapper, TransactionMapper, DeliveryMapper, SupportTicketMapper, ReviewMapper
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="user_history_logger", log_file="logs/user_history.log")
@@ -15,23 +15,30 @@ class HistoryService:
         Retrieve a user's order history.
 
         Args:
-            args (dict, optional): A dictionary containing the request arguments, including user ID.
+            args (dict, optional): A dictionary containing the request arguments, including user ID
+                and the `fields` to return.
             db_session: Optional database session to be used in tests.
 
         Returns:
-            Response: A JSON response containing the user's orders if found, otherwise a 404 error.
+            Response: A JSON response containing the user's orders if found, otherwise a 404 error,
+                or a 400 error if a field is unknown.
         """
         user_id = args.get("user_id") if current_user.role in ["staff", "admin"] else current_user.id
-        orders = OrderMapper.get_all_orders(user_id=user_id, db_session=db_session)
+        try:
+            orders = OrderMapper.get_all_orders(user_id=user_id, fields=(args or {}).get("fields"), db_session=db_session)
+        except ValueError as e:
+            response_data = {"error": str(e)}
+            logger.error(msg=f"Invalid orders query: {e}")
+            return json_response(response_data, status=400)
 
         if not orders:
             response_data = {"error": "Orders not found"}
             logger.error(msg=f"No orders found for user: {user_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Orders found", "orders": orders}
         logger.info(msg=f"Orders found: {[order.get('order_id') for order in orders]} for user: {user_id}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -51,11 +58,11 @@ class HistoryService:
         if not updated_rows:
             response_data = {"error": "Error updating order"}
             logger.error(msg=f"Failed updating order: {order_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Order updated", "updated_rows": updated_rows}
         logger.info(msg=f"Order: {order_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -74,11 +81,11 @@ class HistoryService:
         if not deleted_rows:
             response_data = {"error": "Order not found"}
             logger.error(msg=f"Order: {order_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Order deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Order: {order_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -91,18 +98,48 @@ class HistoryService:
             db_session: Optional database session to be used in tests.
 
         Returns:
-            Response: A JSON response containing the user's listings if found, otherwise a 404 error.
+            Response: A JSON response containing the user's listings if found, otherwise a 404 error,
+                or a 400 error if the query is invalid.
         """
-        listings = ListingMapper.get_all_listings(args=args, db_session=db_session)
+        try:
+            listings = ListingMapper.get_all_listings(args=args, include_drafts=True, db_session=db_session)
+        except ValueError as e:
+            response_data = {"error": str(e)}
+            logger.error(msg=f"Invalid listings query: {e}")
+            return json_response(response_data, status=400)
 
         if not listings:
             response_data = {"error": "Listings not found"}
             logger.error(msg=f"No listings found for user: {args.get('user_id')}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Listings found", "listings": listings}
         logger.info(msg=f"Listings found: {[listing.get('listing_id') for listing in listings]} for user: {args.get('user_id')}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
+
+
+    @staticmethod
+    def get_user_listing(listing_id: int, db_session=None):
+        """
+        Retrieve one of the user's listings, including drafts not live yet.
+
+        Args:
+            listing_id (int): The ID of the listing to retrieve.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            Response: A JSON response containing the listing if found and owned by the user (any
+                listing for staff), otherwise a 404 error.
+        """
+        listing = ListingMapper.get_listing_by_id(listing_id=listing_id, include_drafts=True, db_session=db_session)
+        if not listing or (current_user.role not in ["staff", "admin"] and listing.get("user_id") != current_user.id):
+            response_data = {"error": "Listing not found"}
+            logger.error(msg=f"Listing: {listing_id} not found for user: {current_user.id}")
+            return json_response(response_data, status=404)
+
+        response_data = {"message": "Listing found", "listing": listing}
+        logger.info(msg=f"Listing: {listing_id} found for user: {current_user.id}")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -122,11 +159,11 @@ class HistoryService:
         if not updated_rows:
             response_data = {"error": "Error updating order"}
             logger.error(msg=f"Failed updating listing: {listing_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Listing updated", "updated_rows": updated_rows}
         logger.info(msg=f"Listing: {listing_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -145,11 +182,11 @@ class HistoryService:
         if not deleted_rows:
             response_data = {"error": "Listing not found"}
             logger.error(msg=f"Listing: {listing_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Listing deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Listing: {listing_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -170,7 +207,7 @@ class HistoryService:
         if not transactions:
             response_data = {"error": "Transactions not found"}
             logger.error(msg=f"No transactions found for user: {user_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         for idx, transaction in enumerate(transactions):
             try:
@@ -183,15 +220,15 @@ class HistoryService:
             except stripe.error.StripeError as e:
                 response_data = {"error": str(e)}
                 logger.error(msg=f"Stripe payment intent: {transaction.get("payment_intent_id")} error: {e}")
-                return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+                return json_response(response_data, status=400)
             except Exception as e:
                 response_data = {"error": "Internal server error", "details": str(e)}
                 logger.error(msg=f"Stripe payment intent: {transaction.get("payment_intent_id")} error: {e}")
-                return Response(response=jsonify(response_data).get_data(), status=500, mimetype="application/json")
+                return json_response(response_data, status=500)
 
         response_data = {"message": "Transactions found", "transactions": transactions}
         logger.info(msg=f"Transactions found: {[transaction.get('transaction_id') for transaction in transactions]} for user: {user_id}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -211,11 +248,11 @@ class HistoryService:
         if not updated_rows:
             response_data = {"error": "Error updating transaction"}
             logger.error(msg=f"Failed updating transaction: {transaction_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Transaction updated", "updated_rows": updated_rows}
         logger.info(msg=f"Transaction: {transaction_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -234,11 +271,11 @@ class HistoryService:
         if not deleted_rows:
             response_data = {"error": "Transaction not found"}
             logger.error(msg=f"Transaction: {transaction_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Transaction deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Transaction: {transaction_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -259,11 +296,11 @@ class HistoryService:
         if not deliveries:
             response_data = {"error": "Deliveries not found"}
             logger.error(msg=f"No deliveries found for user: {user_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Deliveries found", "deliveries": deliveries}
         logger.info(msg=f"Deliveries found: {[delivery.get('delivery_id') for delivery in deliveries]} for user: {user_id}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -283,11 +320,11 @@ class HistoryService:
         if not updated_rows:
             response_data = {"error": "Error updating delivery"}
             logger.error(msg=f"Failed updating delivery: {delivery_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Delivery updated", "updated_rows": updated_rows}
         logger.info(msg=f"Delivery: {delivery_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -306,11 +343,11 @@ class HistoryService:
         if not deleted_rows:
             response_data = {"error": "Delivery not found"}
             logger.error(msg=f"Delivery: {delivery_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Delivery deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Delivery: {delivery_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -331,11 +368,11 @@ class HistoryService:
         if not tickets:
             response_data = {"error": "Support tickets not found"}
             logger.error(msg=f"No support tickets found for user: {user_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Support tickets found", "support_tickets": tickets}
         logger.info(msg=f"Support tickets found: {[ticket.get('ticket_id') for ticket in tickets]} for user: {user_id}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -355,11 +392,11 @@ class HistoryService:
         if not updated_rows:
             response_data = {"error": "Error updating support ticket"}
             logger.error(msg=f"Failed updating support ticket: {ticket_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Support ticket updated", "updated_rows": updated_rows}
         logger.info(msg=f"Support ticket: {ticket_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -378,11 +415,11 @@ class HistoryService:
         if not deleted_rows:
             response_data = {"error": "Support ticket not found"}
             logger.error(msg=f"Support ticket: {ticket_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Support ticket deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Support ticket: {ticket_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -403,11 +440,11 @@ class HistoryService:
         if not reviews:
             response_data = {"error": "Reviews not found"}
             logger.error(msg=f"No reviews found for user: {user_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Reviews found", "reviews": reviews}
         logger.info(msg=f"Reviews found: {[review.get('review_id') for review in reviews]} for user: {user_id}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -427,11 +464,11 @@ class HistoryService:
         if not updated_rows:
             response_data = {"error": "Error updating review"}
             logger.error(msg=f"Failed updating review: {review_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Review updated", "updated_rows": updated_rows}
         logger.info(msg=f"Review: {review_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
     @staticmethod
     def delete_user_review(review_id: int, db_session=None):
@@ -449,8 +486,8 @@ class HistoryService:
         if not deleted_rows:
             response_data = {"error": "Review not found"}
             logger.error(msg=f"Review: {review_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Review deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Review: {review_id} delted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
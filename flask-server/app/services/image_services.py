@@ -0,0 +1,42 @@
+from flask import send_file
+
+from ..utils.blob_store import blob_store
+from ..utils.responses import json_response
+from ..utils.logger import setup_logger
+
+logger = setup_logger(name="image_logger", log_file="logs/image.log")
+
+# Images are content addressed, so a given URL never changes and can be cached forever
+IMMUTABLE_MAX_AGE = 31536000
+
+
+class ImageService:
+    @staticmethod
+    def get_image(image_id: str, size: int | None = None):
+        """
+        Serve a listing image, or one of its WebP thumbnails, from the blob store.
+
+        Args:
+            image_id (str): The content hash of the image.
+            size (int, optional): Requested thumbnail size in pixels; the original is served if omitted.
+
+        Returns:
+            Response: The image file with long-lived cache headers if found.
+                Returns status code 404 if the image is not found.
+        """
+        path = blob_store.path(image_id=image_id, size=size)
+        if not path:
+            response_data = {"error": "Image not found"}
+            logger.error(msg=f"Image: {image_id} (size={size}) not found")
+            return json_response(response_data, status=404)
+
+        response = send_file(
+            path,
+            mimetype=blob_store.mimetype(path=path),
+            etag=f"{image_id}-{size or 'original'}",
+            conditional=True,
+            max_age=IMMUTABLE_MAX_AGE
+        )
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
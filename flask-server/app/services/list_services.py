@@ -1,7 +1,7 @@
-from flask import jsonify, Response
 from flask_login import current_user
 
 from ..data_mappers import ListMapper, ListingMapper
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="list_logger", log_file="logs/list.log")
@@ -22,11 +22,11 @@ class ListService:
         if not lists:
             response_data = {"error": "Lists not found"}
             logger.error(msg=f"No lists found for user: {current_user.id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Lists found", "lists": lists}
         logger.info(msg=f"Lists found: {[list.get('title') for list in lists]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -41,18 +41,15 @@ class ListService:
         Returns:
             Response: A JSON response containing the list items if found, otherwise a 404 error.
         """
-        list_items = ListMapper.get_list_items(list_id=list_id, db_session=db_session)
+        list_items = ListMapper.get_list_items_with_listings(list_id=list_id, db_session=db_session)
         if not list_items:
             response_data = {"error": "List items not found"}
             logger.error(msg=f"No items found for list: {list_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
-
-        for i in range(len(list_items)):
-            list_items[i] = ListingMapper.get_listing_by_id(listing_id=list_items[i].get("listing_id"), db_session=db_session)
+            return json_response(response_data, status=404)
 
         response_data = {"message": "List items found", "list_items": list_items}
         logger.info(msg=f"Items found: {[item for item in list_items]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -71,11 +68,11 @@ class ListService:
         if not list_id:
             response_data = {"error": "Error creating list"}
             logger.error(msg=f"Failed creating list with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+            return json_response(response_data, status=409)
 
         response_data = {"message": "List created", "list_id": list_id}
         logger.info(msg=f"List: {list_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype='application/json')
+        return json_response(response_data, status=201)
 
 
     @staticmethod
@@ -91,22 +88,27 @@ class ListService:
         Returns:
             Response: A JSON response containing the newly created list item ID or an error message.
         """
+        if not ListService.is_listable(list_id=list_id, listing_id=listing_id, db_session=db_session):
+            response_data = {"error": "Listing not found"}
+            logger.error(msg=f"Listing: {listing_id} cannot be added to list: {list_id}")
+            return json_response(response_data, status=404)
+
         list_items = ListMapper.get_list_items(list_id=list_id, db_session=db_session)
         for item in list_items:
             if item.get("listing_id") == listing_id:
                 response_data = {"error": "Item is already in list"}
                 logger.error(msg=f"Failed creating list item of listing: {listing_id} for list: {list_id}")
-                return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+                return json_response(response_data, status=409)
 
         list_item_id = ListMapper.create_list_item(list_id=list_id, listing_id=listing_id, db_session=db_session)
         if not list_item_id:
             response_data = {"error": "Error creating list item"}
             logger.error(msg=f"Failed creating list item of listing: {listing_id} for list: {list_id}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+            return json_response(response_data, status=409)
 
         response_data = {"message": "List item created", "list_item_id": list_item_id}
         logger.info(msg=f"List item: {list_item_id} created successfully of listing: {listing_id}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype='application/json')
+        return json_response(response_data, status=201)
 
 
     @staticmethod
@@ -128,7 +130,7 @@ class ListService:
         if current_list_items == updated_list_items and not data.get("title"):
             response_data = {"error": "Error updating list"}
             logger.error(msg=f"Failed updating list: {list_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         if current_list_items != updated_list_items:
             old_list_items = current_list_items - updated_list_items
@@ -137,29 +139,55 @@ class ListService:
                 if not deleted_rows:
                     response_data = {"error": "List item not found"}
                     logger.error(msg=f"List: {list_id} not found")
-                    return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+                    return json_response(response_data, status=404)
 
             new_list_items = updated_list_items - current_list_items
             for listing_id in new_list_items:
+                if not ListService.is_listable(list_id=list_id, listing_id=listing_id, db_session=db_session):
+                    response_data = {"error": "Listing not found"}
+                    logger.error(msg=f"Listing: {listing_id} cannot be added to list: {list_id}")
+                    return json_response(response_data, status=404)
+
                 created_rows = ListMapper.create_list_item(list_id=list_id, listing_id=listing_id)
                 if not created_rows:
                     response_data = {"error": "Error creating list item"}
                     logger.error(msg=f"Failed creating list item of listing: {listing_id} for list: {list_id}")
-                    return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+                    return json_response(response_data, status=409)
 
             response_data = {"message": "List items updated"}
             logger.info(msg=f"List items of list: {list_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in updated_list_items.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+            return json_response(response_data, status=200)
         else:
             updated_rows = ListMapper.update_list(list_id=list_id, title=data.get("title"), db_session=db_session)
             if not updated_rows:
                 response_data = {"error": "Error updating list"}
                 logger.error(msg=f"Failed updating list: {list_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-                return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+                return json_response(response_data, status=409)
 
             response_data = {"message": "List updated", "updated_rows": updated_rows}
             logger.info(msg=f"List: {list_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+            return json_response(response_data, status=200)
+
+
+    @staticmethod
+    def is_listable(list_id: int, listing_id: int, db_session=None):
+        """
+        Check that a listing can be added to a list: it exists, and is not a draft unless the list's
+        owner created it.
+
+        Args:
+            list_id (int): The ID of the list.
+            listing_id (int): The ID of the listing.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            bool: Whether the listing can be added.
+        """
+        list_row = ListMapper.get_list_by_id(list_id=list_id, db_session=db_session)
+        listing = ListingMapper.get_listing_by_id(listing_id=listing_id, include_drafts=True, db_session=db_session)
+        if not list_row or not listing:
+            return False
+        return listing.get("status") != "draft" or listing.get("user_id") == list_row.get("user_id")
 
 
     @staticmethod
@@ -178,8 +206,8 @@ class ListService:
         if not deleted_rows:
             response_data = {"error": "List not found"}
             logger.error(msg=f"List: {list_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "List deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"List: {list_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
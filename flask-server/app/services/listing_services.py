@@ -1,10 +1,15 @@
-from flask import jsonify, Response
 from flask_login import current_user
 
-from ..data_mappers import ListingMapper
+from datetime import datetime
+
+from ..data_mappers import ListingMapper, AuctionDeadlineMapper
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
-from ..utils.auction_tasks import end_auction_task
-from ..utils.scheduler import scheduler
+from ..utils.pagination import next_cursor
+from ..utils.auction_engine import auction_engine
+from ..utils.search_index import search_index
+from ..utils.suggest_index import suggest_index, MAX_SUGGESTIONS
+from ..utils.response_cache import response_cache
 
 logger = setup_logger(name="listing_logger", log_file="logs/listing.log")
 
@@ -14,24 +19,93 @@ class ListingService:
         """
         Retrieves a list of all listings, with optional filtering and sorting based on query parameters.
 
+        With `facets=true`, the response also contains the number of listings matching the search
+        per category, listing type and price bucket, so the filters can show counts without one
+        request per filter value.
+
         Args:
             args (dict): Dictionary of query parameters.
             db_session: Optional database session to be used in tests.
 
         Returns:
-            A Response object containing the list of listings with a 200 status code.
+            A Response object containing the list of listings and, when the page is full, the
+            `next_cursor` to request the following page with, with a 200 status code.
         """
-        listings = ListingMapper.get_all_listings(args=args, db_session=db_session)
+        try:
+            listings = ListingMapper.get_all_listings(args=args, db_session=db_session)
+            facets = ListingMapper.get_facets(args=args, db_session=db_session) if str(args.get("facets", "")).lower() == "true" else None
+        except ValueError as e:
+            response_data = {"error": str(e)}
+            logger.error(msg=f"Invalid listings query: {e}")
+            return json_response(response_data, status=400)
+
         if not listings:
             response_data = {"error": "No listings found"}
             logger.error(msg=f"No listings found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
-        response_data = {"message": "Listings found", "listings": listings}
+        sort, _ = ListingMapper.get_sort(args=args)
+        cursor = next_cursor(rows=listings, sort=sort, id_column="listing_id", limit=int(args.get("range", 0)))
+        response_data = {"message": "Listings found", "listings": listings, "next_cursor": cursor}
+        if facets is not None:
+            response_data["facets"] = facets
         logger.info(msg=f"Listings found: {[listing.get('listing_id') for listing in listings]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
         
 
+    @staticmethod
+    def get_listings_version(args: dict, db_session=None):
+        """
+        Retrieves the version of the listings a query can show, for conditional GETs.
+
+        Args:
+            args (dict): Dictionary of query parameters.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: The latest `updated_at` of the listings and their `count`.
+        """
+        return ListingMapper.get_listings_version(args=args, db_session=db_session)
+
+
+    @staticmethod
+    def get_suggestions(args: dict, db_session=None):
+        """
+        Retrieves typeahead suggestions for the prefix typed in the search bar.
+
+        Args:
+            args (dict): Dictionary of query parameters, `prefix` and optionally `limit`.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            A Response object containing the suggestions with a 200 status code (an empty list if
+            nothing matches), or a 400 error if the prefix or limit is invalid.
+        """
+        prefix = args.get("prefix", "").strip()
+        limit = args.get("limit", "10")
+        if not prefix or not limit.isdigit() or not 0 < int(limit) <= MAX_SUGGESTIONS:
+            response_data = {"error": f"A prefix and a limit between 1 and {MAX_SUGGESTIONS} are required"}
+            logger.error(msg=f"Invalid suggestions query: prefix={prefix!r}, limit={limit!r}")
+            return json_response(response_data, status=400)
+
+        suggestions = ListingMapper.get_suggestions(prefix=prefix, limit=int(limit), db_session=db_session)
+        response_data = {"message": "Suggestions found", "suggestions": suggestions}
+        return json_response(response_data, status=200)
+
+
+    @staticmethod
+    def get_index_stats():
+        """
+        Retrieves the size and memory use of the in-memory search and suggest indexes and the response cache.
+
+        Returns:
+            A Response object containing the statistics of each index with a 200 status code.
+        """
+        response_data = {"message": "Index statistics found", "suggest": suggest_index.stats(), "search": search_index.stats(), "response_cache": response_cache.stats()}
+        logger.info(msg=f"Index statistics found: {response_data}")
+        return json_response(response_data, status=200)
+
+
     @staticmethod
     def get_listing_by_id(listing_id: int, db_session=None):
         """
@@ -48,12 +122,43 @@ class ListingService:
         if not listing:
             response_data = {"error": "Listing not found"}
             logger.error(msg=f"Listing: {listing_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
+
+        # Bids accepted by the auction engine may not be persisted yet
+        auction = auction_engine.get_state(listing_id)
+        if auction:
+            listing.update(current_price=auction.get("current_price"), bids=auction.get("bids"), auction_end=auction.get("auction_end"))
 
         response_data = {"message": "Listing found", "listing": listing}
         logger.info(msg=f"Listing: {listing_id} found")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
+
+
+
+    @staticmethod
+    def get_listing_version(listing_id: int, db_session=None):
+        """
+        Retrieves the version of a listing, for conditional GETs.
+
+        Bids accepted by the auction engine may not be persisted yet, so the version of an auction
+        it holds includes its live state, and has no `last_modified`.
+
+        Args:
+            listing_id: The ID of the listing.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: The `updated_at` of the listing and its `last_modified` or live auction state, or
+                None if the listing does not exist.
+        """
+        updated_at = ListingMapper.get_listing_version(listing_id=listing_id, db_session=db_session)
+        if updated_at is None:
+            return None
 
+        auction = auction_engine.get_state(listing_id)
+        if auction:
+            return {"updated_at": updated_at, "current_price": auction.get("current_price"), "bids": auction.get("bids"), "auction_end": auction.get("auction_end")}
+        return {"updated_at": updated_at, "last_modified": updated_at}
 
 
     @staticmethod
@@ -61,34 +166,52 @@ class ListingService:
         """
         Creates a new listing with the provided data.
 
+        Auctions whose `auction_start` is in the future are created as drafts and go live at that
+        time, activated by the auction scheduler along with every other draft due.
+
         Args:
             data: A dictionary containing the request arguments.
             db_session: Optional database session to be used in tests.
 
         Returns:
-            A Response object with the success message and newly created listing ID, or a 400 error if the title is missing.
+            A Response object with the success message and newly created listing ID, or a 400 error if the auction start or end is invalid.
         """
         listing_data = data.get("listing", {})
-        listing_data.update(user_id=current_user.id, status="active")
+        auction = listing_data.get("listing_type") == "auction"
+        auction_start, auction_end = (listing_data.get(key) if auction else None for key in ("auction_start", "auction_end"))
+        try:
+            auction_start = datetime.fromisoformat(auction_start) if isinstance(auction_start, str) else auction_start
+            auction_end = datetime.fromisoformat(auction_end) if isinstance(auction_end, str) else auction_end
+            if auction_start and auction_end and auction_start >= auction_end:
+                raise ValueError("auction_start must be before auction_end")
+            draft = auction_start is not None and auction_start > datetime.now()
+        except (TypeError, ValueError) as e:
+            response_data = {"error": "Invalid auction start or end"}
+            logger.error(msg=f"Failed creating listing with auction start: {auction_start!r} and end: {auction_end!r}: {e}")
+            return json_response(response_data, status=400)
+
+        listing_data.update(user_id=current_user.id, status="draft" if draft else "active")
 
         listing_id = ListingMapper.create_listing(data=listing_data, db_session=db_session)
         if not listing_id:
             response_data = {"error": "Error creating listing"}
             logger.error(msg=f"Failed creating listing with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
-
-        if listing_data.get("listing_type") == "auction":
-            scheduler.add_job(
-                func=end_auction_task,
-                trigger='date',
-                run_date=listing_data.get("auction_end"),
-                id=listing_data.get("listing_id"),
-                replace_existing=True
+            return json_response(response_data, status=409)
+
+        if draft:
+            AuctionDeadlineMapper.schedule_deadline(
+                data={"kind": "activate", "listing_id": listing_id, "due_at": auction_start},
+                db_session=db_session
+            )
+        if auction_end:
+            AuctionDeadlineMapper.schedule_deadline(
+                data={"kind": "end", "listing_id": listing_id, "due_at": auction_end},
+                db_session=db_session
             )
 
         response_data = {"message": "Listing created", "listing_id": listing_id}
         logger.info(msg=f"Listing: {listing_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype="application/json")
+        return json_response(response_data, status=201)
         
 
     @staticmethod
@@ -108,11 +231,11 @@ class ListingService:
         if not updated_rows:
             response_data = {"error": "Error updating listing"}
             logger.error(msg=f"Failed updating listing: {listing_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Listing updated", "updated_rows": updated_rows}
         logger.info(msg=f"Listing: {listing_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
 
@@ -132,9 +255,9 @@ class ListingService:
         if not deleted_rows:
             response_data = {"message": "Listing not found"}
             logger.error(msg=f"Listing: {listing_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Listing deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Listing: {listing_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
@@ -1,5 +1,5 @@
-from flask import jsonify, Response
 import os, re
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="log_logger", log_file="logs/log.log")
@@ -17,7 +17,7 @@ class LogService:
         logs = [f for f in os.listdir("logs") if f.endswith(".log")]
         response_data = {"message": "Logs successfully retrieved", "logs": logs}
         logger.info(msg=f"Logs found: {logs}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -41,13 +41,13 @@ class LogService:
         if ".." in filename or not filename.endswith(".log"):
             response_data = {"error": "Invalid filename"}
             logger.error(msg=f"Invalid filename: {filename}")
-            return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+            return json_response(response_data, status=400)
 
         filepath = f"logs/{filename}"
         if not os.path.isfile(filepath):
             response_data = {"error": "File not found"}
             logger.error(msg=f"Log: {filename} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         log_lines = []
         try:
@@ -68,8 +68,8 @@ class LogService:
         except Exception as e:
             response_data = {"error": "Error reading log file"}
             logger.error(msg=f"Error reading log file: {e}")
-            return Response(response=jsonify(response_data).get_data(), status=500, mimetype="application/json")
+            return json_response(response_data, status=500)
 
         response_data = {"message": "Log file successfully retrieved", "log": log_lines}
         logger.info(msg=f"Returning {len(log_lines)} lines from log: {filename}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
@@ -1,9 +1,10 @@
-from flask import jsonify, Response, send_from_directory
+from flask import send_from_directory
 
 from dotenv import load_dotenv
 import os
 
 from ..data_mappers import ModelMapper
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 load_dotenv()
@@ -28,11 +29,11 @@ class ModelService:
         if not models:
             response_data = {"error": "No models found"}
             logger.error(msg=f"No models found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Models found", "models": models}
         logger.info(msg=f"Models found: {[model.get('file_reference') for model in models]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -52,13 +53,13 @@ class ModelService:
         if not model:
             response_data = {"error": "Model not found"}
             logger.error(msg=f"Model not found for listing: {listing_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         model.update(file_reference=f"{os.getenv("BACKEND_MODEL_URL")}/{model.get("file_reference")}")
 
         response_data = {"message": "Model found", "model": model}
         logger.info(msg=f"Model: {model.get('file_reference')} found for listing: {listing_id}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -78,13 +79,13 @@ class ModelService:
         if not model:
             response_data = {"error": "Model not found"}
             logger.error(msg=f"Model: {model_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         model.update(file_reference=f"{os.getenv("BACKEND_URL")}/api/models/{model.get("file_reference")}")
 
         response_data = {"message": "Model found", "model": model}
         logger.info(msg=f"Model: {model_id} found")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -104,18 +105,18 @@ class ModelService:
         if not model:
             response_data = {"error": "Model not found"}
             logger.error(msg=f"Model: {model_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         models_directory = os.path.join(os.getcwd(), 'models/')
         model_file = send_from_directory(models_directory, model.get("file_reference"))
         if not model_file:
             response_data = {"error": "Model not found"}
             logger.error(msg=f"Model: {model_file} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Model found", "model": model_file}
         logger.info(msg=f"Model: {model_file} found")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -135,11 +136,11 @@ class ModelService:
         if not model_id:
             response_data = {"error": "Error creating model"}
             logger.error(msg=f"Failed creating model with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Model created", "model_id": model_id}
         logger.info(msg=f"Model: {model_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype="application/json")
+        return json_response(response_data, status=201)
 
 
     @staticmethod
@@ -159,8 +160,8 @@ class ModelService:
         if not deleted_rows:
             response_data = {"error": "Model not found"}
             logger.error(msg=f"Model: {model_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Model deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Model: {model_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
\ No newline at end of file
+        return json_response(response_data, status=200)
\ No newline at end of file
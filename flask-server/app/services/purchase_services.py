@@ -1,4 +1,3 @@
-from flask import Response, jsonify
 from flask_login import current_user
 
 from datetime import date, timedelta
@@ -6,6 +5,8 @@ from dotenv import load_dotenv
 import stripe, os
 
 from ..data_mappers import ProfileMapper, OrderMapper, TransactionMapper, DeliveryMapper, ListingMapper
+from ..database import unit_of_work, checkout, UnitOfWork
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 load_dotenv()
@@ -21,6 +22,10 @@ class PurchaseService:
         """
         Process Stripe Payment
 
+        The order is created and its listings reserved in a transaction of its own, committed
+        before Stripe is called, so the listing row locks are not held during the request to
+        Stripe. If the session cannot be created, the order is cancelled and its listings released.
+
         Args:
             data (dict): Payment data including amount, currency, success_url, cancel_url, and listings.
             db_session: Optional database session to be used in tests.
@@ -30,43 +35,50 @@ class PurchaseService:
                       or an error message with the appropriate HTTP status code.
         """
         try:
-            amount = int(float(data.get("amount")) * 100)
-            currency, success_url, cancel_url = (data.get(k) for k in ("currency", "success_url", "cancel_url"))
-
-            session = stripe.checkout.Session.create(
-                payment_method_types = ["card"],
-                line_items = [{
-                    "price_data": {
-                        "currency": currency,
-                        "product_data": {"name": "Purchase from Marketplace"},
-                        "unit_amount": amount,
-                    },
-                    "quantity": 1,
-                }],
-                mode = "payment",
-                success_url = success_url,
-                cancel_url = cancel_url,
-            )
-
-            data = {"listings": data.get("listings"), "amount": data.get("amount")}
-            response_data = PurchaseService.process_purchase(data=data, db_session=db_session)
+            # Create the order first, so the customer is charged the total computed from the locked listings
+            with UnitOfWork(connection_factory=checkout):
+                response_data = PurchaseService.process_purchase(data={"listings": data.get("listings"), "amount": data.get("amount")}, db_session=db_session)
             if not response_data.get("status") == 200:
                 error = {"error": response_data.get("error")}
                 status = response_data.get("status")
-                return Response(response=jsonify(error).get_data(), status=status, mimetype="application/json")
+                return json_response(error, status=status)
+
+            order_id = response_data.get("order_id")
+            amount = int(round(response_data.get("amount") * 100))
+            currency, success_url, cancel_url = (data.get(k) for k in ("currency", "success_url", "cancel_url"))
+
+            try:
+                session = stripe.checkout.Session.create(
+                    payment_method_types = ["card"],
+                    line_items = [{
+                        "price_data": {
+                            "currency": currency,
+                            "product_data": {"name": "Purchase from Marketplace"},
+                            "unit_amount": amount,
+                        },
+                        "quantity": 1,
+                    }],
+                    mode = "payment",
+                    success_url = success_url,
+                    cancel_url = cancel_url,
+                    idempotency_key = f"checkout-order-{order_id}",  # Retries never open a second session for the order
+                )
+            except Exception:
+                PurchaseService.release_order(order_id=order_id, quantities=response_data.get("quantities"), db_session=db_session)
+                raise
 
             response_data = {"message": "Stripe session created", "id": session.id}
             logger.info(msg=f"Stripe session: {session.id} created successfully")
-            return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+            return json_response(response_data, status=200)
 
         except stripe.error.StripeError as e:
             response_data = {"error": str(e)}
             logger.error(msg=f"Failed creating stripe session with data: {', '.join(f'{k}={v!r}' for k, v in data.items())} stripe error: {e}")
-            return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+            return json_response(response_data, status=400)
         except Exception as e:
             response_data = {"error": "Internal server error", "details": str(e)}
             logger.error(msg=f"Failed creating stripe session with data: {', '.join(f'{k}={v!r}' for k, v in data.items())} internal server error: {e}")
-            return Response(response=jsonify(response_data).get_data(), status=500, mimetype="application/json")
+            return json_response(response_data, status=500)
 
 
     @staticmethod
@@ -100,76 +112,131 @@ class PurchaseService:
         """
         Create a New Order
 
+        The order, its items and deliveries and the listing purchase counters are written in one
+        transaction; if any step fails, nothing is kept.
+
         Args:
             data (dict): Includes user_id, listings, amount, and profile.
             db_session: Optional database session to be used in tests.
 
         Returns:
-            dict: {"status": 200} on success, or {"error": str, "status": int} on failure.
+            dict: {"status": 200, "amount": float, "quantities": dict, "order_id": int} on success, or
+                {"error": str, "status": int} on failure.
         """
-        order_data = {"user_id": data.get("user_id"), "status": "processing"}
-        order_id = OrderMapper.create_order(data=order_data, db_session=db_session)
-        if not order_id:
-            logger.error(msg=f"Failed creating order with data: {', '.join(f'{k}={v!r}' for k, v in order_data.items())}")
-            return {"error": "Error creating order", "status": 409}
+        with unit_of_work() as uow:
+            order_data = {"user_id": data.get("user_id"), "status": "processing"}
+            order_id = OrderMapper.create_order(data=order_data, db_session=db_session)
+            if not order_id:
+                uow.rollback_only = True
+                logger.error(msg=f"Failed creating order with data: {', '.join(f'{k}={v!r}' for k, v in order_data.items())}")
+                return {"error": "Error creating order", "status": 409}
 
-        logger.info(msg=f"Order: {order_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in order_data.items())}")
+            logger.info(msg=f"Order: {order_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in order_data.items())}")
 
-        data.update(order_id=order_id)
-        return PurchaseService.handle_items(data=data, db_session=db_session)
+            data.update(order_id=order_id)
+            response_data = PurchaseService.handle_items(data=data, db_session=db_session)
+            if response_data.get("status") != 200:
+                uow.rollback_only = True
+                return response_data
+            return {**response_data, "order_id": order_id}
 
 
     @staticmethod
-    def handle_items(data: dict, db_session=None):
+    def release_order(order_id: int, quantities: dict, db_session=None):
         """
-        Process Each Purchased Listing
+        Cancel an order whose payment could not be started and release its listings.
+
+        The order was committed before Stripe was called, so this runs in a transaction of its own
+        rather than the request's, which is rolled back with the error response.
 
         Args:
-            data (dict): Contains user_id, profile, listings, order_id, and transaction_id.
+            order_id (int): The ID of the order.
+            quantities (dict[int, int]): Quantity ordered, by listing ID.
             db_session: Optional database session to be used in tests.
-
-        Returns:
-            dict: {"status": 200} on success, or {"error": str, "status": int} on failure.
         """
-        for listing in data.get("listings"):
-            if listing.get("status") != "active":
-                return {"error": "Listing is not available for purchase", "status": 400}
-            # TODO: sold functionality requires new data/logic of total items available for purchase
-            # listing.update(status="sold")
-
-            listing.update(purchases=(listing.get("purchases") + listing.get("quantity")))
-
-            listing_data = {key: val for key, val in listing.items() if key != "quantity" and key != "updated_at"}
-            updated_rows = ListingMapper.update_listing(listing_id=listing.get("listing_id"), data=listing_data, db_session=db_session)
-            if not updated_rows:
-                logger.error(msg=f"Failed updating listing: {listing.get('listing_id')} with data: {', '.join(f'{k}={v!r}' for k, v in listing_data.items())}")
-                return {"error": "Error updating listing", "status": 409}
+        with UnitOfWork(connection_factory=checkout):
+            OrderMapper.update_order(order_id=order_id, data={"status": "cancelled"}, db_session=db_session)
+            ListingMapper.add_purchases(quantities={listing_id: -quantity for listing_id, quantity in quantities.items()}, db_session=db_session)
+        logger.info(msg=f"Order: {order_id} cancelled and listings: {list(quantities)} released")
 
-            logger.info(msg=f"Listing: {listing.get('listing_id')} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
 
-            # Create order item
-            order_item_data = {"order_id": data.get("order_id"), "listing_id": listing.get("listing_id"), "quantity": listing.get("quantity"),
-                               "price": listing.get("buy_now_price"), "total_price": listing.get("quantity") * listing.get("buy_now_price")}
-            order_item_id = OrderMapper.create_order_item(data=order_item_data, db_session=db_session)
-            if not order_item_id:
-                logger.error(msg=f"Failed creating order item with data: {', '.join(f'{k}={v!r}' for k, v in order_item_data.items())}")
-                return {"error": "Error creating order item", "status": 409}
+    @staticmethod
+    def handle_items(data: dict, db_session=None):
+        """
+        Process the Purchased Listings in Bulk
 
-            logger.info(msg=f"Order item: {order_item_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in order_item_data.items())}")
+        Only the listing IDs and quantities of the cart are used; the listings are locked and read
+        with one `SELECT ... FOR UPDATE` and priced from the database. Order items and deliveries
+        are then inserted with one statement each and all purchase counters updated with one more.
 
-            # Create delivery for order item
-            delivery_data = {"order_item_id": order_item_id, "user_id": data.get("user_id"), "address": data.get("profile").get("address"),
-                             "city": data.get("profile").get("city"), "state": data.get("profile").get("state"), "country": data.get("profile").get("country"),
-                             "delivery_status": "processing", "tracking_number": "0000000000", "courier": "UPS",
-                             "estimated_delivery_date": date.today() + timedelta(days=5)}
-            delivery_id = DeliveryMapper.create_delivery(data=delivery_data, db_session=db_session)
-            if not delivery_id:
-                logger.error(msg=f"Failed creating delivery with data: {', '.join(f'{k}={v!r}' for k, v in delivery_data.items())}")
-                return {"error": "Error creating delivery", "status": 409}
+        Args:
+            data (dict): Contains user_id, profile, listings, amount, and order_id.
+            db_session: Optional database session to be used in tests.
 
-            logger.info(msg=f"Delivery: {delivery_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in delivery_data.items())}")
+        Returns:
+            dict: {"status": 200, "amount": float, "quantities": dict} with the order total and the
+                quantity ordered by listing ID on success, or {"error": str, "status": int} on failure.
+        """
+        quantities = {}
+        for line in data.get("listings") or []:
+            listing_id, quantity = line.get("listing_id"), line.get("quantity")
+            if not isinstance(listing_id, int) or not isinstance(quantity, int) or isinstance(quantity, bool) or quantity < 1:
+                logger.error(msg=f"Invalid cart line: {line!r}")
+                return {"error": "Invalid listing or quantity", "status": 400}
+            quantities[listing_id] = quantities.get(listing_id, 0) + quantity
+        if not quantities:
+            return {"error": "No listings to purchase", "status": 400}
+
+        listings = ListingMapper.lock_listings(listing_ids=sorted(quantities), db_session=db_session)
+        for listing_id in quantities:
+            listing = listings.get(listing_id)
+            if not listing or listing.get("status") != "active" or listing.get("buy_now_price") is None:
+                logger.error(msg=f"Listing: {listing_id} is not available for purchase")
+                return {"error": "Listing is not available for purchase", "status": 400}
+            # TODO: sold functionality requires new data/logic of total items available for purchase
 
-        return {"status": 200}
+        total = round(sum(listings[listing_id].get("buy_now_price") * quantity for listing_id, quantity in quantities.items()), 2)
+        try:
+            if data.get("amount") is not None and abs(float(data.get("amount")) - total) >= 0.01:
+                logger.error(msg=f"Order: {data.get('order_id')} amount {data.get('amount')} does not match listing prices total {total}")
+                return {"error": "Listing prices have changed", "status": 409}
+        except (TypeError, ValueError):
+            return {"error": "Invalid amount", "status": 400}
+
+        # Create order items
+        order_items = [
+            {"order_id": data.get("order_id"), "listing_id": listing_id, "quantity": quantity,
+             "price": listings[listing_id].get("buy_now_price"), "total_price": quantity * listings[listing_id].get("buy_now_price")}
+            for listing_id, quantity in quantities.items()
+        ]
+        order_item_ids = OrderMapper.create_order_items(items=order_items, db_session=db_session)
+        if len(order_item_ids) != len(order_items):
+            logger.error(msg=f"Failed creating order items for order: {data.get('order_id')}")
+            return {"error": "Error creating order item", "status": 409}
+
+        logger.info(msg=f"Order items: {order_item_ids} created successfully for order: {data.get('order_id')}")
+
+        # Create a delivery for each order item
+        profile = data.get("profile")
+        deliveries = [
+            {"order_item_id": order_item_id, "user_id": data.get("user_id"), "address": profile.get("address"),
+             "city": profile.get("city"), "state": profile.get("state"), "country": profile.get("country"),
+             "delivery_status": "processing", "tracking_number": "0000000000", "courier": "UPS",
+             "estimated_delivery_date": date.today() + timedelta(days=5)}
+            for order_item_id in order_item_ids
+        ]
+        if DeliveryMapper.create_deliveries(deliveries=deliveries, db_session=db_session) != len(deliveries):
+            logger.error(msg=f"Failed creating deliveries for order items: {order_item_ids}")
+            return {"error": "Error creating delivery", "status": 409}
+
+        logger.info(msg=f"Deliveries created successfully for order items: {order_item_ids}")
+
+        if ListingMapper.add_purchases(quantities=quantities, db_session=db_session) != len(quantities):
+            logger.error(msg=f"Failed updating purchases of listings: {list(quantities)}")
+            return {"error": "Error updating listing", "status": 409}
+
+        logger.info(msg=f"Listings: {list(quantities)} purchases updated successfully")
+        return {"status": 200, "amount": total, "quantities": quantities}
 
 
     @staticmethod
@@ -201,7 +268,7 @@ class PurchaseService:
             if not transaction_response.get("status") == 200:
                 error = {"error": transaction_response.get("error")}
                 status = transaction_response.get("status")
-                return Response(response=jsonify(error).get_data(), status=status, mimetype="application/json")
+                return json_response(error, status=status)
 
             response_data = {
                 "message": "Found stripe session",
@@ -209,16 +276,16 @@ class PurchaseService:
                 "status": stripe_session.status
             }
             logger.info(msg=f"Stripe session: {session_id} found")
-            return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+            return json_response(response_data, status=200)
 
         except stripe.error.StripeError as e:
             response_data = {"error": str(e)}
             logger.error(msg=f"Stripe session: {session_id} error: {e}")
-            return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+            return json_response(response_data, status=400)
         except Exception as e:
             response_data = {"error": "Internal server error", "details": str(e)}
             logger.error(msg=f"Stripe session: {session_id} error: {e}")
-            return Response(response=jsonify(response_data).get_data(), status=500, mimetype="application/json")
+            return json_response(response_data, status=500)
 
 
     @staticmethod
@@ -258,13 +325,13 @@ class PurchaseService:
             payment_method = stripe.PaymentMethod.retrieve(payment_method_id)
             response_data = {"message": "Payment method found", "payment_method": payment_method}
             logger.info(msg=f"Payment method: {payment_method_id} found")
-            return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+            return json_response(response_data, status=200)
 
         except stripe.error.StripeError as e:
             response_data = {"error": str(e)}
             logger.error(msg=f"Stripe error: {e}")
-            return Response(response=jsonify(response_data).get_data(), status=400, mimetype="application/json")
+            return json_response(response_data, status=400)
         except Exception as e:
             response_data = {"error": "Internal server error", "details": str(e)}
             logger.error(msg=f"Stripe error: {e}")
-            return Response(response=jsonify(response_data).get_data(), status=500, mimetype="application/json")
\ No newline at end of file
+            return json_response(response_data, status=500)
\ No newline at end of file
@@ -1,7 +1,7 @@
-from flask import jsonify, Response
-
 from ..data_mappers import ReviewMapper
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
+from ..utils.pagination import next_cursor
 
 logger = setup_logger(name="review_logger", log_file="logs/review.log")
 
@@ -16,19 +16,59 @@ class ReviewService:
             db_session: Optional database session to be used in tests.
 
         Returns:
-            A Response object containing the list of reviews with a 200 status code.
+            A Response object containing the list of reviews and, when the page is full, the
+            `next_cursor` to request the following page with, with a 200 status code.
         """
-        reviews = ReviewMapper.get_all_reviews(args=args, db_session=db_session)
+        try:
+            reviews = ReviewMapper.get_all_reviews(args=args, db_session=db_session)
+        except ValueError as e:
+            response_data = {"error": str(e)}
+            logger.error(msg=f"Invalid reviews query: {e}")
+            return json_response(response_data, status=400)
+
         if not reviews:
             response_data = {"error": "No reviews found"}
             logger.error(msg=f"No reviews found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
-        response_data = {"message": "Reviews found", "reviews": reviews}
+        sort, _ = ReviewMapper.get_sort(args=args)
+        cursor = next_cursor(rows=reviews, sort=sort, id_column="review_id", limit=int(args.get("range", 0)))
+        response_data = {"message": "Reviews found", "reviews": reviews, "next_cursor": cursor}
         logger.info(msg=f"Reviews found: {[review.get('title') for review in reviews]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
             
 
+    @staticmethod
+    def get_reviews_version(args: dict, db_session=None):
+        """
+        Retrieves the version of the reviews a query can show, for conditional GETs.
+
+        Args:
+            args (dict): Dictionary of query parameters.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: The latest `updated_at` of the reviews and their `count`.
+        """
+        return ReviewMapper.get_reviews_version(args=args, db_session=db_session)
+
+
+    @staticmethod
+    def get_review_version(review_id: int, db_session=None):
+        """
+        Retrieves the version of a review, for conditional GETs.
+
+        Args:
+            review_id: The ID of the review.
+            db_session: Optional database session to be used in tests.
+
+        Returns:
+            dict: The `updated_at` and `last_modified` of the review, or None if it does not exist.
+        """
+        updated_at = ReviewMapper.get_review_version(review_id=review_id, db_session=db_session)
+        return {"updated_at": updated_at, "last_modified": updated_at} if updated_at else None
+
+
     @staticmethod
     def get_review_by_id(review_id: int, db_session=None):
         """
@@ -45,11 +85,11 @@ class ReviewService:
         if not review:
             response_data = {"error": "Review not found"}
             logger.error(msg=f"Review: {review_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Review found", "review": review}
         logger.info(msg=f"Review: {review_id} found")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
 
@@ -70,11 +110,11 @@ class ReviewService:
         if not review_id:
             response_data = {"error": "Error creating review"}
             logger.error(msg=f"Failed creating review with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Review created", "review_id": review_id}
         logger.info(msg=f"Review: {review_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype="application/json")
+        return json_response(response_data, status=201)
             
 
     @staticmethod
@@ -95,11 +135,11 @@ class ReviewService:
         if not updated_rows:
             response_data = {"error": "Error updating review"}
             logger.error(msg=f"Failed updating review: {review_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Review updated", "updated_rows": updated_rows}
         logger.info(msg=f"Review: {review_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
 
@@ -120,9 +160,9 @@ class ReviewService:
         if not deleted_rows:
             response_data = {"error": "Review not found"}
             logger.error(msg=f"Review: {review_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Review deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Review: {review_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
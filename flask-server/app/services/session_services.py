@@ -1,9 +1,10 @@
-from flask import jsonify, session, Response
+from flask import session
 
 from datetime import datetime, timedelta
 import uuid
 
 from ..data_mappers import SessionMapper
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="session_logger", log_file="logs/session.log")
@@ -36,8 +37,8 @@ class SessionService:
         if not session_id:
             response_data = {"error": "Error creating session"}
             logger.error(msg=f"Failed creating session with data: {', '.join(f'{k}={v!r}' for k, v in session_data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Session created", "session_id": session_id}
         logger.info(msg=f"Session: {session_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in session_data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype="application/json")
+        return json_response(response_data, status=201)
@@ -1,7 +1,7 @@
-from flask import jsonify, Response
 from flask_login import current_user
 
 from ..data_mappers import SupportTicketMapper, TicketMessageMapper
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="support_ticket_logger", log_file="logs/support_ticket.log")
@@ -26,11 +26,11 @@ class SupportTicketService:
         if not tickets:
             response_data = {"error": "No support tickets found"}
             logger.error(msg=f"No support tickets found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Support tickets retrieved", "support_tickets": tickets}
         logger.info(msg=f"Support tickets found: {[ticket.get('subject') for ticket in tickets]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -49,11 +49,11 @@ class SupportTicketService:
         if not ticket:
             response_data = {"error": "Support ticket not found"}
             logger.error(msg=f"Support ticket: {ticket_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Support ticket retrieved", "ticket": ticket}
         logger.info(msg=f"Support ticket: {ticket_id} found")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -79,7 +79,7 @@ class SupportTicketService:
         if not ticket_id:
             response_data = {"error": "Error creating support ticket"}
             logger.error(msg=f"Failed creating support ticket with data: {', '.join(f'{k}={v!r}' for k, v in ticket_data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+            return json_response(response_data, status=409)
 
         ticket_message_data = {
             "ticket_id": ticket_id,
@@ -90,11 +90,11 @@ class SupportTicketService:
         if not ticket_message_id:
             response_data = {"error": "Error creating support ticket message"}
             logger.error(msg=f"Failed creating support ticket message with data: {', '.join(f'{k}={v!r}' for k, v in ticket_message_data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Support ticket and message created", "ticket_id": ticket_id, "ticket_message_id": ticket_message_id}
         logger.info(msg=f"Support ticket: {ticket_id} and message created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype='application/json')
+        return json_response(response_data, status=201)
 
 
     @staticmethod
@@ -114,11 +114,11 @@ class SupportTicketService:
         if not updated_rows:
             response_data = {"error": "Error updating support ticket"}
             logger.error(msg=f"Failed updating support ticket: {ticket_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "Support ticket updated", "updated_rows": updated_rows}
         logger.info(msg=f"Support ticket: {ticket_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -137,8 +137,8 @@ class SupportTicketService:
         if not deleted_rows:
             response_data = {"error": "Support ticket not found"}
             logger.error(msg=f"Support ticket: {ticket_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Support ticket deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Support ticket: {ticket_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
\ No newline at end of file
+        return json_response(response_data, status=200)
\ No newline at end of file
@@ -1,7 +1,9 @@
-from flask import jsonify, Response
+from functools import partial
 
 from ..data_mappers import TicketMessageMapper, SupportTicketMapper
-from ..utils.socketio import socketio
+from ..database import on_commit
+from ..utils.socketio import socketio, ticket_room
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="ticket_message_logger", log_file="logs/ticket_message.log")
@@ -24,11 +26,11 @@ class TicketMessageService:
         if not messages:
             response_data = {"error": "No messages found"}
             logger.error(msg=f"No messages found for support ticket: {ticket_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Messages found", "ticket_messages": messages}
         logger.info(msg=f"Messages found: {[message.get('message') for message in messages]}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
 
 
     @staticmethod
@@ -47,19 +49,20 @@ class TicketMessageService:
         if not message_id:
             response_data = {"error": "Error creating message"}
             logger.error(msg=f"Failed creating message with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+            return json_response(response_data, status=409)
 
         updated_rows = SupportTicketMapper.update_ticket_timestamp(ticket_id=data.get("ticket_id"), db_session=db_session)
         if not updated_rows:
             response_data = {"error": "Error updating ticket timestamp"}
             logger.error(msg=f"Failed updating timestamp of support ticket: {data.get('ticket_id')}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype='application/json')
+            return json_response(response_data, status=409)
 
-        socketio.emit("new_ticket_message")
+        # Sent once committed, so the refetch it triggers finds the message
+        on_commit(partial(socketio.emit, "new_ticket_message", {"ticket_id": data.get("ticket_id"), "message_id": message_id, "sender_id": data.get("sender_id")}, to=ticket_room(data.get("ticket_id"))))
 
         response_data = {"message": "Message created", "message_id": message_id}
         logger.info(msg=f"Message: {message_id} created successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=201, mimetype='application/json')
+        return json_response(response_data, status=201)
 
 
     @staticmethod
@@ -78,8 +81,8 @@ class TicketMessageService:
         if not deleted_rows:
             response_data = {"error": "Message not found"}
             logger.error(msg=f"Message: {message_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype='application/json')
+            return json_response(response_data, status=404)
 
         response_data = {"message": "Message deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"Message: {message_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype='application/json')
+        return json_response(response_data, status=200)
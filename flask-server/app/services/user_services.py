@@ -1,7 +1,7 @@
-from flask import jsonify, Response
 from flask_login import current_user
 
 from ..data_mappers import UserMapper, ProfileMapper
+from ..utils.responses import json_response
 from ..utils.logger import setup_logger
 
 logger = setup_logger(name="user_logger", log_file="logs/user.log")
@@ -25,11 +25,11 @@ class UserService:
         if not user:
             response_data = {"error": "User not found"}
             logger.error(msg=f"User: {user_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "User found", "user": user}
         logger.error(msg=f"User: {user_id} found")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
 
@@ -52,11 +52,11 @@ class UserService:
         if not updated_rows:
             response_data = {"error": "Error updating user"}
             logger.error(msg=f"Failed updating user: {user_id} with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-            return Response(response=jsonify(response_data).get_data(), status=409, mimetype="application/json")
+            return json_response(response_data, status=409)
 
         response_data = {"message": "User updated", "updated_rows": updated_rows}
         logger.info(msg=f"User: {user_id} updated successfully with data: {', '.join(f'{k}={v!r}' for k, v in data.items())}")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
+        return json_response(response_data, status=200)
 
 
 
@@ -78,7 +78,7 @@ class UserService:
         if not deleted_rows:
             response_data = {"error": "Profile not found"}
             logger.error(msg=f"Profile not found for user: {user_id}")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         user_id = user_id if current_user.role in ["staff", "admin"] else current_user.id
         deleted_rows = UserMapper.delete_user(user_id=user_id, db_session=db_session)
@@ -86,8 +86,8 @@ class UserService:
         if not deleted_rows:
             response_data = {"error": "User not found"}
             logger.error(msg=f"User: {user_id} not found")
-            return Response(response=jsonify(response_data).get_data(), status=404, mimetype="application/json")
+            return json_response(response_data, status=404)
 
         response_data = {"message": "User and profile deleted", "deleted_rows": deleted_rows}
         logger.info(msg=f"User: {user_id} deleted successfully")
-        return Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json")
\ No newline at end of file
+        return json_response(response_data, status=200)
\ No newline at end of file
@@ -0,0 +1,625 @@
+from pymysql import cursors
+from collections import deque
+from datetime import datetime
+from dotenv import load_dotenv
+import glob, json, os, threading
+
+from ..entities import Bid, MaxBid
+from .logger import setup_logger
+from .proxy_bidding import resolve_proxies
+from .soft_close import extended_end
+from .suggest_index import suggest_index
+from .response_cache import response_cache, listing_tag
+
+load_dotenv()
+
+logger = setup_logger(name="bid_logger", log_file="logs/bid.log")
+
+# Columns of a listing held in the live state of its auction
+AUCTION_COLUMNS = ("listing_id", "status", "auction_end", "current_price", "bids")
+
+# Accepted bids kept in memory per auction
+RECENT_BIDS = 10
+
+# Journal size above which it is emptied once every bid in it is persisted
+MAX_JOURNAL_BYTES = 16 * 1024 * 1024
+
+# Journals of the processes that ran the engine, one per process, in the journal directory
+JOURNAL_PATTERN = "auction_journal*.log"
+
+# Result of a bid on an auction the writer does not hold yet, to submit again with its loaded state
+NOT_LOADED = object()
+
+
+class Reply:
+    """
+    Result of an operation submitted to the auction engine's writer.
+
+    A lock acquired on creation and released by the writer once the result is set; much cheaper
+    than a `Future` or `Event` (both built on a `Condition`) on the hot path, with or without gevent.
+    """
+    def __init__(self):
+        self._done = threading.Lock()
+        self._done.acquire()
+        self._result = None
+
+    def set_result(self, result):
+        self._result = result
+        self._done.release()
+
+    def result(self, timeout: float | None = None):
+        """
+        Wait for the result.
+
+        Args:
+            timeout (float, optional): Seconds to wait, forever if omitted.
+
+        Raises:
+            TimeoutError: If the result is not set in time.
+        """
+        if not self._done.acquire(timeout=-1 if timeout is None else timeout):
+            raise TimeoutError("Auction engine did not answer in time")
+        self._done.release()
+        return self._result
+
+
+class AuctionState:
+    """
+    Live state of an auction, as seen by the auction engine.
+
+    Attributes:
+        listing_id (int): The ID of the auctioned listing.
+        status (str): The listing status; only "active" auctions accept bids.
+        auction_end (datetime | None): When the auction ends.
+        current_price (float): The highest accepted bid (or starting price).
+        leader (int | None): The ID of the user with the highest accepted bid, if known.
+        bids (int): Number of bids accepted.
+        recent (deque[dict]): The latest accepted bids, newest first.
+        max_bids (dict): Maximum bid amount per user ID, in registration order.
+    """
+    def __init__(self, listing_id: int, status: str, auction_end: datetime | None, current_price: float | None, bids: int | None):
+        self.listing_id = listing_id
+        self.status = status
+        self.auction_end = auction_end
+        self.current_price = current_price or 0
+        self.leader = None
+        self.bids = bids or 0
+        self.recent = deque(maxlen=RECENT_BIDS)
+        self.max_bids = {}
+
+    def to_dict(self):
+        """Converts the auction state to a dictionary representation."""
+        return {
+            "listing_id": self.listing_id,
+            "current_price": self.current_price,
+            "leader": self.leader,
+            "bids": self.bids,
+            "auction_end": self.auction_end,
+            "recent_bids": list(self.recent)
+        }
+
+
+class AuctionEngine:
+    """
+    In-memory order book of live auctions with write-behind persistence.
+
+    Bids are validated and sequenced one at a time by a single writer thread (a greenlet under
+    gevent) against the in-memory state of their auction, which the caller loads from the database
+    on the auction's first bid, so the writer never waits on the database. Maximum (proxy) bids are
+    held with the auction and answer every accepted bid in the same step, so a bidding war between
+    maximums results in a single bid. Accepted bids and maximum bids are appended to an append-only
+    journal before they are queued for persistence and the caller is answered; all bids queued at
+    once share one journal write (group commit). Other threads read the auctions' states from
+    snapshots the writer publishes once their bids are journaled.
+
+    A flusher thread persists accepted bids every `flush_interval` seconds: one `executemany`
+    insert into `bids` (and upsert into `max_bids`) and one UPDATE of the listings' prices and bid counts per batch. It then
+    asks the writer to append a checkpoint to the journal. On start, bids journaled after the
+    last checkpoint that are missing from the database are persisted again, so a crash loses no
+    acknowledged bid. The journal is flushed to the operating system on every write (surviving a
+    process crash) and also fsynced if `fsync` is set (surviving a machine crash, at the cost of
+    blocking the process on every write).
+
+    The order book only holds the bids of the process running the engine, so a single process
+    may run it: the application starts it in the auction scheduler's leader, which holds a MySQL
+    named lock, and stops it when the leader steps down. Each process journals to its own file in
+    `journal_dir`; the next process to start the engine recovers the journals left behind.
+
+    When `enabled`, bids must go through the engine: processes not running it refuse them instead
+    of placing them in the database behind its back.
+
+    Args:
+        journal_dir (str): Directory of the journals.
+        flush_interval (float): Seconds between persistence batches.
+        fsync (bool): Whether to fsync the journal on every write.
+    """
+    def __init__(self, journal_dir: str, flush_interval: float = 0.1, fsync: bool = False):
+        self.journal_dir = journal_dir
+        self.journal_path = None  # Journal of this process, set on start
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+
+        self.enabled = False
+        self.running = False
+
+        self._lock = threading.Lock()
+        self._incoming = deque()  # Operations submitted to the writer
+        self._wakeup = threading.Event()  # Set when operations are waiting
+        self._auctions = {}  # listing_id -> AuctionState, owned by the writer
+        self._snapshots = {}  # listing_id -> state of the auction as of its last journaled bid, for readers
+        self._sequence = 0  # Sequence number of the last accepted bid
+        self._journaling = []  # Bids accepted in the writer's current batch, not journaled yet
+        self._pending = []  # Accepted bids journaled but not persisted yet, in sequence order
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._journal = None
+        self._connection_factory = None
+        self._threads = []
+
+    @property
+    def active(self):
+        """Whether listing writes should be reported to the engine."""
+        return self.running
+
+    @property
+    def pending(self):
+        """Number of accepted bids and maximum bids not persisted yet."""
+        with self._pending_lock:
+            return len(self._pending)
+
+    # Bids
+
+    def place_bid(self, data: dict, timeout: float = 5.0):
+        """
+        Validate, sequence and journal a bid.
+
+        Args:
+            data (dict): Dictionary containing bid details (`listing_id`, `user_id`, `amount`).
+            timeout (float): Seconds to wait for the writer.
+
+        Returns:
+            dict: `accepted`, and either the accepted `bid` (with its `sequence`) and the auction's
+                new `current_price` and `bids`, or the `error` explaining the rejection.
+
+        Raises:
+            TypeError: If the bid data is invalid.
+            RuntimeError: If the engine is not running.
+            TimeoutError: If the writer did not answer in time.
+        """
+        if not self.running:
+            raise RuntimeError("Auction engine is not running")
+        bid = Bid(**data).to_dict()
+        del bid["bid_id"]
+        return self._place("bid", bid, timeout)
+
+    def place_max_bid(self, data: dict, timeout: float = 5.0):
+        """
+        Register or change a user's maximum bid on an auction and resolve it against the others.
+
+        Args:
+            data (dict): Dictionary containing maximum bid details (`listing_id`, `user_id`, `amount`).
+            timeout (float): Seconds to wait for the writer.
+
+        Returns:
+            dict: `accepted`, and either the accepted `max_bid`, the `proxy_bid` placed on behalf of
+                a maximum bid (None if none was needed) and the auction's new `current_price`,
+                `leader` and `bids`, or the `error` explaining the rejection.
+
+        Raises:
+            TypeError: If the maximum bid data is invalid.
+            RuntimeError: If the engine is not running.
+            TimeoutError: If the writer did not answer in time.
+        """
+        if not self.running:
+            raise RuntimeError("Auction engine is not running")
+        max_bid = MaxBid(**data).to_dict()
+        del max_bid["max_bid_id"]
+        return self._place("max_bid", max_bid, timeout)
+
+    def get_state(self, listing_id: int):
+        """
+        Live state of an auction, if the engine holds it.
+
+        Args:
+            listing_id (int): The ID of the auctioned listing.
+
+        Returns:
+            dict | None: The auction's price, leader, bid count, end (extended by late bids) and recent bids.
+        """
+        return self._snapshots.get(listing_id)
+
+    def sync_listing(self, row: dict):
+        """
+        Apply a committed listing update (e.g. status or end time) to its auction's state.
+
+        Args:
+            row (dict): The listing, with at least the columns in `AUCTION_COLUMNS`.
+        """
+        self._submit("sync", row)
+
+    def forget(self, listing_id: int):
+        """
+        Drop the state of an auction, e.g. when its listing is deleted.
+
+        Args:
+            listing_id (int): The ID of the listing.
+        """
+        self._submit("forget", int(listing_id))
+
+    def _place(self, operation: str, record: dict, timeout: float):
+        """Submit a bid or maximum bid, loading its auction in the calling thread if the writer does not hold it."""
+        result = self._submit(operation, (record, None)).result(timeout=timeout)
+        if result is NOT_LOADED:
+            state = self._load_state(record.get("listing_id"))
+            result = self._submit(operation, (record, state)).result(timeout=timeout)
+        if result is None:
+            raise RuntimeError("Auction engine stopped")  # Answered without the writer
+        return result
+
+    def _submit(self, operation: str, argument):
+        reply = Reply()
+        if self.running:
+            self._incoming.append((operation, argument, reply))
+            if not self._wakeup.is_set():
+                self._wakeup.set()
+        else:
+            reply.set_result(None)
+        return reply
+
+    # Writer
+
+    def _run_writer(self):
+        while True:
+            # Operations submitted after the event is cleared set it again, so none is missed
+            self._wakeup.wait()
+            self._wakeup.clear()
+            batch = []
+            while self._incoming:
+                batch.append(self._incoming.popleft())
+
+            lines, results, touched, stop = [], [], set(), False
+            for operation, argument, reply in batch:
+                result = None
+                try:
+                    if operation in ("bid", "max_bid"):
+                        record, loaded = argument
+                        touched.add(record.get("listing_id"))
+                        result = self._sequence_bid(record, loaded) if operation == "bid" else self._register_max_bid(record, loaded)
+                        for name in ("max_bid", "bid", "proxy_bid"):
+                            if result is not NOT_LOADED and result.get(name):
+                                lines.append(json.dumps(result.get(name), default=str))
+                    elif operation == "checkpoint":
+                        lines.append(json.dumps({"persisted": argument}))
+                        if argument == self._sequence and self._journal.tell() > MAX_JOURNAL_BYTES:
+                            # Everything journaled so far is persisted
+                            lines.clear()
+                            self._journal.truncate(0)
+                    elif operation == "sync":
+                        touched.add(argument.get("listing_id"))
+                        self._sync(argument)
+                    elif operation == "forget":
+                        touched.add(argument)
+                        self._auctions.pop(argument, None)
+                    elif operation == "stop":
+                        stop = True
+                except Exception as e:
+                    logger.error(msg=f"Auction engine failed to process {operation}: {e}")
+                    result = {"accepted": False, "error": "Error placing bid"} if operation in ("bid", "max_bid") else None
+                results.append((reply, result))
+
+            try:
+                if lines:
+                    self._journal.write("\n".join(lines) + "\n")
+                    self._journal.flush()
+                    if self.fsync:
+                        os.fsync(self._journal.fileno())
+            except Exception as e:
+                # Nothing of the batch is acknowledged nor persisted; its auctions are loaded again
+                logger.error(msg=f"Auction engine failed journaling {len(self._journaling)} bids: {e}")
+                for listing_id in touched:
+                    self._auctions.pop(listing_id, None)
+                results = [(reply, {"accepted": False, "error": "Error placing bid"} if result and result is not NOT_LOADED and result.get("accepted") else result) for reply, result in results]
+            else:
+                # Queued for persistence only once journaled, so a crash cannot lose a persisted bid's record
+                with self._pending_lock:
+                    self._pending.extend(self._journaling)
+            self._journaling = []
+
+            for listing_id in touched:
+                state = self._auctions.get(listing_id)
+                if state is not None:
+                    self._snapshots[listing_id] = state.to_dict()
+                else:
+                    self._snapshots.pop(listing_id, None)
+            for reply, result in results:
+                reply.set_result(result)
+            if stop:
+                return
+
+    def _sequence_bid(self, bid: dict, loaded):
+        state, error = self._active_state(bid, loaded)
+        if state is NOT_LOADED:
+            return NOT_LOADED
+        if error:
+            return {"accepted": False, "error": error}
+        if bid.get("amount") <= state.current_price:
+            return {"accepted": False, "error": "Bid must be higher than the current price"}
+
+        self._accept(state, bid)
+        proxy_bid = self._answer_max_bids(state, bid.get("created_at"))
+        return {"accepted": True, "bid": bid, "proxy_bid": proxy_bid, **self._summary(state)}
+
+    def _register_max_bid(self, max_bid: dict, loaded):
+        state, error = self._active_state(max_bid, loaded)
+        if state is NOT_LOADED:
+            return NOT_LOADED
+        if error:
+            return {"accepted": False, "error": error}
+        if max_bid.get("amount") <= state.current_price:
+            return {"accepted": False, "error": "Maximum bid must be higher than the current price"}
+
+        state.max_bids[max_bid.get("user_id")] = max_bid.get("amount")
+        self._sequence += 1
+        max_bid.update(sequence=self._sequence, max_bid=True)
+        self._journaling.append(max_bid)
+        proxy_bid = self._answer_max_bids(state, max_bid.get("created_at"))
+        return {"accepted": True, "max_bid": max_bid, "proxy_bid": proxy_bid, **self._summary(state)}
+
+    def _active_state(self, bid: dict, loaded):
+        """
+        The auction a bid is placed on if it accepts bids, NOT_LOADED if it must be loaded first, or the error.
+
+        `loaded` is the state the caller read with `_load_state` (False if the listing does not
+        exist), or None if it did not read it yet.
+        """
+        listing_id = bid.get("listing_id")
+        state = self._auctions.get(listing_id)
+        if state is None:
+            if loaded is None:
+                return NOT_LOADED, None
+            if loaded is False:
+                return None, "Auction not found"
+            # Loaded by the caller; the writer's own state wins if another bid installed one first
+            state = self._auctions[listing_id] = loaded
+        if state.status != "active" or state.auction_end is None or state.auction_end <= bid.get("created_at"):
+            return None, "Auction is not active"
+        return state, None
+
+    def _accept(self, state: AuctionState, bid: dict):
+        self._sequence += 1
+        bid["sequence"] = self._sequence
+        auction_end = extended_end(state.auction_end, bid.get("created_at"))
+        if auction_end != state.auction_end:
+            # Extended along with the acceptance, so no bid can land between the old and new end
+            state.auction_end = bid["auction_end"] = auction_end
+        state.current_price = bid.get("amount")
+        state.leader = bid.get("user_id")
+        state.bids += 1
+        state.recent.appendleft(bid)
+        self._journaling.append(bid)
+
+    def _answer_max_bids(self, state: AuctionState, created_at: datetime):
+        """Place the single bid resolving the auction's competing maximum bids, if any is needed."""
+        resolved = resolve_proxies(state.current_price, state.leader, state.max_bids.items())
+        if resolved is None:
+            return None
+        user_id, price = resolved
+        bid = {"listing_id": state.listing_id, "user_id": user_id, "amount": price, "created_at": created_at}
+        self._accept(state, bid)
+        return bid
+
+    @staticmethod
+    def _summary(state: AuctionState):
+        return {"current_price": state.current_price, "leader": state.leader, "bids": state.bids, "auction_end": state.auction_end}
+
+    def _load_state(self, listing_id: int):
+        """Read an auction's state from the database, in the calling thread; False if the listing does not exist."""
+        conn = self._connection_factory()
+        try:
+            cursor = conn.cursor(cursors.DictCursor)  # type: ignore
+            cursor.execute(f"SELECT {', '.join(AUCTION_COLUMNS)} FROM listings WHERE listing_id = %s", (listing_id,))
+            row = cursor.fetchone()
+            if row is None:
+                return False
+            cursor.execute("SELECT user_id FROM bids WHERE listing_id = %s ORDER BY amount DESC, bid_id DESC LIMIT 1", (listing_id,))
+            leader = cursor.fetchone()
+            cursor.execute("SELECT user_id, amount FROM max_bids WHERE listing_id = %s ORDER BY created_at, max_bid_id", (listing_id,))
+            max_bids = cursor.fetchall()
+        finally:
+            conn.close()
+        state = AuctionState(**{column: row.get(column) for column in AUCTION_COLUMNS})
+        state.leader = leader.get("user_id") if leader else None
+        state.max_bids = {max_bid.get("user_id"): float(max_bid.get("amount")) for max_bid in max_bids}
+        return state
+
+    def _sync(self, row: dict):
+        state = self._auctions.get(row.get("listing_id"))
+        if state is not None:
+            state.status = row.get("status", state.status)
+            state.auction_end = row.get("auction_end", state.auction_end)
+        elif row.get("status") == "active" and row.get("auction_end") and not row.get("bids") and all(column in row for column in AUCTION_COLUMNS):
+            # An auction going live without bids has no leader nor maximum bids, so the row is its
+            # whole state; warming it spares the first bids a database read
+            self._auctions[row.get("listing_id")] = AuctionState(**{column: row.get(column) for column in AUCTION_COLUMNS})
+
+    # Persistence
+
+    def flush(self):
+        """
+        Persist the bids and maximum bids accepted since the last flush.
+
+        Returns:
+            int: Number of bids persisted; failed batches are kept and retried on the next flush.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                bids, self._pending = self._pending, []
+            if not bids:
+                return 0
+            try:
+                self._persist(bids)
+            except Exception as e:
+                logger.error(msg=f"Failed persisting {len(bids)} bids, retrying on next flush: {e}")
+                with self._pending_lock:
+                    self._pending[:0] = bids
+                return 0
+            self._submit("checkpoint", bids[-1].get("sequence"))
+            return len(bids)
+
+    def _persist(self, records: list):
+        """Insert bids, apply them (and the extensions they caused) to their listings and upsert maximum bids in one transaction."""
+        bids = [record for record in records if not record.get("max_bid")]
+        max_bids = [record for record in records if record.get("max_bid")]
+        listings, ends = {}, {}
+        for bid in bids:
+            price, count = listings.get(bid.get("listing_id"), (0, 0))
+            listings[bid.get("listing_id")] = (max(price, bid.get("amount")), count + 1)
+            if bid.get("auction_end"):
+                ends[bid.get("listing_id")] = max(ends.get(bid.get("listing_id"), bid.get("auction_end")), bid.get("auction_end"))
+
+        cases = " ".join(["WHEN %s THEN %s"] * len(listings))
+        # Soft-close extensions; GREATEST keeps an end moved further meanwhile
+        extend = f"auction_end = CASE listing_id {' '.join(['WHEN %s THEN GREATEST(auction_end, %s)'] * len(ends))} ELSE auction_end END, " if ends else ""
+        conn = self._connection_factory()
+        try:
+            cursor = conn.cursor()
+            if max_bids:
+                cursor.executemany(
+                    "INSERT INTO max_bids (listing_id, user_id, amount, created_at, updated_at) VALUES (%s, %s, %s, %s, %s) "
+                    "ON DUPLICATE KEY UPDATE amount = VALUES(amount), updated_at = VALUES(updated_at)",
+                    [tuple(max_bid.get(column) for column in ("listing_id", "user_id", "amount", "created_at", "updated_at")) for max_bid in max_bids]
+                )
+            if bids:
+                cursor.executemany(
+                    "INSERT INTO bids (listing_id, user_id, amount, created_at) VALUES (%s, %s, %s, %s)",
+                    [(bid.get("listing_id"), bid.get("user_id"), bid.get("amount"), bid.get("created_at")) for bid in bids]
+                )
+                cursor.execute(
+                    f"UPDATE listings SET current_price = GREATEST(COALESCE(current_price, 0), CASE listing_id {cases} END), "
+                    f"bids = bids + CASE listing_id {cases} END, {extend}updated_at = %s "
+                    f"WHERE listing_id IN ({', '.join(['%s'] * len(listings))})",
+                    [value for listing_id, (price, _) in listings.items() for value in (listing_id, price)]
+                    + [value for listing_id, (_, count) in listings.items() for value in (listing_id, count)]
+                    + [value for item in ends.items() for value in item]
+                    + [datetime.now(), *listings]
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        for listing_id, (_, count) in listings.items():
+            suggest_index.add_listing_weight(listing_id, count)
+        # Pages of listings show the persisted prices
+        response_cache.invalidate(*map(listing_tag, listings))
+        logger.info(msg=f"Persisted {len(bids)} bids and {len(max_bids)} maximum bids on listings: {list(listings)}")
+
+    def _run_flusher(self):
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def _recover(self, journal_path: str):
+        """Persist the bids journaled after the last checkpoint that are not in the database yet, and their maximum bids."""
+        persisted, bids = 0, []
+        with open(journal_path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # Partially written last line
+                if "persisted" in record:
+                    persisted = max(persisted, record.get("persisted"))
+                else:
+                    for column in ("created_at", "updated_at", "auction_end"):
+                        if column in record:
+                            record[column] = datetime.fromisoformat(record.get(column))
+                    bids.append(record)
+                    self._sequence = max(self._sequence, record.get("sequence"))
+        bids = [bid for bid in bids if bid.get("sequence") > persisted]
+        # Upserting a maximum bid again is harmless, so only bids need to be deduplicated
+        max_bids = [bid for bid in bids if bid.get("max_bid")]
+        bids = [bid for bid in bids if not bid.get("max_bid")]
+
+        if bids:
+            # A crash between persisting a batch and checkpointing it leaves persisted bids in the
+            # journal; accepted amounts strictly increase per listing, so they identify a bid
+            listing_ids = list(dict.fromkeys(bid.get("listing_id") for bid in bids))
+            conn = self._connection_factory()
+            try:
+                cursor = conn.cursor(cursors.DictCursor)  # type: ignore
+                cursor.execute(
+                    f"SELECT listing_id, user_id, amount FROM bids WHERE listing_id IN ({', '.join(['%s'] * len(listing_ids))}) AND created_at >= %s",
+                    [*listing_ids, min(bid.get("created_at") for bid in bids).replace(microsecond=0)]
+                )
+                existing = {(row.get("listing_id"), row.get("user_id"), round(float(row.get("amount")), 2)) for row in cursor.fetchall()}
+            finally:
+                conn.close()
+            bids = [bid for bid in bids if (bid.get("listing_id"), bid.get("user_id"), round(float(bid.get("amount")), 2)) not in existing]
+        if bids or max_bids:
+            self._persist(max_bids + bids)
+            logger.info(msg=f"Recovered {len(bids)} bids and {len(max_bids)} maximum bids journaled in: {journal_path}")
+
+    # Lifecycle
+
+    def start(self, connection_factory):
+        """
+        Recover the bids journaled by the processes that ran the engine before, then start accepting bids.
+
+        Must only be called in the process owning the engine, e.g. the auction scheduler's leader.
+
+        Args:
+            connection_factory (callable): Zero-argument callable returning a database connection.
+        """
+        with self._lock:
+            if self.running:
+                return
+            self._connection_factory = connection_factory
+            os.makedirs(self.journal_dir, exist_ok=True)
+            for journal_path in sorted(glob.glob(os.path.join(self.journal_dir, JOURNAL_PATTERN)), key=os.path.getmtime):
+                self._recover(journal_path)
+                os.remove(journal_path)  # Everything journaled is persisted
+            # The journals are the source of truth: bids left over from a previous run were recovered
+            with self._pending_lock:
+                self._pending = []
+            self.journal_path = os.path.join(self.journal_dir, f"auction_journal.{os.getpid()}.log")
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+            self._stopped.clear()
+            self._threads = [
+                threading.Thread(target=self._run_writer, daemon=True),
+                threading.Thread(target=self._run_flusher, daemon=True)
+            ]
+            for thread in self._threads:
+                thread.start()
+            self.running = True
+            logger.info(msg=f"Auction engine started with journal: {self.journal_path}")
+
+    def stop(self):
+        """Persist pending bids and stop the writer and flusher."""
+        with self._lock:
+            if not self.running:
+                return
+            self._stopped.set()
+            self.flush()
+            self._submit("stop", None).result()
+            self.running = False
+            for thread in self._threads:
+                thread.join()
+            self._journal.close()
+            self._auctions.clear()
+            self._snapshots.clear()
+            logger.info(msg="Auction engine stopped")
+
+
+try:
+    # Initialize auction engine
+    auction_engine = AuctionEngine(
+        journal_dir=os.getenv("AUCTION_JOURNAL_DIR", os.getcwd()),
+        flush_interval=float(os.getenv("AUCTION_FLUSH_INTERVAL", "0.1")),
+        fsync=os.getenv("AUCTION_JOURNAL_FSYNC", "false").lower() == "true"
+    )
+except Exception as e:
+    # Log any errors during auction engine initialization
+    logger.critical(msg=f"Auction engine initialization error: {e}")
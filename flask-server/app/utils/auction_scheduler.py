@@ -0,0 +1,309 @@
+from dotenv import load_dotenv
+from pymysql import cursors
+from datetime import datetime, timedelta
+import os, threading, time
+
+from ..database.connection import connect
+from .timing_wheel import TimingWheel
+from .logger import setup_logger
+
+load_dotenv()
+
+logger = setup_logger(name="app_logger", log_file="logs/app.log")
+
+# Seconds of `updated_at` read again on each sync, covering deadlines committed after their timestamp
+SYNC_OVERLAP = 60
+# Seconds before deadlines whose handler failed are fired again
+RETRY_DELAY = 30
+# Rows read per fetch while loading the deadlines
+FETCH_SIZE = 10000
+
+
+class AuctionScheduler:
+    """
+    Fires the deadlines of auctions (e.g., their end) stored in the `auction_deadlines` table.
+
+    The table is the source of truth, so deadlines survive restarts; the leader holds them in a
+    timing wheel, so firing the deadlines due does not depend on how many are pending. Only one
+    worker process leads at a time, elected with a MySQL named lock held on a dedicated connection:
+    if the leader dies its connection closes, the lock is released and another worker takes over.
+    Deadlines scheduled by any worker are picked up by the leader within `sync_interval` seconds.
+
+    Each tick, the deadlines due are grouped by kind and their handlers called with the listing IDs
+    in one batch. Handlers must only act on listings whose deadline has actually passed, since a
+    deadline can be fired after being rescheduled, and may return the new deadline of those whose
+    time moved (e.g., auctions extended by late bids), so moving a deadline needs no write until
+    it is reached. Deadlines handled are deleted; those whose handler failed are fired again after
+    `RETRY_DELAY` seconds.
+
+    Work that must run in a single process (e.g. the auction engine) is started by the callbacks
+    given to `on_leadership` when this process is elected, and stopped when it steps down.
+
+    Args:
+        tick (float): Resolution of the timing wheel, in seconds.
+        sync_interval (float): Seconds between reads of newly scheduled deadlines.
+        election_interval (float): Seconds between attempts of a follower to become the leader.
+        lock_name (str): Name of the MySQL lock held by the leader.
+    """
+    def __init__(self, tick: float = 1.0, sync_interval: float = 2.0, election_interval: float = 10.0, lock_name: str = "auction_scheduler"):
+        self.tick = tick
+        self.sync_interval = sync_interval
+        self.election_interval = election_interval
+        self.lock_name = lock_name
+        self.leader = False
+
+        self._handlers = {}  # kind -> handler(listing_ids)
+        self._leadership = []  # (on_elected, on_step_down) callbacks
+        self._lock = threading.Lock()
+        self._wheel = None
+        self._stopped = threading.Event()
+        self._thread = None
+        self._connection_factory = None
+        self._lock_factory = None
+        self._lock_conn = None
+        self._watermark = None  # Database time of the last sync
+        self._fired = {}  # kind -> deadlines handled
+
+    def register(self, kind: str, handler):
+        """
+        Register the handler of a kind of deadline.
+
+        Args:
+            kind (str): The kind of deadline (e.g., "end").
+            handler (callable): Called with the list of listing IDs whose deadline is due; returns None
+                or the new deadline (datetime) of those not due after all, by listing ID.
+        """
+        self._handlers[kind] = handler
+
+    def on_leadership(self, elected, stepped_down):
+        """
+        Register callbacks run in the scheduler thread when this process becomes the leader, before
+        it fires deadlines, and when it steps down.
+
+        Args:
+            elected (callable): Called without arguments once elected.
+            stepped_down (callable): Called without arguments once no longer the leader.
+        """
+        self._leadership.append((elected, stepped_down))
+
+    def add(self, kind: str, listing_id: int, due_at: datetime):
+        """
+        Schedule a deadline in the wheel of this process, if it leads; for deadlines already stored.
+
+        Args:
+            kind (str): The kind of deadline.
+            listing_id (int): The ID of the listing.
+            due_at (datetime): When the deadline is reached.
+        """
+        with self._lock:
+            if self._wheel is not None:
+                self._wheel.add((kind, listing_id), due_at.timestamp())
+
+    def stats(self):
+        """
+        State of the scheduler.
+
+        Returns:
+            dict: Whether this process is the `leader`, the number of deadlines `pending` in its
+                wheel and the number of deadlines `fired` per kind.
+        """
+        with self._lock:
+            return {
+                "leader": self.leader,
+                "pending": len(self._wheel) if self._wheel is not None else 0,
+                "fired": dict(self._fired)
+            }
+
+    # Lifecycle
+
+    def start(self, connection_factory, lock_factory=connect):
+        """
+        Start competing for leadership in a background thread.
+
+        Args:
+            connection_factory (callable): Zero-argument callable returning a database connection.
+            lock_factory (callable): Zero-argument callable returning the dedicated connection
+                holding the lock; it must not be pooled, since closing it releases the lock.
+        """
+        if self._thread is not None:
+            return
+        self._connection_factory = connection_factory
+        self._lock_factory = lock_factory
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop firing deadlines and release the leadership."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stopped.is_set():
+            if self._elect():
+                try:
+                    for elected, _ in self._leadership:
+                        elected()
+                    self._lead()
+                except Exception as e:
+                    logger.error(msg=f"Auction scheduler failed while leading: {e}")
+                self._step_down()
+            self._stopped.wait(self.election_interval)
+
+    # Leadership
+
+    def _elect(self):
+        try:
+            self._lock_conn = self._lock_factory()
+            cursor = self._lock_conn.cursor()
+            cursor.execute("SELECT GET_LOCK(%s, 0)", (self.lock_name,))
+            if cursor.fetchone()[0] == 1:
+                logger.info(msg="Auction scheduler elected leader")
+                return True
+        except Exception as e:
+            logger.warning(msg=f"Auction scheduler failed acquiring lock {self.lock_name}: {e}")
+        self._close_lock_conn()
+        return False
+
+    def _still_leader(self):
+        try:
+            self._lock_conn.ping(reconnect=False)
+            return True
+        except Exception as e:
+            logger.error(msg=f"Auction scheduler lost its lock connection: {e}")
+            return False
+
+    def _step_down(self):
+        with self._lock:
+            self.leader = False
+            self._wheel = None
+        for _, stepped_down in self._leadership:
+            try:
+                stepped_down()
+            except Exception as e:
+                logger.error(msg=f"Auction scheduler failed stepping down: {e}")
+        try:
+            self._lock_conn.cursor().execute("SELECT RELEASE_LOCK(%s)", (self.lock_name,))
+        except Exception:
+            pass  # Released anyway once the connection is closed
+        self._close_lock_conn()
+        logger.info(msg="Auction scheduler stepped down")
+
+    def _close_lock_conn(self):
+        try:
+            if self._lock_conn is not None:
+                self._lock_conn.close()
+        except Exception:
+            pass
+        self._lock_conn = None
+
+    def _lead(self):
+        wheel = TimingWheel(now=time.time(), tick=self.tick)
+        self._watermark = None
+        count = self._sync(wheel)
+        with self._lock:
+            self._wheel = wheel
+            self.leader = True
+        logger.info(msg=f"Auction scheduler loaded {count} deadlines")
+
+        next_sync = time.monotonic() + self.sync_interval
+        while not self._stopped.wait(self.tick):
+            if time.monotonic() >= next_sync:
+                if not self._still_leader():
+                    return
+                self._sync(wheel)
+                next_sync = time.monotonic() + self.sync_interval
+            with self._lock:
+                due = wheel.advance(time.time())
+            if due:
+                self._fire(wheel, due)
+
+    # Deadlines
+
+    def _sync(self, wheel: TimingWheel):
+        """Add the deadlines scheduled since the last sync (all of them on the first) to the wheel."""
+        conn = self._connection_factory()
+        try:
+            cursor = conn.cursor(cursors.SSCursor)  # type: ignore
+            cursor.execute("SELECT NOW()")
+            watermark = cursor.fetchone()[0]
+            if self._watermark is None:
+                cursor.execute("SELECT kind, listing_id, due_at FROM auction_deadlines")
+            else:
+                cursor.execute(
+                    "SELECT kind, listing_id, due_at FROM auction_deadlines WHERE updated_at >= %s",
+                    (self._watermark - timedelta(seconds=SYNC_OVERLAP),)
+                )
+            count = 0
+            while rows := cursor.fetchmany(FETCH_SIZE):
+                with self._lock:
+                    for kind, listing_id, due_at in rows:
+                        wheel.add((kind, listing_id), due_at.timestamp())
+                count += len(rows)
+            cursor.close()
+        finally:
+            conn.close()
+        self._watermark = watermark
+        return count
+
+    def _fire(self, wheel: TimingWheel, due: list):
+        by_kind = {}
+        for kind, listing_id in due:
+            by_kind.setdefault(kind, []).append(listing_id)
+
+        now = datetime.now()
+        for kind, listing_ids in by_kind.items():
+            handler = self._handlers.get(kind)
+            try:
+                if handler is None:
+                    raise LookupError(f"no handler registered for {kind!r}")
+                rescheduled = handler(listing_ids) or {}
+            except Exception as e:
+                logger.error(msg=f"Auction scheduler failed handling {len(listing_ids)} {kind} deadlines: {e}")
+                with self._lock:
+                    for listing_id in listing_ids:
+                        wheel.add((kind, listing_id), time.time() + RETRY_DELAY)
+                continue
+
+            with self._lock:
+                self._fired[kind] = self._fired.get(kind, 0) + len(listing_ids) - len(rescheduled)
+                for listing_id, due_at in rescheduled.items():
+                    wheel.add((kind, listing_id), due_at.timestamp())
+            try:
+                self._complete(kind, listing_ids, rescheduled, now)
+            except Exception as e:
+                # The deadlines are loaded again on the next election and fired as no-ops
+                logger.warning(msg=f"Auction scheduler failed completing {kind} deadlines: {e}")
+
+    def _complete(self, kind: str, listing_ids: list, rescheduled: dict, now: datetime):
+        """Move the deadlines a handler rescheduled, and delete the others unless they were rescheduled meanwhile."""
+        conn = self._connection_factory()
+        try:
+            cursor = conn.cursor()
+            if rescheduled:
+                cursor.executemany(
+                    "UPDATE auction_deadlines SET due_at = %s, updated_at = NOW() WHERE kind = %s AND listing_id = %s AND due_at < %s",
+                    [(due_at, kind, listing_id, due_at) for listing_id, due_at in rescheduled.items()]
+                )
+            cursor.execute(
+                f"DELETE FROM auction_deadlines WHERE kind = %s AND listing_id IN ({', '.join(['%s'] * len(listing_ids))}) AND due_at <= %s",
+                [kind, *listing_ids, now]
+            )
+            conn.commit()
+            cursor.close()
+        finally:
+            conn.close()
+
+try:
+    # Initialize auction scheduler
+    auction_scheduler = AuctionScheduler(
+        tick=float(os.getenv("AUCTION_SCHEDULER_TICK", "1")),
+        sync_interval=float(os.getenv("AUCTION_SCHEDULER_SYNC_INTERVAL", "2")),
+        lock_name=f"{os.getenv('DB', 'auction_house')}.auction_scheduler"
+    )
+except Exception as e:
+    # Log any errors during auction scheduler initialization
+    logger.critical(msg=f"Auction scheduler initialization error: {e}")
@@ -1,7 +1,85 @@
-from celery import shared_task
-from .socketio import socketio
+from ..data_mappers import ListingMapper, BidMapper, OrderMapper
+from ..database import unit_of_work
+from .auction_engine import auction_engine
+from .socketio import socketio, listing_room
+from .logger import setup_logger
 
+logger = setup_logger(name="listing_logger", log_file="logs/listing.log")
 
-@shared_task
-def end_auction_task(listing_id):
-    socketio.emit("auction_ended", {"listing_id": listing_id})
+
+def settle_auctions(listing_ids: list):
+    """
+    Handler of the auction scheduler's "end" deadlines: settle every auction due in one batch.
+
+    The winners are picked with one set-based query, the listings marked sold (highest bid meeting
+    the reserve price) or ended with one UPDATE, and each winner gets one pending order holding
+    the listings they won, created with one INSERT per table. Everything is committed at once;
+    the auctions' rooms are then notified of the outcome.
+
+    Auctions extended by late bids since their deadline was scheduled are not settled; their new
+    end is returned, so the scheduler moves their deadline.
+
+    Args:
+        listing_ids (list[int]): The IDs of the listings whose auction end is due.
+
+    Returns:
+        dict[int, datetime]: The end of the auctions extended, by listing ID.
+
+    Raises:
+        RuntimeError: If bids accepted by the auction engine could not be persisted; the auctions
+            are then settled on the scheduler's retry.
+    """
+    # Bids accepted in memory until the end must be in the database before picking winners
+    if auction_engine.running:
+        auction_engine.flush()
+        if auction_engine.pending:
+            raise RuntimeError(f"{auction_engine.pending} accepted bids are not persisted yet")
+
+    with unit_of_work():
+        auctions = ListingMapper.lock_ended_auctions(listing_ids=listing_ids)
+        winners = {
+            listing_id: bid for listing_id, bid in BidMapper.get_winning_bids(listing_ids=list(auctions)).items()
+            if auctions[listing_id].get("reserve_price") is None or bid.get("amount") >= auctions[listing_id].get("reserve_price")
+        }
+        ListingMapper.update_statuses(statuses={listing_id: "sold" if listing_id in winners else "ended" for listing_id in auctions})
+
+        order_ids = OrderMapper.create_orders(orders=[
+            {"user_id": user_id, "status": "pending"} for user_id in dict.fromkeys(bid.get("user_id") for bid in winners.values())
+        ])
+        order_item_ids = OrderMapper.create_order_items(items=[
+            {"order_id": order_ids[bid.get("user_id")], "listing_id": listing_id, "quantity": 1,
+             "price": bid.get("amount"), "total_price": bid.get("amount")}
+            for listing_id, bid in winners.items()
+        ])
+        if len(order_item_ids) != len(winners):
+            raise RuntimeError(f"Created {len(order_item_ids)} order items for {len(winners)} won auctions")
+
+    extended = ListingMapper.get_extended_auctions(listing_ids=[listing_id for listing_id in listing_ids if listing_id not in auctions])
+
+    for listing_id in auctions:
+        bid = winners.get(listing_id) or {}
+        socketio.emit("auction_ended", {
+            "listing_id": listing_id, "status": "sold" if bid else "ended",
+            "winner_id": bid.get("user_id"), "final_price": float(bid["amount"]) if bid else None
+        }, to=listing_room(listing_id))
+    logger.info(msg=f"Settled {len(auctions)} of {len(listing_ids)} auctions due: {len(winners)} sold in {len(order_ids)} orders, {len(extended)} extended")
+    return extended
+
+
+def activate_listings(listing_ids: list):
+    """
+    Handler of the auction scheduler's "activate" deadlines: put every draft due live in one batch.
+
+    The drafts are activated with one UPDATE, which also adds them to the search and typeahead
+    indexes and warms their auctions in the engine, reading them back with one SELECT.
+
+    Args:
+        listing_ids (list[int]): The IDs of the listings whose auction start is due.
+    """
+    with unit_of_work():
+        drafts = ListingMapper.lock_due_drafts(listing_ids=listing_ids)
+        ListingMapper.update_statuses(statuses=dict.fromkeys(drafts, "active"))
+
+    for listing_id in drafts:
+        socketio.emit("auction_started", {"listing_id": listing_id}, to=listing_room(listing_id))
+    logger.info(msg=f"Activated {len(drafts)} of {len(listing_ids)} drafts due")
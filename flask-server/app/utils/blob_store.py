@@ -0,0 +1,164 @@
+from PIL import Image, UnidentifiedImageError
+from dotenv import load_dotenv
+import base64, binascii, hashlib, io, os, re, tempfile
+
+from .logger import setup_logger
+
+load_dotenv()
+
+logger = setup_logger(name="app_logger", log_file="logs/app.log")
+
+IMAGE_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class BlobStore:
+    """
+    Content-addressed image store on the local filesystem.
+
+    Each original is stored once under the SHA-256 of its bytes (uploading the same image twice
+    returns the same ID without writing anything), next to pre-generated WebP thumbnails. Files are
+    sharded by the first two byte pairs of the hash to keep directories small, and written to a
+    temporary file first so readers never see a partial blob.
+
+    Args:
+        root (str): Directory holding the blobs.
+        thumbnail_sizes (tuple[int, ...]): Bounding box sizes, in pixels, of the thumbnails to generate.
+    """
+    def __init__(self, root: str, thumbnail_sizes: tuple = (128, 256, 512)):
+        self.root = root
+        self.thumbnail_sizes = tuple(sorted(thumbnail_sizes))
+
+    def put(self, data: bytes):
+        """
+        Store an image and its thumbnails.
+
+        Args:
+            data (bytes): The encoded image (any format Pillow can read).
+
+        Returns:
+            str: The image ID (hex SHA-256 of the original bytes).
+
+        Raises:
+            ValueError: If the data is not a readable image, or has more pixels than Pillow's
+                `MAX_IMAGE_PIXELS`.
+        """
+        image_id = hashlib.sha256(data).hexdigest()
+        original = self._path(image_id)
+        if os.path.exists(original) and all(os.path.exists(self._path(image_id, size)) for size in self.thumbnail_sizes):
+            return image_id  # Deduplicated
+
+        try:
+            with Image.open(io.BytesIO(data)) as image:
+                # Checked from the header before the bitmap is decoded; Pillow itself only refuses twice the limit
+                max_pixels = Image.MAX_IMAGE_PIXELS
+                if max_pixels and image.width * image.height > max_pixels:
+                    raise ValueError(f"Image too large: {image.width}x{image.height} pixels")
+                image.load()
+                thumbnails = {size: self._thumbnail(image, size) for size in self.thumbnail_sizes}
+        except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+            raise ValueError(f"Not a valid image: {e}")
+
+        self._write(original, data)
+        for size, thumbnail in thumbnails.items():
+            self._write(self._path(image_id, size), thumbnail)
+
+        logger.info(msg=f"Stored image: {image_id} ({len(data)} bytes)")
+        return image_id
+
+    def put_base64(self, encoded: str):
+        """
+        Store a base64 encoded image, as sent by the frontend in `image_encoded`.
+
+        Args:
+            encoded (str): The base64 image, optionally prefixed with a data URL header.
+
+        Returns:
+            str: The image ID.
+
+        Raises:
+            ValueError: If the string is not valid base64 or not a readable image.
+        """
+        if encoded.startswith("data:"):
+            encoded = encoded.partition(",")[2]
+        try:
+            data = base64.b64decode(encoded, validate=True)
+        except (binascii.Error, ValueError) as e:
+            raise ValueError(f"Invalid base64 image: {e}")
+        return self.put(data)
+
+    def path(self, image_id: str, size: int | None = None):
+        """
+        Filesystem path of a stored image.
+
+        Args:
+            image_id (str): The image ID.
+            size (int, optional): Thumbnail size; the smallest thumbnail at least this large is
+                returned, or the original if the size is larger than every thumbnail.
+
+        Returns:
+            str | None: The path, or None if the ID is invalid or the image does not exist.
+        """
+        if not isinstance(image_id, str) or not IMAGE_ID_PATTERN.match(image_id):
+            return None
+
+        if size is not None:
+            size = next((s for s in self.thumbnail_sizes if s >= size), None)
+        path = self._path(image_id, size)
+        return path if os.path.exists(path) else None
+
+    @staticmethod
+    def mimetype(path: str):
+        """
+        MIME type of a stored file, read from its header since originals are stored without an extension.
+
+        Args:
+            path (str): Path returned by `path()`.
+
+        Returns:
+            str: The MIME type, or "application/octet-stream" if it cannot be determined.
+        """
+        if path.endswith(".webp"):
+            return "image/webp"
+        try:
+            with Image.open(path) as image:
+                return image.get_format_mimetype() or "application/octet-stream"
+        except (UnidentifiedImageError, OSError):
+            return "application/octet-stream"
+
+    def _path(self, image_id: str, size: int | None = None):
+        name = image_id if size is None else f"{image_id}_{size}.webp"
+        return os.path.join(self.root, image_id[:2], image_id[2:4], name)
+
+    @staticmethod
+    def _thumbnail(image: Image.Image, size: int):
+        """Downscale an image to fit in a `size` x `size` box and encode it as WebP."""
+        thumbnail = image.copy()
+        if thumbnail.mode not in ("RGB", "RGBA"):
+            thumbnail = thumbnail.convert("RGBA" if "transparency" in thumbnail.info else "RGB")
+        thumbnail.thumbnail((size, size))
+        buffer = io.BytesIO()
+        thumbnail.save(buffer, format="WEBP", quality=80, method=4)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _write(path: str, data: bytes):
+        """Atomically write a file, creating its directory if needed."""
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+
+try:
+    # Initialize blob store
+    blob_store = BlobStore(root=os.getenv("BLOB_STORE_ROOT", os.path.join(os.getcwd(), "blob_store")))
+except Exception as e:
+    # Log any errors during blob store initialization
+    logger.critical(msg=f"Blob store initialization error: {e}")
@@ -0,0 +1,125 @@
+from dotenv import load_dotenv
+import os, threading, time
+
+from .socketio import socketio
+from .logger import setup_logger
+
+load_dotenv()
+
+logger = setup_logger(name="app_logger", log_file="logs/app.log")
+
+# Seconds before an auction ends during which its bid updates are emitted without coalescing
+BID_CLOSING_WINDOW = float(os.getenv("BID_CLOSING_WINDOW", "30"))
+
+
+class RoomCoalescer:
+    """
+    Coalesces the realtime updates emitted to Socket.IO rooms.
+
+    Each update replaces the one still waiting for the same event and room, since clients only
+    need the latest state. A flusher thread (a greenlet under gevent) emits the waiting updates at
+    most `rate` times per second per room; a room's first update after a quiet period is emitted
+    right away. Updates published with `immediate` bypass the wait, e.g. when an auction is about
+    to close and every bid matters.
+
+    Args:
+        emit (callable): Function emitting an event, called as `emit(event, payload, to=room)`.
+        rate (float): Maximum frames per second per room.
+        sleep (callable): Function waiting for the given seconds between flushes, e.g. a fake clock in tests.
+    """
+    def __init__(self, emit, rate: float = 10.0, sleep=time.sleep):
+        self.emit = emit
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.sleep = sleep
+
+        self._lock = threading.Lock()
+        self._pending = {}  # (event, room) -> latest payload waiting to be emitted
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._sent = {}  # event -> frames emitted
+        self._suppressed = {}  # event -> updates replaced before being emitted
+
+    def publish(self, event: str, payload: dict, room: str, immediate: bool = False):
+        """
+        Emit an update to a room, coalesced with the other updates of the same event and room.
+
+        Args:
+            event (str): The Socket.IO event.
+            payload (dict): The update; replaces any update of the same event and room still waiting.
+            room (str): The room to emit to.
+            immediate (bool): Whether to emit now instead of at the next flush.
+        """
+        key = (event, room)
+        with self._lock:
+            if self._pending.pop(key, None) is not None:
+                self._suppressed[event] = self._suppressed.get(event, 0) + 1
+            if immediate or not self.interval:
+                self._sent[event] = self._sent.get(event, 0) + 1
+            else:
+                self._pending[key] = payload
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+
+        if immediate or not self.interval:
+            self._emit(key, payload)
+        elif not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        Emit every waiting update.
+
+        Returns:
+            int: Number of frames emitted.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            for event, _ in pending:
+                self._sent[event] = self._sent.get(event, 0) + 1
+        for key, payload in pending.items():
+            self._emit(key, payload)
+        return len(pending)
+
+    def stats(self):
+        """
+        Frames emitted and updates suppressed by coalescing, per event.
+
+        Returns:
+            dict: `sent` and `suppressed` counts per event, the number of updates `pending` and the
+                maximum `rate` per room.
+        """
+        with self._lock:
+            return {
+                "sent": dict(self._sent),
+                "suppressed": dict(self._suppressed),
+                "pending": len(self._pending),
+                "rate": 1.0 / self.interval if self.interval else None
+            }
+
+    def _emit(self, key: tuple, payload: dict):
+        event, room = key
+        try:
+            self.emit(event, payload, to=room)
+        except Exception as e:
+            logger.error(msg=f"Failed emitting {event} to room {room}: {e}")
+
+    def _run(self):
+        while True:
+            self._step()
+
+    def _step(self):
+        """One round of the flusher: wait for an update, emit those waiting, then hold off for the interval."""
+        # Updates published after the event is cleared set it again, so none is missed
+        self._wakeup.wait()
+        self._wakeup.clear()
+        self.flush()
+        self.sleep(self.interval)  # Updates published meanwhile are coalesced
+
+
+try:
+    # Initialize coalescer of bid updates
+    bid_updates = RoomCoalescer(emit=socketio.emit, rate=float(os.getenv("BID_UPDATE_RATE", "10")))
+except Exception as e:
+    # Log any errors during coalescer initialization
+    logger.critical(msg=f"Bid update coalescer initialization error: {e}")
@@ -0,0 +1,70 @@
+from decimal import Decimal, InvalidOperation
+
+# Upper bounds of the buy_now_price facet buckets; the last bucket has no upper bound
+PRICE_BUCKET_EDGES = (10, 50, 100, 500, 1000)
+
+
+def price_filter(args: dict):
+    """
+    Price bounds requested in the query parameters.
+
+    Args:
+        args (dict): Dictionary of query parameters.
+
+    Returns:
+        tuple: `min_price` and `max_price` as numbers, None where not set.
+
+    Raises:
+        ValueError: If a bound is not a number.
+    """
+    bounds = []
+    for name in ("min_price", "max_price"):
+        value = args.get(name)
+        if value in (None, ""):
+            bounds.append(None)
+            continue
+        try:
+            bounds.append(Decimal(str(value)))
+        except InvalidOperation:
+            raise ValueError(f"Invalid {name}: {value!r}")
+    return tuple(bounds)
+
+
+def combine_facets(groups, args: dict):
+    """
+    Turn grouped listing counts into facet counts.
+
+    Groups count the listings matching the non-facet conditions of a search (text query, seller)
+    per combination of category, listing type, price bucket and whether the price is within the
+    requested bounds. Each facet is then counted with every filter applied except its own, so the
+    counts show how many results choosing another value of that facet would give.
+
+    Args:
+        groups (iterable[tuple]): (category_id, listing_type, price bucket index or -1 without a
+            price, price within bounds, count) tuples.
+        args (dict): Dictionary of query parameters.
+
+    Returns:
+        dict: Counts per `category_id` and per `listing_type`, and the `price` buckets in
+            ascending order with their `min`, `max` (None for the last one) and `count`.
+    """
+    category, listing_type = args.get("category_id"), args.get("listing_type")
+    categories, listing_types = {}, {}
+    prices = [0] * (len(PRICE_BUCKET_EDGES) + 1)
+
+    for group_category, group_type, bucket, in_price, count in groups:
+        category_ok = category in (None, "") or str(group_category) == str(category)
+        type_ok = listing_type in (None, "") or str(group_type) == str(listing_type)
+        if type_ok and in_price and group_category is not None:
+            categories[str(group_category)] = categories.get(str(group_category), 0) + int(count)
+        if category_ok and in_price and group_type is not None:
+            listing_types[str(group_type)] = listing_types.get(str(group_type), 0) + int(count)
+        if category_ok and type_ok and bucket is not None and bucket >= 0:
+            prices[int(bucket)] += int(count)
+
+    edges = (0, *PRICE_BUCKET_EDGES, None)
+    return {
+        "category_id": categories,
+        "listing_type": listing_types,
+        "price": [{"min": edges[i], "max": edges[i + 1], "count": count} for i, count in enumerate(prices)]
+    }
@@ -0,0 +1,97 @@
+from datetime import datetime
+import base64, json
+
+
+def encode_cursor(sort: str, value, row_id: int):
+    """
+    Build an opaque keyset pagination cursor pointing just past a row.
+
+    Args:
+        sort (str): The sort column the page was ordered by.
+        value: The row's value in the sort column.
+        row_id (int): The row's primary key, used as a tie-breaker.
+
+    Returns:
+        str: A URL-safe cursor token.
+    """
+    if isinstance(value, datetime):
+        value = value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    payload = json.dumps([sort, value, row_id], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort: str):
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        token (str): The cursor token from the request.
+        sort (str): The sort column of the current request; it must match the cursor's.
+
+    Returns:
+        tuple: The sort value and row ID the next page starts after.
+
+    Raises:
+        ValueError: If the token is malformed or was issued for a different sort column.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        cursor_sort, value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError(f"Invalid cursor: {token!r}")
+
+    if cursor_sort != sort or not isinstance(row_id, int):
+        raise ValueError(f"Cursor was issued for sort '{cursor_sort}', not '{sort}'")
+    return value, row_id
+
+
+def keyset_condition(sort: str, id_column: str, order: str, value, row_id: int):
+    """
+    Build the WHERE condition selecting rows that come after (`value`, `row_id`) in the given order.
+
+    The condition is equivalent to a row comparison `(sort, id) > (value, row_id)` (or `<` for
+    descending order), expanded so that NULL sort values, which MySQL orders first when ascending
+    and last when descending, are paged through as well.
+
+    Args:
+        sort (str): Whitelisted sort column.
+        id_column (str): Primary key column used as a tie-breaker.
+        order (str): "ASC" or "DESC".
+        value: The sort value of the last row of the previous page.
+        row_id (int): The primary key of the last row of the previous page.
+
+    Returns:
+        tuple[str, list]: SQL condition and its parameter values.
+    """
+    op = "<" if order == "DESC" else ">"
+
+    if sort == id_column:
+        return f"{id_column} {op} %s", [row_id]
+
+    if value is None:
+        if order == "DESC":
+            return f"({sort} IS NULL AND {id_column} {op} %s)", [row_id]
+        return f"(({sort} IS NULL AND {id_column} {op} %s) OR {sort} IS NOT NULL)", [row_id]
+
+    condition = f"({sort} {op} %s OR ({sort} = %s AND {id_column} {op} %s)"
+    condition += f" OR {sort} IS NULL)" if order == "DESC" else ")"
+    return condition, [value, value, row_id]
+
+
+def next_cursor(rows: list, sort: str, id_column: str, limit: int | None):
+    """
+    Cursor for the page following `rows`, if the page was full.
+
+    Args:
+        rows (list[dict]): The rows of the current page.
+        sort (str): The sort column the page was ordered by.
+        id_column (str): Primary key column used as a tie-breaker.
+        limit (int | None): The page size requested.
+
+    Returns:
+        str | None: The cursor, or None if there is no next page.
+    """
+    if not rows or not limit or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(sort=sort, value=last.get(sort), row_id=last.get(id_column))
@@ -0,0 +1,55 @@
+# Minimum raise of a proxy bid, by the price being raised: (upper bound, increment); the last tier has no bound
+BID_INCREMENTS = ((1, 0.05), (5, 0.25), (25, 0.5), (100, 1), (250, 2.5), (500, 5), (1000, 10), (2500, 25), (None, 50))
+
+
+def bid_increment(price: float):
+    """
+    Minimum amount a proxy bid raises a price by.
+
+    Args:
+        price (float): The price being raised.
+
+    Returns:
+        float: The increment for the price's tier.
+    """
+    for bound, increment in BID_INCREMENTS:
+        if bound is None or price < bound:
+            return increment
+
+
+def resolve_proxies(current_price: float, leader: int | None, max_bids):
+    """
+    Resolve the competing maximum bids of an auction in one computation.
+
+    The highest maximum wins (the earliest registered on a tie) and the price becomes the second
+    highest maximum (or the current price if higher) plus one increment, capped at the winner's
+    maximum; the outcome of every bidder raising the others by one increment until all but one
+    maximum is exceeded, without placing any of those intermediate bids.
+
+    Args:
+        current_price (float): The auction's current price.
+        leader (int | None): The ID of the user holding the current price, if any.
+        max_bids (iterable[tuple]): (user_id, amount) maximum bids in registration order.
+
+    Returns:
+        tuple | None: (user_id, price) of the single bid to place, or None if no maximum bid changes
+            the auction (none beats the current price, or only the leader's does).
+    """
+    current_price = float(current_price or 0)
+    ranked = sorted(
+        ((float(amount), order, user_id) for order, (user_id, amount) in enumerate(max_bids)),
+        key=lambda max_bid: (-max_bid[0], max_bid[1])
+    )
+    if not ranked or ranked[0][0] <= current_price:
+        return None
+
+    top_amount, _, top_user = ranked[0]
+    rival = ranked[1][0] if len(ranked) > 1 else None
+    if top_user == leader:
+        # The leader's maximum only answers rivals that beat the current price
+        if rival is None or rival <= current_price:
+            return None
+        floor = rival
+    else:
+        floor = current_price if rival is None else max(current_price, rival)
+    return top_user, round(min(top_amount, floor + bid_increment(floor)), 2)
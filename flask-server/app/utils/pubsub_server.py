@@ -0,0 +1,144 @@
+from dotenv import load_dotenv
+import os, socket, socketserver, threading
+
+from .logger import setup_logger
+
+load_dotenv()
+
+logger = setup_logger(name="app_logger", log_file="logs/app.log")
+
+
+class PubSubServer(socketserver.ThreadingTCPServer):
+    """
+    Minimal stand-in for a Redis server, implementing only the publish/subscribe commands.
+
+    It speaks the Redis protocol (RESP), so Socket.IO's Redis message queue and the redis client
+    work against it unchanged. Meant for tests and for running several local workers without a
+    Redis server; nothing is persisted and there is no authentication.
+
+    Args:
+        host (str): Address to listen on.
+        port (int): Port to listen on, or 0 for any free port.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), PubSubHandler)
+        self._lock = threading.Lock()
+        self._channels = {}  # channel -> set of subscribed handlers
+        self._thread = None
+
+    @property
+    def url(self):
+        """Redis URL of the server, e.g. for `SOCKETIO_MESSAGE_QUEUE`."""
+        host, port = self.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(msg=f"Pub/sub server listening on: {self.url}")
+
+    def stop(self):
+        """Stop serving and close the listening socket."""
+        self.shutdown()
+        self.server_close()
+
+    def subscribe(self, channel: bytes, handler):
+        with self._lock:
+            self._channels.setdefault(channel, set()).add(handler)
+
+    def unsubscribe(self, channel: bytes, handler):
+        with self._lock:
+            self._channels.get(channel, set()).discard(handler)
+
+    def publish(self, channel: bytes, message: bytes):
+        """
+        Send a message to every subscriber of a channel.
+
+        Returns:
+            int: Number of subscribers that received the message.
+        """
+        with self._lock:
+            handlers = list(self._channels.get(channel, ()))
+        frame = encode([b"message", channel, message])
+        return sum(handler.send(frame) for handler in handlers)
+
+
+class PubSubHandler(socketserver.StreamRequestHandler):
+    """Connection to the pub/sub server; publishers and subscribers alike."""
+
+    def setup(self):
+        super().setup()
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.channels = set()
+        self.write_lock = threading.Lock()
+
+    def send(self, data: bytes):
+        """Write to the connection; returns whether it succeeded."""
+        try:
+            with self.write_lock:
+                self.wfile.write(data)
+                self.wfile.flush()
+            return True
+        except OSError:
+            return False
+
+    def handle(self):
+        while True:
+            command = self.read_command()
+            if not command:
+                break
+            name, args = command[0].upper(), command[1:]
+            if name == b"PUBLISH" and len(args) == 2:
+                self.send(b":%d\r\n" % self.server.publish(args[0], args[1]))
+            elif name in (b"SUBSCRIBE", b"UNSUBSCRIBE"):
+                for channel in args or list(self.channels):
+                    if name == b"SUBSCRIBE":
+                        self.channels.add(channel)
+                        self.server.subscribe(channel, self)
+                    else:
+                        self.channels.discard(channel)
+                        self.server.unsubscribe(channel, self)
+                    self.send(encode([name.lower(), channel, len(self.channels)]))
+            elif name == b"PING":
+                self.send(b"+PONG\r\n")
+            elif name in (b"CLIENT", b"SELECT"):
+                self.send(b"+OK\r\n")
+            else:
+                self.send(b"-ERR unsupported command '%s'\r\n" % name)
+
+    def finish(self):
+        for channel in self.channels:
+            self.server.unsubscribe(channel, self)
+        super().finish()
+
+    def read_command(self):
+        """Read a command sent as a RESP array of bulk strings, or None once the connection is closed."""
+        line = self.rfile.readline()
+        if not line.startswith(b"*"):
+            return None
+        command = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            command.append(self.rfile.read(length + 2)[:-2])
+        return command
+
+
+def encode(items: list):
+    """Encode a RESP array of bulk strings and integers."""
+    parts = [b"*%d\r\n" % len(items)]
+    for item in items:
+        if isinstance(item, int):
+            parts.append(b":%d\r\n" % item)
+        else:
+            parts.append(b"$%d\r\n%s\r\n" % (len(item), item))
+    return b"".join(parts)
+
+
+if __name__ == "__main__":
+    server = PubSubServer(host=os.getenv("PUBSUB_HOST", "127.0.0.1"), port=int(os.getenv("PUBSUB_PORT", "6379")))
+    print(f"Pub/sub server listening on: {server.url}")
+    server.serve_forever()
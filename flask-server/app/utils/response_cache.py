@@ -0,0 +1,407 @@
+from flask import request, g, Response
+from dotenv import load_dotenv
+from collections import OrderedDict
+from functools import wraps
+from urllib.parse import urlencode
+import json, os, threading, time, uuid
+
+from .logger import setup_logger
+
+load_dotenv()
+
+logger = setup_logger(name="app_logger", log_file="logs/app.log")
+
+# Tags recently invalidated remembered by the memory backend, to reject responses computed before
+MAX_TRACKED_INVALIDATIONS = 10000
+
+# Estimated bytes of bookkeeping per entry, on top of its key and body
+ENTRY_OVERHEAD = 256
+
+
+def listing_tag(listing_id):
+    """Tag of the cached responses showing a listing."""
+    return f"listing:{listing_id}"
+
+
+def category_tag(category_id):
+    """Tag of the cached responses showing a category or the listings filtered by it."""
+    return f"category:{category_id}"
+
+
+def review_tag(review_id):
+    """Tag of the cached responses showing a review."""
+    return f"review:{review_id}"
+
+
+def cache_key(path: str, args):
+    """
+    Key of a cached response: the path and the query parameters sorted, so their order does not matter.
+
+    Args:
+        path (str): The request path.
+        args (MultiDict): The query parameters.
+
+    Returns:
+        str: The key.
+    """
+    items = sorted(args.items(multi=True) if hasattr(args, "getlist") else args.items())
+    return f"{path}?{urlencode(items)}" if items else path
+
+
+class MemoryBackend:
+    """
+    In-process LRU store of cached response bodies, each with the tags it depends on.
+
+    Entries expire after their TTL; the least recently used are evicted once the bodies, keys and
+    bookkeeping exceed `max_bytes`. Each worker process has its own store, so with several workers
+    a write only invalidates the store of the worker that made it (others serve the entries until
+    they expire), unless the invalidations are shared, as with `RedisBackend`.
+
+    Args:
+        max_bytes (int): Bytes the entries may use before the least recently used are evicted.
+    """
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (body, expires at, tags), least recently used first
+        self._tags = {}  # tag -> keys of the entries depending on it
+        self._sequence = 0  # Number of invalidations so far
+        self._invalidated = OrderedDict()  # tag -> sequence of its last invalidation, oldest first
+        self._forgotten = 0  # Sequence of the last invalidation dropped from `_invalidated`
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def begin(self):
+        """Token to pass to `set()` for a response about to be computed."""
+        with self._lock:
+            return self._sequence
+
+    def get(self, key: str):
+        """
+        Retrieve a cached body.
+
+        Returns:
+            bytes | None: The body, or None if it is not cached or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: str, body: bytes, tags, ttl: float, since: int):
+        """
+        Cache a body, unless one of its tags was invalidated while it was computed.
+
+        Args:
+            key (str): The key of the response.
+            body (bytes): The response body.
+            tags (iterable[str]): Tags whose invalidation removes the entry.
+            ttl (float): Seconds before the entry expires.
+            since (int): Token returned by `begin()` before the response was computed.
+
+        Returns:
+            bool: Whether the body was cached.
+        """
+        tags = frozenset(tags)
+        size = len(key) + len(body) + ENTRY_OVERHEAD
+        with self._lock:
+            if since < self._forgotten or any(self._invalidated.get(tag, -1) > since for tag in tags):
+                return False  # Computed from data that may have changed since
+            if size > self.max_bytes:
+                return False
+            self._remove(key)
+            self._entries[key] = (body, time.monotonic() + ttl, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def invalidate(self, tags):
+        """
+        Remove the entries depending on any of the tags.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        removed = 0
+        with self._lock:
+            self._sequence += 1
+            for tag in tags:
+                self._invalidated.pop(tag, None)
+                self._invalidated[tag] = self._sequence
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+            while len(self._invalidated) > MAX_TRACKED_INVALIDATIONS:
+                _, self._forgotten = self._invalidated.popitem(last=False)
+        return removed
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._sequence += 1
+            self._forgotten = self._sequence
+            self._invalidated.clear()
+            self._entries.clear()
+            self._tags.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"backend": "memory", "entries": len(self._entries), "bytes": self.bytes, "max_bytes": self.max_bytes, "evictions": self.evictions}
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        body, _, tags = entry
+        self.bytes -= len(key) + len(body) + ENTRY_OVERHEAD
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisBackend:
+    """
+    Store of cached response bodies shared by every worker process, in Redis.
+
+    Each body is stored with its TTL, and each tag as a set of the keys depending on it, so a write
+    made by any worker invalidates the entries of all of them. Size-based eviction is left to the
+    server's `maxmemory` policy. Responses computed while one of their tags is invalidated may be
+    cached stale, until their TTL.
+
+    Invalidated tags are also published on the `<prefix>:invalidations` channel, for the other
+    workers to update what they derive from the data in memory (see `listen`). Invalidations
+    published while a worker is reconnecting are missed by it.
+
+    Args:
+        url (str): Redis URL, e.g. "redis://localhost:6379/1".
+        prefix (str): Prefix of the keys, different for each deployment sharing the server.
+    """
+    def __init__(self, url: str, prefix: str = "response_cache"):
+        import redis  # Optional dependency, only needed for a shared cache
+
+        self.url = url
+        self.prefix = prefix
+        self.channel = f"{prefix}:invalidations"
+        self.source = uuid.uuid4().hex  # Tells this worker's invalidations from the others'
+        self._client = redis.Redis.from_url(url)
+        self._listener = None
+
+    def begin(self):
+        return None
+
+    def get(self, key: str):
+        return self._client.get(f"{self.prefix}:response:{key}")
+
+    def set(self, key: str, body: bytes, tags, ttl: float, since=None):
+        pipeline = self._client.pipeline()
+        pipeline.set(f"{self.prefix}:response:{key}", body, px=int(ttl * 1000))
+        for tag in tags:
+            pipeline.sadd(f"{self.prefix}:tag:{tag}", key)
+            pipeline.pexpire(f"{self.prefix}:tag:{tag}", int(ttl * 1000))
+        pipeline.execute()
+        return True
+
+    def invalidate(self, tags):
+        tag_keys = [f"{self.prefix}:tag:{tag}" for tag in tags]
+        pipeline = self._client.pipeline()
+        for tag_key in tag_keys:
+            pipeline.smembers(tag_key)
+        keys = {key.decode() for members in pipeline.execute() for key in members}
+        if keys or tag_keys:
+            self._client.delete(*(f"{self.prefix}:response:{key}" for key in keys), *tag_keys)
+        self._client.publish(self.channel, json.dumps({"source": self.source, "tags": list(tags)}))
+        return len(keys)
+
+    def listen(self, callback):
+        """
+        Call `callback` with the tags invalidated by every other worker, from a background thread.
+
+        Args:
+            callback (callable): Called with the list of tags of each invalidation.
+        """
+        if self._listener is None:
+            self._listener = threading.Thread(target=self._listen, args=(callback,), daemon=True)
+            self._listener.start()
+
+    def _listen(self, callback):
+        while True:
+            try:
+                pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    invalidation = json.loads(message.get("data"))
+                    if invalidation.get("source") != self.source:
+                        callback(invalidation.get("tags"))
+            except Exception as e:
+                logger.error(msg=f"Response cache invalidation listener failed, reconnecting: {e}")
+                time.sleep(1)
+
+    def clear(self):
+        keys = list(self._client.scan_iter(match=f"{self.prefix}:*"))
+        if keys:
+            self._client.delete(*keys)
+
+    def stats(self):
+        return {"backend": "redis", "url": self.url}
+
+
+class ResponseCache:
+    """
+    Cache of successful JSON responses of GET routes, invalidated by tags.
+
+    Responses are cached by path and normalized query parameters. Each carries the tags of the
+    data it shows (e.g. `listing:<id>`, `category:<id>`), computed from its body by the route, and
+    writes invalidate the tags of what they changed once committed, so an entry is only dropped
+    when something it depends on changes, or after its TTL at the latest. Backend failures are
+    logged and the response computed as if it was not cached.
+
+    Args:
+        backend: `MemoryBackend`, `RedisBackend` or None to disable the cache.
+        ttl (float): Seconds before cached responses expire.
+    """
+    def __init__(self, backend=None, ttl: float = 60.0):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._listeners = []
+
+    @property
+    def active(self):
+        return self.backend is not None
+
+    def cached(self, tags):
+        """
+        Decorator caching the responses of a GET route.
+
+        Under the `conditional` decorator, entries are stored with the version of the resource they
+        were computed at, and only served while it is still current; a write another worker process
+        made to the database is then seen at once even if the invalidation did not reach this cache.
+
+        Args:
+            tags (callable): Called with the JSON body, the query parameters and the view arguments
+                of a successful response; returns the tags it depends on.
+        """
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if self.backend is None or kwargs.get("db_session") is not None:
+                    return view(*args, **kwargs)
+
+                key = cache_key(request.path, request.args)
+                version = g.get("response_version", "").encode()
+                try:
+                    body = self.backend.get(key)
+                    since = self.backend.begin()
+                except Exception as e:
+                    logger.warning(msg=f"Response cache lookup failed for {key}: {e}")
+                    return view(*args, **kwargs)
+                if body is not None:
+                    stored_version, _, body = body.partition(b"\n")
+                    if stored_version == version:
+                        self.hits += 1
+                        return Response(response=body, status=200, mimetype="application/json")
+
+                self.misses += 1
+                response = view(*args, **kwargs)
+                if response.status_code == 200 and response.mimetype == "application/json":
+                    body = response.get_data()
+                    try:
+                        self.backend.set(key, version + b"\n" + body, tags(json.loads(body), request.args, kwargs), self.ttl, since)
+                    except Exception as e:
+                        logger.warning(msg=f"Response cache store failed for {key}: {e}")
+                return response
+            return wrapper
+        return decorator
+
+    def invalidate(self, *tags):
+        """
+        Remove the cached responses depending on any of the tags; registered with `on_commit` by writes.
+
+        Args:
+            *tags (str): The tags of the data changed.
+        """
+        if self.backend is None or not tags:
+            return
+        try:
+            removed = self.backend.invalidate(tags)
+            logger.info(msg=f"Response cache invalidated {removed} entries for: {list(tags)}")
+        except Exception as e:
+            logger.error(msg=f"Response cache invalidation failed for {list(tags)}: {e}")
+
+    def on_remote_invalidation(self, listener):
+        """
+        Register a callable run with the tags invalidated by other worker processes, e.g. to update
+        the in-memory indexes of the data they changed.
+
+        Only a backend shared by the workers relays their invalidations; with the memory backend,
+        each worker has its own cache and the listeners are never called.
+
+        Args:
+            listener (callable): Called with the list of tags of each invalidation.
+        """
+        self._listeners.append(listener)
+        if self.backend is not None and hasattr(self.backend, "listen"):
+            self.backend.listen(self._notify)
+
+    def _notify(self, tags):
+        for listener in self._listeners:
+            try:
+                listener(tags)
+            except Exception as e:
+                logger.error(msg=f"Response cache invalidation listener failed for {tags}: {e}")
+
+    def stats(self):
+        """
+        State of the cache.
+
+        Returns:
+            dict: The backend statistics, with the number of `hits` and `misses`.
+        """
+        if self.backend is None:
+            return {"backend": None}
+        try:
+            stats = self.backend.stats()
+        except Exception as e:
+            stats = {"error": str(e)}
+        return {**stats, "hits": self.hits, "misses": self.misses}
+
+
+def create_backend(url: str, max_bytes: int):
+    """
+    Backend named by `RESPONSE_CACHE_BACKEND`: "memory", a Redis URL, or "none" to disable the cache.
+    """
+    if url == "none":
+        return None
+    if url == "memory":
+        return MemoryBackend(max_bytes=max_bytes)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend(url=url, prefix=os.getenv("RESPONSE_CACHE_PREFIX", "response_cache"))
+    raise ValueError(f"Unknown response cache backend: {url}")
+
+
+try:
+    # Initialize response cache
+    response_cache = ResponseCache(
+        backend=create_backend(url=os.getenv("RESPONSE_CACHE_BACKEND", "memory"), max_bytes=int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))),
+        ttl=float(os.getenv("RESPONSE_CACHE_TTL", "60"))
+    )
+except Exception as e:
+    # Log any errors during response cache initialization
+    logger.critical(msg=f"Response cache initialization error: {e}")
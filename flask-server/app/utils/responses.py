@@ -0,0 +1,23 @@
+from flask import Response
+import msgspec
+
+# Shared encoder; datetimes are written in ISO 8601 (as in the Socket.IO events) and Decimals as strings
+encoder = msgspec.json.Encoder(decimal_format="string")
+
+
+def json_response(data, status: int = 200):
+    """
+    Build a JSON response, encoding the data straight into its body.
+
+    Unlike `Response(response=jsonify(data).get_data(), ...)`, no intermediate response is built
+    and the encoding is done by msgspec, several times faster than the standard library on large
+    payloads such as pages of listings.
+
+    Args:
+        data: The data to send: dicts, lists, strings, numbers, datetimes, Decimals, ...
+        status (int): The HTTP status code.
+
+    Returns:
+        Response: The response, with the `application/json` mimetype.
+    """
+    return Response(response=encoder.encode(data), status=status, mimetype="application/json")
@@ -2,6 +2,7 @@ from apscheduler.schedulers.background import BackgroundScheduler
 
 from ..database import backup_db
 from .logger import setup_logger
+from .search_index import search_index
 
 logger = setup_logger(name="app_logger", log_file="logs/app.log")
 
@@ -10,6 +11,7 @@ try:
     # Initialize scheduler
     scheduler = BackgroundScheduler()
     scheduler.add_job(backup_db, trigger="cron", hour=12, minute=0)  # Runs every day at Noon
+    scheduler.add_job(search_index.save_snapshot, trigger="interval", minutes=10)
 except Exception as e:
     # Log any errors during scheduler initialization
     logger.warning(msg=f"Scheduler initialization error: {e}")
\ No newline at end of file
@@ -0,0 +1,685 @@
+from pymysql import cursors
+from datetime import datetime
+from dotenv import load_dotenv
+from array import array
+import math, os, pickle, re, tempfile, threading, time
+import numpy as np
+
+from .facets import PRICE_BUCKET_EDGES, price_filter
+from .logger import setup_logger
+
+load_dotenv()
+
+logger = setup_logger(name="search_logger", log_file="logs/search.log")
+
+# Text columns indexed and the weight of a term occurrence in each of them
+FIELD_WEIGHTS = {"title": 3.0, "title_short": 2.0, "description": 1.0, "item_specifics": 1.0}
+
+# Columns that can be filtered on exactly, matched against query parameters as strings
+FILTER_FIELDS = ("user_id", "category_id", "listing_type")
+
+# Columns selected to (re)index a listing
+INDEXED_COLUMNS = ("listing_id", *FIELD_WEIGHTS, *FILTER_FIELDS, "buy_now_price", "status")
+
+# Statuses of listings left out of the index, e.g. drafts until they go live
+HIDDEN_STATUSES = frozenset({"draft"})
+
+# Number of listings written since the last compaction above which writes trigger one
+MAX_DELTA_LISTINGS = 10000
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+STOP_WORDS = frozenset({"a", "an", "and", "for", "in", "of", "on", "or", "the", "to", "with"})
+
+SNAPSHOT_VERSION = 1
+
+
+def tokenize(text):
+    """
+    Split text into normalized search terms.
+
+    Text is case folded and split on anything that is not a letter or digit, stop words are
+    dropped and a trailing plural "s" is stripped, so "Gaming Laptops" and "gaming laptop"
+    produce the same terms.
+
+    Args:
+        text (str | None): The text to tokenize.
+
+    Returns:
+        list[str]: The terms, in order of appearance.
+    """
+    if not text:
+        return []
+    terms = []
+    for token in TOKEN_PATTERN.findall(str(text).casefold()):
+        if token in STOP_WORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+def weighted_terms(row: dict):
+    """
+    Weighted frequency of every term of a listing, see `FIELD_WEIGHTS`.
+
+    Args:
+        row (dict): The listing.
+
+    Returns:
+        dict[str, float]: Term mapped to the sum of the weights of its occurrences.
+    """
+    terms = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        for term in tokenize(row.get(field)):
+            terms[term] = terms.get(term, 0.0) + weight
+    return terms
+
+
+class SearchIndex:
+    """
+    In-process inverted index over listing text, ranked with BM25.
+
+    The index is split into two segments, like a log-structured merge tree:
+    - The base segment stores the posting list of every term as a slice of two flat NumPy arrays
+      (listing IDs sorted ascending, and the term's weighted frequency in each listing), so a
+      million listings take tens of megabytes and posting lists are intersected, filtered and
+      scored with vectorized operations instead of per-listing Python code.
+    - The delta segment holds listings added or updated since the base was built, in plain dicts
+      that are cheap to modify. Base postings of updated or removed listings are masked out
+      until the next compaction merges the delta into a new base.
+
+    Per-listing data used by filters and scoring (length, price, filter values) is kept in dense
+    columns indexed by listing ID, shared by both segments.
+
+    Queries match listings containing every query term. The index starts empty and inactive;
+    `load()` fills it from a snapshot or the database, queuing writes reported through
+    `add()`/`remove()` meanwhile and replaying them afterwards, then marks it ready. Until then
+    callers fall back to SQL.
+
+    Args:
+        snapshot_path (str | None): File the index is saved to and loaded from.
+        k1 (float): BM25 term frequency saturation.
+        b (float): BM25 document length normalization.
+    """
+    def __init__(self, snapshot_path: str | None = None, k1: float = 1.2, b: float = 0.75):
+        self.snapshot_path = snapshot_path
+        self.k1 = k1
+        self.b = b
+
+        self.ready = False
+        self.loading = False
+
+        self._lock = threading.RLock()
+        self._pending = []  # Writes received while loading, replayed once loaded
+        self._reset()
+
+    @property
+    def active(self):
+        """Whether writes should be reported to the index."""
+        return self.ready or self.loading
+
+    def __len__(self):
+        return self._count
+
+    def _reset(self):
+        # Base segment: term -> (start, end) of its postings in the flat arrays
+        self._vocabulary = {}
+        self._ids = np.empty(0, dtype=np.int32)
+        self._frequencies = np.empty(0, dtype=np.float32)
+
+        # Delta segment
+        self._delta = {}  # listing_id -> {term: weighted frequency}
+        self._delta_postings = {}  # term -> {listing_id}
+
+        # Columns indexed by listing ID
+        self._alive = np.zeros(0, dtype=bool)
+        self._stale = np.zeros(0, dtype=bool)  # Base postings outdated by an update or removal
+        self._stale_count = 0
+        self._lengths = np.zeros(0, dtype=np.float32)
+        self._prices = np.zeros(0, dtype=np.float64)
+        self._columns = {field: np.zeros(0, dtype=np.int32) for field in FILTER_FIELDS}
+        self._codes = {field: {} for field in FILTER_FIELDS}  # Filter value -> code stored in its column
+
+        self._count = 0
+        self._total_length = 0.0
+
+    # Writes
+
+    def add(self, row: dict):
+        """
+        Index a listing, replacing any previous version of it.
+
+        Args:
+            row (dict): The listing, with at least the columns in `INDEXED_COLUMNS`.
+        """
+        with self._lock:
+            if self.loading:
+                self._pending.append(("add", row))
+            elif self.ready:
+                self._add(row)
+                if len(self._delta) > MAX_DELTA_LISTINGS:
+                    self._compact()
+
+    def remove(self, listing_id: int):
+        """
+        Remove a listing from the index.
+
+        Args:
+            listing_id (int): The ID of the listing to remove.
+        """
+        with self._lock:
+            if self.loading:
+                self._pending.append(("remove", listing_id))
+            elif self.ready:
+                self._remove(int(listing_id))
+
+    def _add(self, row: dict):
+        listing_id = int(row["listing_id"])
+        self._remove(listing_id)
+        if row.get("status") in HIDDEN_STATUSES:
+            return
+
+        terms = weighted_terms(row)
+        self._set_columns(listing_id, row, sum(terms.values()))
+        self._delta[listing_id] = terms
+        for term in terms:
+            self._delta_postings.setdefault(term, set()).add(listing_id)
+
+    def _remove(self, listing_id: int):
+        if listing_id >= len(self._alive) or not self._alive[listing_id]:
+            return
+
+        self._alive[listing_id] = False
+        if not self._stale[listing_id]:
+            self._stale[listing_id] = True
+            self._stale_count += 1
+        self._count -= 1
+        self._total_length -= float(self._lengths[listing_id])
+        for term in self._delta.pop(listing_id, ()):
+            postings = self._delta_postings[term]
+            postings.discard(listing_id)
+            if not postings:
+                del self._delta_postings[term]
+
+    def _set_columns(self, listing_id: int, row: dict, length: float):
+        if listing_id >= len(self._alive):
+            size = max(listing_id + 1, 2 * len(self._alive), 1024)
+            grow = size - len(self._alive)
+            self._alive = np.concatenate((self._alive, np.zeros(grow, dtype=bool)))
+            self._stale = np.concatenate((self._stale, np.zeros(grow, dtype=bool)))
+            self._lengths = np.concatenate((self._lengths, np.zeros(grow, dtype=np.float32)))
+            self._prices = np.concatenate((self._prices, np.full(grow, np.nan)))
+            for field in FILTER_FIELDS:
+                self._columns[field] = np.concatenate((self._columns[field], np.full(grow, -1, dtype=np.int32)))
+
+        price = row.get("buy_now_price")
+        self._alive[listing_id] = True
+        self._lengths[listing_id] = length
+        self._prices[listing_id] = np.nan if price is None else float(price)
+        for field in FILTER_FIELDS:
+            value = row.get(field)
+            codes = self._codes[field]
+            self._columns[field][listing_id] = -1 if value is None else codes.setdefault(str(value), len(codes))
+        self._count += 1
+        self._total_length += length
+
+    # Base segment
+
+    def _build_base(self, vocabulary: list, term_index: np.ndarray, ids: np.ndarray, frequencies: np.ndarray):
+        """Replace the base segment with postings given as parallel arrays sorted by (term, listing)."""
+        counts = np.bincount(term_index, minlength=len(vocabulary))
+        ends = np.cumsum(counts)
+        starts = ends - counts
+
+        self._ids = ids.astype(np.int32)
+        self._frequencies = frequencies.astype(np.float32)
+        self._vocabulary = {
+            term: (start, end)
+            for term, start, end in zip(vocabulary, starts.tolist(), ends.tolist()) if end > start
+        }
+        self._stale[:] = False
+        self._stale_count = 0
+        self._delta.clear()
+        self._delta_postings.clear()
+
+    def _compact(self):
+        """
+        Merge the delta segment into the base segment, dropping outdated postings.
+
+        The base is already sorted by (term, listing), so only the delta postings are sorted and
+        then inserted at their positions in a single linear pass.
+        """
+        if not self._delta and not self._stale_count:
+            return
+
+        started = time.monotonic()
+        vocabulary = list(self._vocabulary)
+        counts = [end - start for start, end in self._vocabulary.values()]
+        keep = ~self._stale[self._ids]
+        term_index = np.repeat(np.arange(len(vocabulary), dtype=np.int32), counts)[keep]
+        ids, frequencies = self._ids[keep], self._frequencies[keep]
+
+        positions = {term: i for i, term in enumerate(vocabulary)}
+        delta_terms, delta_ids, delta_frequencies = array("i"), array("i"), array("f")
+        for listing_id, terms in self._delta.items():
+            for term, frequency in terms.items():
+                if term not in positions:
+                    positions[term] = len(vocabulary)
+                    vocabulary.append(term)
+                delta_terms.append(positions[term])
+                delta_ids.append(listing_id)
+                delta_frequencies.append(frequency)
+        delta_terms = np.frombuffer(delta_terms, dtype=np.int32)
+        delta_ids = np.frombuffer(delta_ids, dtype=np.int32)
+        delta_frequencies = np.frombuffer(delta_frequencies, dtype=np.float32)
+
+        # Sort keys: term in the high 32 bits, listing ID in the low ones
+        delta_keys = (delta_terms.astype(np.int64) << 32) | delta_ids
+        order = np.argsort(delta_keys)
+        at = np.searchsorted((term_index.astype(np.int64) << 32) | ids, delta_keys[order])
+
+        self._build_base(
+            vocabulary=vocabulary,
+            term_index=np.insert(term_index, at, delta_terms[order]),
+            ids=np.insert(ids, at, delta_ids[order]),
+            frequencies=np.insert(frequencies, at, delta_frequencies[order])
+        )
+        logger.info(msg=f"Search index compacted: {len(self._ids)} postings in {time.monotonic() - started:.2f}s")
+
+    def _build(self, rows):
+        """Fill an empty index from an iterable of listing rows, building the base segment directly."""
+        positions, vocabulary = {}, []
+        term_index, ids, frequencies = array("i"), array("i"), array("f")
+
+        for i, row in enumerate(rows):
+            if row.get("status") in HIDDEN_STATUSES:
+                continue
+            listing_id = int(row["listing_id"])
+            terms = weighted_terms(row)
+            self._set_columns(listing_id, row, sum(terms.values()))
+            for term, frequency in terms.items():
+                if term not in positions:
+                    positions[term] = len(vocabulary)
+                    vocabulary.append(term)
+                term_index.append(positions[term])
+                ids.append(listing_id)
+                frequencies.append(frequency)
+            if i % 1000 == 0:
+                time.sleep(0)  # Let other greenlets run
+
+        term_index = np.frombuffer(term_index, dtype=np.int32)
+        ids = np.frombuffer(ids, dtype=np.int32)
+        order = np.lexsort((ids, term_index))
+        self._build_base(
+            vocabulary=vocabulary,
+            term_index=term_index[order],
+            ids=ids[order],
+            frequencies=np.frombuffer(frequencies, dtype=np.float32)[order]
+        )
+
+    # Queries
+
+    def search(self, query: str, filters: dict | None = None, limit: int | None = None, offset: int = 0, after: tuple | None = None):
+        """
+        Rank the listings matching a query.
+
+        Args:
+            query (str): Free text; every term must appear in a listing for it to match.
+            filters (dict, optional): Query parameters; `user_id`, `category_id`, `listing_type`
+                are matched exactly and `min_price`/`max_price` bound `buy_now_price` (exclusive).
+            limit (int, optional): Maximum number of results, all matches if omitted.
+            offset (int): Number of leading results to skip.
+            after (tuple, optional): (score, listing_id) of the last result of the previous page;
+                only results ranked after it are returned (keyset pagination).
+
+        Returns:
+            list[tuple[int, float]]: (listing_id, score) pairs, best first, ties broken by
+                descending listing_id.
+
+        Raises:
+            ValueError: If a price filter is not a number.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            if not self._count:
+                return []
+            ids, frequencies, document_frequencies = self._matches(terms)
+            if not len(ids):
+                return []
+
+            mask = self._filter_mask(ids, filters or {})
+            if mask is not None:
+                ids, frequencies = ids[mask], frequencies[:, mask]
+            scores = self._scores(ids, frequencies, document_frequencies)
+
+        if after is not None:
+            score, listing_id = after
+            later = (scores < score) | ((scores == score) & (ids < listing_id))
+            ids, scores = ids[later], scores[later]
+
+        wanted = None if limit is None else offset + limit
+        if wanted is not None and len(ids) > wanted:
+            # Keep only the candidates that can make the page before sorting
+            threshold = np.partition(scores, len(scores) - wanted)[len(scores) - wanted]
+            best = scores >= threshold
+            ids, scores = ids[best], scores[best]
+        order = np.lexsort((-ids, -scores))[offset:wanted]
+        return list(zip(ids[order].tolist(), scores[order].tolist()))
+
+    def match(self, query: str, filters: dict | None = None, limit: int | None = None):
+        """
+        IDs of the listings matching a query, most relevant first.
+
+        Args:
+            query (str): Free text; every term must appear in a listing for it to match.
+            filters (dict, optional): Query parameters filtering the matches, as for `search`; they
+                are applied before the limit, so it only drops matches the query would return.
+            limit (int, optional): Maximum number of IDs returned.
+
+        Returns:
+            list[int]: The matching listing IDs.
+
+        Raises:
+            ValueError: If a price filter is not a number.
+        """
+        return [listing_id for listing_id, _ in self.search(query=query, filters=filters, limit=limit)]
+
+    def facet_groups(self, query: str | None = None, filters: dict | None = None):
+        """
+        Count the listings matching a query per facet combination, for `combine_facets`.
+
+        Listings are grouped by category, listing type, price bucket and whether their price is
+        within the `min_price`/`max_price` filters in one vectorized pass over the columns.
+        Category, listing type and price filters are left to `combine_facets`; only `user_id`
+        narrows the listings counted.
+
+        Args:
+            query (str, optional): Free text; all listings are counted if omitted.
+            filters (dict, optional): Query parameters.
+
+        Returns:
+            list[tuple]: (category_id, listing_type, price bucket index or -1 without a price,
+                price within bounds, count) tuples.
+
+        Raises:
+            ValueError: If a price filter is not a number.
+        """
+        filters = filters or {}
+        min_price, max_price = price_filter(filters)
+
+        with self._lock:
+            if query:
+                terms = list(dict.fromkeys(tokenize(query)))
+                ids = self._matches(terms)[0] if terms and self._count else np.empty(0, dtype=np.int64)
+            else:
+                ids = np.flatnonzero(self._alive)
+            mask = self._filter_mask(ids, {"user_id": filters.get("user_id")})
+            if mask is not None:
+                ids = ids[mask]
+            if not len(ids):
+                return []
+
+            categories = self._columns["category_id"][ids]
+            listing_types = self._columns["listing_type"][ids]
+            prices = self._prices[ids]
+            category_values = {code: value for value, code in self._codes["category_id"].items()}
+            type_values = {code: value for value, code in self._codes["listing_type"].items()}
+
+        priced = ~np.isnan(prices)
+        buckets = np.where(priced, np.searchsorted(PRICE_BUCKET_EDGES, prices, side="right"), -1)
+        in_price = np.ones(len(ids), dtype=bool)
+        if min_price is not None:
+            in_price &= prices > float(min_price)  # NaN (no price) never matches
+        if max_price is not None:
+            in_price &= prices < float(max_price)
+
+        keys = np.stack((categories, listing_types, buckets, in_price)).T
+        groups, counts = np.unique(keys, axis=0, return_counts=True)
+        return [
+            (category_values.get(category), type_values.get(listing_type), int(bucket), bool(within), int(count))
+            for (category, listing_type, bucket, within), count in zip(groups.tolist(), counts.tolist())
+        ]
+
+    def _matches(self, terms: list):
+        """
+        Find the listings containing every term, in both segments.
+
+        Returns:
+            tuple: Listing IDs, their weighted frequency of each term (one row per term) and the
+                number of listings containing each term.
+        """
+        slices = []
+        for term in terms:
+            start, end = self._vocabulary.get(term, (0, 0))
+            slices.append((self._ids[start:end], self._frequencies[start:end]))
+        document_frequencies = [
+            (np.count_nonzero(~self._stale[ids]) if self._stale_count else len(ids)) + len(self._delta_postings.get(term, ()))
+            for term, (ids, _) in zip(terms, slices)
+        ]
+        if not all(document_frequencies):
+            return np.empty(0, dtype=np.int64), np.empty((len(terms), 0)), document_frequencies
+
+        # Base segment: look the shortest posting list's IDs up in the others with binary searches
+        order = sorted(range(len(terms)), key=lambda i: len(slices[i][0]))
+        ids = slices[order[0]][0]
+        columns = {order[0]: slices[order[0]][1]}
+        for i in order[1:]:
+            other_ids, other_frequencies = slices[i]
+            if not len(ids) or not len(other_ids):
+                ids = ids[:0]
+                break
+            positions = np.minimum(np.searchsorted(other_ids, ids), len(other_ids) - 1)
+            found = other_ids[positions] == ids
+            ids = ids[found]
+            columns = {k: v[found] for k, v in columns.items()}
+            columns[i] = other_frequencies[positions[found]]
+        if len(ids) and self._stale_count:
+            valid = ~self._stale[ids]
+            ids = ids[valid]
+            base = np.vstack([columns[i][valid] for i in range(len(terms))])
+        elif len(ids):
+            base = np.vstack([columns[i] for i in range(len(terms))])
+        else:
+            base = np.empty((len(terms), 0), dtype=np.float32)
+
+        # Delta segment
+        postings = [self._delta_postings.get(term) for term in terms]
+        delta_ids = sorted(set.intersection(*sorted(postings, key=len))) if all(postings) else []
+        delta = np.array(
+            [[self._delta[listing_id][term] for listing_id in delta_ids] for term in terms], dtype=np.float32
+        ).reshape(len(terms), len(delta_ids))
+
+        return np.concatenate((ids.astype(np.int64), np.array(delta_ids, dtype=np.int64))), np.hstack((base, delta)), document_frequencies
+
+    def _filter_mask(self, ids: np.ndarray, filters: dict):
+        """Boolean mask of the listings passing the filters, or None if nothing is filtered."""
+        mask = None
+        for field in FILTER_FIELDS:
+            if filters.get(field) is None:
+                continue
+            code = self._codes[field].get(str(filters.get(field)), -2)
+            matches = self._columns[field][ids] == code
+            mask = matches if mask is None else mask & matches
+
+        for name, compare in (("min_price", np.greater), ("max_price", np.less)):
+            if filters.get(name) not in (None, ""):
+                matches = compare(self._prices[ids], float(filters.get(name)))  # NaN (no price) never matches
+                mask = matches if mask is None else mask & matches
+        return mask
+
+    def _scores(self, ids: np.ndarray, frequencies: np.ndarray, document_frequencies: list):
+        """BM25 score of each listing, rounded so that scores survive a round trip through a cursor."""
+        k1, b = self.k1, self.b
+        norm = k1 * (1 - b + b * self._lengths[ids].astype(np.float64) / (self._total_length / self._count or 1.0))
+        scores = np.zeros(len(ids))
+        for row, document_frequency in zip(frequencies, document_frequencies):
+            idf = math.log(1 + (self._count - document_frequency + 0.5) / (document_frequency + 0.5))
+            scores += idf * row * (k1 + 1) / (row + norm)
+        return np.round(scores, 6)
+
+    def stats(self):
+        """
+        Size and memory use of the index.
+
+        Returns:
+            dict: Listing, term and posting counts and the bytes used by the arrays.
+        """
+        with self._lock:
+            arrays = [self._ids, self._frequencies, self._alive, self._stale, self._lengths, self._prices, *self._columns.values()]
+            return {
+                "ready": self.ready,
+                "listings": self._count,
+                "terms": len(self._vocabulary),
+                "postings": len(self._ids),
+                "delta_listings": len(self._delta),
+                "array_bytes": sum(a.nbytes for a in arrays)
+            }
+
+    # Persistence
+
+    def save_snapshot(self):
+        """
+        Compact the index and atomically write it to `snapshot_path`.
+        """
+        if not self.ready or not self.snapshot_path:
+            return
+
+        with self._lock:
+            self._compact()
+            state = {
+                "version": SNAPSHOT_VERSION,
+                "created_at": datetime.now(),
+                "vocabulary": self._vocabulary,
+                "ids": self._ids,
+                "frequencies": self._frequencies,
+                "alive": self._alive,
+                "lengths": self._lengths,
+                "prices": self._prices,
+                "columns": self._columns,
+                "codes": self._codes,
+                "count": self._count,
+                "total_length": self._total_length
+            }
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+        directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        logger.info(msg=f"Search index snapshot saved: {state['count']} listings, {len(data)} bytes")
+
+    def _load_snapshot(self):
+        """
+        Fill the index from `snapshot_path`.
+
+        Returns:
+            datetime | None: When the snapshot was taken, or None if there is no usable snapshot.
+        """
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                state = pickle.load(f)
+        except Exception as e:
+            logger.warning(msg=f"Ignoring unreadable search index snapshot: {e}")
+            return None
+        if state.get("version") != SNAPSHOT_VERSION:
+            return None
+
+        self._vocabulary = state.get("vocabulary")
+        self._ids = state.get("ids")
+        self._frequencies = state.get("frequencies")
+        self._alive = state.get("alive")
+        self._stale = np.zeros(len(self._alive), dtype=bool)
+        self._stale_count = 0
+        self._lengths = state.get("lengths")
+        self._prices = state.get("prices")
+        self._columns = state.get("columns")
+        self._codes = state.get("codes")
+        self._count = state.get("count")
+        self._total_length = state.get("total_length")
+        return state.get("created_at")
+
+    def load(self, connection_factory):
+        """
+        Build the index, then start serving queries from it.
+
+        The index is restored from its snapshot and caught up with listings created or updated
+        since (and those deleted), or fully rebuilt from the database if there is no snapshot.
+        Rows are streamed with an unbuffered cursor so the table is never held in memory.
+
+        Args:
+            connection_factory (callable): Zero-argument callable returning a database connection.
+        """
+        with self._lock:
+            if self.active:
+                return
+            self.loading = True
+            self._reset()
+
+        started = time.monotonic()
+        conn = connection_factory()
+        try:
+            snapshot_at = self._load_snapshot()
+            cursor = conn.cursor(cursors.SSDictCursor)  # type: ignore
+            columns = ", ".join(INDEXED_COLUMNS)
+            if snapshot_at is None:
+                cursor.execute(f"SELECT {columns} FROM listings")
+                self._build(cursor)
+            else:
+                last_id = int(np.flatnonzero(self._alive)[-1]) if self._count else 0
+                cursor.execute(
+                    f"SELECT {columns} FROM listings WHERE listing_id > %s OR updated_at >= %s",
+                    (last_id, snapshot_at)
+                )
+                for i, row in enumerate(cursor):
+                    self._add(row)
+                    if i % 1000 == 0:
+                        time.sleep(0)  # Let other greenlets run
+            cursor.close()
+
+            if snapshot_at is not None:
+                cursor = conn.cursor(cursors.SSCursor)  # type: ignore
+                cursor.execute("SELECT listing_id FROM listings")
+                existing = np.fromiter((row[0] for row in cursor), dtype=np.int64)
+                cursor.close()
+                for listing_id in np.setdiff1d(np.flatnonzero(self._alive), existing).tolist():
+                    self._remove(listing_id)
+
+            with self._lock:
+                for operation, argument in self._pending:
+                    self._add(argument) if operation == "add" else self._remove(int(argument))
+                self._pending.clear()
+                self._compact()
+                self.loading = False
+                self.ready = True
+
+            logger.info(msg=f"Search index loaded: {self._count} listings, {len(self._vocabulary)} terms in {time.monotonic() - started:.1f}s")
+
+        except Exception as e:
+            with self._lock:
+                self.loading = False
+                self._pending.clear()
+                self._reset()
+            logger.error(msg=f"Failed loading search index, falling back to SQL search: {e}")
+
+        finally:
+            conn.close()
+
+
+try:
+    # Initialize search index
+    search_index = SearchIndex(snapshot_path=os.getenv("SEARCH_INDEX_SNAPSHOT", os.path.join(os.getcwd(), "search_index.snapshot")))
+except Exception as e:
+    # Log any errors during search index initialization
+    logger.critical(msg=f"Search index initialization error: {e}")
@@ -15,4 +15,35 @@ try:
     socketio = SocketIO(cors_allowed_origins=os.getenv("FRONTEND_URL"))
 except Exception as e:
     # Log any errors during SocketIO initialization
-    logger.critical(msg=f"SocketIO initialization error: {e}")
\ No newline at end of file
+    logger.critical(msg=f"SocketIO initialization error: {e}")
+
+
+def message_queue_options():
+    """
+    Options connecting Socket.IO to the message queue shared by every worker process, if configured.
+
+    Emits are then published to the queue and every worker delivers them to its own clients, so
+    clients connected to any worker receive them. Without a queue only one worker can be run.
+
+    Returns:
+        dict: The `message_queue` URL and `channel`, or nothing if `SOCKETIO_MESSAGE_QUEUE` is not set.
+    """
+    url = os.getenv("SOCKETIO_MESSAGE_QUEUE")
+    if not url:
+        return {}
+    return {"message_queue": url, "channel": os.getenv("SOCKETIO_CHANNEL", "flask-socketio")}
+
+
+def listing_room(listing_id: int):
+    """Room of the clients watching a listing's auction."""
+    return f"listing:{listing_id}"
+
+
+def chat_room(chat_id: int):
+    """Room of the participants of a chat."""
+    return f"chat:{chat_id}"
+
+
+def ticket_room(ticket_id: int):
+    """Room of the participants of a support ticket."""
+    return f"ticket:{ticket_id}"
@@ -0,0 +1,44 @@
+from dotenv import load_dotenv
+from datetime import datetime, timedelta
+import os
+
+load_dotenv()
+
+# Bids landing this many seconds or less before an auction's end extend it; 0 disables soft close
+SOFT_CLOSE_WINDOW = timedelta(seconds=float(os.getenv("SOFT_CLOSE_WINDOW", "60")))
+# Seconds left in an auction after a bid extends it
+SOFT_CLOSE_EXTENSION = timedelta(seconds=float(os.getenv("SOFT_CLOSE_EXTENSION", "60")))
+
+
+def extended_end(auction_end: datetime | None, bid_time: datetime):
+    """
+    End of an auction after a bid, extended if the bid landed within the soft-close window.
+
+    Bidders then always get `SOFT_CLOSE_EXTENSION` to answer a late bid, so sniping in the last
+    second is pointless and the bids closing an auction are spread over time.
+
+    Args:
+        auction_end (datetime | None): The auction's end before the bid.
+        bid_time (datetime): When the bid was placed.
+
+    Returns:
+        datetime | None: The auction's end after the bid.
+    """
+    if auction_end is None or not SOFT_CLOSE_WINDOW or auction_end - bid_time > SOFT_CLOSE_WINDOW:
+        return auction_end
+    return max(auction_end, bid_time + SOFT_CLOSE_EXTENSION)
+
+
+def soft_close_bounds(bid_time: datetime):
+    """
+    Bounds for applying soft close in SQL: `CASE WHEN auction_end <= %s THEN GREATEST(auction_end, %s) ...`.
+
+    Args:
+        bid_time (datetime): When the bid was placed.
+
+    Returns:
+        tuple[datetime, datetime]: Latest end extended by the bid, and the end it is extended to.
+    """
+    if not SOFT_CLOSE_WINDOW:
+        return bid_time, bid_time  # Accepted bids land before the end, so nothing is extended
+    return bid_time + SOFT_CLOSE_WINDOW, bid_time + SOFT_CLOSE_EXTENSION
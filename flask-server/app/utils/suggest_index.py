@@ -0,0 +1,392 @@
+from pymysql import cursors
+from dotenv import load_dotenv
+from bisect import bisect_left
+import heapq, os, re, sys, threading, time
+
+from .logger import setup_logger
+
+load_dotenv()
+
+logger = setup_logger(name="search_logger", log_file="logs/search.log")
+
+# Columns selected to (re)index a listing
+SUGGEST_COLUMNS = ("listing_id", "title", "category_id", "status", "purchases", "bids")
+
+# Words of a title, from its start, that a prefix can match from ("lap" suggests "Gaming Laptop")
+MAX_WORD_STARTS = 4
+
+# Most suggestions returned for a prefix
+MAX_SUGGESTIONS = 20
+
+# Prefixes matching more keys than this get their best suggestions cached
+CACHED_RANGE = 256
+
+# Estimated bytes of bookkeeping per item and per key, on top of the strings themselves
+ITEM_OVERHEAD = 232
+KEY_OVERHEAD = 16
+
+WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def normalize(text):
+    """
+    Normalize text for prefix matching: case folded words separated by single spaces.
+
+    Args:
+        text (str | None): The text to normalize.
+
+    Returns:
+        str: The normalized text.
+    """
+    return " ".join(WORD_PATTERN.findall(str(text or "").casefold()))
+
+
+class SuggestIndex:
+    """
+    In-memory typeahead index over active listing titles and category names.
+
+    Every title is stored under keys starting at each of its first `MAX_WORD_STARTS` words, in
+    one sorted list, so the keys matching a prefix are a contiguous range found with two binary
+    searches. Suggestions are ranked by weight: purchases plus bids for listings and the total
+    weight of their listings for categories.
+
+    Ranking a large range (short prefixes like "a") is the only step that is not logarithmic, so
+    the best suggestions of such prefixes are cached. Since weights only grow with bids and
+    purchases, a weight increase updates cached rankings in place; other changes drop the
+    cached rankings of the prefixes they affect.
+
+    The estimated memory used is tracked as items are added and removed. Once it exceeds the
+    budget, new listings are not indexed (categories and updates still are) until memory is freed.
+
+    Args:
+        memory_budget (int): Memory, in bytes, the index may use.
+    """
+    def __init__(self, memory_budget: int):
+        self.memory_budget = memory_budget
+
+        self.ready = False
+        self.loading = False
+
+        self._lock = threading.RLock()
+        self._pending = []  # Writes received while loading, replayed once loaded
+        self._reset()
+
+    @property
+    def active(self):
+        """Whether writes should be reported to the index."""
+        return self.ready or self.loading
+
+    def _reset(self):
+        self._keys = []  # Sorted normalized phrases
+        self._refs = []  # ("listing" | "category", ID) of each key
+        self._items = {}  # Ref -> [text, keys, listing weight, listing category]
+        self._category_weights = {}  # category_id -> total weight of its listings
+        self._cache = {}  # Prefix -> best refs
+        self._cached_length = 0  # Longest cached prefix
+        self._bytes = 0
+        self._skipped = 0  # Listings not indexed because of the memory budget
+
+    # Writes
+
+    def add_listing(self, row: dict):
+        """
+        Index a listing, or remove it if it is no longer active.
+
+        Args:
+            row (dict): The listing, with at least the columns in `SUGGEST_COLUMNS`.
+        """
+        self._write("add_listing", row)
+
+    def remove_listing(self, listing_id: int):
+        """
+        Remove a listing from the index.
+
+        Args:
+            listing_id (int): The ID of the listing to remove.
+        """
+        self._write("remove", ("listing", int(listing_id)))
+
+    def add_listing_weight(self, listing_id: int, delta: float):
+        """
+        Change the weight of an indexed listing without reading the listing again.
+
+        Args:
+            listing_id (int): The ID of the listing, e.g. one that just received a bid.
+            delta (float): Amount added to the listing's weight.
+        """
+        self._write("add_weight", (("listing", int(listing_id)), float(delta)))
+
+    def add_category(self, row: dict):
+        """
+        Index a category, replacing any previous version of it.
+
+        Args:
+            row (dict): The category, with at least `category_id` and `name`.
+        """
+        self._write("add_category", row)
+
+    def remove_category(self, category_id: int):
+        """
+        Remove a category from the index.
+
+        Args:
+            category_id (int): The ID of the category to remove.
+        """
+        self._write("remove", ("category", int(category_id)))
+
+    def _write(self, operation: str, argument):
+        with self._lock:
+            if self.loading:
+                self._pending.append((operation, argument))
+            elif self.ready:
+                self._apply(operation, argument)
+
+    def _apply(self, operation: str, argument):
+        if operation == "add_listing":
+            self._add_listing(argument)
+        elif operation == "add_category":
+            self._add_category(argument)
+        elif operation == "add_weight":
+            self._add_weight(*argument)
+        else:
+            self._remove(argument)
+
+    def _add_listing(self, row: dict):
+        ref = ("listing", int(row["listing_id"]))
+        if row.get("status") != "active" or not normalize(row.get("title")):
+            self._remove(ref)
+            return
+
+        weight = float((row.get("purchases") or 0) + (row.get("bids") or 0))
+        category_id = row.get("category_id")
+        item = self._items.get(ref)
+        if item is not None and item[0] == row.get("title") and item[3] == category_id:
+            # Same keys, only the weight may have changed
+            increased = weight >= item[2]
+            self._set_category_weight(category_id, weight - item[2])
+            item[2] = weight
+            self._update_cache(ref, item[1], increased)
+            return
+
+        if item is None and self._bytes > self.memory_budget:
+            self._skipped += 1
+            return
+        self._remove(ref)
+        self._insert(ref, text=row.get("title"), keys=self._title_keys(row.get("title")), weight=weight, category_id=category_id)
+        self._set_category_weight(category_id, weight)
+
+    def _add_weight(self, ref: tuple, delta: float):
+        item = self._items.get(ref)
+        if item is None or not delta:
+            return
+        item[2] += delta
+        self._set_category_weight(item[3], delta)
+        self._update_cache(ref, item[1], increased=delta > 0)
+
+    def _add_category(self, row: dict):
+        ref = ("category", int(row["category_id"]))
+        self._remove(ref)
+        if normalize(row.get("name")):
+            self._insert(ref, text=row.get("name"), keys=(normalize(row.get("name")),), weight=0.0, category_id=None)
+
+    def _insert(self, ref: tuple, text: str, keys: tuple, weight: float, category_id):
+        self._items[ref] = [text, keys, weight, category_id]
+        self._bytes += ITEM_OVERHEAD + sys.getsizeof(text)
+        for key in keys:
+            i = bisect_left(self._keys, key)
+            self._keys.insert(i, key)
+            self._refs.insert(i, ref)
+            self._bytes += KEY_OVERHEAD + sys.getsizeof(key)
+        self._update_cache(ref, keys, increased=True)
+
+    def _remove(self, ref: tuple):
+        item = self._items.pop(ref, None)
+        if item is None:
+            return
+
+        text, keys, weight, category_id = item
+        self._bytes -= ITEM_OVERHEAD + sys.getsizeof(text)
+        for key in keys:
+            i = bisect_left(self._keys, key)
+            while self._refs[i] != ref:
+                i += 1
+            del self._keys[i]
+            del self._refs[i]
+            self._bytes -= KEY_OVERHEAD + sys.getsizeof(key)
+        if ref[0] == "listing":
+            self._set_category_weight(category_id, -weight)
+        self._update_cache(ref, keys, increased=False)
+
+    def _set_category_weight(self, category_id, delta: float):
+        if category_id is None or not delta:
+            return
+        category_id = int(category_id)
+        self._category_weights[category_id] = self._category_weights.get(category_id, 0.0) + delta
+        item = self._items.get(("category", category_id))
+        if item is not None:
+            self._update_cache(("category", category_id), item[1], increased=delta > 0)
+
+    def _update_cache(self, ref: tuple, keys: tuple, increased: bool):
+        """
+        Keep the cached rankings of the prefixes of `keys` correct after `ref` changed.
+
+        A ref that was added or whose weight increased can only move up, so it is merged into
+        each cached ranking. Otherwise a cached ranking containing it is dropped, since the ref
+        that would replace it is unknown.
+        """
+        if not self._cache:
+            return
+        for key in keys:
+            for length in range(1, min(len(key), self._cached_length) + 1):
+                best = self._cache.get(key[:length])
+                if best is None:
+                    continue
+                if not increased or ref not in self._items:
+                    if ref in best:
+                        del self._cache[key[:length]]
+                    continue
+                if ref not in best:
+                    if len(best) == MAX_SUGGESTIONS and self._weight(ref) <= self._weight(best[-1]):
+                        continue
+                    best.append(ref)
+                best.sort(key=self._weight, reverse=True)
+                del best[MAX_SUGGESTIONS:]
+
+    def _weight(self, ref: tuple):
+        if ref[0] == "category":
+            return self._category_weights.get(ref[1], 0.0)
+        return self._items[ref][2]
+
+    @staticmethod
+    def _title_keys(title: str):
+        words = normalize(title).split(" ")
+        return tuple(dict.fromkeys(" ".join(words[i:]) for i in range(min(len(words), MAX_WORD_STARTS))))
+
+    # Queries
+
+    def suggest(self, prefix: str, limit: int = 10):
+        """
+        Best suggestions for a prefix.
+
+        Args:
+            prefix (str): What the user has typed so far.
+            limit (int): Maximum number of suggestions, at most `MAX_SUGGESTIONS`.
+
+        Returns:
+            list[dict]: Suggestions with their `type` ("listing" or "category"), `id` and `text`,
+                best first.
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        with self._lock:
+            best = self._cache.get(prefix)
+            if best is None:
+                start = bisect_left(self._keys, prefix)
+                end = bisect_left(self._keys, prefix + "\U0010ffff", lo=start)
+                best = heapq.nlargest(MAX_SUGGESTIONS, set(self._refs[start:end]), key=self._weight)
+                if end - start > CACHED_RANGE:
+                    self._cache[prefix] = best
+                    self._cached_length = max(self._cached_length, len(prefix))
+            return [{"type": kind, "id": ref_id, "text": self._items[(kind, ref_id)][0]} for kind, ref_id in best[:limit]]
+
+    def stats(self):
+        """
+        Size and estimated memory use of the index.
+
+        Returns:
+            dict: Item, key and cached prefix counts, estimated bytes used and the budget.
+        """
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "items": len(self._items),
+                "keys": len(self._keys),
+                "cached_prefixes": len(self._cache),
+                "estimated_bytes": self._bytes + sys.getsizeof(self._keys) + sys.getsizeof(self._refs),
+                "memory_budget": self.memory_budget,
+                "skipped_listings": self._skipped
+            }
+
+    # Loading
+
+    def load(self, connection_factory):
+        """
+        Build the index from the database, then start serving suggestions from it.
+
+        Keys are collected and sorted once rather than inserted one by one.
+
+        Args:
+            connection_factory (callable): Zero-argument callable returning a database connection.
+        """
+        with self._lock:
+            if self.active:
+                return
+            self.loading = True
+            self._reset()
+
+        started = time.monotonic()
+        conn = connection_factory()
+        try:
+            pairs = []
+            cursor = conn.cursor(cursors.SSDictCursor)  # type: ignore
+            cursor.execute(f"SELECT {', '.join(SUGGEST_COLUMNS)} FROM listings WHERE status = 'active'")
+            for i, row in enumerate(cursor):
+                if not normalize(row.get("title")) or self._bytes > self.memory_budget:
+                    self._skipped += self._bytes > self.memory_budget
+                    continue
+                ref = ("listing", int(row["listing_id"]))
+                weight = float((row.get("purchases") or 0) + (row.get("bids") or 0))
+                keys = self._title_keys(row.get("title"))
+                self._items[ref] = [row.get("title"), keys, weight, row.get("category_id")]
+                self._bytes += ITEM_OVERHEAD + sys.getsizeof(row.get("title")) + sum(KEY_OVERHEAD + sys.getsizeof(key) for key in keys)
+                pairs.extend((key, ref) for key in keys)
+                if row.get("category_id") is not None:
+                    category_id = int(row.get("category_id"))
+                    self._category_weights[category_id] = self._category_weights.get(category_id, 0.0) + weight
+                if i % 1000 == 0:
+                    time.sleep(0)  # Let other greenlets run
+            cursor.close()
+
+            cursor = conn.cursor(cursors.DictCursor)  # type: ignore
+            cursor.execute("SELECT category_id, name FROM categories")
+            for row in cursor.fetchall():
+                key = normalize(row.get("name"))
+                if key:
+                    ref = ("category", int(row["category_id"]))
+                    self._items[ref] = [row.get("name"), (key,), 0.0, None]
+                    self._bytes += ITEM_OVERHEAD + sys.getsizeof(row.get("name")) + KEY_OVERHEAD + sys.getsizeof(key)
+                    pairs.append((key, ref))
+            cursor.close()
+
+            pairs.sort()
+            self._keys = [key for key, _ in pairs]
+            self._refs = [ref for _, ref in pairs]
+
+            with self._lock:
+                for operation, argument in self._pending:
+                    self._apply(operation, argument)
+                self._pending.clear()
+                self.loading = False
+                self.ready = True
+
+            logger.info(msg=f"Suggest index loaded: {len(self._items)} items, {len(self._keys)} keys, ~{self._bytes // 2 ** 20} MiB in {time.monotonic() - started:.1f}s")
+
+        except Exception as e:
+            with self._lock:
+                self.loading = False
+                self._pending.clear()
+                self._reset()
+            logger.error(msg=f"Failed loading suggest index, falling back to SQL: {e}")
+
+        finally:
+            conn.close()
+
+
+try:
+    # Initialize suggest index
+    suggest_index = SuggestIndex(memory_budget=int(os.getenv("SUGGEST_MEMORY_BUDGET", 256 * 2 ** 20)))
+except Exception as e:
+    # Log any errors during suggest index initialization
+    logger.critical(msg=f"Suggest index initialization error: {e}")
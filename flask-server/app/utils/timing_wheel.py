@@ -0,0 +1,112 @@
+import math
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel holding deadlines by key.
+
+    Level 0 has one slot per tick; each higher level has slots covering a whole lap of the level
+    below. A deadline is placed in the lowest level whose lap covers it, and is moved down a level
+    (cascaded) when the wheel reaches the start of its slot, so adding, cancelling and firing a
+    deadline cost O(1) (amortized over at most `levels` cascades) however many are pending.
+    Deadlines beyond the last level are kept aside and placed again on each lap of it.
+
+    Args:
+        now (float): Current time, in seconds.
+        tick (float): Resolution of the wheel, in seconds; deadlines fire on the first tick at or after them.
+        slots (int): Slots per level, a power of two.
+        levels (int): Number of levels.
+    """
+    def __init__(self, now: float, tick: float = 1.0, slots: int = 64, levels: int = 4):
+        if slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        self.tick = tick
+        self.levels = levels
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._wheels = [[{} for _ in range(slots)] for _ in range(levels)]  # Slot: key -> due tick
+        self._overflow = {}  # Deadlines beyond the last level
+        self._due = {}  # Deadlines reached, fired on the next advance
+        self._buckets = {}  # key -> bucket holding it
+        self._current = math.floor(now / tick)  # Last tick processed
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def __contains__(self, key):
+        return key in self._buckets
+
+    def add(self, key, due: float):
+        """
+        Add a deadline, replacing any deadline with the same key.
+
+        Args:
+            key: Hashable identifier of the deadline.
+            due (float): Time of the deadline, in seconds; deadlines already passed fire on the next advance.
+        """
+        self.cancel(key)
+        self._place(key, math.ceil(due / self.tick))
+
+    def cancel(self, key):
+        """
+        Remove a deadline.
+
+        Returns:
+            bool: Whether the deadline was pending.
+        """
+        bucket = self._buckets.pop(key, None)
+        if bucket is None:
+            return False
+        del bucket[key]
+        return True
+
+    def advance(self, now: float):
+        """
+        Move the wheel to the current time.
+
+        Args:
+            now (float): Current time, in seconds.
+
+        Returns:
+            list: Keys of the deadlines reached, in deadline order.
+        """
+        fired = self._drain(self._due)
+        target = math.floor(now / self.tick)
+        while self._current < target:
+            self._current += 1
+            tick = self._current
+            if not tick & ((1 << self._bits * self.levels) - 1):
+                self._cascade(self._overflow)
+            for level in range(self.levels - 1, 0, -1):
+                if not tick & ((1 << self._bits * level) - 1):
+                    self._cascade(self._wheels[level][(tick >> self._bits * level) & self._mask])
+            fired.extend(self._drain(self._wheels[0][tick & self._mask]))
+            fired.extend(self._drain(self._due))
+        return fired
+
+    def _place(self, key, tick: int):
+        delta = tick - self._current
+        if delta <= 0:
+            bucket = self._due
+        else:
+            for level in range(self.levels):
+                if not delta >> self._bits * (level + 1):
+                    bucket = self._wheels[level][(tick >> self._bits * level) & self._mask]
+                    break
+            else:
+                bucket = self._overflow
+        bucket[key] = tick
+        self._buckets[key] = bucket
+
+    def _cascade(self, bucket: dict):
+        entries = list(bucket.items())
+        bucket.clear()
+        for key, tick in entries:
+            self._place(key, tick)
+
+    def _drain(self, bucket: dict):
+        keys = [key for key, _ in sorted(bucket.items(), key=lambda entry: entry[1])]
+        for key in keys:
+            del self._buckets[key]
+        bucket.clear()
+        return keys
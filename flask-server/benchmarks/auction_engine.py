@@ -0,0 +1,103 @@
+"""
+Throughput of the auction engine: bids accepted per second by one process.
+
+Clients in concurrent threads (greenlets once the app has patched them) place increasing bids on
+a set of live auctions; the engine validates, sequences and journals them, and its flusher
+persists them in batches. The database is replaced by a connection answering instantly, so the
+engine itself is measured.
+
+Run from the `flask-server` directory: `python -m benchmarks.auction_engine`.
+"""
+from datetime import datetime, timedelta
+import argparse, tempfile, threading, time
+
+from app.utils.auction_engine import AuctionEngine
+
+
+class Cursor:
+    """Cursor of a database answering every auction as live, with no bids yet."""
+    def __init__(self):
+        self.row = None
+
+    def execute(self, statement, values=None):
+        if statement.startswith("SELECT listing_id"):
+            self.row = {"listing_id": values[0], "status": "active", "auction_end": datetime.now() + timedelta(days=1), "current_price": 0, "bids": 0}
+        else:
+            self.row = None
+
+    def executemany(self, statement, rows):
+        pass
+
+    def fetchone(self):
+        return self.row
+
+    def fetchall(self):
+        return []
+
+
+class Connection:
+    def cursor(self, *args):
+        return Cursor()
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def run(clients: int = 64, bids: int = 2000, auctions: int = 100, fsync: bool = False):
+    """
+    Place `clients * bids` bids through a started engine and time them.
+
+    Args:
+        clients (int): Concurrent clients placing bids.
+        bids (int): Bids placed by each client.
+        auctions (int): Auctions the clients bid on; each client bids on its own subset.
+        fsync (bool): Whether the journal is fsynced on every write.
+
+    Returns:
+        dict: Bids `accepted` out of `placed`, bids per second, mean latency in microseconds and the
+            bids persisted by the flusher.
+    """
+    with tempfile.TemporaryDirectory() as journal_dir:
+        engine = AuctionEngine(journal_dir=journal_dir, flush_interval=0.1, fsync=fsync)
+        engine.start(connection_factory=Connection)
+        accepted = [0] * clients
+
+        def client(index: int):
+            for n in range(bids):
+                listing_id = index % auctions + auctions * (n % 2)  # Two auctions per client
+                result = engine.place_bid(data={"listing_id": listing_id, "user_id": index + 1, "amount": float(n + 1)})
+                accepted[index] += result.get("accepted")
+
+        threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        engine.flush()
+        persisted = engine.pending == 0
+        engine.stop()
+
+    placed = clients * bids
+    return {
+        "placed": placed, "accepted": sum(accepted), "bids_per_second": round(placed / elapsed),
+        "mean_latency_us": round(elapsed / bids * 1e6, 1), "all_persisted": persisted
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--bids", type=int, default=2000)
+    parser.add_argument("--auctions", type=int, default=100)
+    parser.add_argument("--fsync", action="store_true")
+    arguments = parser.parse_args()
+    print(run(clients=arguments.clients, bids=arguments.bids, auctions=arguments.auctions, fsync=arguments.fsync))
@@ -0,0 +1,59 @@
+"""
+Time `json_response` against the `jsonify(...).get_data()` path it replaced, on a page of listings.
+
+Run from the `flask-server` directory: `python -m benchmarks.responses`.
+"""
+from flask import Flask, Response, jsonify
+from datetime import datetime, timedelta
+from decimal import Decimal
+import argparse, time
+
+from app.utils.responses import json_response
+
+
+def run(count: int = 1000, repeat: int = 200):
+    """
+    Build the same page of listings with both paths and time them.
+
+    Args:
+        count (int): Number of listings in the payload.
+        repeat (int): Number of responses built with each path.
+
+    Returns:
+        dict: Milliseconds per response with each path, and the body size.
+    """
+    now = datetime(2025, 1, 1, 12, 0, 0)
+    listings = [{
+        "listing_id": i, "user_id": i % 97, "category_id": i % 12, "title": f"Listing {i}", "title_short": f"Short title {i}",
+        "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4, "item_specifics": '{"Condition": "Used", "Brand": "Generic"}',
+        "listing_type": "auction" if i % 2 else "buy_now", "status": "active", "image_encoded": "", "image_id": f"{i:064x}",
+        "buy_now_price": Decimal("1200.00"), "starting_price": Decimal("100.00"), "reserve_price": None, "current_price": Decimal(f"{150 + i}.50"),
+        "auction_start": now, "auction_end": now + timedelta(days=7), "bids": i % 30, "purchases": i % 5,
+        "average_review": 4.5, "total_reviews": i % 40, "created_at": now, "updated_at": now + timedelta(seconds=i)
+    } for i in range(count)]
+    response_data = {"message": "Listings found", "listings": listings, "next_cursor": "eyJ2IjogMTAwMH0"}
+
+    app = Flask(__name__)
+    with app.app_context():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            body = Response(response=jsonify(response_data).get_data(), status=200, mimetype="application/json").get_data()
+        jsonify_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fast_body = json_response(response_data, status=200).get_data()
+    msgspec_ms = (time.perf_counter() - start) * 1000 / repeat
+
+    return {
+        "jsonify_ms": round(jsonify_ms, 3), "msgspec_ms": round(msgspec_ms, 3), "speedup": round(jsonify_ms / msgspec_ms, 1),
+        "jsonify_bytes": len(body), "msgspec_bytes": len(fast_body)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    arguments = parser.parse_args()
+    print(run(count=arguments.count, repeat=arguments.repeat))
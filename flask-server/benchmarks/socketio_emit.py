@@ -0,0 +1,124 @@
+"""
+End-to-end latency of Socket.IO emits relayed between worker processes by the message queue.
+
+Worker processes each run a Socket.IO server with the Redis client manager, as the app does with
+`SOCKETIO_MESSAGE_QUEUE`, and clients connected to every worker over WebSocket join a listing's
+room. Bid updates are emitted to the room through the queue at a fixed rate, from a process
+serving no clients (like a worker whose request placed the bid), and each client records the
+time from the emit until it received the event. The queue is the local stand-in
+`app.utils.pubsub_server` unless `--queue` gives a Redis URL.
+
+The clients need the `websocket-client` package. Run from the `flask-server` directory: `python -m benchmarks.socketio_emit`.
+"""
+from gevent.pywsgi import WSGIServer
+import argparse, multiprocessing, statistics, threading, time
+import socketio
+
+from app.utils.pubsub_server import PubSubServer
+from app.utils.socketio import listing_room
+
+CHANNEL = "benchmark-socketio"
+
+
+def serve_worker(queue_url: str, ports):
+    """Run one worker process: a Socket.IO server joined to the queue, its port sent to `ports`."""
+    server = socketio.Server(async_mode="gevent", client_manager=socketio.RedisManager(queue_url, channel=CHANNEL))
+
+    @server.on("watch")
+    def watch(sid, listing_id):
+        server.enter_room(sid, listing_room(listing_id))
+        return True
+
+    http = WSGIServer(("127.0.0.1", 0), socketio.WSGIApp(server), log=None)
+    http.start()
+    ports.put(http.server_port)
+    http.serve_forever()
+
+
+def run(workers: int = 4, clients: int = 2, emits: int = 1000, rate: float = 100, queue: str | None = None):
+    """
+    Emit `emits` bid updates to a room watched by `clients` clients on each of `workers` workers.
+
+    Args:
+        workers (int): Worker processes the clients are spread over.
+        clients (int): Clients connected to each worker.
+        emits (int): Events emitted.
+        rate (float): Events emitted per second, or 0 to emit as fast as possible.
+        queue (str, optional): Redis URL of the message queue; the local stand-in if omitted.
+
+    Returns:
+        dict: Events emitted per second, the share delivered and the p50, p99 and maximum
+            latencies in milliseconds, over every (event, client) delivery.
+    """
+    stand_in = None
+    if queue is None:
+        stand_in = PubSubServer()
+        stand_in.start()
+        queue = stand_in.url
+
+    context = multiprocessing.get_context("spawn")
+    ports = context.Queue()
+    processes = [context.Process(target=serve_worker, args=(queue, ports), daemon=True) for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    latencies, lock = [], threading.Lock()
+    connected = []  # Kept referenced until the workers are killed
+    try:
+        for _ in range(workers):
+            port = ports.get(timeout=30)
+            for _ in range(clients):
+                client = socketio.Client(reconnection=False)
+
+                @client.on("new_bid")
+                def new_bid(data):
+                    received_at = time.perf_counter()
+                    with lock:
+                        latencies.append(received_at - data.get("sent_at"))
+
+                client.connect(f"http://127.0.0.1:{port}", transports=["websocket"])
+                client.call("watch", 1)
+                connected.append(client)
+
+        emitter = socketio.RedisManager(queue, channel=CHANNEL, write_only=True)
+        emitter.set_server(socketio.Server(async_mode="threading", client_manager=emitter))
+        time.sleep(0.5)  # Every worker subscribed
+
+        start = time.perf_counter()
+        for n in range(emits):
+            if rate:
+                time.sleep(max(0.0, start + n / rate - time.perf_counter()))
+            emitter.emit("new_bid", {"listing_id": 1, "current_price": n, "sent_at": time.perf_counter()}, room=listing_room(1), namespace="/")
+        elapsed = time.perf_counter() - start
+
+        expected = emits * workers * clients
+        deadline = time.time() + 10
+        while len(latencies) < expected and time.time() < deadline:
+            time.sleep(0.05)
+    finally:
+        # Killing the workers ends the clients' connections
+        for process in processes:
+            process.kill()
+            process.join()
+        if stand_in is not None:
+            stand_in.stop()
+
+    milliseconds = sorted(latency * 1000 for latency in latencies)
+    quantiles = statistics.quantiles(milliseconds, n=100) if len(milliseconds) > 1 else milliseconds * 99
+    return {
+        "workers": workers, "clients": workers * clients, "emits_per_second": round(emits / elapsed),
+        "delivered": round(len(milliseconds) / expected, 4), "p50_ms": round(quantiles[49], 2),
+        "p99_ms": round(quantiles[98], 2), "max_ms": round(milliseconds[-1], 2) if milliseconds else None
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[4, 8])
+    parser.add_argument("--clients", type=int, default=2)
+    parser.add_argument("--emits", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=100)
+    parser.add_argument("--queue")
+    arguments = parser.parse_args()
+    for count in arguments.workers:
+        print(run(workers=count, clients=arguments.clients, emits=arguments.emits, rate=arguments.rate, queue=arguments.queue))
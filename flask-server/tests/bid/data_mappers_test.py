@@ -0,0 +1,130 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.data_mappers import BidMapper
+
+
+@pytest.fixture
+def mock_db_session():
+    session = MagicMock()
+    session.cursor.return_value = session
+    return session
+
+
+def test_place_bid_accepted(mock_db_session):
+    mock_db_session.rowcount = 1
+    mock_db_session.lastrowid = 42
+    mock_db_session.fetchall.return_value = []
+    mock_db_session.fetchone.return_value = {"bids": 4, "auction_end": None}
+
+    result = BidMapper.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 120.0}, db_session=mock_db_session)
+
+    assert result == {"bid_id": 42, "current_price": 120.0, "leader": 1, "bids": 4, "auction_end": None, "proxy_bid_id": None}
+    update, insert, max_bids, _ = mock_db_session.execute.call_args_list
+    assert "COALESCE(current_price, 0) < %s" in update.args[0]
+    assert update.args[1][0] == update.args[1][-1] == 120.0
+    assert "auction_end = CASE WHEN auction_end <= %s THEN GREATEST(auction_end, %s)" in update.args[0]
+    assert insert.args[1][:3] == (5, 1, 120.0)
+    assert max_bids.args[1] == (5, 120.0)
+    mock_db_session.commit.assert_called_once()
+
+
+def test_place_bid_answered_by_max_bid(mock_db_session):
+    mock_db_session.rowcount = 1
+    mock_db_session.lastrowid = 43
+    mock_db_session.fetchall.return_value = [{"user_id": 2, "amount": 150.0}]
+
+    result = BidMapper.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 120.0}, db_session=mock_db_session)
+
+    assert result["current_price"] == 122.5 and result["leader"] == 2
+    *_, proxy_update, proxy_insert, _ = mock_db_session.execute.call_args_list
+    assert proxy_update.args[1][0] == 122.5
+    assert proxy_insert.args[1][:3] == (5, 2, 122.5)
+    mock_db_session.commit.assert_called_once()
+
+
+def test_place_bid_rejected_without_insert(mock_db_session):
+    mock_db_session.rowcount = 0
+
+    bid_id = BidMapper.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 90.0}, db_session=mock_db_session)
+
+    assert bid_id is None
+    assert mock_db_session.execute.call_count == 1
+    mock_db_session.commit.assert_not_called()
+
+
+def test_place_bid_rolls_back_on_failure(mock_db_session):
+    mock_db_session.rowcount = 1
+    mock_db_session.execute.side_effect = [None, Exception("Duplicate entry")]
+
+    with pytest.raises(Exception):
+        BidMapper.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 120.0}, db_session=mock_db_session)
+
+    mock_db_session.rollback.assert_called_once()
+    mock_db_session.commit.assert_not_called()
+
+
+def test_place_bid_invalid_data(mock_db_session):
+    with pytest.raises(TypeError):
+        BidMapper.place_bid(data={"listing_id": 5, "user_id": 1, "amount": "120"}, db_session=mock_db_session)
+
+
+def test_place_max_bid_outbids_leader(mock_db_session):
+    mock_db_session.fetchone.side_effect = [
+        {"status": "active", "auction_end": datetime.now() + timedelta(hours=1), "current_price": 100.0},
+        {"user_id": 1},
+        {"bids": 5, "auction_end": None}
+    ]
+    mock_db_session.fetchall.return_value = [{"user_id": 2, "amount": 300.0}]
+    mock_db_session.lastrowid = 44
+
+    result = BidMapper.place_max_bid(data={"listing_id": 5, "user_id": 2, "amount": 300.0}, db_session=mock_db_session)
+
+    assert result == {"current_price": 102.5, "leader": 2, "bids": 5, "auction_end": None, "proxy_bid_id": 44}
+    upsert = mock_db_session.execute.call_args_list[1]
+    assert "ON DUPLICATE KEY UPDATE" in upsert.args[0]
+    mock_db_session.commit.assert_called_once()
+
+
+def test_late_proxy_bid_extends_the_auction(mock_db_session):
+    auction_end = datetime.now() + timedelta(seconds=10)
+    mock_db_session.fetchone.side_effect = [
+        {"status": "active", "auction_end": auction_end, "current_price": 100.0},
+        {"user_id": 1},
+        {"bids": 5, "auction_end": auction_end + timedelta(seconds=50)}
+    ]
+    mock_db_session.fetchall.return_value = [{"user_id": 2, "amount": 300.0}]
+
+    result = BidMapper.place_max_bid(data={"listing_id": 5, "user_id": 2, "amount": 300.0}, db_session=mock_db_session)
+
+    proxy_update = next(call for call in mock_db_session.execute.call_args_list if call.args[0].lstrip().startswith("UPDATE listings"))
+    statement, values = proxy_update.args
+    assert "auction_end = CASE WHEN auction_end <= %s THEN GREATEST(auction_end, %s) ELSE auction_end END" in statement
+    latest_extended, extended_to = values[2:4]
+    assert auction_end <= latest_extended and extended_to > auction_end  # Within the window, so extended
+    assert values[-1] == 5
+    assert result["auction_end"] == auction_end + timedelta(seconds=50)
+
+
+def test_place_max_bid_rejects_amount_below_price(mock_db_session):
+    mock_db_session.fetchone.return_value = {"status": "active", "auction_end": datetime.now() + timedelta(hours=1), "current_price": 100.0}
+
+    assert BidMapper.place_max_bid(data={"listing_id": 5, "user_id": 2, "amount": 100.0}, db_session=mock_db_session) is None
+    assert mock_db_session.execute.call_count == 1
+    mock_db_session.commit.assert_not_called()
+
+
+def test_get_winning_bids_keeps_earliest_highest_bid_per_listing(mock_db_session):
+    mock_db_session.fetchall.return_value = [
+        {"listing_id": 4, "bid_id": 20, "user_id": 3, "amount": 150.0},
+        {"listing_id": 4, "bid_id": 23, "user_id": 8, "amount": 150.0},
+        {"listing_id": 9, "bid_id": 21, "user_id": 5, "amount": 30.0}
+    ]
+
+    winners = BidMapper.get_winning_bids(listing_ids=[4, 9, 12], db_session=mock_db_session)
+
+    statement, values = mock_db_session.execute.call_args.args
+    assert winners == {4: {"bid_id": 20, "user_id": 3, "amount": 150.0}, 9: {"bid_id": 21, "user_id": 5, "amount": 30.0}}
+    assert "GROUP BY listing_id" in statement and values == [4, 9, 12]
+    assert mock_db_session.execute.call_count == 1
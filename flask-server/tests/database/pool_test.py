@@ -0,0 +1,115 @@
+import pytest, time
+from unittest.mock import MagicMock
+
+from app.database import ConnectionPool, PoolTimeoutError
+
+
+@pytest.fixture
+def connection_factory():
+    def factory():
+        conn = MagicMock()
+        conn.open = True
+        conn.server_status = 0
+        return conn
+    return MagicMock(side_effect=factory)
+
+
+def test_acquire_reuses_released_connection(connection_factory):
+    pool = ConnectionPool(factory=connection_factory, min_size=0, max_size=2)
+
+    first = pool.acquire()
+    raw = first.raw
+    first.close()
+    second = pool.acquire()
+
+    assert second.raw is raw
+    assert connection_factory.call_count == 1
+
+
+def test_connection_released_when_proxy_goes_out_of_scope(connection_factory):
+    pool = ConnectionPool(factory=connection_factory, min_size=0, max_size=1)
+
+    def mapper_call():
+        db = pool.acquire()
+        db.cursor()
+
+    mapper_call()
+    mapper_call()
+
+    assert pool.idle == 1
+    assert connection_factory.call_count == 1
+
+
+def test_acquire_times_out_when_exhausted(connection_factory):
+    pool = ConnectionPool(factory=connection_factory, min_size=0, max_size=1)
+    held = pool.acquire()
+
+    with pytest.raises(expected_exception=PoolTimeoutError):
+        pool.acquire(timeout=0.01)
+
+    held.close()
+
+
+def test_release_rolls_back_open_transaction(connection_factory):
+    pool = ConnectionPool(factory=connection_factory, min_size=0, max_size=1)
+    conn = pool.acquire()
+    conn.raw.server_status = 1  # SERVER_STATUS_IN_TRANS
+
+    raw = conn.raw
+    conn.close()
+
+    raw.rollback.assert_called_once()
+
+
+def test_failed_ping_replaces_connection(connection_factory):
+    pool = ConnectionPool(factory=connection_factory, min_size=0, max_size=1, ping_interval=0)
+    conn = pool.acquire()
+    broken = conn.raw
+    broken.ping.side_effect = Exception("MySQL server has gone away")
+    conn.close()
+
+    replacement = pool.acquire()
+
+    assert replacement.raw is not broken
+    assert pool.size == 1
+    broken.close.assert_called_once()
+
+
+def test_max_lifetime_recycles_connection(connection_factory):
+    pool = ConnectionPool(factory=connection_factory, min_size=0, max_size=1, max_lifetime=0.001)
+    conn = pool.acquire()
+    old = conn.raw
+    time.sleep(0.01)
+    conn.close()
+
+    assert pool.size == 0
+    old.close.assert_called_once()
+
+
+def test_idle_timeout_keeps_min_size(connection_factory):
+    pool = ConnectionPool(factory=connection_factory, min_size=1, max_size=3, idle_timeout=0.001, ping_interval=60)
+    held = [pool.acquire() for _ in range(3)]
+    for conn in held:
+        conn.close()
+    held.clear()
+    time.sleep(0.01)
+
+    conn = pool.acquire()
+    conn.close()
+
+    assert pool.size == 1
+    assert pool.idle == 1
+
+
+def test_warm_opens_min_size(connection_factory):
+    pool = ConnectionPool(factory=connection_factory, min_size=2, max_size=4)
+
+    pool.warm()
+
+    assert pool.idle == 2
+    assert pool.size == 2
+
+
+def test_invalid_bounds():
+    with pytest.raises(expected_exception=ValueError):
+        ConnectionPool(factory=MagicMock(), min_size=5, max_size=2)
@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.database import ConnectionPool, ReplicaRouter
+
+
+def make_replica(status):
+    def factory():
+        conn = MagicMock()
+        conn.open = True
+        conn.server_status = 0
+        conn.cursor.return_value.fetchone.return_value = status
+        return conn
+    return ConnectionPool(factory=factory, min_size=0, max_size=2)
+
+
+@pytest.fixture
+def primary():
+    return MagicMock(return_value=MagicMock(name="primary"))
+
+
+def test_reads_go_to_replicas_round_robin(primary):
+    replicas = [make_replica({"Seconds_Behind_Source": 0}), make_replica({"Seconds_Behind_Source": 1})]
+    router = ReplicaRouter(primary=primary, replicas=replicas, max_lag=5)
+
+    first = router.checkout_read()
+    second = router.checkout_read()
+
+    assert first.raw is not second.raw
+    primary.assert_not_called()
+
+
+def test_lagging_replica_falls_back_to_primary(primary):
+    router = ReplicaRouter(primary=primary, replicas=[make_replica({"Seconds_Behind_Source": 30})], max_lag=5)
+
+    conn = router.checkout_read()
+
+    assert conn is primary.return_value
+    assert router.replica_lag() == {0: 30}
+
+
+def test_broken_replication_falls_back_to_primary(primary):
+    router = ReplicaRouter(primary=primary, replicas=[make_replica({"Seconds_Behind_Source": None})])
+
+    assert router.checkout_read() is primary.return_value
+
+
+def test_standalone_stand_in_counts_as_replica(primary):
+    router = ReplicaRouter(primary=primary, replicas=[make_replica(None)])
+
+    conn = router.checkout_read()
+
+    assert conn is not primary.return_value
+    primary.assert_not_called()
+
+
+def test_lag_is_sampled_once_per_interval(primary):
+    replica = make_replica({"Seconds_Behind_Source": 0})
+    router = ReplicaRouter(primary=primary, replicas=[replica], lag_check_interval=60)
+
+    router.checkout_read().close()
+    conn = router.checkout_read()
+
+    conn.raw.cursor.return_value.execute.assert_called_once_with("SHOW REPLICA STATUS")
+
+
+def test_no_replicas_uses_primary(primary):
+    router = ReplicaRouter(primary=primary)
+
+    assert router.checkout_read() is primary.return_value
@@ -0,0 +1,121 @@
+import pytest
+from unittest.mock import MagicMock
+from flask import Flask, Response
+
+from app.database import UnitOfWork, current_unit_of_work, init_unit_of_work
+
+
+@pytest.fixture
+def mock_connection():
+    return MagicMock()
+
+
+@pytest.fixture
+def connection_factory(mock_connection):
+    return MagicMock(return_value=mock_connection)
+
+
+def test_mappers_share_connection_and_commit_once(connection_factory, mock_connection):
+    with UnitOfWork(connection_factory=connection_factory) as uow:
+        first = current_unit_of_work().connection
+        first.commit()
+        second = current_unit_of_work().connection
+        second.commit()
+
+        assert first is second
+        mock_connection.commit.assert_not_called()
+
+    connection_factory.assert_called_once()
+    mock_connection.commit.assert_called_once()
+    mock_connection.close.assert_called_once()
+    assert current_unit_of_work() is None
+    assert not uow.active
+
+
+def test_exception_rolls_back(connection_factory, mock_connection):
+    with pytest.raises(expected_exception=ValueError):
+        with UnitOfWork(connection_factory=connection_factory) as uow:
+            uow.connection.commit()
+            raise ValueError("Failed creating order item")
+
+    mock_connection.commit.assert_not_called()
+    mock_connection.rollback.assert_called_once()
+    mock_connection.close.assert_called_once()
+
+
+def test_nested_block_joins_outer(connection_factory, mock_connection):
+    with UnitOfWork(connection_factory=connection_factory) as outer:
+        with current_unit_of_work() as inner:
+            inner.connection.commit()
+
+        assert inner is outer
+        mock_connection.commit.assert_not_called()
+
+    mock_connection.commit.assert_called_once()
+
+
+def test_unused_unit_of_work_does_not_check_out(connection_factory):
+    with UnitOfWork(connection_factory=connection_factory):
+        pass
+
+    connection_factory.assert_not_called()
+
+
+def test_request_commits_on_success_and_rolls_back_on_error(connection_factory, mock_connection):
+    app = Flask(__name__)
+    init_unit_of_work(app, connection_factory=connection_factory)
+
+    @app.route("/ok")
+    def ok():
+        current_unit_of_work().connection.commit()
+        return Response(status=201)
+
+    @app.route("/conflict")
+    def conflict():
+        current_unit_of_work().connection.commit()
+        return Response(status=409)
+
+    client = app.test_client()
+
+    assert client.get("/ok").status_code == 201
+    mock_connection.commit.assert_called_once()
+
+    assert client.get("/conflict").status_code == 409
+    mock_connection.commit.assert_called_once()
+    mock_connection.rollback.assert_called_once()
+
+
+def test_on_commit_callbacks_run_only_after_commit(connection_factory, mock_connection):
+    committed, rolled_back = MagicMock(), MagicMock()
+
+    with UnitOfWork(connection_factory=connection_factory) as uow:
+        uow.connection.commit()
+        uow.on_commit(committed)
+        committed.assert_not_called()
+    committed.assert_called_once()
+
+    with pytest.raises(expected_exception=ValueError):
+        with UnitOfWork(connection_factory=connection_factory) as uow:
+            uow.connection.commit()
+            uow.on_commit(rolled_back)
+            raise ValueError("Failed updating listing")
+    rolled_back.assert_not_called()
+
+
+def test_explicit_unit_of_work_commits_independently_of_the_request():
+    request_connection, own_connection = MagicMock(), MagicMock()
+    app = Flask(__name__)
+    init_unit_of_work(app, connection_factory=MagicMock(return_value=request_connection))
+
+    @app.route("/checkout")
+    def checkout():
+        with UnitOfWork(connection_factory=MagicMock(return_value=own_connection)):
+            current_unit_of_work().connection.commit()
+        own_connection.commit.assert_called_once()  # Committed, and its locks released, before the view returns
+        current_unit_of_work().connection.commit()
+        return Response(status=400)
+
+    assert app.test_client().get("/checkout").status_code == 400
+    own_connection.rollback.assert_not_called()
+    request_connection.commit.assert_not_called()
+    request_connection.rollback.assert_called_once()
@@ -131,3 +131,19 @@ def test_delete_delivery(mock_db_session):
     rows_deleted = DeliveryMapper.delete_delivery(delivery_id=1, db_session=mock_db_session)
 
     assert rows_deleted == 1
+
+
+def test_create_deliveries_inserts_in_one_statement(mock_db_session):
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.rowcount = 2
+    deliveries = [
+        {"order_item_id": order_item_id, "user_id": 1, "address": "789 Oak St", "city": "Villageville", "state": "FL",
+         "country": "USA", "delivery_status": "processing", "tracking_number": "0000000000", "courier": "UPS",
+         "estimated_delivery_date": datetime(2023, 5, 12)}
+        for order_item_id in (103, 104)
+    ]
+
+    assert DeliveryMapper.create_deliveries(deliveries=deliveries, db_session=mock_db_session) == 2
+    assert mock_cursor.executemany.call_count == 1
+    assert [row[0] for row in mock_cursor.executemany.call_args.args[1]] == [103, 104]
+    assert DeliveryMapper.create_deliveries(deliveries=[], db_session=mock_db_session) == 0
@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.data_mappers import ListMapper
+
+
+@pytest.fixture
+def mock_db_session():
+    session = MagicMock()
+    session.cursor.return_value = session
+    return session
+
+
+def test_get_list_items_with_listings_uses_one_query(mock_db_session):
+    mock_db_session.fetchall.return_value = [
+        {"listing_id": listing_id, "user_id": 10, "category_id": 2, "title": "Laptop", "title_short": "Laptop",
+         "description": "Gaming laptop", "item_specifics": "16GB RAM", "listing_type": "buy_now", "status": "active",
+         "image_encoded": "", "buy_now_price": 1200}
+        for listing_id in range(1, 201)
+    ]
+
+    listings = ListMapper.get_list_items_with_listings(list_id=5, db_session=mock_db_session)
+
+    assert [listing["listing_id"] for listing in listings] == list(range(1, 201))
+    assert mock_db_session.execute.call_count == 1
+    statement, values = mock_db_session.execute.call_args.args
+    assert "JOIN listings" in statement and values == (5,)
+
+
+def test_get_list_items_with_listings_hides_drafts_of_other_users(mock_db_session):
+    mock_db_session.fetchall.return_value = []
+
+    ListMapper.get_list_items_with_listings(list_id=5, db_session=mock_db_session)
+
+    statement, _ = mock_db_session.execute.call_args.args
+    assert "JOIN lists ON lists.list_id = list_items.list_id" in statement
+    assert "(listings.status != 'draft' OR listings.user_id = lists.user_id)" in statement
+
+
+def test_get_list_items_with_listings_empty_list(mock_db_session):
+    mock_db_session.fetchall.return_value = []
+
+    assert ListMapper.get_list_items_with_listings(list_id=5, db_session=mock_db_session) == []
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 from datetime import datetime
 
 from app.data_mappers import ListingMapper
+from app.utils.pagination import encode_cursor
 
 
 @pytest.fixture
@@ -150,6 +151,22 @@ def test_get_listing_by_id_db_failure(mock_db_session):
         ListingMapper.get_listing_by_id(listing_id=1, db_session=mock_db_session)
 
 
+def test_drafts_are_hidden_except_from_their_owner(mock_db_session):
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.fetchone.return_value = None
+    mock_cursor.fetchall.return_value = []
+
+    assert ListingMapper.get_listing_by_id(listing_id=1, db_session=mock_db_session) is None
+    assert "status != 'draft'" in mock_cursor.execute.call_args.args[0]
+    ListingMapper.get_all_listings(args={"category_id": 2}, db_session=mock_db_session)
+    assert "WHERE status != 'draft' AND category_id = %s" in mock_cursor.execute.call_args.args[0]
+
+    ListingMapper.get_listing_by_id(listing_id=1, include_drafts=True, db_session=mock_db_session)
+    assert "draft" not in mock_cursor.execute.call_args.args[0]
+    ListingMapper.get_all_listings(args={"user_id": 10}, include_drafts=True, db_session=mock_db_session)
+    assert "draft" not in mock_cursor.execute.call_args.args[0]
+
+
 def test_get_all_listings_no_results(mock_db_session):
     mock_cursor = mock_db_session.cursor.return_value
     mock_cursor.fetchall.return_value = []
@@ -198,3 +215,259 @@ def test_delete_listing_db_failure(mock_db_session):
     with pytest.raises(expected_exception=Exception, match="Database error"):
         ListingMapper.delete_listing(listing_id=1, db_session=mock_db_session)
 
+
+
+def test_get_all_listings_keyset_pagination(mock_db_session):
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.fetchall.return_value = []
+    cursor = encode_cursor(sort="purchases", value=10, row_id=42)
+
+    ListingMapper.get_all_listings(args={"sort": "purchases", "order": "desc", "cursor": cursor, "range": "12"}, db_session=mock_db_session)
+
+    statement, values = mock_cursor.execute.call_args[0]
+    assert "(purchases < %s OR (purchases = %s AND listing_id < %s) OR purchases IS NULL)" in statement
+    assert statement.endswith("ORDER BY purchases DESC, listing_id DESC LIMIT %s")
+    assert "OFFSET" not in statement
+    assert values == [10, 10, 42, 12]
+
+
+def test_get_all_listings_rejects_cursor_for_other_sort(mock_db_session):
+    cursor = encode_cursor(sort="purchases", value=10, row_id=42)
+
+    with pytest.raises(expected_exception=ValueError):
+        ListingMapper.get_all_listings(args={"sort": "created_at", "cursor": cursor, "range": "12"}, db_session=mock_db_session)
+
+
+def test_get_all_listings_ignores_unknown_sort(mock_db_session):
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.fetchall.return_value = []
+
+    ListingMapper.get_all_listings(args={"sort": "1; DROP TABLE listings", "order": "asc"}, db_session=mock_db_session)
+
+    statement, _ = mock_cursor.execute.call_args[0]
+    assert statement.endswith("ORDER BY listing_id ASC")
+
+
+def test_get_all_listings_selects_only_requested_fields(mock_db_session):
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.fetchall.return_value = [{"listing_id": 1, "purchases": 10, "title_short": "Laptop", "buy_now_price": 1200}]
+
+    listings = ListingMapper.get_all_listings(args={"fields": "title_short, buy_now_price", "sort": "purchases"}, db_session=mock_db_session)
+
+    statement, _ = mock_cursor.execute.call_args[0]
+    assert statement.startswith("SELECT listing_id, purchases, title_short, buy_now_price FROM listings")
+    assert listings == [{"listing_id": 1, "purchases": 10, "title_short": "Laptop", "buy_now_price": 1200}]
+
+
+def test_get_all_listings_rejects_unknown_fields(mock_db_session):
+    with pytest.raises(expected_exception=ValueError, match="Unknown fields: password"):
+        ListingMapper.get_all_listings(args={"fields": "title,password"}, db_session=mock_db_session)
+
+    mock_db_session.cursor.return_value.execute.assert_not_called()
+
+
+def test_store_image_moves_image_to_blob_store(monkeypatch):
+    blob_store = MagicMock()
+    blob_store.put_base64.return_value = "a" * 64
+    monkeypatch.setattr("app.data_mappers.listing_mapper.blob_store", blob_store)
+
+    data = ListingMapper.store_image({"title": "Laptop", "image_encoded": "aW1hZ2U="})
+
+    blob_store.put_base64.assert_called_once_with(encoded="aW1hZ2U=")
+    assert data == {"title": "Laptop", "image_encoded": "", "image_id": "a" * 64}
+
+
+def test_store_image_keeps_undecodable_image_inline():
+    data = {"title": "Laptop", "image_encoded": "image_data"}
+
+    assert ListingMapper.store_image(data) is data
+
+
+def test_get_all_listings_sorted_search_filters_matches_in_the_index(mock_db_session, monkeypatch):
+    search_index = MagicMock(ready=True)
+    search_index.match.return_value = [2, 1]
+    monkeypatch.setattr("app.data_mappers.listing_mapper.search_index", search_index)
+    mock_db_session.cursor.return_value.fetchall.return_value = []
+    args = {"query": "laptop", "sort": "current_price", "category_id": "2"}
+
+    ListingMapper.get_all_listings(args=args, db_session=mock_db_session)
+
+    search_index.match.assert_called_once_with(query="laptop", filters=args, limit=10000)
+
+
+def test_reindex_remote_changes(mock_db_session, monkeypatch):
+    search_index = MagicMock(active=True)
+    monkeypatch.setattr("app.data_mappers.listing_mapper.LISTING_INDEXES", ((search_index, search_index.add, search_index.remove, ("listing_id", "title")),))
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.fetchall.return_value = [{"listing_id": 4, "title": "Laptop"}]
+
+    ListingMapper.reindex_remote_changes(tags=["listings", "listing:4", "category:2", "listing:5"], db_session=mock_db_session)
+
+    statement, values = mock_cursor.execute.call_args.args
+    assert statement == "SELECT listing_id, title FROM listings WHERE listing_id IN (%s, %s)" and values == [4, 5]
+    search_index.add.assert_called_once_with({"listing_id": 4, "title": "Laptop"})
+    search_index.remove.assert_called_once_with(5)  # Deleted
+
+
+def test_get_all_listings_ranks_search_by_relevance(mock_db_session, monkeypatch):
+    search_index = MagicMock(ready=True)
+    search_index.search.return_value = [(2, 3.5), (1, 1.25)]
+    monkeypatch.setattr("app.data_mappers.listing_mapper.search_index", search_index)
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.fetchall.return_value = [
+        {"listing_id": listing_id, "user_id": 10, "category_id": 2, "title": "Laptop", "title_short": "Laptop",
+         "description": "Gaming laptop", "item_specifics": "16GB RAM", "listing_type": "buy_now", "status": "active",
+         "image_encoded": "", "buy_now_price": 1200}
+        for listing_id in (1, 2)
+    ]
+
+    listings = ListingMapper.get_all_listings(args={"query": "laptop", "range": "2"}, db_session=mock_db_session)
+
+    search_index.search.assert_called_once_with(query="laptop", filters={"query": "laptop", "range": "2"}, limit=2, offset=0, after=None)
+    assert [(listing["listing_id"], listing["relevance"]) for listing in listings] == [(2, 3.5), (1, 1.25)]
+    assert ListingMapper.get_sort(args={"query": "laptop"}) == ("relevance", "DESC")
+
+
+def test_get_suggestions_falls_back_to_prefix_like(mock_db_session, monkeypatch):
+    monkeypatch.setattr("app.data_mappers.listing_mapper.suggest_index", MagicMock(ready=False))
+    mock_db_session.fetchall.side_effect = [[{"category_id": 2, "name": "Laptops"}], [{"listing_id": 1, "title": "Laptop_Stand"}]]
+
+    suggestions = ListingMapper.get_suggestions(prefix="lap_", limit=5, db_session=mock_db_session)
+
+    assert suggestions == [{"type": "category", "id": 2, "text": "Laptops"}, {"type": "listing", "id": 1, "text": "Laptop_Stand"}]
+    assert mock_db_session.execute.call_args.args[1] == ("lap\\_%", 5)
+
+
+def test_get_facets_aggregates_in_one_query(mock_db_session, monkeypatch):
+    monkeypatch.setattr("app.data_mappers.listing_mapper.search_index", MagicMock(ready=False))
+    mock_db_session.fetchall.return_value = [
+        {"category_id": 2, "listing_type": "auction", "bucket": 5, "in_price": 0, "count": 4},
+        {"category_id": 2, "listing_type": "buy_now", "bucket": 4, "in_price": 1, "count": 3}
+    ]
+
+    facets = ListingMapper.get_facets(args={"query": "laptop", "max_price": "1000"}, db_session=mock_db_session)
+
+    assert mock_db_session.execute.call_count == 1
+    assert "GROUP BY" in mock_db_session.execute.call_args.args[0]
+    assert facets["category_id"] == {"2": 3}
+    assert facets["listing_type"] == {"buy_now": 3}
+    assert [bucket["count"] for bucket in facets["price"]] == [0, 0, 0, 0, 3, 4]
+
+
+def test_get_listings_by_ids_chunks_and_preserves_order(mock_db_session, monkeypatch):
+    monkeypatch.setattr("app.data_mappers.listing_mapper.MAX_IDS_PER_QUERY", 2)
+    rows = {
+        listing_id: {"listing_id": listing_id, "user_id": 10, "category_id": 2, "title": "Laptop", "title_short": "Laptop",
+                     "description": "Gaming laptop", "item_specifics": "16GB RAM", "listing_type": "buy_now", "status": "active",
+                     "image_encoded": "", "buy_now_price": 1200}
+        for listing_id in (1, 2, 3)
+    }
+    mock_db_session.fetchall.side_effect = lambda: [rows[i] for i in mock_db_session.execute.call_args.args[1] if i in rows]
+
+    listings = ListingMapper.get_listings_by_ids(listing_ids=[3, 9, 1, 3, 2], db_session=mock_db_session)
+
+    assert [listing["listing_id"] for listing in listings] == [3, 1, 2]
+    assert [call.args[1] for call in mock_db_session.execute.call_args_list] == [[3, 9], [1, 2]]
+    assert ListingMapper.get_listings_by_ids(listing_ids=[], db_session=mock_db_session) == []
+    assert mock_db_session.execute.call_count == 2
+
+
+def test_lock_listings_selects_for_update_in_id_order(mock_db_session):
+    mock_db_session.fetchall.return_value = [
+        {"listing_id": 3, "user_id": 10, "category_id": 2, "title": "Laptop", "title_short": "Laptop",
+         "description": "Gaming laptop", "item_specifics": "16GB RAM", "listing_type": "buy_now", "status": "active",
+         "image_encoded": "", "buy_now_price": 1200}
+    ]
+
+    listings = ListingMapper.lock_listings(listing_ids=[3, 7], db_session=mock_db_session)
+
+    statement, values = mock_db_session.execute.call_args.args
+    assert statement.endswith("ORDER BY listing_id FOR UPDATE") and values == [3, 7]
+    assert list(listings) == [3] and listings[3]["buy_now_price"] == 1200
+
+
+def test_add_purchases_updates_every_counter_in_one_statement(mock_db_session, monkeypatch):
+    monkeypatch.setattr("app.data_mappers.listing_mapper.LISTING_INDEXES", ())
+    mock_db_session.rowcount = 2
+
+    updated_rows = ListingMapper.add_purchases(quantities={4: 2, 9: 1}, db_session=mock_db_session)
+
+    statement, values = mock_db_session.execute.call_args.args
+    assert updated_rows == 2
+    assert mock_db_session.execute.call_count == 1
+    assert "purchases = purchases + CASE listing_id WHEN %s THEN %s WHEN %s THEN %s END" in statement
+    assert values[:4] == [4, 2, 9, 1] and values[-2:] == [4, 9]
+
+
+def test_lock_ended_auctions_only_locks_active_auctions_past_their_end(mock_db_session):
+    mock_db_session.fetchall.return_value = [{"listing_id": 4, "user_id": 10, "reserve_price": 100}]
+
+    auctions = ListingMapper.lock_ended_auctions(listing_ids=[4, 9], db_session=mock_db_session)
+
+    statement, values = mock_db_session.execute.call_args.args
+    assert auctions == {4: {"user_id": 10, "reserve_price": 100}}
+    assert "status = 'active' AND auction_end <= %s ORDER BY listing_id FOR UPDATE" in statement and values[:2] == [4, 9]
+    assert ListingMapper.lock_ended_auctions(listing_ids=[], db_session=mock_db_session) == {}
+
+
+def test_update_statuses_updates_every_listing_in_one_statement(mock_db_session, monkeypatch):
+    monkeypatch.setattr("app.data_mappers.listing_mapper.LISTING_INDEXES", ())
+    mock_db_session.rowcount = 2
+
+    updated_rows = ListingMapper.update_statuses(statuses={4: "sold", 9: "ended"}, db_session=mock_db_session)
+
+    statement, values = mock_db_session.execute.call_args.args
+    assert updated_rows == 2 and mock_db_session.execute.call_count == 1
+    assert "SET status = CASE listing_id WHEN %s THEN %s WHEN %s THEN %s END" in statement
+    assert values[:4] == [4, "sold", 9, "ended"] and values[-2:] == [4, 9]
+
+
+def test_lock_due_drafts_only_locks_drafts_past_their_start(mock_db_session):
+    mock_db_session.fetchall.return_value = [{"listing_id": 9}]
+
+    drafts = ListingMapper.lock_due_drafts(listing_ids=[4, 9], db_session=mock_db_session)
+
+    statement, values = mock_db_session.execute.call_args.args
+    assert drafts == [9]
+    assert "status = 'draft' AND auction_start <= %s ORDER BY listing_id FOR UPDATE" in statement and values[:2] == [4, 9]
+    assert ListingMapper.lock_due_drafts(listing_ids=[], db_session=mock_db_session) == []
+
+
+def test_get_extended_auctions_reads_ends_still_ahead(mock_db_session):
+    end = datetime(2030, 1, 1, 12)
+    mock_db_session.fetchall.return_value = [{"listing_id": 9, "auction_end": end}]
+
+    auctions = ListingMapper.get_extended_auctions(listing_ids=[9], db_session=mock_db_session)
+
+    statement, values = mock_db_session.execute.call_args.args
+    assert auctions == {9: end}
+    assert statement.endswith("status = 'active' AND auction_end > %s") and values[0] == 9
+
+
+def test_listing_versions_are_read_from_the_primary(monkeypatch):
+    get_db = MagicMock()
+    monkeypatch.setattr("app.data_mappers.listing_mapper.get_db", get_db)
+
+    ListingMapper.get_listings_version(args={})
+    ListingMapper.get_listing_version(listing_id=1)
+
+    assert get_db.call_count == 2
+    assert all(not call.kwargs.get("read_only") for call in get_db.call_args_list)
+
+
+def test_get_listings_version_applies_only_the_filters(mock_db_session):
+    mock_db_session.fetchone.return_value = {"updated_at": datetime(2024, 1, 1), "count": 3}
+
+    version = ListingMapper.get_listings_version(args={"category_id": 2, "query": "laptop", "range": 10}, db_session=mock_db_session)
+
+    statement, values = mock_db_session.execute.call_args.args
+    assert version == {"updated_at": datetime(2024, 1, 1), "count": 3}
+    assert statement == "SELECT MAX(updated_at) AS updated_at, COUNT(*) AS count FROM listings WHERE status != 'draft' AND category_id = %s" and values == [2]
+
+
+def test_get_listing_version(mock_db_session):
+    mock_db_session.fetchone.return_value = {"updated_at": datetime(2024, 1, 1)}
+    assert ListingMapper.get_listing_version(listing_id=1, db_session=mock_db_session) == datetime(2024, 1, 1)
+
+    mock_db_session.fetchone.return_value = None
+    assert ListingMapper.get_listing_version(listing_id=2, db_session=mock_db_session) is None
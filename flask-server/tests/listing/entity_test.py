@@ -202,3 +202,30 @@ def test_listing_invalid_types():
             status="invalid_type",
             image_encoded="image_data"
         )
+
+
+def test_listing_from_row():
+    row = {
+        "listing_id": 1, "user_id": 1, "category_id": 2, "title": "Smartphone", "title_short": "Smartphone",
+        "description": "Latest model smartphone", "item_specifics": None, "listing_type": "auction", "status": "sold",
+        "starting_price": 100.00, "current_price": 150.00, "bids": 3, "created_at": datetime(2025, 1, 1), "extra_column": "ignored"
+    }
+
+    listing = Listing.from_row(row)
+
+    assert isinstance(listing, Listing)
+    assert not hasattr(listing, "__dict__")
+    assert listing.listing_id == 1
+    assert listing.item_specifics is None
+    assert listing.current_price == 150.00
+    assert listing.auction_end is None
+    assert listing.to_dict()["created_at"] == datetime(2025, 1, 1)
+    assert "extra_column" not in listing.to_dict()
+
+
+def test_listing_from_row_skips_validation():
+    # Rows were validated when written; the read path trusts them
+    listing = Listing.from_row({"user_id": "1", "listing_type": "invalid_type"})
+
+    assert listing.user_id == "1"
+    assert listing.listing_type == "invalid_type"
@@ -40,6 +40,15 @@ def test_get_all_orders(mock_db_session):
     assert isinstance(orders[1]["created_at"], datetime)
 
 
+def test_get_all_orders_selects_only_requested_fields(mock_db_session):
+    mock_db_session.fetchall.return_value = [{"order_id": 1, "status": "delivered"}]
+
+    orders = OrderMapper.get_all_orders(user_id=1, fields="status", db_session=mock_db_session)
+
+    mock_db_session.execute.assert_called_once_with("SELECT order_id, status FROM orders WHERE user_id = %s", (1,))
+    assert orders == [{"order_id": 1, "status": "delivered"}]
+
+
 def test_get_order_by_id(mock_db_session):
     mock_cursor = mock_db_session.cursor.return_value
     mock_cursor.fetchone.return_value = {
@@ -92,3 +101,33 @@ def test_delete_order(mock_db_session):
     rows_deleted = OrderMapper.delete_order(order_id=1, db_session=mock_db_session)
 
     assert rows_deleted == 1
+
+
+def test_create_order_items_returns_ids_in_item_order(mock_db_session):
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.fetchall.return_value = [{"order_item_id": 8, "order_id": 1, "listing_id": 5}, {"order_item_id": 7, "order_id": 1, "listing_id": 9}]
+    items = [
+        {"order_id": 1, "listing_id": 9, "quantity": 2, "price": 10.0, "total_price": 20.0},
+        {"order_id": 1, "listing_id": 5, "quantity": 1, "price": 4.5, "total_price": 4.5}
+    ]
+
+    order_item_ids = OrderMapper.create_order_items(items=items, db_session=mock_db_session)
+
+    assert order_item_ids == [7, 8]
+    assert mock_cursor.executemany.call_count == 1
+    assert [row[1] for row in mock_cursor.executemany.call_args.args[1]] == [9, 5]
+    assert OrderMapper.create_order_items(items=[], db_session=mock_db_session) == []
+
+
+def test_create_orders_inserts_once_and_numbers_ids_from_the_last_insert_id(mock_db_session):
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.lastrowid = 11
+
+    order_ids = OrderMapper.create_orders(orders=[{"user_id": 3, "status": "pending"}, {"user_id": 8, "status": "pending"}], db_session=mock_db_session)
+
+    assert order_ids == {3: 11, 8: 12}
+    mock_cursor.execute.assert_called_once()
+    statement, values = mock_cursor.execute.call_args.args
+    assert "VALUES (%s, %s, %s, %s, %s), (%s, %s, %s, %s, %s)" in statement
+    assert values[0] == 3 and values[5] == 8 and values[2] == values[7] == "pending"
+    assert OrderMapper.create_orders(orders=[], db_session=mock_db_session) == {}
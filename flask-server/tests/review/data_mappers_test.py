@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 from datetime import datetime
 
 from app.data_mappers import ReviewMapper
+from app.utils.pagination import encode_cursor
 
 
 @pytest.fixture
@@ -84,3 +85,37 @@ def test_delete_review(mock_db_session):
     rows_deleted = ReviewMapper.delete_review(review_id=1, db_session=mock_db_session)
 
     assert rows_deleted == 1
+
+
+def test_get_all_reviews_keyset_pagination(mock_db_session):
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.fetchall.return_value = []
+    cursor = encode_cursor(sort="created_at", value=datetime(2024, 1, 1), row_id=7)
+
+    ReviewMapper.get_all_reviews(args={"listing_id": 101, "sort": "created_at", "cursor": cursor, "range": "5"}, db_session=mock_db_session)
+
+    statement, values = mock_cursor.execute.call_args[0]
+    assert "WHERE listing_id = %s AND (created_at > %s OR (created_at = %s AND review_id > %s))" in statement
+    assert statement.endswith("ORDER BY created_at ASC, review_id ASC LIMIT %s")
+    assert values == [101, "2024-01-01 00:00:00.000000", "2024-01-01 00:00:00.000000", 7, 5]
+
+
+def test_get_all_reviews_combines_filters(mock_db_session):
+    mock_cursor = mock_db_session.cursor.return_value
+    mock_cursor.fetchall.return_value = []
+
+    ReviewMapper.get_all_reviews(args={"listing_id": 101, "user_id": 1}, db_session=mock_db_session)
+
+    statement, values = mock_cursor.execute.call_args[0]
+    assert "WHERE listing_id = %s AND user_id = %s" in statement
+    assert values == [101, 1]
+
+
+def test_get_reviews_version_counts_reviews_never_updated(mock_db_session):
+    mock_db_session.fetchone.return_value = {"updated_at": datetime(2024, 1, 1), "count": 2}
+
+    version = ReviewMapper.get_reviews_version(args={"listing_id": 101, "sort": "stars"}, db_session=mock_db_session)
+
+    statement, values = mock_db_session.execute.call_args.args
+    assert version == {"updated_at": datetime(2024, 1, 1), "count": 2}
+    assert "MAX(COALESCE(updated_at, created_at))" in statement and statement.endswith("WHERE listing_id = %s") and values == [101]
@@ -0,0 +1,198 @@
+import json, os, pytest, threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.utils.auction_engine import AuctionEngine
+
+
+@pytest.fixture
+def connection():
+    connection = MagicMock()
+    connection.cursor.return_value.fetchone.side_effect = lambda: {
+        "listing_id": 5, "status": "active", "auction_end": datetime.now() + timedelta(hours=1), "current_price": 100.0, "bids": 3
+    }
+    connection.cursor.return_value.fetchall.return_value = []
+    return connection
+
+
+@pytest.fixture
+def engine(tmp_path, connection):
+    engine = AuctionEngine(journal_dir=str(tmp_path), flush_interval=60)
+    engine.start(connection_factory=MagicMock(return_value=connection))
+    yield engine
+    engine.stop()
+
+
+def journal(engine):
+    with open(engine.journal_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_place_bid_accepts_only_higher_bids(engine):
+    accepted = engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 110.0})
+    assert accepted["accepted"] and accepted["current_price"] == 110.0 and accepted["bids"] == 4
+
+    rejected = engine.place_bid(data={"listing_id": 5, "user_id": 2, "amount": 110.0})
+    assert not rejected["accepted"]
+
+    state = engine.get_state(5)
+    assert state["current_price"] == 110.0 and state["leader"] == 1
+    assert [bid["sequence"] for bid in state["recent_bids"]] == [1]
+
+
+def test_place_bid_rejects_ended_auctions(engine):
+    engine.sync_listing({"listing_id": 5, "status": "active", "auction_end": datetime.now() - timedelta(seconds=1)})
+    engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 1.0})  # Loads the auction
+    engine.sync_listing({"listing_id": 5, "status": "active", "auction_end": datetime.now() - timedelta(seconds=1)})
+
+    assert not engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 500.0})["accepted"]
+
+
+def test_auctions_going_live_are_warmed_without_a_database_read(engine, connection):
+    end = datetime.now() + timedelta(hours=1)
+    engine.sync_listing({"listing_id": 8, "status": "active", "auction_end": end, "current_price": None, "bids": 0})
+    engine.sync_listing({"listing_id": 9, "status": "active", "auction_end": None, "current_price": None, "bids": 0})
+
+    assert engine.place_bid(data={"listing_id": 8, "user_id": 1, "amount": 20.0})["accepted"]
+    assert engine.get_state(9) is None
+    connection.cursor.return_value.execute.assert_not_called()
+
+
+def test_place_bid_validates_data(engine):
+    with pytest.raises(TypeError):
+        engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": "110"})
+
+
+def test_max_bids_answer_bids_in_one_step(engine, connection):
+    registered = engine.place_max_bid(data={"listing_id": 5, "user_id": 2, "amount": 200.0})
+    assert registered["accepted"] and registered["proxy_bid"]["amount"] == 102.5 and registered["leader"] == 2
+
+    answered = engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 150.0})
+    assert answered["accepted"] and answered["proxy_bid"] == {**answered["proxy_bid"], "user_id": 2, "amount": 152.5}
+    assert answered["current_price"] == 152.5 and answered["leader"] == 2 and answered["bids"] == 6
+
+    assert not engine.place_max_bid(data={"listing_id": 5, "user_id": 1, "amount": 150.0})["accepted"]
+
+    assert engine.flush() == 4
+    cursor = connection.cursor.return_value
+    upsert, insert = cursor.executemany.call_args_list
+    assert upsert.args[1][0][:3] == (5, 2, 200.0)
+    assert [row[1:3] for row in insert.args[1]] == [(2, 102.5), (1, 150.0), (2, 152.5)]
+
+
+def test_accepted_bids_are_journaled_then_flushed_in_batch(engine, connection):
+    for amount in (110.0, 120.0, 130.0):
+        engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": amount})
+    assert [record["amount"] for record in journal(engine)] == [110.0, 120.0, 130.0]
+
+    assert engine.flush() == 3
+    cursor = connection.cursor.return_value
+    assert len(cursor.executemany.call_args.args[1]) == 3
+    assert cursor.execute.call_args.args[1][:4] == [5, 130.0, 5, 3]
+    connection.commit.assert_called_once()
+
+    engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 140.0})  # Writes the checkpoint first
+    assert {"persisted": 3} in journal(engine)
+
+
+def test_late_bids_extend_the_auction_with_their_acceptance(engine, connection):
+    end = datetime.now() + timedelta(seconds=10)
+    engine.sync_listing({"listing_id": 8, "status": "active", "auction_end": end, "current_price": None, "bids": 0})
+
+    accepted = engine.place_bid(data={"listing_id": 8, "user_id": 1, "amount": 20.0})
+    assert accepted["auction_end"] > end + timedelta(seconds=40)
+    assert engine.get_state(8)["auction_end"] == accepted["auction_end"]
+    assert journal(engine)[0]["auction_end"] == str(accepted["auction_end"])
+
+    engine.flush()
+    statement, values = connection.cursor.return_value.execute.call_args.args
+    assert "auction_end = CASE listing_id WHEN %s THEN GREATEST(auction_end, %s) ELSE auction_end END" in statement
+    assert values[4:6] == [8, accepted["auction_end"]]
+
+
+def test_failed_flush_is_retried(engine, connection):
+    engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 110.0})
+    connection.cursor.return_value.executemany.side_effect = [Exception("Lost connection"), None]
+
+    assert engine.flush() == 0
+    connection.rollback.assert_called_once()
+    assert engine.flush() == 1
+
+
+def test_start_recovers_unpersisted_bids(tmp_path, connection):
+    path = tmp_path / "auction_journal.log"
+    created_at = datetime.now().isoformat()
+    path.write_text("\n".join([
+        json.dumps({"listing_id": 5, "user_id": 1, "amount": 110.0, "created_at": created_at, "sequence": 1}),
+        json.dumps({"persisted": 1}),
+        json.dumps({"listing_id": 5, "user_id": 2, "amount": 120.0, "created_at": created_at, "sequence": 2}),
+        json.dumps({"listing_id": 5, "user_id": 1, "amount": 130.0, "created_at": created_at, "sequence": 3}),
+        '{"listing_id": 5, "user_'
+    ]))
+    connection.cursor.return_value.fetchall.return_value = [{"listing_id": 5, "user_id": 2, "amount": 120.0}]
+
+    engine = AuctionEngine(journal_dir=str(tmp_path), flush_interval=60)
+    engine.start(connection_factory=MagicMock(return_value=connection))
+    try:
+        rows = connection.cursor.return_value.executemany.call_args.args[1]
+        assert [(row[1], row[2]) for row in rows] == [(1, 130.0)]
+        assert not path.exists()
+        assert engine.journal_path == str(tmp_path / f"auction_journal.{os.getpid()}.log")
+        assert engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 140.0})["bid"]["sequence"] == 4
+    finally:
+        engine.stop()
+
+
+def test_start_recovers_the_journals_of_every_previous_process(tmp_path, connection):
+    created_at = datetime.now().isoformat()
+    for pid, amount in ((101, 110.0), (102, 120.0)):
+        (tmp_path / f"auction_journal.{pid}.log").write_text(
+            json.dumps({"listing_id": 5, "user_id": 1, "amount": amount, "created_at": created_at, "sequence": 1}) + "\n"
+        )
+
+    engine = AuctionEngine(journal_dir=str(tmp_path), flush_interval=60)
+    engine.start(connection_factory=MagicMock(return_value=connection))
+    try:
+        recovered = [row[2] for call in connection.cursor.return_value.executemany.call_args_list for row in call.args[1]]
+        assert sorted(recovered) == [110.0, 120.0]
+        assert [path.name for path in tmp_path.iterdir()] == [f"auction_journal.{os.getpid()}.log"]
+    finally:
+        engine.stop()
+
+
+def test_auctions_are_loaded_by_the_caller_not_the_writer(tmp_path, connection):
+    threads = []
+    def connection_factory():
+        threads.append(threading.current_thread())
+        return connection
+    engine = AuctionEngine(journal_dir=str(tmp_path), flush_interval=60)
+    engine.start(connection_factory=connection_factory)
+    try:
+        assert engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 110.0})["accepted"]
+        assert threads == [threading.current_thread()]
+        assert engine.place_bid(data={"listing_id": 5, "user_id": 2, "amount": 120.0})["accepted"]
+        assert len(threads) == 1
+    finally:
+        engine.stop()
+
+
+def test_get_state_returns_a_snapshot(engine):
+    engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 110.0})
+    state = engine.get_state(5)
+
+    engine.place_bid(data={"listing_id": 5, "user_id": 2, "amount": 120.0})
+
+    assert state["current_price"] == 110.0 and len(state["recent_bids"]) == 1
+    assert engine.get_state(5)["current_price"] == 120.0
+
+
+def test_bids_not_journaled_are_neither_acknowledged_nor_persisted(engine, connection):
+    engine.place_bid(data={"listing_id": 5, "user_id": 1, "amount": 110.0})
+    engine._journal.close()  # Makes the next journal write fail
+
+    rejected = engine.place_bid(data={"listing_id": 5, "user_id": 2, "amount": 120.0})
+
+    assert not rejected["accepted"]
+    assert engine.pending == 1
+    assert engine.get_state(5) is None  # Loaded again on the next bid
+    engine._journal = open(engine.journal_path, "a", encoding="utf-8")
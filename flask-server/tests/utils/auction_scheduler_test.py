@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock
+from datetime import datetime, timedelta
+import time
+
+from app.utils.auction_scheduler import AuctionScheduler, RETRY_DELAY
+from app.utils.timing_wheel import TimingWheel
+
+
+def make_connection(rows=()):
+    conn = MagicMock()
+    cursor = conn.cursor.return_value
+    cursor.fetchone.return_value = (datetime(2025, 1, 1, 12),)
+    cursor.fetchmany.side_effect = [list(rows), []]
+    return conn
+
+
+def test_sync_loads_every_deadline_then_only_recent_ones():
+    due = datetime.now() + timedelta(hours=1)
+    conn = make_connection(rows=[("end", 4, due), ("end", 9, due)])
+    scheduler = AuctionScheduler()
+    scheduler._connection_factory = lambda: conn
+    wheel = TimingWheel(now=time.time())
+
+    assert scheduler._sync(wheel) == 2
+    assert ("end", 4) in wheel and ("end", 9) in wheel
+    assert conn.cursor.return_value.execute.call_args.args == ("SELECT kind, listing_id, due_at FROM auction_deadlines",)
+
+    conn.cursor.return_value.fetchmany.side_effect = [[]]
+    scheduler._sync(wheel)
+    statement, values = conn.cursor.return_value.execute.call_args.args
+    assert statement.endswith("WHERE updated_at >= %s") and values[0] < datetime(2025, 1, 1, 12)
+
+
+def test_fire_batches_by_kind_and_deletes_handled_deadlines():
+    conn = make_connection()
+    handler = MagicMock(return_value=None)
+    scheduler = AuctionScheduler()
+    scheduler._connection_factory = lambda: conn
+    scheduler.register("end", handler)
+
+    scheduler._fire(TimingWheel(now=time.time()), [("end", 4), ("end", 9)])
+
+    handler.assert_called_once_with([4, 9])
+    statement, values = conn.cursor.return_value.execute.call_args.args
+    assert statement.startswith("DELETE FROM auction_deadlines") and values[:3] == ["end", 4, 9]
+    assert scheduler.stats()["fired"] == {"end": 2}
+
+
+def test_fire_moves_deadlines_rescheduled_by_the_handler():
+    conn = make_connection()
+    extended = datetime.now() + timedelta(minutes=2)
+    scheduler = AuctionScheduler()
+    scheduler._connection_factory = lambda: conn
+    scheduler.register("end", MagicMock(return_value={9: extended}))
+    wheel = TimingWheel(now=time.time())
+
+    scheduler._fire(wheel, [("end", 4), ("end", 9)])
+
+    assert ("end", 9) in wheel and ("end", 4) not in wheel
+    cursor = conn.cursor.return_value
+    assert cursor.executemany.call_args.args[1] == [(extended, "end", 9, extended)]
+    assert cursor.execute.call_args.args[0].startswith("DELETE FROM auction_deadlines")
+    assert scheduler.stats()["fired"] == {"end": 1}
+
+
+def test_fire_retries_deadlines_whose_handler_failed():
+    conn = make_connection()
+    scheduler = AuctionScheduler()
+    scheduler._connection_factory = lambda: conn
+    scheduler.register("end", MagicMock(side_effect=RuntimeError("database unavailable")))
+    wheel = TimingWheel(now=time.time())
+
+    scheduler._fire(wheel, [("end", 4)])
+
+    assert ("end", 4) in wheel
+    assert wheel.advance(time.time() + RETRY_DELAY + 1) == [("end", 4)]
+    conn.cursor.return_value.execute.assert_not_called()
+
+
+def test_only_the_lock_holder_leads():
+    lock_conn = MagicMock()
+    lock_conn.cursor.return_value.fetchone.return_value = (0,)
+    scheduler = AuctionScheduler()
+    scheduler._lock_factory = lambda: lock_conn
+
+    assert scheduler._elect() is False
+    lock_conn.close.assert_called_once()
+
+    lock_conn.cursor.return_value.fetchone.return_value = (1,)
+    assert scheduler._elect() is True
+    assert lock_conn.cursor.return_value.execute.call_args.args == ("SELECT GET_LOCK(%s, 0)", ("auction_scheduler",))
+
+
+def test_leadership_callbacks_run_when_elected_and_stepping_down():
+    lock_conn = MagicMock()
+    lock_conn.cursor.return_value.fetchone.return_value = (1,)
+    elected, stepped_down = MagicMock(), MagicMock()
+    scheduler = AuctionScheduler(election_interval=60)
+    scheduler.on_leadership(elected=elected, stepped_down=stepped_down)
+    scheduler._lead = MagicMock(side_effect=lambda: scheduler._stopped.set())
+
+    scheduler.start(connection_factory=MagicMock(), lock_factory=lambda: lock_conn)
+    scheduler.stop()
+
+    elected.assert_called_once_with()
+    stepped_down.assert_called_once_with()
+    scheduler._lead.assert_called_once()
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+from contextlib import nullcontext
+from decimal import Decimal
+
+from app.utils import auction_tasks
+
+
+def test_settle_auctions_sells_to_highest_bidders_meeting_reserve(monkeypatch):
+    listings, bids, orders, emit = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    listings.lock_ended_auctions.return_value = {
+        4: {"user_id": 10, "reserve_price": Decimal("100")},
+        9: {"user_id": 10, "reserve_price": None},
+        12: {"user_id": 11, "reserve_price": Decimal("500")},
+        15: {"user_id": 11, "reserve_price": None}
+    }
+    bids.get_winning_bids.return_value = {
+        4: {"bid_id": 1, "user_id": 3, "amount": Decimal("150")},
+        9: {"bid_id": 2, "user_id": 3, "amount": Decimal("20")},
+        12: {"bid_id": 3, "user_id": 5, "amount": Decimal("300")}
+    }
+    orders.create_orders.return_value = {3: 70}
+    orders.create_order_items.return_value = [80, 81]
+    listings.get_extended_auctions.return_value = {20: "extended end"}
+    monkeypatch.setattr(auction_tasks, "ListingMapper", listings)
+    monkeypatch.setattr(auction_tasks, "BidMapper", bids)
+    monkeypatch.setattr(auction_tasks, "OrderMapper", orders)
+    monkeypatch.setattr(auction_tasks, "unit_of_work", nullcontext)
+    monkeypatch.setattr(auction_tasks.auction_engine, "running", False)
+    monkeypatch.setattr(auction_tasks.socketio, "emit", emit)
+
+    extended = auction_tasks.settle_auctions([4, 9, 12, 15, 20])
+
+    listings.update_statuses.assert_called_once_with(statuses={4: "sold", 9: "sold", 12: "ended", 15: "ended"})
+    orders.create_orders.assert_called_once_with(orders=[{"user_id": 3, "status": "pending"}])
+    assert [item["listing_id"] for item in orders.create_order_items.call_args.kwargs["items"]] == [4, 9]
+    assert {item["order_id"] for item in orders.create_order_items.call_args.kwargs["items"]} == {70}
+    assert extended == {20: "extended end"}
+    listings.get_extended_auctions.assert_called_once_with(listing_ids=[20])
+    assert emit.call_count == 4
+    assert emit.call_args_list[0].args[1] == {"listing_id": 4, "status": "sold", "winner_id": 3, "final_price": 150.0}
+    assert emit.call_args_list[2].args[1] == {"listing_id": 12, "status": "ended", "winner_id": None, "final_price": None}
+
+
+def test_activate_listings_flips_due_drafts_in_one_update(monkeypatch):
+    listings, emit = MagicMock(), MagicMock()
+    listings.lock_due_drafts.return_value = [4, 9]
+    monkeypatch.setattr(auction_tasks, "ListingMapper", listings)
+    monkeypatch.setattr(auction_tasks, "unit_of_work", nullcontext)
+    monkeypatch.setattr(auction_tasks.socketio, "emit", emit)
+
+    auction_tasks.activate_listings([4, 9, 12])
+
+    listings.update_statuses.assert_called_once_with(statuses={4: "active", 9: "active"})
+    assert [call.kwargs["to"] for call in emit.call_args_list] == ["listing:4", "listing:9"]
@@ -0,0 +1,68 @@
+import pytest
+from PIL import Image
+import base64, io, os
+
+from app.utils.blob_store import BlobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BlobStore(root=str(tmp_path), thumbnail_sizes=(64, 128))
+
+
+@pytest.fixture
+def png_bytes():
+    buffer = io.BytesIO()
+    Image.new("RGB", (300, 200), color=(200, 30, 30)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_put_stores_original_and_thumbnails(store, png_bytes):
+    image_id = store.put(png_bytes)
+
+    with open(store.path(image_id), "rb") as f:
+        assert f.read() == png_bytes
+    with Image.open(store.path(image_id, size=64)) as thumbnail:
+        assert thumbnail.format == "WEBP"
+        assert max(thumbnail.size) == 64
+    assert store.mimetype(store.path(image_id)) == "image/png"
+
+
+def test_put_deduplicates_by_content(store, png_bytes):
+    first = store.put(png_bytes)
+    mtime = os.path.getmtime(store.path(first))
+
+    assert store.put(png_bytes) == first
+    assert os.path.getmtime(store.path(first)) == mtime
+
+
+def test_put_base64_accepts_data_url(store, png_bytes):
+    encoded = base64.b64encode(png_bytes).decode()
+
+    assert store.put_base64("data:image/png;base64," + encoded) == store.put_base64(encoded)
+
+
+def test_put_rejects_invalid_images(store):
+    with pytest.raises(ValueError):
+        store.put_base64("image_data")
+    with pytest.raises(ValueError):
+        store.put(b"not an image")
+
+
+
+@pytest.mark.parametrize("max_pixels", [300 * 200 - 1, 1000])  # Under and over twice the limit
+@pytest.mark.filterwarnings("ignore::PIL.Image.DecompressionBombWarning")
+def test_put_rejects_decompression_bombs(store, png_bytes, monkeypatch, max_pixels):
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", max_pixels)
+
+    with pytest.raises(ValueError):
+        store.put(png_bytes)
+    assert os.listdir(store.root) == []
+
+def test_path_picks_smallest_sufficient_thumbnail(store, png_bytes):
+    image_id = store.put(png_bytes)
+
+    assert store.path(image_id, size=100).endswith("_128.webp")
+    assert store.path(image_id, size=1000) == store.path(image_id)
+    assert store.path("../../etc/passwd") is None
+    assert store.path("0" * 64) is None
@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+
+from app.utils.coalescer import RoomCoalescer
+
+
+def test_updates_are_coalesced_into_latest_state():
+    emit = MagicMock()
+    coalescer = RoomCoalescer(emit=emit, rate=1)
+    coalescer._thread = MagicMock()  # Flushed by hand
+
+    for bids in (1, 2, 3):
+        coalescer.publish("new_bid", {"bids": bids}, room="listing:5")
+    coalescer.publish("new_bid", {"bids": 1}, room="listing:6")
+
+    assert coalescer.flush() == 2
+    assert emit.call_args_list[0].args == ("new_bid", {"bids": 3})
+    assert emit.call_args_list[0].kwargs == {"to": "listing:5"}
+    assert coalescer.stats()["sent"] == {"new_bid": 2}
+    assert coalescer.stats()["suppressed"] == {"new_bid": 2}
+
+
+def test_immediate_updates_replace_waiting_ones():
+    emit = MagicMock()
+    coalescer = RoomCoalescer(emit=emit, rate=1)
+    coalescer._thread = MagicMock()
+
+    coalescer.publish("new_bid", {"bids": 1}, room="listing:5")
+    coalescer.publish("new_bid", {"bids": 2}, room="listing:5", immediate=True)
+
+    emit.assert_called_once_with("new_bid", {"bids": 2}, to="listing:5")
+    assert coalescer.flush() == 0
+    assert coalescer.stats() == {"sent": {"new_bid": 1}, "suppressed": {"new_bid": 1}, "pending": 0, "rate": 1.0}
+
+
+def test_flusher_limits_frames_per_room():
+    emit, sleeps = MagicMock(), []
+    coalescer = RoomCoalescer(emit=emit, rate=20, sleep=sleeps.append)
+    coalescer._thread = MagicMock()  # Flusher rounds run by hand
+
+    coalescer.publish("new_bid", {"bids": 1}, room="listing:5")
+    coalescer._step()  # First update after a quiet period: emitted right away
+    for bids in range(2, 50):  # Published while the flusher holds off
+        coalescer.publish("new_bid", {"bids": bids}, room="listing:5")
+    coalescer._step()
+
+    assert [call.args[1]["bids"] for call in emit.call_args_list] == [1, 49]
+    assert sleeps == [0.05, 0.05]
+    assert coalescer.stats()["suppressed"] == {"new_bid": 47}
@@ -0,0 +1,83 @@
+from flask import Flask, Response
+from datetime import datetime, timedelta
+
+from app.utils.conditional import conditional, version_etag
+from app.utils.response_cache import ResponseCache, MemoryBackend
+
+
+def make_app(versions: dict, calls: list, cache: ResponseCache | None = None):
+    app = Flask(__name__)
+    cache = cache or ResponseCache(backend=None)
+
+    @app.route("/api/listings/<int:listing_id>/")
+    @conditional(validator=lambda args, listing_id: versions.get(listing_id))
+    @cache.cached(tags=lambda data, args, view_args: [f"listing:{view_args.get('listing_id')}"])
+    def get_listing(listing_id: int, db_session=None):
+        calls.append(listing_id)
+        if listing_id not in versions:
+            return Response(response='{"error": "Listing not found"}', status=404, mimetype="application/json")
+        return Response(response=f'{{"calls": {len(calls)}}}', status=200, mimetype="application/json")
+
+    return app
+
+
+UPDATED_AT = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def test_unchanged_resource_is_not_modified():
+    versions, calls = {1: {"updated_at": UPDATED_AT, "last_modified": UPDATED_AT}}, []
+    client = make_app(versions, calls).test_client()
+
+    response = client.get("/api/listings/1/")
+    etag = response.headers["ETag"]
+    assert response.status_code == 200 and etag.startswith('W/"')
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    response = client.get("/api/listings/1/", headers={"If-None-Match": etag})
+    assert response.status_code == 304 and response.headers["ETag"] == etag and not response.data
+    response = client.get("/api/listings/1/", headers={"If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT"})
+    assert response.status_code == 304
+    assert calls == [1]
+
+
+def test_changed_resource_is_sent_again():
+    versions, calls = {1: {"updated_at": UPDATED_AT, "last_modified": UPDATED_AT}}, []
+    client = make_app(versions, calls).test_client()
+    etag = client.get("/api/listings/1/").headers["ETag"]
+
+    versions[1] = {"updated_at": UPDATED_AT + timedelta(seconds=1), "last_modified": UPDATED_AT + timedelta(seconds=1)}
+    response = client.get("/api/listings/1/", headers={"If-None-Match": etag})
+    assert response.status_code == 200 and response.headers["ETag"] != etag
+    response = client.get("/api/listings/1/", headers={"If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT"})
+    assert response.status_code == 200
+    # If-None-Match takes precedence over If-Modified-Since
+    response = client.get("/api/listings/1/", headers={"If-None-Match": etag, "If-Modified-Since": "Mon, 01 Jan 2024 12:00:01 GMT"})
+    assert response.status_code == 200
+
+
+def test_versions_without_last_modified_only_get_an_etag():
+    versions, calls = {1: {"updated_at": UPDATED_AT, "bids": 3}}, []
+    response = make_app(versions, calls).test_client().get("/api/listings/1/")
+
+    assert response.headers["ETag"] == f'W/"{version_etag(versions[1])}"'
+    assert "Last-Modified" not in response.headers
+
+
+def test_recent_and_missing_resources_get_no_validators():
+    versions, calls = {1: {"updated_at": datetime.now(), "last_modified": datetime.now()}}, []
+    client = make_app(versions, calls).test_client()
+
+    assert "ETag" not in client.get("/api/listings/1/").headers
+    response = client.get("/api/listings/2/", headers={"If-None-Match": "*"})
+    assert response.status_code == 404 and "ETag" not in response.headers
+
+
+def test_cached_responses_of_an_older_version_are_not_served():
+    versions, calls = {1: {"updated_at": UPDATED_AT}}, []
+    client = make_app(versions, calls, cache=ResponseCache(backend=MemoryBackend())).test_client()
+
+    assert client.get("/api/listings/1/").get_json()["calls"] == 1
+    assert client.get("/api/listings/1/").get_json()["calls"] == 1
+    # Updated by another worker process, whose invalidation did not reach this cache
+    versions[1] = {"updated_at": UPDATED_AT + timedelta(seconds=5)}
+    assert client.get("/api/listings/1/").get_json()["calls"] == 2
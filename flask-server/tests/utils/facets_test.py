@@ -0,0 +1,35 @@
+import pytest
+
+from app.utils.facets import combine_facets, price_filter
+
+
+GROUPS = [
+    (2, "auction", 5, True, 4),
+    (2, "buy_now", 4, False, 3),
+    (3, "buy_now", 2, True, 2),
+    (3, "auction", -1, False, 1),
+]
+
+
+def test_price_filter():
+    assert price_filter({"min_price": "10", "max_price": ""}) == (10, None)
+    with pytest.raises(ValueError):
+        price_filter({"max_price": "cheap"})
+
+
+def test_combine_facets_without_filters():
+    facets = combine_facets(groups=GROUPS, args={})
+
+    assert facets["category_id"] == {"2": 4, "3": 2}
+    assert facets["listing_type"] == {"auction": 4, "buy_now": 2}
+    assert [bucket["count"] for bucket in facets["price"]] == [0, 0, 2, 0, 3, 4]
+    assert facets["price"][0] == {"min": 0, "max": 10, "count": 0}
+    assert facets["price"][-1] == {"min": 1000, "max": None, "count": 4}
+
+
+def test_combine_facets_ignores_each_facets_own_filter():
+    facets = combine_facets(groups=GROUPS, args={"category_id": "2", "listing_type": "buy_now"})
+
+    assert facets["category_id"] == {"3": 2}
+    assert facets["listing_type"] == {"auction": 4}
+    assert [bucket["count"] for bucket in facets["price"]] == [0, 0, 0, 0, 3, 0]
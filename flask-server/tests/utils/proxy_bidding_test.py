@@ -0,0 +1,31 @@
+from app.utils.proxy_bidding import bid_increment, resolve_proxies
+
+
+def test_bid_increment_tiers():
+    assert bid_increment(0.5) == 0.05
+    assert bid_increment(99.99) == 1
+    assert bid_increment(100) == 2.5
+    assert bid_increment(10000) == 50
+
+
+def test_no_max_bid_beats_current_price():
+    assert resolve_proxies(100.0, 1, []) is None
+    assert resolve_proxies(100.0, 1, [(2, 100.0)]) is None
+
+
+def test_single_max_bid_outbids_leader_by_one_increment():
+    assert resolve_proxies(100.0, 1, [(2, 300.0)]) == (2, 102.5)
+    assert resolve_proxies(100.0, 1, [(2, 101.0)]) == (2, 101.0)
+
+
+def test_leader_max_bid_only_answers_rivals():
+    assert resolve_proxies(100.0, 1, [(1, 300.0)]) is None
+    assert resolve_proxies(100.0, 1, [(1, 300.0), (2, 150.0)]) == (1, 152.5)
+
+
+def test_highest_max_bid_wins_at_second_highest_plus_increment():
+    assert resolve_proxies(100.0, 3, [(1, 200.0), (2, 260.0), (4, 120.0)]) == (2, 202.5)
+
+
+def test_earliest_max_bid_wins_ties():
+    assert resolve_proxies(100.0, 3, [(1, 200.0), (2, 200.0)]) == (1, 200.0)
@@ -0,0 +1,54 @@
+import pytest, redis, socketio, time
+
+from app.utils.pubsub_server import PubSubServer
+
+
+def next_message(subscriber, timeout: float = 1):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        message = subscriber.get_message(timeout=0.01)
+        if message:
+            return message
+    return None
+
+
+@pytest.fixture
+def server():
+    server = PubSubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_messages_reach_every_subscriber(server):
+    client = redis.Redis.from_url(server.url)
+    subscribers = [client.pubsub(ignore_subscribe_messages=True) for _ in range(2)]
+    for subscriber in subscribers:
+        subscriber.subscribe("socketio")
+        assert next_message(subscriber, timeout=0.1) is None  # Subscription confirmed
+
+    assert client.publish("socketio", b"hello") == 2
+    assert client.publish("other", b"ignored") == 0
+
+    for subscriber in subscribers:
+        message = next_message(subscriber)
+        assert message["channel"] == b"socketio" and message["data"] == b"hello"
+        assert next_message(subscriber, timeout=0.05) is None
+
+
+def test_socketio_emits_reach_other_servers(server):
+    received = []
+    listener = socketio.Server(async_mode="threading", client_manager=socketio.RedisManager(server.url, channel="test"))
+    listener.manager.set_server(listener)
+    listener.manager._handle_emit = received.append
+    listener.manager.initialize()
+    time.sleep(0.1)  # Subscribed
+
+    emitter = socketio.RedisManager(server.url, channel="test", write_only=True)
+    emitter.set_server(socketio.Server(async_mode="threading", client_manager=emitter))
+    emitter._publish({"method": "emit", "event": "new_bid", "data": {"listing_id": 5}, "namespace": "/", "room": "listing:5", "host_id": "other"})
+
+    deadline = time.time() + 1
+    while not received and time.time() < deadline:
+        time.sleep(0.01)
+    assert received and received[0]["event"] == "new_bid" and received[0]["room"] == "listing:5"
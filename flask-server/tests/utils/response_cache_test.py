@@ -0,0 +1,129 @@
+from flask import Flask, Response
+import time
+
+from app.utils.response_cache import ResponseCache, MemoryBackend, cache_key, listing_tag, category_tag
+
+
+def make_app(cache: ResponseCache, calls: list):
+    app = Flask(__name__)
+
+    @app.route("/api/listings/")
+    @cache.cached(tags=lambda data, args, view_args: [listing_tag(listing) for listing in data.get("listings")] + [category_tag(args.get("category_id"))])
+    def get_all_listings(db_session=None):
+        calls.append(1)
+        return Response(response=f'{{"listings": [1, 2], "calls": {len(calls)}}}', status=200, mimetype="application/json")
+
+    @app.route("/api/listings/<int:listing_id>/")
+    @cache.cached(tags=lambda data, args, view_args: [listing_tag(view_args.get("listing_id"))])
+    def get_listing(listing_id: int, db_session=None):
+        calls.append(1)
+        return Response(response='{"error": "Listing not found"}', status=404, mimetype="application/json")
+
+    return app
+
+
+def test_cache_key_ignores_the_order_of_query_parameters():
+    app = Flask(__name__)
+    with app.test_request_context("/?range=10&category_id=3"):
+        from flask import request
+        first = cache_key("/api/listings/", request.args)
+    with app.test_request_context("/?category_id=3&range=10"):
+        from flask import request
+        assert cache_key("/api/listings/", request.args) == first
+    assert cache_key("/api/listings/", {}) == "/api/listings/"
+
+
+def test_responses_are_cached_until_a_tag_is_invalidated():
+    cache, calls = ResponseCache(backend=MemoryBackend(), ttl=60), []
+    client = make_app(cache, calls).test_client()
+
+    assert client.get("/api/listings/?category_id=3&range=2").get_json()["calls"] == 1
+    assert client.get("/api/listings/?range=2&category_id=3").get_json()["calls"] == 1
+    cache.invalidate(listing_tag(5))
+    assert client.get("/api/listings/?range=2&category_id=3").get_json()["calls"] == 1
+    cache.invalidate(listing_tag(2))
+    assert client.get("/api/listings/?range=2&category_id=3").get_json()["calls"] == 2
+    cache.invalidate(category_tag(3))
+    assert client.get("/api/listings/?range=2&category_id=3").get_json()["calls"] == 3
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 3
+
+
+def test_errors_are_not_cached():
+    cache, calls = ResponseCache(backend=MemoryBackend(), ttl=60), []
+    client = make_app(cache, calls).test_client()
+
+    assert client.get("/api/listings/1/").status_code == 404
+    assert client.get("/api/listings/1/").status_code == 404
+    assert len(calls) == 2
+
+
+def test_disabled_cache_always_computes_the_response():
+    cache, calls = ResponseCache(backend=None), []
+    client = make_app(cache, calls).test_client()
+
+    client.get("/api/listings/")
+    client.get("/api/listings/")
+    cache.invalidate(listing_tag(1))
+    assert len(calls) == 2
+
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    backend = MemoryBackend()
+    backend.set("a", b"{}", ["listings"], ttl=10, since=backend.begin())
+    assert backend.get("a") == b"{}"
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert backend.get("a") is None
+    assert len(backend) == 0 and backend.bytes == 0
+
+
+def test_least_recently_used_entries_are_evicted_over_the_budget():
+    backend = MemoryBackend(max_bytes=3 * (1 + 100 + 256))
+    for key in "abc":
+        backend.set(key, b"x" * 100, [key], ttl=60, since=backend.begin())
+    backend.get("a")
+    backend.set("d", b"x" * 100, ["d"], ttl=60, since=backend.begin())
+
+    assert backend.get("b") is None
+    assert all(backend.get(key) for key in "acd")
+    assert backend.evictions == 1
+    assert backend.bytes <= backend.max_bytes
+    # Evicted entries leave no tags behind
+    assert backend.invalidate(["b"]) == 0
+
+
+def test_responses_computed_across_an_invalidation_are_not_cached():
+    backend = MemoryBackend()
+    since = backend.begin()
+    backend.invalidate([listing_tag(1)])
+
+    assert not backend.set("a", b"{}", [listing_tag(1)], ttl=60, since=since)
+    assert backend.set("b", b"{}", [listing_tag(2)], ttl=60, since=since)
+    assert backend.set("a", b"{}", [listing_tag(1)], ttl=60, since=backend.begin())
+
+
+def test_forgotten_invalidations_reject_older_responses(monkeypatch):
+    monkeypatch.setattr("app.utils.response_cache.MAX_TRACKED_INVALIDATIONS", 2)
+    backend = MemoryBackend()
+    since = backend.begin()
+    for listing_id in range(3):
+        backend.invalidate([listing_tag(listing_id)])
+
+    assert not backend.set("a", b"{}", [listing_tag(9)], ttl=60, since=since)
+
+
+def test_remote_invalidations_reach_the_listeners():
+    class SharedBackend(MemoryBackend):
+        def listen(self, callback):
+            self.callback = callback
+
+    backend = SharedBackend()
+    cache, received = ResponseCache(backend=backend, ttl=60), []
+    cache.on_remote_invalidation(received.append)
+    cache.on_remote_invalidation(lambda tags: 1 / 0)  # A failing listener does not stop the others
+
+    backend.callback([listing_tag(4)])
+    assert received == [[listing_tag(4)]]
+
+    ResponseCache(backend=MemoryBackend(), ttl=60).on_remote_invalidation(received.append)  # Not shared: nothing to listen to
@@ -0,0 +1,18 @@
+from datetime import datetime, date
+from decimal import Decimal
+import json
+
+from app.utils.responses import json_response
+
+
+def test_json_response_encodes_datetimes_and_decimals():
+    response = json_response({
+        "listing": {"listing_id": 1, "current_price": Decimal("150.50"), "auction_end": datetime(2025, 1, 7, 12, 30), "reserve_price": None},
+        "date_of_birth": date(2000, 2, 29)
+    }, status=201)
+
+    assert response.status_code == 201 and response.mimetype == "application/json"
+    assert json.loads(response.get_data()) == {
+        "listing": {"listing_id": 1, "current_price": "150.50", "auction_end": "2025-01-07T12:30:00", "reserve_price": None},
+        "date_of_birth": "2000-02-29"
+    }
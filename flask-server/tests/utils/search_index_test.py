@@ -0,0 +1,119 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.utils.search_index import SearchIndex, tokenize
+
+
+LISTINGS = [
+    {"listing_id": 1, "title": "Gaming Laptop", "title_short": "Laptop", "description": "RTX 3060 gaming laptop", "item_specifics": "16GB RAM", "user_id": 10, "category_id": 2, "listing_type": "auction", "buy_now_price": 1200},
+    {"listing_id": 2, "title": "Office Laptop", "title_short": "Laptop", "description": "Light laptop for work", "item_specifics": "8GB RAM", "user_id": 11, "category_id": 2, "listing_type": "buy_now", "buy_now_price": 600},
+    {"listing_id": 3, "title": "Gaming Mouse", "title_short": "Mouse", "description": "Wireless mouse", "item_specifics": None, "user_id": 10, "category_id": 3, "listing_type": "buy_now", "buy_now_price": 50},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    connection = MagicMock()
+    connection.cursor.return_value.__iter__.return_value = iter(LISTINGS)
+    index = SearchIndex(snapshot_path=str(tmp_path / "search_index.snapshot"))
+    index.load(connection_factory=MagicMock(return_value=connection))
+    return index
+
+
+def test_tokenize():
+    assert tokenize("The Gaming-Laptops, for sale!") == ["gaming", "laptop", "sale"]
+    assert tokenize(None) == []
+
+
+def test_load_marks_index_ready(index):
+    assert index.ready
+    assert len(index) == 3
+
+
+def test_search_requires_every_term_and_ranks_title_matches_first(index):
+    assert [listing_id for listing_id, _ in index.search("gaming laptop")] == [1]
+    assert [listing_id for listing_id, _ in index.search("laptops")][0] in (1, 2)
+    assert {listing_id for listing_id, _ in index.search("gaming")} == {1, 3}
+    assert index.search("tablet") == []
+
+
+def test_search_applies_filters(index):
+    assert [listing_id for listing_id, _ in index.search("laptop", filters={"listing_type": "buy_now"})] == [2]
+    assert [listing_id for listing_id, _ in index.search("gaming", filters={"category_id": "2"})] == [1]
+    assert [listing_id for listing_id, _ in index.search("laptop", filters={"min_price": "700"}, limit=10)] == [1]
+    assert index.search("laptop", filters={"user_id": "99"}) == []
+
+
+def test_match_filters_before_the_limit(index):
+    assert index.match("laptop", filters={"listing_type": "buy_now"}, limit=1) == [2]
+    assert index.match("gaming", filters={"category_id": "3"}, limit=1) == [3]
+
+
+def test_search_pages_with_limit_and_keyset(index):
+    first = index.search("laptop", limit=1)
+    second = index.search("laptop", limit=1, after=(first[0][1], first[0][0]))
+
+    assert len(first) == len(second) == 1
+    assert first[0][0] != second[0][0]
+    assert index.search("laptop", limit=1, offset=1) == second
+
+
+def test_add_and_remove_update_postings(index):
+    index.add({**LISTINGS[2], "title": "Gaming Laptop Stand"})
+    assert {listing_id for listing_id, _ in index.search("laptop")} == {1, 2, 3}
+
+    index.remove(1)
+    assert [listing_id for listing_id, _ in index.search("gaming laptop")] == [3]
+    assert index.search("rtx") == []
+
+
+def test_drafts_are_indexed_once_they_go_live(index):
+    draft = {**LISTINGS[0], "listing_id": 4, "title": "Vintage Camera", "status": "draft"}
+    index.add(draft)
+    assert index.search("camera") == []
+
+    index.add({**draft, "status": "active"})
+    assert [listing_id for listing_id, _ in index.search("camera")] == [4]
+
+
+def test_compaction_merges_delta_into_base(index):
+    index.add({**LISTINGS[2], "title": "Gaming Laptop Stand"})
+    index.add({**LISTINGS[0], "listing_id": 4, "title": "Laptop Bag"})
+    index.remove(2)
+    before = [listing_id for listing_id, _ in index.search("laptop")]
+
+    index._compact()
+
+    assert not index._delta
+    assert [listing_id for listing_id, _ in index.search("laptop")] == before
+    assert set(before) == {1, 3, 4}
+
+
+def test_snapshot_round_trip(index):
+    index.save_snapshot()
+    connection = MagicMock()
+    connection.cursor.return_value.__iter__.side_effect = [iter([]), iter([(1,), (2,)])]
+
+    restored = SearchIndex(snapshot_path=index.snapshot_path)
+    restored.load(connection_factory=MagicMock(return_value=connection))
+
+    assert restored.ready
+    assert len(restored) == 2  # Listing 3 was deleted since the snapshot
+    assert [listing_id for listing_id, _ in restored.search("laptop")] == [listing_id for listing_id, _ in index.search("laptop")]
+
+
+def test_writes_are_ignored_until_loaded():
+    index = SearchIndex()
+    index.add(LISTINGS[0])
+
+    assert not index.active
+    assert len(index) == 0
+
+
+def test_facet_groups_counts_matches_per_combination(index):
+    assert sorted(index.facet_groups(query="gaming")) == [("2", "auction", 5, True, 1), ("3", "buy_now", 2, True, 1)]
+    assert sorted(index.facet_groups(filters={"max_price": "1000"})) == [
+        ("2", "auction", 5, False, 1), ("2", "buy_now", 4, True, 1), ("3", "buy_now", 2, True, 1)
+    ]
+    assert index.facet_groups(query="laptop", filters={"user_id": "11"}) == [("2", "buy_now", 4, True, 1)]
+    assert index.facet_groups(query="tablet") == []
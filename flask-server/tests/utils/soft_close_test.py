@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta
+
+from app.utils import soft_close
+from app.utils.soft_close import extended_end, soft_close_bounds
+
+
+def test_only_bids_within_the_window_extend_the_auction(monkeypatch):
+    monkeypatch.setattr(soft_close, "SOFT_CLOSE_WINDOW", timedelta(seconds=60))
+    monkeypatch.setattr(soft_close, "SOFT_CLOSE_EXTENSION", timedelta(seconds=120))
+    now = datetime(2025, 1, 1, 12)
+
+    assert extended_end(now + timedelta(seconds=61), now) == now + timedelta(seconds=61)
+    assert extended_end(now + timedelta(seconds=60), now) == now + timedelta(seconds=120)
+    assert extended_end(now + timedelta(seconds=1), now) == now + timedelta(seconds=120)
+    assert extended_end(None, now) is None
+    assert soft_close_bounds(now) == (now + timedelta(seconds=60), now + timedelta(seconds=120))
+
+
+def test_extension_never_shortens_the_auction(monkeypatch):
+    monkeypatch.setattr(soft_close, "SOFT_CLOSE_WINDOW", timedelta(seconds=60))
+    monkeypatch.setattr(soft_close, "SOFT_CLOSE_EXTENSION", timedelta(seconds=10))
+    now = datetime(2025, 1, 1, 12)
+
+    assert extended_end(now + timedelta(seconds=30), now) == now + timedelta(seconds=30)
+
+
+def test_zero_window_disables_soft_close(monkeypatch):
+    monkeypatch.setattr(soft_close, "SOFT_CLOSE_WINDOW", timedelta(0))
+    now = datetime(2025, 1, 1, 12)
+
+    assert extended_end(now + timedelta(seconds=1), now) == now + timedelta(seconds=1)
+    assert soft_close_bounds(now) == (now, now)
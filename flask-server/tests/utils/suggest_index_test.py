@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import MagicMock
+
+from app.utils.suggest_index import SuggestIndex, normalize
+
+
+LISTINGS = [
+    {"listing_id": 1, "title": "Gaming Laptop", "category_id": 2, "status": "active", "purchases": 5, "bids": 10},
+    {"listing_id": 2, "title": "Office Laptop", "category_id": 2, "status": "active", "purchases": 1, "bids": 0},
+    {"listing_id": 3, "title": "Gaming Mouse", "category_id": 3, "status": "active", "purchases": 30, "bids": 0},
+]
+
+CATEGORIES = [
+    {"category_id": 2, "name": "Laptops"},
+    {"category_id": 3, "name": "Gaming Accessories"},
+]
+
+
+@pytest.fixture
+def index():
+    connection = MagicMock()
+    connection.cursor.return_value.__iter__.return_value = iter(LISTINGS)
+    connection.cursor.return_value.fetchall.return_value = CATEGORIES
+    index = SuggestIndex(memory_budget=1 << 20)
+    index.load(connection_factory=MagicMock(return_value=connection))
+    return index
+
+
+def texts(suggestions):
+    return [suggestion["text"] for suggestion in suggestions]
+
+
+def test_normalize():
+    assert normalize("  Gaming-Laptop, 16GB!") == "gaming laptop 16gb"
+    assert normalize(None) == ""
+
+
+def test_load_marks_index_ready(index):
+    assert index.ready
+    assert index.stats()["items"] == 5
+
+
+def test_suggest_matches_word_starts_ranked_by_weight(index):
+    assert set(texts(index.suggest("gam")[:2])) == {"Gaming Mouse", "Gaming Accessories"}
+    assert texts(index.suggest("gam"))[2] == "Gaming Laptop"
+    assert texts(index.suggest("LAPTOP")) == ["Laptops", "Gaming Laptop", "Office Laptop"]
+    assert texts(index.suggest("lap", limit=1)) == ["Laptops"]
+    assert index.suggest("tablet") == []
+    assert index.suggest("   ") == []
+
+
+def test_suggest_returns_type_and_id(index):
+    assert index.suggest("office") == [{"type": "listing", "id": 2, "text": "Office Laptop"}]
+    assert index.suggest("gaming acc") == [{"type": "category", "id": 3, "text": "Gaming Accessories"}]
+
+
+def test_writes_update_suggestions(index):
+    index.add_listing({"listing_id": 2, "title": "Office Laptop", "category_id": 2, "status": "active", "purchases": 1, "bids": 50})
+    assert texts(index.suggest("laptop"))[1] == "Office Laptop"
+
+    index.add_listing({"listing_id": 2, "title": "Office Laptop", "category_id": 2, "status": "sold", "purchases": 1, "bids": 50})
+    assert "Office Laptop" not in texts(index.suggest("laptop"))
+
+    index.remove_listing(1)
+    index.add_category({"category_id": 4, "name": "Gadgets"})
+    index.remove_category(3)
+    assert texts(index.suggest("ga")) == ["Gaming Mouse", "Gadgets"]
+
+
+def test_memory_budget_skips_new_listings(index):
+    index.memory_budget = 0
+    index.add_listing({"listing_id": 4, "title": "Gaming Chair", "category_id": 3, "status": "active", "purchases": 0, "bids": 0})
+
+    assert "Gaming Chair" not in texts(index.suggest("gaming"))
+    assert index.stats()["skipped_listings"] == 1
+
+
+def test_writes_are_ignored_before_load():
+    index = SuggestIndex(memory_budget=1 << 20)
+    index.add_listing(LISTINGS[0])
+
+    assert not index.ready
+    assert index.suggest("gaming") == []
+
+
+def test_add_listing_weight_reorders_suggestions(index):
+    index.add_listing_weight(listing_id=2, delta=20)
+    assert texts(index.suggest("laptop")) == ["Laptops", "Office Laptop", "Gaming Laptop"]
+
+    index.add_listing_weight(listing_id=99, delta=1)
+    assert index.stats()["items"] == 5
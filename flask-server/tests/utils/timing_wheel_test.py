@@ -0,0 +1,50 @@
+import random
+
+from app.utils.timing_wheel import TimingWheel
+
+
+def test_deadlines_fire_on_first_tick_at_or_after_them_in_order():
+    wheel = TimingWheel(now=0, tick=1, slots=4, levels=2)
+    for key, due in (("c", 9.5), ("a", 2), ("b", 2.2), ("far", 40)):
+        wheel.add(key, due)
+
+    assert wheel.advance(1.9) == []
+    assert wheel.advance(2) == ["a"]
+    assert wheel.advance(10) == ["b", "c"]
+    assert len(wheel) == 1 and "far" in wheel  # Beyond both levels
+    assert wheel.advance(39) == []
+    assert wheel.advance(40) == ["far"]
+    assert len(wheel) == 0
+
+
+def test_add_replaces_and_cancel_removes_a_deadline():
+    wheel = TimingWheel(now=100, tick=1, slots=4, levels=2)
+    wheel.add("a", 105)
+    wheel.add("a", 120)
+    wheel.add("b", 50)  # Already passed
+
+    assert wheel.advance(100) == ["b"]
+    assert wheel.advance(110) == []
+    assert wheel.cancel("a") is True and wheel.cancel("a") is False
+    assert wheel.advance(200) == []
+
+
+def test_matches_a_sorted_list_of_deadlines():
+    rng = random.Random(7)
+    wheel = TimingWheel(now=0, tick=0.5, slots=8, levels=3)
+    pending = {}
+    now = 0.0
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if rng.random() < 0.2:
+            assert wheel.cancel(key) == (pending.pop(key, None) is not None)
+        else:
+            pending[key] = now + rng.uniform(-5, 1000)
+            wheel.add(key, pending[key])
+        now += rng.uniform(0, 3)
+        fired = wheel.advance(now)
+        expected = [key for key, due in pending.items() if due <= now - now % 0.5]
+        assert sorted(fired) == sorted(expected)
+        for key in fired:
+            del pending[key]
+    assert len(wheel) == len(pending)
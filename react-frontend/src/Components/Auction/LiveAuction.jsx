@@ -7,6 +7,7 @@ import PropTypes from "prop-types";
 
 // Internal Modules
 import { useAuth } from "@/ContextAPI/AuthContext"
+import { listingImageSrc } from "@/utils/helpers";
 
 // Stylesheets
 import "./LiveAuction.scss";
@@ -17,6 +18,7 @@ const LiveAuction = ({ listing }) => {
     const auth = useAuth();
 
     const [newBid, setNewBid] = useState((listing.current_price + 1).toFixed(2));
+    const [maxBid, setMaxBid] = useState("");
     const [error, setError] = useState(false);
 
     useEffect(() => setNewBid((listing.current_price + 1).toFixed(2)), [listing]);
@@ -29,6 +31,22 @@ const LiveAuction = ({ listing }) => {
         setError(false);
         if (!auth.user) navigate("/auth-page", { state: { from: location } });
 
+        // A maximum bid lets the server bid on the user's behalf up to that amount
+        if (maxBid) {
+            axios.post(`${ import.meta.env.VITE_BACKEND_API_URL }/bids/max/`,
+                {
+                    listing_id: listing.listing_id,
+                    amount: parseFloat(maxBid),
+                },
+                {
+                    headers: { "Content-Type": "application/json" },
+                    withCredentials: true,
+                })
+                .then((res) => alert(`Maximum bid placed for $${maxBid}, current bid is $${res.data.current_price}`))
+                .catch((err) => console.error(err));
+            return;
+        }
+
         axios.post(`${ import.meta.env.VITE_BACKEND_API_URL }/bids/`,
             {
                 listing_id: listing.listing_id,
@@ -48,7 +66,7 @@ const LiveAuction = ({ listing }) => {
                 <div className="section left">
                     <div className="image">
                         <img
-                            src={ `data:image/jpg;base64,${ listing.image_encoded  }`}
+                            src={ listingImageSrc(listing, 512)}
                             alt={ listing.title }
                             style={ { display: "block" } }
                         />
@@ -88,10 +106,10 @@ const LiveAuction = ({ listing }) => {
 
                     <TextField
                         className="newBid"
-                        value=""
+                        value={ maxBid }
                         label="Maximum Bid"
                         type="number"
-                        onChange={ (e) => {} }
+                        onChange={ (e) => setMaxBid(e.target.value) }
                         variant="outlined"
                     />
 
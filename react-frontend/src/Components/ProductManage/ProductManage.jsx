@@ -11,7 +11,7 @@ import axios from "axios";
 import PropTypes from "prop-types";
 
 // Internal Modules
-import { encodeImageToBase64 } from "@/utils/helpers.jsx";
+import { encodeImageToBase64, listingImageSrc } from "@/utils/helpers.jsx";
 import tempImage from "@/assets/images/noImage.webp";
 
 // Stylesheets
@@ -33,6 +33,7 @@ const ProductManage = ({ httpType }) => {
         listing_type: "buy_now",
         starting_price: 0,
         reserve_price: 0,
+        auction_start: null,
         auction_end: null,
         buy_now_price: 0
     }) // State to hold uploaded listing data
@@ -46,9 +47,10 @@ const ProductManage = ({ httpType }) => {
 
     useEffect(() => {
         if (httpType === "put") {
-            axios.get(`${ import.meta.env.VITE_BACKEND_API_URL }/listings/${ id }/`,
+            axios.get(`${ import.meta.env.VITE_BACKEND_API_URL }/user/listings/${ id }/`,
                 {
                     headers: { "Content-Type": "application/json" },
+                    withCredentials: true, // Drafts are only shown to their owner
                 })
                 .then((res) => {
                     setListing(res.data.listing);
@@ -102,6 +104,7 @@ const ProductManage = ({ httpType }) => {
             ...(e.target.value === "buy_now" && {
                 starting_price: null,
                 reserve_price: null,
+                auction_start: null,
                 auction_end: null,
             }),
         });
@@ -114,6 +117,7 @@ const ProductManage = ({ httpType }) => {
             starting_price: parseFloat(listing.starting_price) || 0,
             reserve_price: parseFloat(listing.reserve_price) || 0,
             buy_now_price: parseFloat(listing.buy_now_price) || 0,
+            auction_start: listing.auction_start ? dayjs.utc(listing.auction_start).format("YYYY-MM-DD HH:mm:ss") : null,
             auction_end: listing.auction_end ? dayjs.utc(listing.auction_end).format("YYYY-MM-DD HH:mm:ss") : null,
         };
 
@@ -159,7 +163,7 @@ const ProductManage = ({ httpType }) => {
                     <div className="imageUpload" ref={ imgRef }>
                         <div className="image">
                             <img
-                                src={ `data:image/jpg;base64,${ listing.image_encoded }` }
+                                src={ listingImageSrc(listing, 512) }
                                 alt="Product Image"
                                 className="product-image"
                             />
@@ -258,6 +262,16 @@ const ProductManage = ({ httpType }) => {
                                     required
                                 />
                                 <LocalizationProvider dateAdapter={ AdapterDayjs }>
+                                    {/* Optional; auctions starting later are published as drafts until then */}
+                                    <DatePicker
+                                        className="input"
+                                        label="Auction Start"
+                                        name="auction_start"
+                                        value={ listing.auction_start ? dayjs.utc(listing.auction_start) : null }
+                                        onChange={ (value) => setListing({ ...listing, auction_start: value })}
+                                        minDate={ dayjs() }
+                                        slotProps={ { textField: { variant: "outlined" } } }
+                                    />
                                     <DatePicker
                                         className="input"
                                         label="Auction End"
@@ -10,7 +10,7 @@ import axios from "axios";
 // Internal Modules
 import Header from "@/Components/Header/Header";
 import RightNav from "@/Components/Navigation/RightNav/RightNav";
-import { renderStars, navigateToListing } from "@/utils/helpers";
+import { renderStars, navigateToListing, listingImageSrc } from "@/utils/helpers";
 import { useCart } from "@/ContextAPI/CartContext"
 
 // Stylesheets
@@ -99,7 +99,7 @@ const Cart = () => {
                             <div className="cartItem" key={ index }>
                                 <div className="itemImage">
                                     { /* Display the product image */ }
-                                    <img src={ `data:image/jpg;base64,${ item.image_encoded  }`} alt="" />
+                                    <img src={ listingImageSrc(item, 128)} alt="" />
                                 </div>
                                 <div className="itemContent">
                                     <div className="basicInfo">
@@ -7,7 +7,7 @@ import axios from "axios";
 // Internal Modules
 import Header from "@/Components/Header/Header";
 import RightNav from "@/Components/Navigation/RightNav/RightNav";
-import { renderStars, navigateToListing, updateList } from "@/utils/helpers";
+import { renderStars, navigateToListing, updateList, listingImageSrc } from "@/utils/helpers";
 import { useCart } from "@/ContextAPI/CartContext";
 
 // Stylesheets
@@ -99,7 +99,7 @@ const Lists = () => {
                             >
                                 <div className="image">
                                     { /* Display the product image */ }
-                                    <img src={ `data:image/jpg;base64,${ listing.image_encoded  }`} alt="" />
+                                    <img src={ listingImageSrc(listing, 256)} alt="" />
                                 </div>
                                 <div className="info">
                                     { /* Button to navigate to the detailed listing view */ }
@@ -22,6 +22,7 @@ const Messages = () => {
 
     const messagesEndRef = useRef(null); // Reference to scroll to the bottom of the messages div
     const currentChatRef = useRef(currentChat);
+    const socketRef = useRef(null);
 
     useEffect(() => {
         currentChatRef.current = currentChat;
@@ -60,11 +61,12 @@ const Messages = () => {
         });
 
         if (!socket) return;
+        socketRef.current = socket;
 
         // We have to use references because of fucking race conditions
-        const handleNewMessage = () => {
+        const handleNewMessage = (update) => {
             const chatId = currentChatRef.current?.chat_id;
-            if (chatId) {
+            if (chatId && (!update || update.chat_id === chatId)) {
                 axios.get(`${import.meta.env.VITE_BACKEND_API_URL}/user/messages/${ chatId }/`,
                     {
                         headers: { "Content-Type": "application/json" },
@@ -79,9 +81,26 @@ const Messages = () => {
 
         return () => {
             socket.off("new_message", handleNewMessage);
+            socket.disconnect();
         };
     }, []);
 
+    // Only receive the messages of the current chat; rooms are joined again after a reconnect
+    useEffect(() => {
+        const socket = socketRef.current;
+        const chatId = currentChat?.chat_id;
+        if (!socket || !chatId) return;
+
+        const joinRoom = () => socket.emit("join_chat", { chat_id: chatId });
+        if (socket.connected) joinRoom();
+        socket.on("connect", joinRoom);
+
+        return () => {
+            socket.off("connect", joinRoom);
+            socket.emit("leave_chat", { chat_id: chatId });
+        };
+    }, [currentChat?.chat_id]);
+
     // When current chat changes, fetch messages for the new chat
     useEffect(() => {
         if (!currentChat) return;
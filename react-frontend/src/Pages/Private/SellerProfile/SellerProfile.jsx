@@ -9,7 +9,7 @@ import Header from "@/Components/Header/Header";
 import RightNav from "@/Components/Navigation/RightNav/RightNav";
 import SellerProfileNav from "@/Components/Navigation/SellerProfileNav/SellerProfileNav";
 import ProductManage from "@/Components/ProductManage/ProductManage.jsx";
-import { renderStars } from "@/utils/helpers";
+import { renderStars, listingImageSrc } from "@/utils/helpers";
 
 // Stylesheets
 import "./SellerProfile.scss";
@@ -43,7 +43,7 @@ const SellerProfile = () => {
                         {listings.map((item, index) => (
                             <div className="listing" key={ index }>
                                 <div className="image">
-                                    <img src={ `data:image/jpg;base64,${ item.image_encoded  }`} alt="" />
+                                    <img src={ listingImageSrc(item, 256)} alt="" />
                                 </div>
                                 <div className="info">
                                     <div className="review">
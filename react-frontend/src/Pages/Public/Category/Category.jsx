@@ -8,7 +8,7 @@ import axios from "axios";
 // Internal Modules
 import Header from "@/Components/Header/Header";
 import RightNav from "@/Components/Navigation/RightNav/RightNav";
-import { renderStars, navigateToListing } from "@/utils/helpers";
+import { renderStars, navigateToListing, listingImageSrc, LISTING_CARD_FIELDS } from "@/utils/helpers";
 
 // Stylesheets
 import "./Category.scss";
@@ -23,7 +23,8 @@ import "./Category.scss";
  * Features:
  * - Fetches category data from a backend API based on the "category_id" query parameter.
  * - Displays the category"s bestsellers, new listings, and specific category listings.
- * - Implements pagination using React Router, allowing users to navigate between pages of listings.
+ * - Implements pagination using React Router, following the backend's `next_cursor` (keyset pagination)
+ *   and keeping previously visited cursors in the history state so "Previous" can step back.
  *
  * @returns { JSX.Element } The rendered category page containing category information and listings.
  */
@@ -36,6 +37,7 @@ const Category = () => {
     const [bestSellers, setBestSellers] = useState([]); // State to hold bestsellers data
     const [newListings, setNewListings] = useState([]); // State to hold new listings data
     const [listings, setListings] = useState([]); // State to hold listings data
+    const [nextCursor, setNextCursor] = useState(null); // Cursor of the next page of listings
     const sections = [
         {
             title: "Best Sellers",
@@ -77,6 +79,7 @@ const Category = () => {
                     order: "desc", // Order in descending order
                     start: 0, // Start from the first item
                     range: 8, // Limit to 8 items
+                    fields: LISTING_CARD_FIELDS, // Only the columns the cards show
                 }
             })
             .then((res) => setBestSellers(res.data.listings)) // Update state with fetched data
@@ -94,6 +97,7 @@ const Category = () => {
                     order: "desc", // Order by descending (newest first)
                     start: 0, // Starting position
                     range: 8, // Number of listings to fetch
+                    fields: LISTING_CARD_FIELDS, // Only the columns the cards show
                 }
             })
             .then((res) => setNewListings(res.data.listings)) // Update state with fetched data
@@ -107,18 +111,25 @@ const Category = () => {
             filters.range = "12"; // Set the range (number of items per page)
         }
 
-        // Fetch listings from the backend API
+        // Fetch listings from the backend API, seeking past the cursor when we have one
         axios.get(`${ import.meta.env.VITE_BACKEND_API_URL }/listings/`,
             {
                 headers: { "Content-Type": "application/json" },
                 params: {
                     category_id: filters.category_id, // Filter by category ID
-                    start: filters.start, // Starting position
+                    ...(filters.cursor ? { cursor: filters.cursor } : { start: filters.start }), // Page position
                     range: filters.range, // Number of listings to fetch
+                    fields: LISTING_CARD_FIELDS, // Only the columns the cards show
                 }
             })
-            .then((res) => setListings(res.data.listings)) // Update state with fetched data
-            .catch(() => setListings([]));
+            .then((res) => {
+                setListings(res.data.listings); // Update state with fetched data
+                setNextCursor(res.data.next_cursor || null);
+            })
+            .catch(() => {
+                setListings([]);
+                setNextCursor(null);
+            });
     }, [location.search]); // Call on update of URL filters
 
     /**
@@ -128,12 +139,25 @@ const Category = () => {
      * @param { number } n - Increment or decrement for pagination.
      */
     function pagination(n) {
-        // Update URL filter
+        // Cursors of the pages visited before this one
+        const cursors = location.state?.cursors || [];
+        const currentCursor = filters.cursor || "";
+
+        // Update URL filters
         filters.page = (parseInt(filters.page) + n).toString();
+        if (n > 0 && nextCursor) {
+            filters.cursor = nextCursor;
+        } else if (n < 0 && cursors.length && cursors[cursors.length - 1]) {
+            filters.cursor = cursors[cursors.length - 1];
+        } else {
+            delete filters.cursor; // Fall back to the page offset
+        }
         // Navigate with new filters
         navigate({
             pathname: "/category",
             search: createSearchParams(filters).toString(),
+        }, {
+            state: { cursors: n > 0 ? [...cursors, currentCursor] : cursors.slice(0, -1) },
         });
 
         // Calculate scroll position of top of pagination section and scroll
@@ -191,7 +215,7 @@ const Category = () => {
                                     <div className={`listing ${section.identifier !== "Listings" && index === 0 ? "first" :
                                         (section.identifier === "Listings" && index % 4 === 0 ? "first" : "")}`} key={ index }>
                                         <div className="image">
-                                            <img src={ `data:image/jpg;base64,${ listing.image_encoded  }`} alt="" />
+                                            <img src={ listingImageSrc(listing, 256)} alt="" />
                                         </div>
                                         <div className="info">
                                             <div className="review">
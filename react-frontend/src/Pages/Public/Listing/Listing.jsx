@@ -16,7 +16,7 @@ import Header from "@/Components/Header/Header";
 import RightNav from "@/Components/Navigation/RightNav/RightNav";
 import Listing3D from "@/Components/Listing3D/Listing3D";
 import LiveAuction from "@/Components/Auction/LiveAuction"
-import { renderStars } from "@/utils/helpers";
+import { renderStars, listingImageSrc } from "@/utils/helpers";
 import { useCart } from "@/ContextAPI/CartContext";
 
 // Stylesheets
@@ -53,6 +53,7 @@ const Listing = () => {
     const [showAuction, setShowAuction] = useState(false);
 
     const listingRef = useRef(listing);
+    const socketRef = useRef(null);
 
     dayjs.extend(utc);
 
@@ -76,27 +77,68 @@ const Listing = () => {
         });
 
         if (!socket) return;
+        socketRef.current = socket;
 
         // We have to use references because of fucking race conditions
-        const handleNewBid = () => {
-            const listingId = listingRef.current?.listing_id;
-            if (listingId) {
-                axios.get(`${ import.meta.env.VITE_BACKEND_API_URL }/listings/${ listingId }/`,
-                    {
-                        headers: { "Content-Type": "application/json" },
-                    })
-                    .then((res) => setListing(res.data.listing)) // Update state with fetched data
-                    .catch((err) => console.error(err)); // Log errors if any
-            }
+        // Bid updates carry the auction's new state, so the listing does not have to be fetched again
+        const handleNewBid = (update) => {
+            if (!update || update.listing_id !== listingRef.current?.listing_id) return;
+            setListing((current) => {
+                // Updates are coalesced and may overtake each other when an auction is closing
+                if (update.bids != null && current.bids != null && update.bids < current.bids) return current;
+                return {
+                    ...current,
+                    current_price: update.current_price ?? current.current_price,
+                    bids: update.bids ?? current.bids,
+                    auction_end: update.auction_end ?? current.auction_end,
+                };
+            });
+        }
+
+        // Settled auctions are either sold to the highest bidder or ended without a winner
+        const handleAuctionEnded = (update) => {
+            if (!update || update.listing_id !== listingRef.current?.listing_id) return;
+            setListing((current) => ({
+                ...current,
+                status: update.status ?? "ended",
+                current_price: update.final_price ?? current.current_price,
+            }));
+        }
+
+        // Drafts go live at their auction start
+        const handleAuctionStarted = (update) => {
+            if (!update || update.listing_id !== listingRef.current?.listing_id) return;
+            setListing((current) => ({ ...current, status: "active" }));
         }
 
         socket.on("new_bid", handleNewBid);
+        socket.on("auction_ended", handleAuctionEnded);
+        socket.on("auction_started", handleAuctionStarted);
 
         return () => {
             socket.off("new_bid", handleNewBid);
+            socket.off("auction_ended", handleAuctionEnded);
+            socket.off("auction_started", handleAuctionStarted);
+            socket.disconnect();
         };
     }, []);
 
+    // Only receive the bids of the listing being viewed; rooms are joined again after a reconnect
+    useEffect(() => {
+        const socket = socketRef.current;
+        const listingId = listing.listing_id;
+        if (!socket || !listingId) return;
+
+        const joinRoom = () => socket.emit("join_listing", { listing_id: listingId });
+        if (socket.connected) joinRoom();
+        socket.on("connect", joinRoom);
+
+        return () => {
+            socket.off("connect", joinRoom);
+            socket.emit("leave_listing", { listing_id: listingId });
+        };
+    }, [listing.listing_id]);
+
     useEffect(() => {
         if (showAuction || showModel) {
             const handleEscapeKey = (event) => {
@@ -196,7 +238,7 @@ const Listing = () => {
                                         Place Bid
                                     </Button>
                                     <p className="bidDescription">
-                                        { listing.bids } bids. Ends: { format(new Date(listing.auction_end), "MM/dd/yyyy, hh:mm a") }
+                                        { listing.bids } bids. Ends: { format(dayjs.utc(listing.auction_end).toDate(), "MM/dd/yyyy, hh:mm a") }
                                     </p>
                                 </div>
                             )}
@@ -209,7 +251,7 @@ const Listing = () => {
                                 <TwitterShareButton className="shareBtn" data-testid="twitterShareBtn" url={ location.href }>
                                     <XIcon size={ 24 } round={ true } />
                                 </TwitterShareButton>
-                                <PinterestShareButton className="shareBtn" data-testid="pinterestShareBtn" url={ location.href } media={ listing.image_encoded }>
+                                <PinterestShareButton className="shareBtn" data-testid="pinterestShareBtn" url={ location.href } media={ listingImageSrc(listing) }>
                                     <PinterestIcon size={ 24 } round={ true } />
                                 </PinterestShareButton>
                             </div>
@@ -217,10 +259,10 @@ const Listing = () => {
 
                         { /* Display product image or fallback message */ }
                         <div className="image">
-                            {listing.image_encoded ? (
+                            {listing.image_id || listing.image_encoded ? (
                                 <div style={ { position: "relative", display: "inline-block" } }>
                                     <img
-                                        src={ `data:image/jpg;base64,${ listing.image_encoded  }`}
+                                        src={ listingImageSrc(listing)}
                                         alt={ listing.title }
                                         style={ { display: "block" } }
                                     />
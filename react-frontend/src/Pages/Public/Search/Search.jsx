@@ -9,7 +9,7 @@ import axios from "axios";
 import Header from "@/Components/Header/Header";
 import SearchNav from "@/Components/Navigation/SearchNav/SearchNav";
 import RightNav from "@/Components/Navigation/RightNav/RightNav";
-import { renderStars, navigateToListing, addToList } from "@/utils/helpers";
+import { renderStars, navigateToListing, addToList, listingImageSrc } from "@/utils/helpers";
 import { useCart } from "@/ContextAPI/CartContext";
 
 // Stylesheets
@@ -36,11 +36,14 @@ const Search = () => {
     const { addToCart } = useCart(); // Access authentication functions from the AuthProvider context
 
     const [listings, setListings] = useState([]); // State to hold product listings
+    const [nextCursor, setNextCursor] = useState(null); // Cursor of the next page of listings
 
     useEffect(() => {
         // Adjust filters for pagination
         if (filters.page) {
-            filters.start = ((filters.page - 1) * 10).toString();
+            if (!filters.cursor) {
+                filters.start = ((filters.page - 1) * 10).toString();
+            }
             filters.range = "10";
         }
         // Apply sorting logic based on filter (new or bestsellers)
@@ -58,8 +61,14 @@ const Search = () => {
             headers: { "Content-Type": "application/json" },
             params: createSearchParams(filters),
         })
-            .then((res) => setListings(res.data.listings))
-            .catch(() => setListings([]));
+            .then((res) => {
+                setListings(res.data.listings);
+                setNextCursor(res.data.next_cursor || null);
+            })
+            .catch(() => {
+                setListings([]);
+                setNextCursor(null);
+            });
     }, [location.search]);
 
     /**
@@ -69,12 +78,25 @@ const Search = () => {
      * @param { number } n - Increment or decrement for pagination.
      */
     function pagination(n) {
-        // Update URL filter
+        // Cursors of the pages visited before this one
+        const cursors = location.state?.cursors || [];
+        const currentCursor = filters.cursor || "";
+
+        // Update URL filters
         filters.page = (parseInt(filters.page) + n).toString();
+        if (n > 0 && nextCursor) {
+            filters.cursor = nextCursor;
+        } else if (n < 0 && cursors.length && cursors[cursors.length - 1]) {
+            filters.cursor = cursors[cursors.length - 1];
+        } else {
+            delete filters.cursor; // Fall back to the page offset
+        }
         // Navigate with new filters
         navigate({
             pathname: "/search",
             search: createSearchParams(filters).toString(),
+        }, {
+            state: { cursors: n > 0 ? [...cursors, currentCursor] : cursors.slice(0, -1) },
         });
 
         // Scroll to top of page
@@ -97,7 +119,7 @@ const Search = () => {
                         >
                             <div className="image">
                                 { /* Display the product image */ }
-                                <img src={ `data:image/jpg;base64,${ listing.image_encoded  }`} alt="" />
+                                <img src={ listingImageSrc(listing, 256)} alt="" />
                             </div>
                             <div className="info">
                                 { /* Button to navigate to the detailed listing view */ }
@@ -22,6 +22,7 @@ const CustomerInquiries = () => {
 
     const messagesEndRef = useRef(null); // Reference to scroll to the bottom of the messages div
     const currentSupportTicketRef = useRef(currentSupportTicket);
+    const socketRef = useRef(null);
 
     useEffect(() => {
         currentSupportTicketRef.current = currentSupportTicket;
@@ -57,11 +58,12 @@ const CustomerInquiries = () => {
         });
 
         if (!socket) return;
+        socketRef.current = socket;
 
         // We have to use references because of fucking race conditions
-        const handleNewMessage = () => {
+        const handleNewMessage = (update) => {
             const ticketId = currentSupportTicketRef.current?.ticket_id;
-            if (ticketId) {
+            if (ticketId && (!update || update.ticket_id === ticketId)) {
                 axios.get(`${import.meta.env.VITE_BACKEND_API_URL}/ticket/messages/${ ticketId }/`,
                     {
                         headers: {"Content-Type": "application/json"},
@@ -76,9 +78,26 @@ const CustomerInquiries = () => {
 
         return () => {
             socket.off("new_ticket_message", handleNewMessage);
+            socket.disconnect();
         };
     }, []);
 
+    // Only receive the messages of the current ticket; rooms are joined again after a reconnect
+    useEffect(() => {
+        const socket = socketRef.current;
+        const ticketId = currentSupportTicket?.ticket_id;
+        if (!socket || !ticketId) return;
+
+        const joinRoom = () => socket.emit("join_ticket", { ticket_id: ticketId });
+        if (socket.connected) joinRoom();
+        socket.on("connect", joinRoom);
+
+        return () => {
+            socket.off("connect", joinRoom);
+            socket.emit("leave_ticket", { ticket_id: ticketId });
+        };
+    }, [currentSupportTicket?.ticket_id]);
+
     useEffect(() => {
         if (!currentSupportTicket) return;
         getMessages();
@@ -46,6 +46,29 @@ const encodeImageToBase64 = (file) => {
     });
 };
 
+/**
+ * Returns the image URL of a listing.
+ * Inline base64 images (not yet migrated, or just picked for upload) are shown as a data URL,
+ * images moved to the backend blob store are served as cacheable thumbnails.
+ *
+ * @param { Object } listing - The listing (or cart item) to get the image of.
+ * @param { number } size - The thumbnail size in pixels, omit for the original image.
+ * @returns { string } The image URL.
+ */
+const listingImageSrc = (listing, size) => {
+    if (!listing.image_encoded && listing.image_id) {
+        return `${ import.meta.env.VITE_BACKEND_API_URL }/images/${ listing.image_id }/${ size ? `?size=${ size }` : "" }`;
+    }
+    return `data:image/jpg;base64,${ listing.image_encoded }`;
+};
+
+/**
+ * Fields of the listings shown as cards in grids, requested with `fields=` so the backend
+ * skips the description, item specifics and other large columns.
+ * `image_encoded` is kept for listings whose image was not moved to the blob store yet.
+ */
+const LISTING_CARD_FIELDS = "listing_id,title_short,buy_now_price,average_review,total_reviews,image_id,image_encoded";
+
 // Navigate to a specific listing page when a listing is clicked
 const navigateToListing = (id, navigate) => {
     navigate(`/listing?key=${ id }`);
@@ -75,4 +98,4 @@ const updateList = (list_id, list_items) => {
         .catch((err) => console.error(err)); // Log errors if any
 }
 
-export { renderStars, encodeImageToBase64, navigateToListing, addToList, updateList };
\ No newline at end of file
+export { renderStars, encodeImageToBase64, listingImageSrc, LISTING_CARD_FIELDS, navigateToListing, addToList, updateList };
\ No newline at end of file